@@ -0,0 +1,59 @@
+"""add pantry_item_chunks for blob storage mode
+
+Revision ID: 0a6d3e8f2b51
+Revises: f3c9a1d5e872
+Create Date: 2026-10-18 23:05:41.118205
+
+"""
+from datetime import datetime
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0a6d3e8f2b51'
+down_revision: Union[str, None] = 'f3c9a1d5e872'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'pantry_states', sa.Column('storage_mode', sa.String(length=16), server_default='relational', nullable=False)
+    )
+    op.create_table('pantry_item_chunks',
+    sa.Column('pantry_state_id', sa.UUID(), nullable=False),
+    sa.Column('snapshot_date', sa.Date(), nullable=False),
+    sa.Column('chunk_no', sa.Integer(), nullable=False),
+    sa.Column('item_offset', sa.Integer(), nullable=False),
+    sa.Column('item_count', sa.Integer(), nullable=False),
+    sa.Column('item_ids', postgresql.ARRAY(sa.UUID()), nullable=False),
+    sa.Column('encoding', sa.String(length=16), nullable=False),
+    sa.Column('payload', sa.LargeBinary(), nullable=False),
+    sa.ForeignKeyConstraint(['pantry_state_id'], ['pantry_states.pantry_state_id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('pantry_state_id', 'snapshot_date', 'chunk_no'),
+    postgresql_partition_by='RANGE (snapshot_date)',
+    )
+
+    # Same daily partitions as the other pantry tables, so the retention job drops chunks with them
+    partitions = op.get_bind().execute(
+        sa.text(
+            "SELECT child.relname FROM pg_inherits JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE pg_inherits.inhparent = to_regclass('pantry_items') AND child.relname LIKE 'pantry_items_p%'"
+        )
+    ).scalars()
+    for partition in partitions:
+        day = datetime.strptime(partition.removeprefix('pantry_items_p'), '%Y%m%d').date()
+        op.execute(
+            f"CREATE TABLE pantry_item_chunks_p{day:%Y%m%d} PARTITION OF pantry_item_chunks "
+            f"FOR VALUES FROM ('{day.isoformat()}') TO ('{day.isoformat()}'::date + 1)"
+        )
+    op.execute('CREATE TABLE pantry_item_chunks_default PARTITION OF pantry_item_chunks DEFAULT')
+
+
+def downgrade() -> None:
+    op.drop_table('pantry_item_chunks')
+    op.drop_column('pantry_states', 'storage_mode')
@@ -0,0 +1,36 @@
+"""add current_pantry_states for pre-warmed pantry snapshots
+
+Revision ID: 5c81f0e3a9d4
+Revises: 7e2b94c1d6a3
+Create Date: 2026-10-19 15:40:12.118305
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5c81f0e3a9d4'
+down_revision: Union[str, None] = '7e2b94c1d6a3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'current_pantry_states',
+        sa.Column('partner_id', sa.String(length=8), nullable=False),
+        sa.Column('pantry_state_id', sa.UUID(), nullable=False),
+        sa.Column('items_available_from', sa.TIMESTAMP(timezone=True), nullable=True),
+        sa.Column('items_available_until', sa.TIMESTAMP(timezone=True), nullable=True),
+        sa.Column('published_at', sa.TIMESTAMP(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(['partner_id'], ['partners.partner_id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['pantry_state_id'], ['pantry_states.pantry_state_id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('partner_id'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('current_pantry_states')
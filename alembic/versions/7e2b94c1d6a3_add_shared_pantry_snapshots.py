@@ -0,0 +1,38 @@
+"""add shared pantry snapshots to pantry_states
+
+Revision ID: 7e2b94c1d6a3
+Revises: 0a6d3e8f2b51
+Create Date: 2026-10-19 10:12:37.504118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7e2b94c1d6a3'
+down_revision: Union[str, None] = '0a6d3e8f2b51'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Shared snapshots are crawled once per availability window and belong to no partner
+    op.alter_column('pantry_states', 'partner_id', existing_type=sa.String(length=8), nullable=True)
+    op.add_column('pantry_states', sa.Column('source_pantry_state_id', sa.UUID(), nullable=True))
+    op.create_index(
+        'ix_pantry_states_shared_snapshots',
+        'pantry_states',
+        ['items_available_from', 'items_available_until', 'pantry_state_timestamp'],
+        postgresql_where=sa.text('partner_id IS NULL'),
+    )
+
+
+def downgrade() -> None:
+    # Shared snapshots and the partner snapshots referencing them cannot be represented without the new columns
+    op.execute('DELETE FROM pantry_states WHERE source_pantry_state_id IS NOT NULL OR partner_id IS NULL')
+    op.drop_index('ix_pantry_states_shared_snapshots', table_name='pantry_states')
+    op.drop_column('pantry_states', 'source_pantry_state_id')
+    op.alter_column('pantry_states', 'partner_id', existing_type=sa.String(length=8), nullable=False)
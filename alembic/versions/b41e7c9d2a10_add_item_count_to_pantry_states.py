@@ -0,0 +1,26 @@
+"""add item_count to pantry_states
+
+Revision ID: b41e7c9d2a10
+Revises: fba7c49090d9
+Create Date: 2026-10-18 09:12:44.103215
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b41e7c9d2a10'
+down_revision: Union[str, None] = 'fba7c49090d9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('pantry_states', sa.Column('item_count', sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('pantry_states', 'item_count')
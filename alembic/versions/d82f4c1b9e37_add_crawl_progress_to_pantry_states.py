@@ -0,0 +1,37 @@
+"""add crawl progress to pantry_states
+
+Revision ID: d82f4c1b9e37
+Revises: b41e7c9d2a10
+Create Date: 2026-10-18 14:03:51.582907
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd82f4c1b9e37'
+down_revision: Union[str, None] = 'b41e7c9d2a10'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('pantry_states', sa.Column('crawl_status', sa.String(length=16), server_default='running', nullable=False))
+    op.add_column('pantry_states', sa.Column('pages_fetched', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('pantry_states', sa.Column('crawl_finished_at', sa.TIMESTAMP(timezone=True), nullable=True))
+
+    # Existing snapshots stored their item count only when the crawl finished; the rest never will
+    op.execute(
+        "UPDATE pantry_states SET crawl_status = 'complete', crawl_finished_at = pantry_state_timestamp "
+        "WHERE item_count IS NOT NULL"
+    )
+    op.execute("UPDATE pantry_states SET crawl_status = 'failed' WHERE item_count IS NULL")
+
+
+def downgrade() -> None:
+    op.drop_column('pantry_states', 'crawl_finished_at')
+    op.drop_column('pantry_states', 'pages_fetched')
+    op.drop_column('pantry_states', 'crawl_status')
@@ -0,0 +1,42 @@
+"""add crawl checkpoint to pantry_states
+
+Revision ID: e4a7b2c90f15
+Revises: d82f4c1b9e37
+Create Date: 2026-10-18 16:27:09.318442
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4a7b2c90f15'
+down_revision: Union[str, None] = 'd82f4c1b9e37'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('pantry_states', sa.Column('brand_name', sa.String(), nullable=True))
+    op.add_column('pantry_states', sa.Column('crawl_page_size', sa.Integer(), nullable=True))
+    op.add_column('pantry_states', sa.Column('last_page_saved', sa.Integer(), nullable=True))
+    op.add_column('pantry_states', sa.Column('crawl_updated_at', sa.TIMESTAMP(timezone=True), nullable=True))
+    op.add_column('pantry_states', sa.Column('crawl_attempts', sa.Integer(), server_default='1', nullable=False))
+    # The recovery sweep looks for running crawls that stopped committing pages
+    op.create_index(
+        'ix_pantry_states_running_crawls',
+        'pantry_states',
+        ['crawl_updated_at'],
+        postgresql_where=sa.text("crawl_status = 'running'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_pantry_states_running_crawls', table_name='pantry_states')
+    op.drop_column('pantry_states', 'crawl_attempts')
+    op.drop_column('pantry_states', 'crawl_updated_at')
+    op.drop_column('pantry_states', 'last_page_saved')
+    op.drop_column('pantry_states', 'crawl_page_size')
+    op.drop_column('pantry_states', 'brand_name')
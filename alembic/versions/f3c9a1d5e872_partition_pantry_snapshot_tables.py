@@ -0,0 +1,243 @@
+"""partition pantry snapshot tables by day
+
+Revision ID: f3c9a1d5e872
+Revises: e4a7b2c90f15
+Create Date: 2026-10-18 21:48:12.604117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3c9a1d5e872'
+down_revision: Union[str, None] = 'e4a7b2c90f15'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# In foreign key order: created and filled in this order, dropped in reverse
+PANTRY_TABLES = [
+    'pantry_items',
+    'pantry_item_data_sources',
+    'pantry_item_costs',
+    'pantry_item_availabilities',
+    'pantry_item_custom_fields',
+]
+
+# Columns copied as they are; pantry_item_id is always copied and snapshot_date is added by the upgrade
+COPIED_COLUMNS = {
+    'pantry_items': ['pantry_state_id', 'description', 'units', 'amount', 'is_prepped_and_ready', 'brand_name'],
+    'pantry_item_data_sources': ['culops_culinary_ingredient_id', 'culops_culinary_ingredient_specification_id'],
+    'pantry_item_costs': ['applied_from', 'applied_until', 'production_cost_us_dollars'],
+    'pantry_item_availabilities': ['applied_from', 'applied_until'],
+    'pantry_item_custom_fields': ['key', 'value'],
+}
+
+SECONDARY_INDEXES = {
+    'pantry_items': [('ix_pantry_items_pantry_state_id', 'pantry_state_id')],
+    'pantry_item_data_sources': [
+        (
+            'ix_pantry_item_data_sources_culops_culinary_ingredient_specification_id',
+            'culops_culinary_ingredient_specification_id',
+        ),
+        ('ix_pantry_item_data_sources_culops_culinary_ingredient_id', 'culops_culinary_ingredient_id'),
+    ],
+}
+
+PRECREATED_DAYS = 7
+
+
+def upgrade() -> None:
+    op.add_column('pantry_states', sa.Column('snapshot_date', sa.Date(), nullable=True))
+    op.execute("UPDATE pantry_states SET snapshot_date = (pantry_state_timestamp AT TIME ZONE 'UTC')::date")
+    op.alter_column('pantry_states', 'snapshot_date', nullable=False)
+    op.create_index(op.f('ix_pantry_states_snapshot_date'), 'pantry_states', ['snapshot_date'], unique=False)
+
+    # Keep the old tables around under another name until their rows are copied; the copy only joins on primary keys
+    for table in PANTRY_TABLES:
+        for index, _ in SECONDARY_INDEXES.get(table, []):
+            op.drop_index(op.f(index), table_name=table)
+        op.rename_table(table, f'{table}_unpartitioned')
+        op.execute(f'ALTER INDEX {table}_pkey RENAME TO {table}_unpartitioned_pkey')
+
+    _create_partitioned_tables()
+
+    # One partition per day that already has snapshots plus the coming week; the retention job keeps it going
+    days = op.get_bind().execute(
+        sa.text(
+            "SELECT DISTINCT snapshot_date FROM pantry_states "
+            "UNION SELECT (now() AT TIME ZONE 'UTC')::date + days FROM generate_series(0, :days) AS days"
+        ),
+        {'days': PRECREATED_DAYS},
+    ).scalars()
+    for day in sorted(days):
+        for table in PANTRY_TABLES:
+            op.execute(
+                f"CREATE TABLE {table}_p{day:%Y%m%d} PARTITION OF {table} "
+                f"FOR VALUES FROM ('{day.isoformat()}') TO ('{day.isoformat()}'::date + 1)"
+            )
+    # Rows for a day without a partition land here instead of failing the crawl
+    for table in PANTRY_TABLES:
+        op.execute(f'CREATE TABLE {table}_default PARTITION OF {table} DEFAULT')
+
+    columns = ', '.join(COPIED_COLUMNS['pantry_items'])
+    op.execute(
+        f"INSERT INTO pantry_items (pantry_item_id, snapshot_date, {columns}) "
+        f"SELECT old.pantry_item_id, pantry_states.snapshot_date, "
+        f"{', '.join(f'old.{column}' for column in COPIED_COLUMNS['pantry_items'])} "
+        f"FROM pantry_items_unpartitioned AS old JOIN pantry_states USING (pantry_state_id)"
+    )
+    for table in PANTRY_TABLES[1:]:
+        columns = ', '.join(COPIED_COLUMNS[table])
+        op.execute(
+            f"INSERT INTO {table} (pantry_item_id, snapshot_date, {columns}) "
+            f"SELECT old.pantry_item_id, pantry_items.snapshot_date, "
+            f"{', '.join(f'old.{column}' for column in COPIED_COLUMNS[table])} "
+            f"FROM {table}_unpartitioned AS old JOIN pantry_items USING (pantry_item_id)"
+        )
+
+    for table in reversed(PANTRY_TABLES):
+        op.drop_table(f'{table}_unpartitioned')
+
+
+def downgrade() -> None:
+    for table in PANTRY_TABLES:
+        for index, _ in SECONDARY_INDEXES.get(table, []):
+            op.drop_index(op.f(index), table_name=table)
+        op.rename_table(table, f'{table}_partitioned')
+        op.execute(f'ALTER INDEX {table}_pkey RENAME TO {table}_partitioned_pkey')
+
+    _create_plain_tables()
+
+    for table in PANTRY_TABLES:
+        columns = ', '.join(['pantry_item_id', *COPIED_COLUMNS[table]])
+        op.execute(f'INSERT INTO {table} ({columns}) SELECT {columns} FROM {table}_partitioned')
+
+    # Dropping a partitioned table drops its partitions with it
+    for table in reversed(PANTRY_TABLES):
+        op.drop_table(f'{table}_partitioned')
+
+    op.drop_index(op.f('ix_pantry_states_snapshot_date'), table_name='pantry_states')
+    op.drop_column('pantry_states', 'snapshot_date')
+
+
+def _create_partitioned_tables() -> None:
+    op.create_table('pantry_items',
+    sa.Column('pantry_item_id', sa.UUID(), nullable=False),
+    sa.Column('snapshot_date', sa.Date(), nullable=False),
+    sa.Column('pantry_state_id', sa.UUID(), nullable=False),
+    sa.Column('description', sa.String(), nullable=True),
+    sa.Column('units', sa.String(), nullable=False),
+    sa.Column('amount', sa.DECIMAL(precision=10, scale=2), nullable=False),
+    sa.Column('is_prepped_and_ready', sa.Boolean(), nullable=False),
+    sa.Column('brand_name', sa.String(), nullable=True),
+    sa.ForeignKeyConstraint(['pantry_state_id'], ['pantry_states.pantry_state_id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('pantry_item_id', 'snapshot_date'),
+    postgresql_partition_by='RANGE (snapshot_date)',
+    )
+    op.create_table('pantry_item_data_sources',
+    sa.Column('pantry_item_id', sa.UUID(), nullable=False),
+    sa.Column('snapshot_date', sa.Date(), nullable=False),
+    sa.Column('culops_culinary_ingredient_id', sa.BigInteger(), nullable=False),
+    sa.Column('culops_culinary_ingredient_specification_id', sa.BigInteger(), nullable=False),
+    sa.ForeignKeyConstraint(
+        ['pantry_item_id', 'snapshot_date'],
+        ['pantry_items.pantry_item_id', 'pantry_items.snapshot_date'],
+        ondelete='CASCADE',
+    ),
+    sa.PrimaryKeyConstraint('pantry_item_id', 'snapshot_date'),
+    postgresql_partition_by='RANGE (snapshot_date)',
+    )
+    op.create_table('pantry_item_costs',
+    sa.Column('pantry_item_id', sa.UUID(), nullable=False),
+    sa.Column('applied_from', sa.String(), nullable=False),
+    sa.Column('applied_until', sa.String(), nullable=False),
+    sa.Column('snapshot_date', sa.Date(), nullable=False),
+    sa.Column('production_cost_us_dollars', sa.DECIMAL(precision=10, scale=2), nullable=False),
+    sa.ForeignKeyConstraint(
+        ['pantry_item_id', 'snapshot_date'],
+        ['pantry_items.pantry_item_id', 'pantry_items.snapshot_date'],
+        ondelete='CASCADE',
+    ),
+    sa.PrimaryKeyConstraint('pantry_item_id', 'applied_from', 'applied_until', 'snapshot_date'),
+    postgresql_partition_by='RANGE (snapshot_date)',
+    )
+    op.create_table('pantry_item_availabilities',
+    sa.Column('pantry_item_id', sa.UUID(), nullable=False),
+    sa.Column('applied_from', sa.String(), nullable=False),
+    sa.Column('applied_until', sa.String(), nullable=False),
+    sa.Column('snapshot_date', sa.Date(), nullable=False),
+    sa.ForeignKeyConstraint(
+        ['pantry_item_id', 'snapshot_date'],
+        ['pantry_items.pantry_item_id', 'pantry_items.snapshot_date'],
+        ondelete='CASCADE',
+    ),
+    sa.PrimaryKeyConstraint('pantry_item_id', 'applied_from', 'applied_until', 'snapshot_date'),
+    postgresql_partition_by='RANGE (snapshot_date)',
+    )
+    op.create_table('pantry_item_custom_fields',
+    sa.Column('pantry_item_id', sa.UUID(), nullable=False),
+    sa.Column('key', sa.String(), nullable=False),
+    sa.Column('snapshot_date', sa.Date(), nullable=False),
+    sa.Column('value', sa.String(), nullable=True),
+    sa.ForeignKeyConstraint(
+        ['pantry_item_id', 'snapshot_date'],
+        ['pantry_items.pantry_item_id', 'pantry_items.snapshot_date'],
+        ondelete='CASCADE',
+    ),
+    sa.PrimaryKeyConstraint('pantry_item_id', 'key', 'snapshot_date'),
+    postgresql_partition_by='RANGE (snapshot_date)',
+    )
+    _create_secondary_indexes()
+
+
+def _create_plain_tables() -> None:
+    op.create_table('pantry_items',
+    sa.Column('pantry_item_id', sa.UUID(), nullable=False),
+    sa.Column('pantry_state_id', sa.UUID(), nullable=False),
+    sa.Column('description', sa.String(), nullable=True),
+    sa.Column('units', sa.String(), nullable=False),
+    sa.Column('amount', sa.DECIMAL(precision=10, scale=2), nullable=False),
+    sa.Column('is_prepped_and_ready', sa.Boolean(), nullable=False),
+    sa.Column('brand_name', sa.String(), nullable=True),
+    sa.ForeignKeyConstraint(['pantry_state_id'], ['pantry_states.pantry_state_id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('pantry_item_id')
+    )
+    op.create_table('pantry_item_data_sources',
+    sa.Column('pantry_item_id', sa.UUID(), nullable=False),
+    sa.Column('culops_culinary_ingredient_id', sa.BigInteger(), nullable=False),
+    sa.Column('culops_culinary_ingredient_specification_id', sa.BigInteger(), nullable=False),
+    sa.ForeignKeyConstraint(['pantry_item_id'], ['pantry_items.pantry_item_id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('pantry_item_id')
+    )
+    op.create_table('pantry_item_costs',
+    sa.Column('pantry_item_id', sa.UUID(), nullable=False),
+    sa.Column('applied_from', sa.String(), nullable=False),
+    sa.Column('applied_until', sa.String(), nullable=False),
+    sa.Column('production_cost_us_dollars', sa.DECIMAL(precision=10, scale=2), nullable=False),
+    sa.ForeignKeyConstraint(['pantry_item_id'], ['pantry_items.pantry_item_id'], ),
+    sa.PrimaryKeyConstraint('pantry_item_id', 'applied_from', 'applied_until')
+    )
+    op.create_table('pantry_item_availabilities',
+    sa.Column('pantry_item_id', sa.UUID(), nullable=False),
+    sa.Column('applied_from', sa.String(), nullable=False),
+    sa.Column('applied_until', sa.String(), nullable=False),
+    sa.ForeignKeyConstraint(['pantry_item_id'], ['pantry_items.pantry_item_id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('pantry_item_id', 'applied_from', 'applied_until')
+    )
+    op.create_table('pantry_item_custom_fields',
+    sa.Column('pantry_item_id', sa.UUID(), nullable=False),
+    sa.Column('key', sa.String(), nullable=False),
+    sa.Column('value', sa.String(), nullable=True),
+    sa.ForeignKeyConstraint(['pantry_item_id'], ['pantry_items.pantry_item_id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('pantry_item_id', 'key')
+    )
+    _create_secondary_indexes()
+
+
+def _create_secondary_indexes() -> None:
+    for table, indexes in SECONDARY_INDEXES.items():
+        for index, column in indexes:
+            op.create_index(op.f(index), table, [column], unique=False)
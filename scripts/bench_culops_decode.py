@@ -0,0 +1,163 @@
+"""Microbenchmark for decoding and validating CulOps response bodies.
+
+Builds a ``/culinary-ingredient-specifications`` page and a ``/recipes`` list from the mocked CulOps responses, then
+times the old path, ``json.loads`` of the body followed by ``model_validate`` of models whose included resources are
+an attributes union tried member by member, against the current models, which pick each included resource's model
+by type and skip types no mapper reads. The current models are timed both through ``validate_response``, which
+decodes with orjson, and with ``model_validate_json`` straight from the bytes.
+
+    poetry run python -m scripts.bench_culops_decode --items 100 --recipes 50
+"""
+
+import argparse
+import copy
+import gc
+import json
+import statistics
+import time
+from collections.abc import Callable
+from typing import Any, cast
+
+from pydantic import BaseModel
+
+from scripts.bench_culops_included import synthetic_page
+from src.clients.culops.culops import CulOpsService
+from src.clients.culops.decoding import validate_response
+from src.clients.culops.mocks.response_data.recipe import recipe_data
+from src.clients.culops.models.culops_pantry import (
+    CulinaryIngredientAttribute,
+    CulinaryIngredientBrand,
+    CulinaryIngredientSpecificationCostAttribute,
+    CulopsAvailabilityAttribute,
+    CulopsData,
+    CulopsDataItem,
+    CulopsPantryPage,
+)
+from src.clients.culops.models.culops_recipe import (
+    CulinaryIngredientSpecificationAttributes,
+    CulinaryIngredientSpecificationRelationships,
+    CulopsRecipeData,
+    CulopsRecipeListResponse,
+    IngredientAttributes,
+    IngredientRelationships,
+    Links,
+)
+
+
+class LegacyIncludedItem(BaseModel):
+    type: str
+    id: str
+    attributes: (
+        CulinaryIngredientAttribute
+        | CulinaryIngredientSpecificationCostAttribute
+        | CulopsAvailabilityAttribute
+        | CulinaryIngredientBrand
+    )
+
+
+class LegacyCulopsData(BaseModel):
+    data: list[CulopsDataItem]
+    included: list[LegacyIncludedItem]
+
+
+class LegacyIncludedData(BaseModel):
+    id: str
+    type: str
+    links: Links
+    attributes: IngredientAttributes | CulinaryIngredientSpecificationAttributes
+    relationships: IngredientRelationships | CulinaryIngredientSpecificationRelationships
+
+
+class LegacyRecipeListResponse(BaseModel):
+    data: list[CulopsRecipeData]
+    included: list[LegacyIncludedData] | None = None
+
+
+def synthetic_recipes(recipe_count: int) -> dict[str, Any]:
+    """A recipe list of ``recipe_count`` copies of the mocked recipe, each with its own included resources."""
+    data, included = [], []
+    for n in range(recipe_count):
+        recipe = copy.deepcopy(recipe_data)
+        recipe["data"]["id"] = str(n + 1)
+        for resource in recipe["included"]:
+            resource["id"] = f"{n + 1}-{resource['id']}"
+        for relationship in recipe["data"]["relationships"]["ingredients"]["data"]:
+            relationship["id"] = f"{n + 1}-{relationship['id']}"
+        for resource in recipe["included"]:
+            specification = resource.get("relationships", {}).get("culinary-ingredient-specification", {})
+            if specification.get("data"):
+                specification["data"]["id"] = f"{n + 1}-{specification['data']['id']}"
+        data.append(recipe["data"])
+        included.extend(recipe["included"])
+    return {"data": data, "included": included}
+
+
+def timed(fn: Callable[[], Any], rounds: int) -> list[float]:
+    # Like timeit, keep collector pauses triggered by earlier rounds' garbage out of the timings
+    timings = []
+    gc.disable()
+    try:
+        for _ in range(rounds):
+            started = time.perf_counter()
+            fn()
+            timings.append(time.perf_counter() - started)
+    finally:
+        gc.enable()
+    return timings
+
+
+def report(title: str, results: dict[str, list[float]]) -> None:
+    print(title)
+    for name, timings in results.items():
+        print(f"  {name:<30} best {min(timings) * 1000:8.2f}ms median {statistics.median(timings) * 1000:8.2f}ms")
+    baseline, fast_path = min(results["json.loads + model_validate"]), min(results["validate_response"])
+    print(f"  validate_response speedup over json.loads + model_validate: {baseline / fast_path:.2f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=100)
+    parser.add_argument("--recipes", type=int, default=50)
+    parser.add_argument("--rounds", type=int, default=50)
+    args = parser.parse_args()
+
+    pantry_body = json.dumps(synthetic_page(args.items)).encode()
+    recipes_body = json.dumps(synthetic_recipes(args.recipes)).encode()
+
+    # Both paths must map to the same pantry items before their timings mean anything
+    # The legacy models only differ in how included attributes validate, so the mapper reads them the same way
+    legacy_page = cast(CulopsData, LegacyCulopsData.model_validate(json.loads(pantry_body)))
+    legacy_items = CulOpsService._map_pantry_items(legacy_page, None, None)
+    fast_items = CulOpsService._map_pantry_items(validate_response(CulopsPantryPage, pantry_body), None, None)
+    assert [item.model_dump(exclude={"id"}) for item in legacy_items] == [
+        item.model_dump(exclude={"id"}) for item in fast_items
+    ]
+
+    pantry_results = {
+        "json.loads + model_validate": timed(
+            lambda: LegacyCulopsData.model_validate(json.loads(pantry_body)), args.rounds
+        )
+    }
+    recipe_results = {
+        "json.loads + model_validate": timed(
+            lambda: LegacyRecipeListResponse.model_validate(json.loads(recipes_body)), args.rounds
+        )
+    }
+    pantry_results["model_validate_json"] = timed(
+        lambda: CulopsPantryPage.model_validate_json(pantry_body), args.rounds
+    )
+    recipe_results["model_validate_json"] = timed(
+        lambda: CulopsRecipeListResponse.model_validate_json(recipes_body), args.rounds
+    )
+    pantry_results["validate_response"] = timed(lambda: validate_response(CulopsPantryPage, pantry_body), args.rounds)
+    recipe_results["validate_response"] = timed(
+        lambda: validate_response(CulopsRecipeListResponse, recipes_body), args.rounds
+    )
+
+    rounds = f"best of {args.rounds} rounds"
+    report(f"pantry page: {args.items} items, {len(pantry_body) // 1024} KiB, {rounds}", pantry_results)
+    report(f"recipe list: {args.recipes} recipes, {len(recipes_body) // 1024} KiB, {rounds}", recipe_results)
+
+
+if __name__ == "__main__":
+    main()
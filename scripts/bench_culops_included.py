@@ -0,0 +1,88 @@
+"""Microbenchmark for resolving JSON:API ``included`` resources in CulOps culinary ingredient specification pages.
+
+Builds one large ``/culinary-ingredient-specifications`` page from the mocked CulOps responses, then resolves the
+culinary ingredient of every item the way ``CulOpsService.get_recipe_pantry_item_data`` used to, with a scan of
+``included`` per item, and through the shared ``JsonApiIndex``. Parsing the page is timed too for scale.
+
+    poetry run python -m scripts.bench_culops_included --items 2000
+"""
+
+import argparse
+import copy
+import statistics
+import time
+from collections.abc import Callable
+from typing import Any
+
+from src.clients.culops.mocks.response_data.culinary_ingredient_specs import culinary_ingredient_specifications
+from src.clients.culops.models.culops_pantry import CulopsData, CulopsIncludedItem
+from src.clients.culops.models.jsonapi import JsonApiIndex
+
+
+def synthetic_page(item_count: int) -> dict[str, Any]:
+    """A page of ``item_count`` specifications cloned from the mocks, each with its own included resources."""
+    data, included = [], []
+    for n in range(item_count):
+        template = copy.deepcopy(culinary_ingredient_specifications[n % len(culinary_ingredient_specifications)])
+        ids = {resource["id"]: str(1_000_000 * (n + 1) + index) for index, resource in enumerate(template["included"])}
+
+        spec = template["data"]
+        spec["id"] = str(n + 1)
+        for relationship in spec["relationships"].values():
+            identifiers = relationship["data"] if isinstance(relationship["data"], list) else [relationship["data"]]
+            for identifier in identifiers:
+                identifier["id"] = ids.get(identifier["id"], identifier["id"])
+        for resource in template["included"]:
+            resource["id"] = ids[resource["id"]]
+
+        data.append(spec)
+        included.extend(template["included"])
+    return {"data": data, "included": included, "links": {}}
+
+
+def resolve_by_scan(page: CulopsData) -> list[CulopsIncludedItem]:
+    ingredients = []
+    for item in page.data:
+        item_ingredient_id = item.relationships.culinary_ingredient.data.id
+        ingredients.append(next(i for i in page.included if i.id == item_ingredient_id))
+    return ingredients
+
+
+def resolve_by_index(page: CulopsData) -> list[CulopsIncludedItem]:
+    included_index = JsonApiIndex(page.included)
+    return [included_index.resolve(item.relationships.culinary_ingredient.data) for item in page.data]
+
+
+def timed(fn: Callable[[], Any], rounds: int) -> list[float]:
+    timings = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=2000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    res_json = synthetic_page(args.items)
+    page = CulopsData.model_validate(res_json)
+    assert resolve_by_scan(page) == resolve_by_index(page)
+
+    results = {
+        "parse page": timed(lambda: CulopsData.model_validate(res_json), args.rounds),
+        "scan included": timed(lambda: resolve_by_scan(page), args.rounds),
+        "JsonApiIndex": timed(lambda: resolve_by_index(page), args.rounds),
+    }
+
+    print(f"{args.items} items, {len(page.included)} included resources, best of {args.rounds} rounds:")
+    for name, timings in results.items():
+        print(f"  {name:<14} best {min(timings) * 1000:9.2f}ms median {statistics.median(timings) * 1000:9.2f}ms")
+    print(f"  index speedup over scan: {min(results['scan included']) / min(results['JsonApiIndex']):.0f}x")
+
+
+if __name__ == "__main__":
+    main()
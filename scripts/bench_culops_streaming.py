@@ -0,0 +1,83 @@
+"""Peak memory of reading one CulOps pantry page whole versus streaming it, across page sizes.
+
+Builds ``/culinary-ingredient-specifications`` pages from the mocked CulOps responses and reads each the way
+``CulOpsService._fetch_pantry_page`` does: whole, by joining the body and validating it as a ``CulopsPantryPage``,
+or streamed, by spooling the body and mapping its specifications one at a time through ``StreamedPantryPage``.
+Both build the same list of PantryItems, so the difference is everything held besides the output.
+
+    poetry run python -m scripts.bench_culops_streaming --items 100 1000 5000
+"""
+
+import argparse
+import json
+import time
+import tracemalloc
+from collections.abc import Callable, Iterator
+from tempfile import SpooledTemporaryFile
+from typing import Any
+
+from scripts.bench_culops_included import synthetic_page
+from src.clients.culops.culops import CulOpsService
+from src.clients.culops.decoding import validate_response
+from src.clients.culops.models.culops_pantry import CulopsPantryPage
+from src.clients.culops.streaming import (
+    READ_CHUNK_BYTES,
+    SPOOL_MAX_MEMORY_BYTES,
+    StreamedPantryPage,
+)
+from src.services.models.pantry import PantryItem
+
+MIB = 1024 * 1024
+
+
+def body_chunks(body: bytes) -> Iterator[bytes]:
+    """The body as ``Response.iter_content`` hands it over, so neither mode starts out holding all of it."""
+    view = memoryview(body)
+    for start in range(0, len(body), READ_CHUNK_BYTES):
+        yield bytes(view[start : start + READ_CHUNK_BYTES])
+
+
+def read_whole(body: bytes) -> list[PantryItem]:
+    page = validate_response(CulopsPantryPage, b"".join(body_chunks(body)))
+    return CulOpsService._map_pantry_items(page, None, None)
+
+
+def read_streamed(body: bytes) -> list[PantryItem]:
+    with SpooledTemporaryFile(max_size=SPOOL_MAX_MEMORY_BYTES) as spooled:
+        for chunk in body_chunks(body):
+            spooled.write(chunk)
+        return list(CulOpsService._map_streamed_pantry_items(StreamedPantryPage(spooled)))
+
+
+def measured(fn: Callable[[bytes], list[PantryItem]], body: bytes) -> tuple[float, float, float]:
+    """Peak traced memory while reading, memory still held by the returned items, and untraced wall time."""
+    tracemalloc.start()
+    items = fn(body)
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert items
+    del items
+
+    started = time.perf_counter()
+    fn(body)
+    return peak / MIB, retained / MIB, time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, nargs="+", default=[100, 1000, 5000])
+    args = parser.parse_args()
+
+    print(f"{'items':>6} {'body':>9}  {'mode':<8} {'peak':>9} {'items held':>11} {'overhead':>9} {'time':>9}")
+    for item_count in args.items:
+        body = json.dumps(synthetic_page(item_count)).encode()
+        results: dict[str, Any] = {"whole": measured(read_whole, body), "streamed": measured(read_streamed, body)}
+        for mode, (peak, retained, elapsed) in results.items():
+            print(
+                f"{item_count:>6} {len(body) / MIB:>7.1f}MB  {mode:<8} {peak:>7.1f}MB {retained:>9.1f}MB "
+                f"{peak - retained:>7.1f}MB {elapsed * 1000:>7.0f}ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""Request-overhead microbenchmark for the HTTP middleware stack.
+
+Compares the previous BaseHTTPMiddleware wrappers with the pure ASGI middleware now installed in src/main.py, using
+an in-process ASGI transport so only framework overhead is measured.
+
+    poetry run python -m scripts.bench_middleware --requests 5000
+"""
+
+import argparse
+import asyncio
+import base64
+import json
+import statistics
+import time
+from collections.abc import Callable
+
+import httpx
+import jwt
+from fastapi import APIRouter, Depends, FastAPI, Request, Response
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.routing import Match
+
+from src.core.middleware.partner_id_middleware import PartnerIDMiddleware, partner_id_ctx
+from src.core.middleware.rollbar_middleware import RollbarMiddleware
+from src.dependancies.route_context import set_route_logger_context
+from src.utils.logger_context import set_logger_context_value
+
+
+class LegacyPartnerIDMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        payload = jwt.decode(
+            request.headers["authorization"].split()[1], options={"verify_signature": False, "verify_exp": False}
+        )
+        token = partner_id_ctx.set(payload["custom:partner_id"])
+        try:
+            return await call_next(request)
+        finally:
+            partner_id_ctx.reset(token)
+
+
+class LegacyRouteContextMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        for route in request.app.router.routes:
+            match, child_scope = route.matches(request.scope)
+            if match == Match.FULL:
+                for key, value in child_scope.get("path_params", {}).items():
+                    set_logger_context_value(key, value)
+                break
+        return await call_next(request)
+
+
+class LegacyRollbarMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        return await call_next(request)
+
+
+def _routes(router: APIRouter) -> APIRouter:
+    # A few sibling routes so route matching has something to scan, as in the real router
+    for index in range(20):
+        router.add_api_route(f"/v1/resource-{index}/{{item_id}}", lambda item_id: {"id": item_id}, methods=["GET"])
+
+    @router.get("/v1/recipes/{recipe_id}")
+    async def get_recipe(recipe_id: str) -> dict[str, str]:
+        return {"id": recipe_id}
+
+    return router
+
+
+def legacy_app() -> FastAPI:
+    app = FastAPI()
+    app.include_router(_routes(APIRouter()))
+    app.add_middleware(LegacyPartnerIDMiddleware)
+    app.add_middleware(LegacyRouteContextMiddleware)
+    app.add_middleware(LegacyRollbarMiddleware)
+    return app
+
+
+def asgi_app() -> FastAPI:
+    app = FastAPI()
+    app.include_router(_routes(APIRouter(dependencies=[Depends(set_route_logger_context)])))
+    app.add_middleware(PartnerIDMiddleware)
+    app.add_middleware(RollbarMiddleware)
+    return app
+
+
+def _token() -> str:
+    def b64u(data: dict) -> str:
+        return base64.urlsafe_b64encode(json.dumps(data).encode()).decode().rstrip("=")
+
+    return f"{b64u({'alg': 'RS256', 'typ': 'JWT'})}.{b64u({'custom:partner_id': 'BA-MAIN'})}.c2ln"
+
+
+async def run(app: FastAPI, requests: int) -> list[float]:
+    headers = {"Authorization": f"Bearer {_token()}"}
+    timings: list[float] = []
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+        for _ in range(min(requests // 10, 200)):
+            await client.get("/v1/recipes/warmup", headers=headers)
+        for index in range(requests):
+            started = time.perf_counter()
+            await client.get(f"/v1/recipes/{index}", headers=headers)
+            timings.append((time.perf_counter() - started) * 1_000_000)
+    return timings
+
+
+def _report(name: str, timings: list[float]) -> None:
+    quantiles = statistics.quantiles(timings, n=100)
+    print(f"{name:<8} p50={quantiles[49]:8.1f}us  p99={quantiles[98]:8.1f}us  mean={statistics.fmean(timings):8.1f}us")
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--requests", type=int, default=2000)
+    args = arg_parser.parse_args()
+
+    _report("legacy", asyncio.run(run(legacy_app(), args.requests)))
+    _report("asgi", asyncio.run(run(asgi_app(), args.requests)))
+
+
+if __name__ == "__main__":
+    main()
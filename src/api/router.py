@@ -1,10 +1,11 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 
 from src.api import health
 from src.api.routes.v1.orders import routes as order
 from src.api.routes.v1.recipes import routes as recipe
+from src.dependancies.route_context import set_route_logger_context
 
-api_router = APIRouter()
+api_router = APIRouter(dependencies=[Depends(set_route_logger_context)])
 
 api_router.include_router(health.router)
 
@@ -57,12 +57,15 @@ class Pantry(BaseModel):
     ingredients_available_until: str = Field(alias="ingredientsAvailableUntil", default=None)
     pantry_state_timestamp: datetime = Field(alias="pantryStateTimestamp")
     pantry_items: list[PantryItem] = Field(alias="pantryItems")
+    # A fresh pantry's total is taken from CulOps' pagination while the rest of it is crawled; the stored total of
+    # its pantry_state_id is exact once the crawl is complete
+    total_count_estimated: bool = Field(alias="totalCountEstimated", default=False)
 
 
 class Pagination(BaseModel):
     total: int
     per_page: int
-    current_page: int
+    current_page: int | None = None
     total_pages: int
 
 
@@ -82,6 +85,20 @@ class GetPantry(BaseModel):
     pantry: Pantry
 
 
+class PantrySnapshot(BaseModel):
+    model_config = ConfigDict(validate_by_name=True)
+
+    pantry_state_id: str = Field(alias="pantryStateId")
+    status: str
+    pages_fetched: int = Field(alias="pagesFetched")
+    item_count: int | None = Field(alias="itemCount", default=None)
+    finished_at: datetime | None = Field(alias="finishedAt", default=None)
+
+
+class GetPantrySnapshot(BaseModel):
+    snapshot: PantrySnapshot
+
+
 class RecipeIngredient(BaseModel):
     model_config = ConfigDict(validate_by_name=True)
     pantry_item_id: UUID = Field(alias="pantryItemId")
@@ -1,23 +1,23 @@
+from collections.abc import Callable
+from datetime import datetime
+
 from fastapi import APIRouter, Depends, HTTPException, Request
 from pydantic import BaseModel, Field
-from datetime import datetime
 
-from src.api.routes.v1.models import ErrorResponse, GetPantry
+from src.api.routes.v1.models import ErrorResponse, GetPantry, GetPantrySnapshot, Links, PantrySnapshot
 from src.core.config import Settings
 from src.core.exceptions import NotFoundException
 from src.core.middleware.partner_id_middleware import partner_id_ctx
-from src.dependancies.culops_client import get_culops_client
-from src.dependancies.pantry_db import get_pantry_db
-from src.dependancies.partner_db import get_partner_db
-from src.dependancies.recipe_db import get_recipes_db
-from src.dependancies.token_service import get_token_service
-from src.interfaces.culops_client_interface import CulopsClientInterface
-from src.interfaces.pantry_db_interface import PantryDBInterface
-from src.interfaces.partner_repo_interface import PartnerRepoInterface
-from src.interfaces.recipes_repo_interface import RecipesRepoInterface
-from src.interfaces.token_service_interface import TokenServiceInterface
-from src.services.pantry import PantryService
-from src.services.partner import PartnerService
+from src.dependancies.culops_client import get_async_culops_client
+from src.dependancies.pantry_cache import get_pantry_cache
+from src.dependancies.pantry_crawl_service import get_pantry_crawl_service_factory
+from src.dependancies.pantry_db import get_async_pantry_db
+from src.dependancies.partner_db import get_async_partner_db
+from src.interfaces.culops_client_interface import AsyncCulopsClientInterface
+from src.interfaces.pantry_db_interface import AsyncPantryDBInterface
+from src.interfaces.partner_repo_interface import AsyncPartnerRepoInterface
+from src.services.pantry import AsyncPantryService, PantryService
+from src.services.pantry_cache import PantryResponseCache
 from src.utils.paginator import PaginatedResponse, paginate_response
 
 router = APIRouter(
@@ -39,6 +39,7 @@ class PantryQueryParams(BaseModel):
     cost_end_date: datetime | None = Field(default=None, alias="costEndDate")
     pantry_state_id: str = Field(default="", alias="pantryStateId")
     brand: str = Field(default="")
+    after: str | None = Field(default=None)
 
 
 @router.get(
@@ -50,31 +51,35 @@ class PantryQueryParams(BaseModel):
         500: {"model": ErrorResponse, "description": "Internal Server Error"},
     },
 )
-def get_pantry(
+async def get_pantry(
     request: Request,
     params: PantryQueryParams = Depends(),
-    pantry_db: PantryDBInterface = Depends(get_pantry_db),
-    partner_db: PartnerRepoInterface = Depends(get_partner_db),
-    recipe_db: RecipesRepoInterface = Depends(get_recipes_db),
-    token_svc: TokenServiceInterface = Depends(get_token_service),
-    culops_client: CulopsClientInterface = Depends(get_culops_client),
+    async_pantry_db: AsyncPantryDBInterface = Depends(get_async_pantry_db),
+    async_partner_db: AsyncPartnerRepoInterface = Depends(get_async_partner_db),
+    async_culops_client: AsyncCulopsClientInterface = Depends(get_async_culops_client),
+    crawl_service_factory: Callable[[], PantryService] = Depends(get_pantry_crawl_service_factory),
+    pantry_cache: PantryResponseCache | None = Depends(get_pantry_cache),
 ) -> PaginatedResponse[GetPantry]:
     try:
         partner_id = partner_id_ctx.get()
-        partner_service = PartnerService(partner_id=partner_id or "", partner_db=partner_db)
         # TODO uncomment below, commented out for staging testing while db migrations are broken
-        # if not partner_service.validate_partner_id():
+        # if not await async_partner_db.find_partner_id(partner_id or ""):
         #     raise AccessDeniedException(f"Failed to find partner {partner_id}")
 
-        pantry_service = PantryService(
-            pantry_db=pantry_db, culops_service=culops_client, partner_service=partner_service
+        # The sync crawl service is only built when a fresh pantry needs the rest of it cached in the background
+        pantry_service = AsyncPantryService(
+            pantry_db=async_pantry_db,
+            culops_service=async_culops_client,
+            partner_db=async_partner_db,
+            crawl_service_factory=crawl_service_factory,
+            cache=pantry_cache,
         )
-        all_brands = partner_service.get_branding()
+        all_brands = await async_partner_db.get_branding(partner_id or "")
 
         if params.brand and not any(brand.name == params.brand for brand in all_brands):
             raise NotFoundException(f"Brand {params.brand} not found")
 
-        pantry, item_count = pantry_service.get_pantry(
+        pantry, item_count = await pantry_service.get_pantry(
             partner_id=partner_id or "",
             pantry_state_id=params.pantry_state_id,
             available_from=params.available_from,
@@ -84,8 +89,13 @@ def get_pantry(
             brand_name=params.brand or "",
             page_size=params.page_size,
             page=params.page,
+            after=params.after,
         )
 
+        next_cursor = None
+        if params.after is not None and len(pantry.pantry_items) == params.page_size:
+            next_cursor = pantry.pantry_items[-1].id
+
         return paginate_response(
             items=pantry.pantry_items,
             item_count=item_count,
@@ -100,6 +110,39 @@ def get_pantry(
             },
             data_model=GetPantry(pantry=pantry),
             list_attr_path="pantry.pantry_items",
+            cursor=params.after,
+            next_cursor=next_cursor,
+        )
+
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from None
+
+
+@router.get(
+    "/{pantry_state_id}/status",
+    responses={
+        400: {"model": ErrorResponse, "description": "Bad request"},
+        401: {"model": ErrorResponse, "description": "Unauthorized"},
+        404: {"model": ErrorResponse, "description": "Not found"},
+        500: {"model": ErrorResponse, "description": "Internal Server Error"},
+    },
+)
+async def get_pantry_snapshot_status(
+    request: Request,
+    pantry_state_id: str,
+    async_pantry_db: AsyncPantryDBInterface = Depends(get_async_pantry_db),
+) -> PaginatedResponse[GetPantrySnapshot]:
+    """Report how far the background crawl for a pantry snapshot has got, so clients know when totals are exact."""
+    try:
+        partner_id = partner_id_ctx.get()
+        progress = await async_pantry_db.get_pantry_snapshot_progress(pantry_state_id, partner_id or "")
+        if progress is None:
+            raise NotFoundException(f"Pantry state {pantry_state_id} not found for partner {partner_id}")
+
+        return PaginatedResponse(
+            data=GetPantrySnapshot(snapshot=PantrySnapshot.model_validate(progress.model_dump())),
+            meta=None,
+            links=Links(self=str(request.url)),
         )
 
     except ValueError as e:
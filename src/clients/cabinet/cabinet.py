@@ -5,6 +5,7 @@ from pydantic import ValidationError
 from requests import HTTPError, RequestException
 
 from src.clients.cabinet.models import CabinetCycleResponse, CabinetResponse
+from src.clients.reference_data_cache import ReferenceDataCache
 from src.core.config import settings
 from src.core.exceptions import ServerError
 from src.interfaces.cabinet_client_interface import CabinetClientInterface
@@ -15,11 +16,21 @@ class CabinetService(CabinetClientInterface):
     def __init__(self) -> None:
         self.host = settings.CABINET_API_HOST
         self.session = requests.Session()
+        self.reference_cache = ReferenceDataCache()
 
     def get_recipe_slots(
         self,
         filter_date: datetime | None = None,
     ) -> list[RecipeSlotCode]:
+        key = filter_date.strftime("%Y-%m-%d") if filter_date else "current"
+        ttl_seconds = self.reference_cache.cycle_ttl_seconds(filter_date.date()) if filter_date else None
+        slots = self.reference_cache.cabinet_recipe_slots.get_or_load(
+            key, lambda: self._fetch_recipe_slots(filter_date), ttl_seconds=ttl_seconds
+        )
+        # The cached list is shared; callers get their own
+        return list(slots)
+
+    def _fetch_recipe_slots(self, filter_date: datetime | None) -> list[RecipeSlotCode]:
         try:
             res_json = self.session.get(
                 url=f"https://{self.host}/recipe-slots",
@@ -47,6 +58,13 @@ class CabinetService(CabinetClientInterface):
         return results
 
     def find_cycle(self, cycle_date: datetime) -> bool:
+        return self.reference_cache.cabinet_cycles.get_or_load(
+            cycle_date.strftime("%Y-%m-%d"),
+            lambda: self._fetch_cycle(cycle_date),
+            ttl_seconds=self.reference_cache.cycle_ttl_seconds(cycle_date.date()),
+        )
+
+    def _fetch_cycle(self, cycle_date: datetime) -> bool:
         try:
             res = self.session.get(
                 url=f"https://{self.host}/cycles",
@@ -0,0 +1,90 @@
+import asyncio
+from datetime import datetime
+
+import httpx
+from pydantic import ValidationError
+
+from src.clients.culops.culops import CulOpsService
+from src.clients.culops.decoding import validate_response
+from src.clients.culops.models.culops_pantry import CulopsPantryPage
+from src.clients.culops.transport import CulOpsTransport
+from src.core.config import settings
+from src.core.exceptions import ServerError
+from src.interfaces.culops_client_interface import AsyncCulopsClientInterface
+from src.interfaces.token_service_interface import TokenServiceInterface
+from src.services.models.pantry import PantryItem, PantryPageInfo
+from src.services.token import TokenName
+from src.utils.logger import ServiceLogger
+
+log = ServiceLogger().get_logger(__name__)
+
+
+class AsyncCulOpsService(AsyncCulopsClientInterface):
+    """Non-blocking CulOps reads for the request path, sharing the pooled client held by CulOpsTransport."""
+
+    def __init__(self, token_svc: TokenServiceInterface) -> None:
+        self.host = settings.CULOPS_API_HOST
+        self.api_path = "/api"
+        self.transport = CulOpsTransport()
+        self.client = self.transport.async_client
+        self.token_svc = token_svc
+        self.fetch_size = settings.CULOPS_PANTRY_FETCH_SIZE
+
+    async def get_partner_culops_pantry_page(
+        self,
+        available_from: datetime | None = None,
+        available_until: datetime | None = None,
+        partner_id: str = "",
+        page: int = 1,
+        page_size: int | None = None,
+    ) -> tuple[list[PantryItem], PantryPageInfo]:
+        token = await self._get_culops_token()
+        url = f"https://{self.host}{self.api_path}/culinary-ingredient-specifications"
+
+        headers = {"Authorization": f"Bearer {token}"}
+        params: dict[str, str | int] = {
+            "include": "culinary-ingredient,culinary-ingredient-specification-costs",
+            "page[number]": page,
+            "page[size]": page_size if page_size is not None else self.fetch_size,
+        }
+
+        try:
+            # Identical page requests in flight at the same time share one CulOps call, its retries and its response
+            res = await self.transport.coalesce_async(
+                "GET",
+                url,
+                headers,
+                params,
+                lambda: self.transport.retry_async(lambda: self.client.get(url, headers=headers, params=params)),
+            )
+            res.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            raise ServerError(
+                "failed to fetch culinary ingredient specifications for partner pantry request"
+                f" with status code {e.response.status_code} and message: {e.response.text}"
+            ) from e
+        except httpx.HTTPError as e:
+            raise ServerError("failed to fetch culinary ingredient specifications for partner pantry request") from e
+
+        try:
+            culops_pantry_data = validate_response(CulopsPantryPage, res.content)
+        except ValidationError as e:
+            raise ServerError("Failed to parse culinary ingredient specifications response data") from e
+
+        pantry_items = CulOpsService._map_pantry_items(culops_pantry_data, available_from, available_until)
+        page_info = CulOpsService._page_info(culops_pantry_data)
+
+        log.info(
+            f"culops get pantry: fetched page {page}",
+            extra={
+                "partner_id": partner_id,
+                "page": page,
+                "items_count": len(pantry_items),
+                "has_next": page_info.has_next,
+            },
+        )
+        return pantry_items, page_info
+
+    async def _get_culops_token(self) -> str:
+        # The token service caches in-process but may fall back to a blocking parameter store call
+        return await asyncio.to_thread(self.token_svc.get_token, TokenName.CUL_OPS_ACCESS_TOKEN)
@@ -1,24 +1,43 @@
-from collections.abc import Iterator
-from datetime import UTC, datetime, timedelta
+from collections import Counter
+from collections.abc import Callable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from datetime import UTC, date, datetime, timedelta
 from enum import Enum
-from uuid import uuid4
+from typing import Any
+from urllib.parse import parse_qs, urlparse
+from uuid import UUID, uuid4
 
-import requests
 from pydantic import ValidationError
+from requests import Response
 from requests.exceptions import HTTPError, RequestException
 
+from src.clients.culops.decoding import validate_response
 from src.clients.culops.models.culops_pantry import (
     CulinaryIngredientBrand,
     CulinaryIngredientSpecificationCostAttribute,
     CulopsData,
+    CulopsDataItem,
+    CulopsMappedIncludedItem,
+    CulopsPagination,
+    CulopsPantryPage,
 )
 from src.clients.culops.models.culops_recipe import (
     CulinaryIngredientSpecificationRelationships,
+    CulopsRecipeData,
     CulopsRecipeListResponse,
     CulopsRecipeUpdateResponse,
     IngredientRelationships,
+    MappedIncludedData,
     ResourceIdentifier,
 )
+from src.clients.culops.models.jsonapi import JsonApiIndex
+from src.clients.culops.streaming import (
+    PAGE_PARSE_ERRORS,
+    StreamedPantryPage,
+    spool_response_body,
+)
+from src.clients.culops.transport import CulOpsTransport
+from src.clients.reference_data_cache import CulopsRecipeSlots, ReferenceDataCache
 from src.core.config import settings
 from src.core.constants import PREPPED_AND_READY_CATEGORY
 from src.core.exceptions import RecipeNotFoundError, ServerError
@@ -35,6 +54,7 @@ from src.services.models.pantry import (
     PantryItemCustomField,
     PantryItemDataSource,
     PantryItemStatus,
+    PantryPageInfo,
 )
 from src.services.models.recipe import (
     CreateCulopsRecipeResponse,
@@ -44,6 +64,7 @@ from src.services.models.recipe import (
     Recipe,
     RecipeCardAssignment,
     RecipeConstraintTag,
+    RecipeRef,
     TagListType,
 )
 from src.services.token import TokenName
@@ -70,7 +91,9 @@ class CulOpsService(CulopsClientInterface):
     ) -> None:
         self.host = settings.CULOPS_API_HOST
         self.api_path = "/api"
-        self.session = requests.Session()
+        self.transport = CulOpsTransport()
+        self.session = self.transport.session
+        self.reference_cache = ReferenceDataCache()
         self.token_svc = token_svc
         self.partner_repo = partner_repo
         self.recipe_repo = recipe_repo
@@ -85,13 +108,17 @@ class CulOpsService(CulopsClientInterface):
         brand_name: str = "",
         page: int | None = None,
         page_size: int | None = None,
+        concurrency: int | None = None,
+        ordered: bool = True,
+        start_page: int = 1,
     ) -> Iterator[tuple[list[PantryItem], bool]]:
         token = self._get_culops_token()
 
-        # If page is specified, fetch only that page. Otherwise fetch all pages.
+        # If page is specified, fetch only that page. Otherwise fetch every page from start_page on.
         fetch_all_pages = page is None
-        current_page = page if page is not None else 1
+        current_page = page if page is not None else start_page
         actual_page_size = page_size if page_size is not None else self.fetch_size
+        max_workers = concurrency if concurrency is not None else settings.CULOPS_PANTRY_FETCH_CONCURRENCY
 
         log.info(
             "culops get pantry: starting fetch",
@@ -103,6 +130,7 @@ class CulOpsService(CulopsClientInterface):
                 "page_size": actual_page_size,
                 "page": current_page,
                 "fetch_all_pages": fetch_all_pages,
+                "concurrency": max_workers,
             },
         )
         if rollbar:
@@ -121,79 +149,194 @@ class CulOpsService(CulopsClientInterface):
             except Exception:
                 pass
 
-        while True:
-            url = f"https://{self.host}{self.api_path}/culinary-ingredient-specifications"
+        def fetch_page(page_number: int) -> tuple[list[PantryItem], CulopsPagination]:
+            return self._fetch_pantry_page(
+                token, page_number, actual_page_size, partner_id, available_from, available_until
+            )
 
-            try:
-                res = self.session.get(
-                    url=url,
-                    headers={"Authorization": f"Bearer {token}"},
-                    params={
-                        # NOTE: CulOps API does not support these filters - they are silently ignored
-                        # Filtering is done client-side in _map_pantry_items() instead
-                        # "brand_name": brand_name,
-                        # "available_from": available_from.strftime("%Y-%m-%d") if available_from else None,
-                        # "available_until": available_until.strftime("%Y-%m-%d") if available_until else None,
-                        "include": "culinary-ingredient,culinary-ingredient-specification-costs",
-                        "page[number]": current_page,
-                        "page[size]": actual_page_size,
-                    },
-                )
+        pantry_items, pagination = fetch_page(current_page)
+        has_next = bool(pagination.links.get("next"))
+
+        # If we're only fetching a specific page, or there is nothing after it, stop after yielding it
+        if not fetch_all_pages or not has_next:
+            yield pantry_items, has_next
+            return
+
+        last_page = self._get_last_page_number(pagination)
+        if last_page is None or last_page <= current_page or max_workers <= 1:
+            # Without a known last page we can only follow links.next one page at a time
+            yield pantry_items, has_next
+            while has_next:
+                current_page += 1
+                pantry_items, pagination = fetch_page(current_page)
+                has_next = bool(pagination.links.get("next"))
+                yield pantry_items, has_next
+            return
 
-                res.raise_for_status()
-                res_json = res.json()
+        yield pantry_items, True
+        yield from self._fetch_pantry_pages_concurrently(
+            fetch_page, list(range(current_page + 1, last_page + 1)), max_workers, ordered
+        )
 
-            except (HTTPError, RequestException) as e:
-                err_msg = "failed to fetch culinary ingredient specifications for partner pantry request"
-                if getattr(e, "response", None) is not None:
-                    status_code = e.response.status_code
-                    message = e.response.text
-                    err_msg += f" with status code {status_code} and message: {message}"
-                raise ServerError(err_msg) from e
+    def get_partner_culops_pantry_page(
+        self,
+        available_from: datetime | None = None,
+        available_until: datetime | None = None,
+        partner_id: str = "",
+        page: int = 1,
+        page_size: int | None = None,
+    ) -> tuple[list[PantryItem], PantryPageInfo]:
+        """Fetch one page of pantry items together with where it sits in the CulOps listing."""
+        token = self._get_culops_token()
+        pantry_items, pagination = self._fetch_pantry_page(
+            token,
+            page,
+            page_size if page_size is not None else self.fetch_size,
+            partner_id,
+            available_from,
+            available_until,
+        )
+        return pantry_items, self._page_info(pagination)
 
-            try:
-                culops_pantry_data = CulopsData.model_validate(res_json)
-                pantry_items = self._map_pantry_items(culops_pantry_data, available_from, available_until)
+    @staticmethod
+    def _fetch_pantry_pages_concurrently(
+        fetch_page: Callable[[int], tuple[list[PantryItem], CulopsPagination]],
+        pages: list[int],
+        max_workers: int,
+        ordered: bool,
+    ) -> Iterator[tuple[list[PantryItem], bool]]:
+        """Fetch pages with at most ``max_workers`` requests in flight, yielding in page order unless
+        ``ordered`` is False, in which case pages are yielded as they complete."""
+        executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="culops-pantry")
+        pending_pages = iter(pages)
+        in_flight: dict[Future, int] = {}
+        # Keep a small read-ahead window so a slow consumer doesn't buffer the whole pantry in memory
+        window = max_workers * 2
+
+        def submit_next() -> None:
+            next_page = next(pending_pages, None)
+            if next_page is not None:
+                in_flight[executor.submit(fetch_page, next_page)] = next_page
 
-                log.info(
-                    f"culops get pantry: fetched page {current_page}",
-                    extra={
+        try:
+            for _ in range(window):
+                submit_next()
+
+            remaining = len(pages)
+            while in_flight:
+                if ordered:
+                    future = min(in_flight, key=in_flight.__getitem__)
+                else:
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    future = next(iter(done))
+                del in_flight[future]
+                page_items, _ = future.result()
+                remaining -= 1
+                submit_next()
+                yield page_items, remaining > 0
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _fetch_pantry_page(
+        self,
+        token: str,
+        page_number: int,
+        page_size: int,
+        partner_id: str,
+        available_from: datetime | None,
+        available_until: datetime | None,
+    ) -> tuple[list[PantryItem], CulopsPagination]:
+        url = f"https://{self.host}{self.api_path}/culinary-ingredient-specifications"
+        stream = settings.CULOPS_PANTRY_STREAMING
+
+        try:
+            res = self._get(
+                url=url,
+                headers={"Authorization": f"Bearer {token}"},
+                params={
+                    # NOTE: CulOps API does not support these filters - they are silently ignored
+                    # Filtering is done client-side in _map_pantry_items() instead
+                    # "brand_name": brand_name,
+                    # "available_from": available_from.strftime("%Y-%m-%d") if available_from else None,
+                    # "available_until": available_until.strftime("%Y-%m-%d") if available_until else None,
+                    "include": "culinary-ingredient,culinary-ingredient-specification-costs",
+                    "page[number]": page_number,
+                    "page[size]": page_size,
+                },
+                stream=stream,
+            )
+            res.raise_for_status()
+            body = spool_response_body(res) if stream else None
+
+        except (HTTPError, RequestException) as e:
+            err_msg = "failed to fetch culinary ingredient specifications for partner pantry request"
+            if getattr(e, "response", None) is not None:
+                status_code = e.response.status_code
+                message = e.response.text
+                err_msg += f" with status code {status_code} and message: {message}"
+            raise ServerError(err_msg) from e
+
+        try:
+            if body is not None:
+                with body:
+                    streamed_page = StreamedPantryPage(body)
+                    pantry_items = list(self._map_streamed_pantry_items(streamed_page))
+                pagination = streamed_page.pagination
+            else:
+                culops_page = validate_response(CulopsPantryPage, res.content)
+                pantry_items = self._map_pantry_items(culops_page, available_from, available_until)
+                pagination = culops_page
+        except PAGE_PARSE_ERRORS as e:
+            raise ServerError("Failed to parse culinary ingredient specifications response data") from e
+
+        has_next = bool(pagination.links.get("next"))
+
+        log.info(
+            f"culops get pantry: fetched page {page_number}",
+            extra={
+                "partner_id": partner_id,
+                "page": page_number,
+                "items_count": len(pantry_items),
+                "has_next": has_next,
+            },
+        )
+        if rollbar:
+            try:
+                rollbar.report_message(
+                    f"culops get pantry: fetched page {page_number}",
+                    level="info",
+                    extra_data={
                         "partner_id": partner_id,
-                        "page": current_page,
+                        "page": page_number,
                         "items_count": len(pantry_items),
-                        "has_next": bool(res_json.get("links", {}).get("next")),
+                        "has_next": has_next,
                     },
                 )
-                if rollbar:
-                    try:
-                        rollbar.report_message(
-                            f"culops get pantry: fetched page {current_page}",
-                            level="info",
-                            extra_data={
-                                "partner_id": partner_id,
-                                "page": current_page,
-                                "items_count": len(pantry_items),
-                                "has_next": bool(res_json.get("links", {}).get("next")),
-                            },
-                        )
-                    except Exception:
-                        pass
-
-                has_next = bool(res_json.get("links", {}).get("next"))
-                yield pantry_items, has_next
-            except ValidationError as e:
-                raise ServerError("Failed to parse culinary ingredient specifications response data") from e
+            except Exception:
+                pass
 
-            # If we're only fetching a specific page, stop after yielding it
-            if not fetch_all_pages:
-                break
+        return pantry_items, pagination
 
-            # Otherwise, continue to next page if it exists
-            if not has_next:
-                break
+    @staticmethod
+    def _page_info(pagination: CulopsPagination) -> PantryPageInfo:
+        return PantryPageInfo(
+            has_next=bool(pagination.links.get("next")), last_page=CulOpsService._get_last_page_number(pagination)
+        )
 
-            current_page += 1
-        return
+    @staticmethod
+    def _get_last_page_number(pagination: CulopsPagination) -> int | None:
+        last_link = pagination.links.get("last")
+        if last_link:
+            page_numbers = parse_qs(urlparse(last_link).query).get("page[number]")
+            if page_numbers and page_numbers[0].isdigit():
+                return int(page_numbers[0])
+
+        meta = pagination.meta or {}
+        for key in ("total_pages", "total-pages", "page-count"):
+            value = meta.get(key)
+            if isinstance(value, int):
+                return value
+        return None
 
     def get_recipe_pantry_item_data(
         self,
@@ -218,27 +361,25 @@ class CulOpsService(CulopsClientInterface):
 
         try:
             while True:
-                res = self.session.get(url=url, headers={"Authorization": f"Bearer {token}"}, params=params)
+                res = self._get(url=url, headers={"Authorization": f"Bearer {token}"}, params=params)
                 res.raise_for_status()
 
-                res_json = res.json()
-
                 try:
-                    culops_pantry_data = CulopsData.model_validate(res_json)
+                    culops_pantry_data = validate_response(CulopsPantryPage, res.content)
                 except ValidationError as e:
                     raise ServerError("Failed to parse culinary ingredient specifications response data") from e
                 included = culops_pantry_data.included
+                included_index: JsonApiIndex[CulopsMappedIncludedItem] = JsonApiIndex(included)
                 data = culops_pantry_data.data
 
                 for item in data:
                     availabilities = []
 
-                    item_ingredient_id = item.relationships.culinary_ingredient.data.id
-                    ingredients = list(filter(lambda i: i.id == item_ingredient_id, included))
-                    ingredient = ingredients[0]
+                    item_ingredient_ref = item.relationships.culinary_ingredient.data
+                    ingredient = included_index.resolve(item_ingredient_ref)
 
                     if not ingredient:
-                        raise ValueError(f"Culops data missing culinary-ingredient: {item_ingredient_id}")
+                        raise ValueError(f"Culops data missing culinary-ingredient: {item_ingredient_ref.id}")
 
                     is_prepped_and_ready = ingredient.attributes.category.lower() == PREPPED_AND_READY_CATEGORY
 
@@ -258,7 +399,7 @@ class CulOpsService(CulopsClientInterface):
                         is_prepped_and_ready=is_prepped_and_ready,
                     )
 
-                if not res_json.get("links", {}).get("next"):
+                if not culops_pantry_data.links.get("next"):
                     break
 
                 page += 1
@@ -434,6 +575,18 @@ class CulOpsService(CulopsClientInterface):
             raise RecipeNotFoundError(f"CulOps recipe {culops_recipe_id} not found", recipe_id=culops_recipe_id)
         return recipes[0]
 
+    def get_recipes(self, partner_id: str, culops_recipe_ids: list[int]) -> list[CulopsRecipe]:
+        """Get recipes by CulOps id in one request, skipping ids CulOps does not return."""
+        if not culops_recipe_ids:
+            return []
+        recipes = self._get_recipes(partner_id=partner_id, recipe_ids=culops_recipe_ids, require_all=False)
+
+        found_ids = {recipe.culops_recipe_id for recipe in recipes}
+        for rid in culops_recipe_ids:
+            if rid not in found_ids:
+                log.warning(f"CulOps recipe {rid} not found, skipping")
+        return recipes
+
     def get_cycle_recipes_by_plan(self, partner_id: str, cycle_date: datetime, plan_name: str) -> list[CulopsRecipe]:
         if not validate_cycle_datetime(cycle_date):
             raise ValueError(f"Cycle date {cycle_date} must be a Monday")
@@ -459,13 +612,18 @@ class CulOpsService(CulopsClientInterface):
 
     def get_available_recipe_slots(self, plan_name: str) -> list[str]:
         """Get all available recipe slot codes from Culops for a given plan."""
+        slots = self.reference_cache.culops_recipe_slots.get_or_load("recipe-slots", self._fetch_recipe_slots)
+        return sorted(code for slot_plan_name, code in slots if slot_plan_name == plan_name)
+
+    def _fetch_recipe_slots(self) -> CulopsRecipeSlots:
+        # Slots of every plan are fetched in one call, so one cached list serves all plans
         token = self._get_culops_token()
         url = f"https://{self.host}{self.api_path}/recipe-slots"
         params = {"page[size]": 1000}
         headers = {"Authorization": f"Bearer {token}"}
 
         try:
-            res = self.session.get(url=url, headers=headers, params=params, timeout=15)
+            res = self._get(url=url, headers=headers, params=params, timeout=15)
             res.raise_for_status()
             res_json = res.json()
         except HTTPError as e:
@@ -473,14 +631,13 @@ class CulOpsService(CulopsClientInterface):
         except RequestException as e:
             raise ServerError(f"Failed to fetch recipe slots from Culops: {e}") from e
 
-        # Extract slot codes for the specified plan
-        slot_codes = []
+        slots: CulopsRecipeSlots = []
         for slot in res_json.get("data", []):
             attrs = slot.get("attributes", {})
-            if attrs.get("plan-description") == plan_name:
-                slot_codes.append(attrs.get("short-code"))
-
-        return sorted([code for code in slot_codes if code])
+            plan_name, code = attrs.get("plan-description"), attrs.get("short-code")
+            if plan_name and code:
+                slots.append((plan_name, code))
+        return slots
 
     def delete_recipe(
         self,
@@ -646,15 +803,37 @@ class CulOpsService(CulopsClientInterface):
                     raise ValueError(f"Failed to remove recipe ingredients from CulOps: {message}") from e
             raise ServerError("Failed to remove recipe ingredients from CulOps") from e
 
+    def _get(self, url: str, headers: dict[str, str], params: Any = None, **kwargs: Any) -> Response:
+        """GET from CulOps, sharing one call between identical requests in flight at the same time.
+
+        Concurrent callers get the same Response object, so it must be treated as read-only. A streamed body can
+        only be read once and is never shared.
+        """
+        if kwargs.get("stream"):
+            return self.session.get(url=url, headers=headers, params=params, **kwargs)
+        return self.transport.coalesce(
+            "GET", url, headers, params, lambda: self.session.get(url=url, headers=headers, params=params, **kwargs)
+        )
+
     def _get_culops_token(self) -> str:
         return self.token_svc.get_token(TokenName.CUL_OPS_ACCESS_TOKEN)
 
     def _get_culops_cycle_id(self, cycle_date: str) -> str:
+        cycle_id = self.reference_cache.culops_cycle_ids.get_or_load(
+            cycle_date,
+            lambda: self._fetch_culops_cycle_id(cycle_date),
+            ttl_seconds=self.reference_cache.cycle_ttl_seconds(date.fromisoformat(cycle_date)),
+        )
+        if cycle_id is None:
+            raise ValueError(f"CulOps cycle not found for date {cycle_date}")
+        return cycle_id
+
+    def _fetch_culops_cycle_id(self, cycle_date: str) -> str | None:
         token = self._get_culops_token()
         url = f"https://{self.host}{self.api_path}/cycles"
         params = {"filter[cycle-date]": cycle_date}
         try:
-            res = self.session.get(url=url, headers={"Authorization": f"Bearer {token}"}, params=params)
+            res = self._get(url=url, headers={"Authorization": f"Bearer {token}"}, params=params)
             res.raise_for_status()
             res_json = res.json()
         except HTTPError as e:
@@ -670,7 +849,7 @@ class CulOpsService(CulopsClientInterface):
 
         data = res_json.get("data")
         if not isinstance(data, list) or not data or not isinstance(data[0], dict) or "id" not in data[0]:
-            raise ValueError(f"CulOps cycle not found for date {cycle_date}")
+            return None
         return str(data[0]["id"])
 
     def _set_recipe_cycle(self, recipe_id: int, cycle_id: str) -> None:
@@ -704,10 +883,11 @@ class CulOpsService(CulopsClientInterface):
         cycle_date: datetime | None = None,
         recipe_ids: list[int] | None = None,
         plan_name: str | None = None,
+        require_all: bool = True,
     ) -> list[CulopsRecipe]:
         token = self._get_culops_token()
         url = f"https://{self.host}{self.api_path}/recipes"
-        params: dict[str, str] = {"include": "ingredients.culinary-ingredient-specification"}
+        params: dict[str, str | list[str]] = {"include": "ingredients.culinary-ingredient-specification"}
         if cycle_date is not None:
             params["filter[cycle-date]"] = cycle_date.strftime("%Y-%m-%d")
         if plan_name is not None:
@@ -715,8 +895,8 @@ class CulOpsService(CulopsClientInterface):
         if recipe_ids:
             # Major requirement: explicit logging of applying recipe_ids to params
             params_before = params.copy()
-            for rid in recipe_ids:
-                params.setdefault("filter[id][]", str(rid))
+            params["filter[id][]"] = [str(rid) for rid in recipe_ids]
+            params["page[size]"] = str(len(recipe_ids))
             log.info(
                 "culops list recipes: applying id filters",
                 extra={
@@ -742,11 +922,10 @@ class CulOpsService(CulopsClientInterface):
                     pass
 
         try:
-            res = self.session.get(url=url, headers={"Authorization": f"Bearer {token}"}, params=params)
+            res = self._get(url=url, headers={"Authorization": f"Bearer {token}"}, params=params)
             res.raise_for_status()
-            res_json = res.json()
 
-            recipes_response = CulopsRecipeListResponse.model_validate(res_json)
+            recipes_response = validate_response(CulopsRecipeListResponse, res.content)
         except HTTPError as e:
             assert isinstance(e.response.status_code, int)
             status = e.response.status_code
@@ -758,59 +937,45 @@ class CulOpsService(CulopsClientInterface):
         except RequestException as e:
             raise ServerError("Failed to fetch recipes from CulOps") from e
         except ValidationError as e:
+            if any(error["type"] == "json_invalid" for error in e.errors()):
+                # A body that is not JSON at all is a failed fetch, as it was when decoded with res.json()
+                raise ServerError("Failed to fetch recipes from CulOps") from e
             raise ServerError("Failed to parse recipes response data") from e
 
-        included = recipes_response.included or []
-        included_lookup = {(item.type, item.id): item for item in included}
+        included_index: JsonApiIndex[MappedIncludedData] = JsonApiIndex(recipes_response.included)
 
-        if recipe_ids:
+        if recipe_ids and require_all:
             recipe_ids_returned = [r.id for r in recipes_response.data]
             for rid in recipe_ids:
                 if str(rid) not in recipe_ids_returned:
                     raise RecipeNotFoundError(f"CulOps recipe {rid} not found", recipe_id=rid)
 
+        # Resolve recipe ids and pantry items for the whole response up front so mapping stays in memory
+        recipe_uuids = self._resolve_recipe_uuids(partner_id, recipes_response.data)
+        ingredient_sources = {
+            item.id: self._get_recipe_ingredient_sources(item, included_index) for item in recipes_response.data
+        }
+        pantry_item_data_by_source = (
+            self.pantry_repo.get_pantry_item_data_by_culops_culinary_ingredient_and_specification_ids(
+                [
+                    (culinary_specification_id, culinary_ingredient_id)
+                    for sources in ingredient_sources.values()
+                    for _, culinary_specification_id, culinary_ingredient_id in sources
+                ]
+            )
+        )
+        partner_constraint_tags = self.partner_repo.get_partner_recipe_constraint_tags(partner_id)
+        partner_packaging_config_tags = self.partner_repo.get_partner_packaging_configuration_tags(partner_id)
+
         results: list[CulopsRecipe] = []
         for item in recipes_response.data:
             culops_recipe_id = int(item.id)
             attributes = item.attributes
-
-            recipe_uuid = self.recipe_repo.get_recipe_id_by_culops_recipe_id(culops_recipe_id)
-            if not recipe_uuid:
-                recipe_uuid = uuid4()
-                self.recipe_repo.store_recipe_source(partner_id, recipe_uuid, int(item.id), item.attributes.sku, True)
-
-            pantry_item_data_source_ids: list[tuple[int, int]] = []
-            ingredients_rel = item.relationships.ingredients
-            if ingredients_rel and ingredients_rel.data and isinstance(ingredients_rel.data, list):
-                for ingredient_rel in ingredients_rel.data:
-                    ingredient_id = ingredient_rel.id
-                    inc_ingredient = included_lookup.get(("ingredients", ingredient_id))
-
-                    if (
-                        inc_ingredient
-                        and isinstance(inc_ingredient.relationships, IngredientRelationships)
-                        and isinstance(
-                            inc_ingredient.relationships.culinary_ingredient_specification.data, ResourceIdentifier
-                        )
-                    ):
-                        spec_inc_id = inc_ingredient.relationships.culinary_ingredient_specification.data.id
-
-                        spec_inc = included_lookup.get(("culinary-ingredient-specifications", spec_inc_id))
-
-                        if spec_inc and isinstance(
-                            spec_inc.relationships, CulinaryIngredientSpecificationRelationships
-                        ):
-                            pantry_item_data_source_ids.append(
-                                (int(spec_inc.id), spec_inc.attributes.culinary_ingredient_id)
-                            )
+            recipe_uuid = recipe_uuids[culops_recipe_id]
 
             recipe_pantry_items_data: list[CulopsRecipePantryItemData] = []
-            for culinary_specification_id, culinary_ingredient_id in pantry_item_data_source_ids:
-                pantry_item_data = (
-                    self.pantry_repo.get_pantry_item_data_by_culops_culinary_ingredient_and_specification_id(
-                        culinary_specification_id, culinary_ingredient_id
-                    )
-                )
+            for ingredient_id, culinary_specification_id, culinary_ingredient_id in ingredient_sources[item.id]:
+                pantry_item_data = pantry_item_data_by_source.get((culinary_specification_id, culinary_ingredient_id))
 
                 if pantry_item_data:
                     culops_recipe_pantry_item_data = CulopsRecipePantryItemData(
@@ -821,12 +986,12 @@ class CulOpsService(CulopsClientInterface):
                     recipe_pantry_items_data.append(culops_recipe_pantry_item_data)
                 else:
                     # See note in original code re: archived specs/ingredients.
-                    cul_spec_ingredient = included_lookup.get(
-                        ("culinary-ingredient-specifications", culinary_specification_id)
+                    cul_spec_ingredient = included_index.get(
+                        "culinary-ingredient-specifications", str(culinary_specification_id)
                     )
                     cul_spec_archived = cul_spec_ingredient and cul_spec_ingredient.attributes.is_archived
 
-                    cul_ingredient = included_lookup.get(("culinary-ingredients", culinary_ingredient_id))
+                    cul_ingredient = included_index.get("culinary-ingredients", str(culinary_ingredient_id))
                     cul_ingredient_archived = cul_ingredient and cul_ingredient.attributes.is_archived
 
                     possible_issue_msg = "."
@@ -849,9 +1014,6 @@ class CulOpsService(CulopsClientInterface):
             badge_tags = set(attributes.badge_tag_list)
             campaign_tags = set(attributes.campaign_tag_list)
 
-            partner_constraint_tags = self.partner_repo.get_partner_recipe_constraint_tags(partner_id)
-            partner_packaging_config_tags = self.partner_repo.get_partner_packaging_configuration_tags(partner_id)
-
             badge_constraint_tags = self._match_recipe_constraint_tags(
                 badge_tags, partner_constraint_tags, TagListType.BADGE_TAG_LIST
             )
@@ -923,140 +1085,199 @@ class CulOpsService(CulopsClientInterface):
         available_from: datetime | None,
         available_until: datetime | None,
     ) -> list[PantryItem]:
-        pantry_items: list[PantryItem] = []
-        included_lookup = {(item.type, item.id): item for item in culops_data.included or []}
-
-        items_with_cost_rels = 0
-        items_without_cost_rels = 0
-        items_using_fallback = 0
-
-        for item in culops_data.data:
-            brand_name: str | None = ""
-            availabilities: list[PantryItemAvailability] = []
-            costs: list[PantryItemCost] = []
-            custom_field_data: list[PantryItemCustomField] = []
-
-            if not item.relationships or not item.relationships.culinary_ingredient:
-                continue
-            ingredient_ref = item.relationships.culinary_ingredient.data
-            ingredient = included_lookup.get((ingredient_ref.type, ingredient_ref.id))
-            if not ingredient:
-                raise ValueError(
-                    f"Culops data missing culinary-ingredient: "
-                    f"{item.relationships.culinary_ingredient.data.id} for "
-                    f"culinary-ingredient-specification: {item.id}"
-                )
-            description = ingredient.attributes.display_name if ingredient.attributes.display_name else "Unknown"
-            category = ingredient.attributes.category.strip().lower()
-
-            # Use cost relationship data if available, otherwise fallback to attributes.cost
-            if item.relationships.culinary_ingredient_specification_costs and item.relationships.culinary_ingredient_specification_costs.data:
-                items_with_cost_rels += 1
-                item_cost_ids = [
-                    cost.id
-                    for cost in item.relationships.culinary_ingredient_specification_costs.data
-                    if cost.type == "culinary-ingredient-specification-costs"
-                ]
-                item_costs = [
-                    included_lookup.get(("culinary-ingredient-specification-costs", cost_id)) for cost_id in item_cost_ids
-                ]
-                # Don't filter by date - return all costs regardless of cycle date
-                valid_item_costs = [
-                    cost
-                    for cost in item_costs
-                    if cost is not None
-                    and isinstance(cost.attributes, CulinaryIngredientSpecificationCostAttribute)
-                ]
-
-                # Convert all available costs without date range filtering
-                for cost in valid_item_costs:
-                    cycle_start = cost.attributes.get_cycle_start_date()
-                    costs.append(
-                        PantryItemCost(
-                            production_cost_us_dollars=cost.attributes.cost,
-                            start_date=cycle_start,
-                            end_date=cycle_start + timedelta(days=7),
-                        )
-                    )
-            else:
-                items_without_cost_rels += 1
+        included_index: JsonApiIndex[CulopsMappedIncludedItem] = JsonApiIndex(culops_data.included)
+        stats: Counter[str] = Counter()
+        pantry_items = [
+            pantry_item
+            for item in culops_data.data
+            if (pantry_item := CulOpsService._map_pantry_item(item, included_index, stats)) is not None
+        ]
+        CulOpsService._log_mapped_pantry_items(len(culops_data.data), len(pantry_items), stats)
+        return pantry_items
 
-            # Fallback to item.attributes.cost if no cost relationships
-            if not costs and item.attributes.cost is not None:
-                items_using_fallback += 1
+    @staticmethod
+    def _map_pantry_item(
+        item: CulopsDataItem, included_index: JsonApiIndex[CulopsMappedIncludedItem], stats: Counter[str]
+    ) -> PantryItem | None:
+        """Map one culinary ingredient specification, counting how its cost was sourced in ``stats``."""
+        brand_name: str | None = ""
+        availabilities: list[PantryItemAvailability] = []
+        costs: list[PantryItemCost] = []
+        custom_field_data: list[PantryItemCustomField] = []
+
+        if not item.relationships or not item.relationships.culinary_ingredient:
+            return None
+        ingredient = included_index.resolve(item.relationships.culinary_ingredient.data)
+        if not ingredient:
+            raise ValueError(
+                f"Culops data missing culinary-ingredient: "
+                f"{item.relationships.culinary_ingredient.data.id} for "
+                f"culinary-ingredient-specification: {item.id}"
+            )
+        description = ingredient.attributes.display_name if ingredient.attributes.display_name else "Unknown"
+        category = ingredient.attributes.category.strip().lower()
+
+        # Use cost relationship data if available, otherwise fallback to attributes.cost
+        if (
+            item.relationships.culinary_ingredient_specification_costs
+            and item.relationships.culinary_ingredient_specification_costs.data
+        ):
+            stats["items_with_cost_rels"] += 1
+            item_costs = included_index.resolve_all(
+                item.relationships.culinary_ingredient_specification_costs.data,
+                "culinary-ingredient-specification-costs",
+            )
+            # Don't filter by date - return all costs regardless of cycle date
+            valid_item_costs = [
+                cost
+                for cost in item_costs
+                if isinstance(cost.attributes, CulinaryIngredientSpecificationCostAttribute)
+            ]
+
+            # Convert all available costs without date range filtering
+            for cost in valid_item_costs:
+                cycle_start = cost.attributes.get_cycle_start_date()
                 costs.append(
                     PantryItemCost(
-                        production_cost_us_dollars=item.attributes.cost,
-                        start_date=datetime.now(UTC),
-                        end_date=datetime.now(UTC) + timedelta(days=7),
+                        production_cost_us_dollars=cost.attributes.cost,
+                        start_date=cycle_start,
+                        end_date=cycle_start + timedelta(days=7),
                     )
                 )
+        else:
+            stats["items_without_cost_rels"] += 1
+
+        # Fallback to item.attributes.cost if no cost relationships
+        if not costs and item.attributes.cost is not None:
+            stats["items_using_fallback"] += 1
+            costs.append(
+                PantryItemCost(
+                    production_cost_us_dollars=item.attributes.cost,
+                    start_date=datetime.now(UTC),
+                    end_date=datetime.now(UTC) + timedelta(days=7),
+                )
+            )
 
-            if item.relationships.culinary_ingredient_specification_availabilities:
-                for availability_ref in item.relationships.culinary_ingredient_specification_availabilities.data:
-                    availability_entry = included_lookup.get((availability_ref.type, availability_ref.id))
-                    if availability_entry:
-                        availability_attr = availability_entry.attributes
-                        availabilities.append(
-                            PantryItemAvailability(
-                                available_until=parse_to_datetime(availability_attr.end)
-                                if availability_attr.end
-                                else None,
-                                available_from=parse_to_datetime(availability_attr.start)
-                                if availability_attr.start
-                                else None,
-                            )
-                        )
+        if item.relationships.culinary_ingredient_specification_availabilities:
+            for availability_entry in included_index.resolve_all(
+                item.relationships.culinary_ingredient_specification_availabilities.data,
+                "culinary-ingredient-specification-availabilities",
+            ):
+                availability_attr = availability_entry.attributes
+                availabilities.append(
+                    PantryItemAvailability(
+                        available_until=parse_to_datetime(availability_attr.end) if availability_attr.end else None,
+                        available_from=parse_to_datetime(availability_attr.start) if availability_attr.start else None,
+                    )
+                )
 
-            if item.custom_fields:
-                for custom_field in item.custom_fields:
-                    custom_field_data.append(
-                        PantryItemCustomField(
-                            key=custom_field.key,
-                            value=custom_field.value,
-                        )
+        if item.custom_fields:
+            for custom_field in item.custom_fields:
+                custom_field_data.append(
+                    PantryItemCustomField(
+                        key=custom_field.key,
+                        value=custom_field.value,
                     )
+                )
 
-            if item.relationships and item.relationships.culinary_ingredient_brand:
-                brand_ref = item.relationships.culinary_ingredient_brand.data
-                included_item = included_lookup.get((brand_ref.type, brand_ref.id))
-
-                if included_item and isinstance(included_item.attributes, CulinaryIngredientBrand):
-                    brand_name = included_item.attributes.name
-
-            is_prepped_and_ready = category == PREPPED_AND_READY_CATEGORY
-
-            pantry_item = PantryItem(
-                id=str(uuid4()),
-                description=description,
-                amount=item.attributes.amount,
-                units=item.attributes.unit,
-                availability=availabilities,
-                cost=costs,
-                custom_fields=custom_field_data,
-                is_prepped_and_ready=is_prepped_and_ready,
-                pantry_item_data_source=PantryItemDataSource(
-                    culops_culinary_ingredient_id=int(ingredient.id if ingredient else "0"),
-                    culops_culinary_ingredient_specification_id=int(item.id),
-                ),
-                brand_name=brand_name,
-            )
+        if item.relationships and item.relationships.culinary_ingredient_brand:
+            included_item = included_index.resolve(item.relationships.culinary_ingredient_brand.data)
+
+            if included_item and isinstance(included_item.attributes, CulinaryIngredientBrand):
+                brand_name = included_item.attributes.name
+
+        is_prepped_and_ready = category == PREPPED_AND_READY_CATEGORY
+
+        return PantryItem(
+            id=str(uuid4()),
+            description=description,
+            amount=item.attributes.amount,
+            units=item.attributes.unit,
+            availability=availabilities,
+            cost=costs,
+            custom_fields=custom_field_data,
+            is_prepped_and_ready=is_prepped_and_ready,
+            pantry_item_data_source=PantryItemDataSource(
+                culops_culinary_ingredient_id=int(ingredient.id if ingredient else "0"),
+                culops_culinary_ingredient_specification_id=int(item.id),
+            ),
+            brand_name=brand_name,
+        )
 
-            pantry_items.append(pantry_item)
+    @staticmethod
+    def _map_streamed_pantry_items(page: StreamedPantryPage) -> Iterator[PantryItem]:
+        """Map a streamed page's specifications one at a time, as its data array is read."""
+        stats: Counter[str] = Counter()
+        culops_items_count = returned_items = 0
+        for item in page.data_items():
+            culops_items_count += 1
+            pantry_item = CulOpsService._map_pantry_item(item, page.included_index, stats)
+            if pantry_item is not None:
+                returned_items += 1
+                yield pantry_item
+        CulOpsService._log_mapped_pantry_items(culops_items_count, returned_items, stats)
 
+    @staticmethod
+    def _log_mapped_pantry_items(culops_items_count: int, returned_items: int, stats: Counter[str]) -> None:
         log.info(
-            f"_map_pantry_items: processed {len(culops_data.data)} items from CulOps, "
-            f"returning {len(pantry_items)} items",
+            f"_map_pantry_items: processed {culops_items_count} items from CulOps, returning {returned_items} items",
             extra={
-                "culops_items_count": len(culops_data.data),
-                "items_with_cost_rels": items_with_cost_rels,
-                "items_without_cost_rels": items_without_cost_rels,
-                "items_using_fallback": items_using_fallback,
-                "returned_items": len(pantry_items),
+                "culops_items_count": culops_items_count,
+                "items_with_cost_rels": stats["items_with_cost_rels"],
+                "items_without_cost_rels": stats["items_without_cost_rels"],
+                "items_using_fallback": stats["items_using_fallback"],
+                "returned_items": returned_items,
             },
         )
 
-        return pantry_items
+    def _resolve_recipe_uuids(self, partner_id: str, recipes_data: list[CulopsRecipeData]) -> dict[int, UUID]:
+        """Map CulOps recipe ids to our recipe ids, storing sources for any recipe we have not seen yet."""
+        culops_recipe_ids = [int(item.id) for item in recipes_data]
+        recipe_uuids = self.recipe_repo.get_recipe_ids_by_culops_recipe_ids(culops_recipe_ids)
+
+        new_recipe_refs: list[RecipeRef] = []
+        for item in recipes_data:
+            culops_recipe_id = int(item.id)
+            if culops_recipe_id not in recipe_uuids:
+                recipe_uuids[culops_recipe_id] = uuid4()
+                new_recipe_refs.append(
+                    RecipeRef(
+                        culops_recipe_id=culops_recipe_id,
+                        recipe_id=recipe_uuids[culops_recipe_id],
+                        culops_product_sku=item.attributes.sku,
+                    )
+                )
+
+        self.recipe_repo.store_recipe_sources(partner_id, new_recipe_refs, True)
+        return recipe_uuids
+
+    @staticmethod
+    def _get_recipe_ingredient_sources(
+        item: CulopsRecipeData, included_index: JsonApiIndex[MappedIncludedData]
+    ) -> list[tuple[str, int, int]]:
+        """Return (ingredient id, specification id, culinary ingredient id) for each ingredient of a recipe."""
+        sources: list[tuple[str, int, int]] = []
+        ingredients_rel = item.relationships.ingredients
+        if ingredients_rel and ingredients_rel.data and isinstance(ingredients_rel.data, list):
+            for ingredient_rel in ingredients_rel.data:
+                ingredient_id = ingredient_rel.id
+                inc_ingredient = included_index.get("ingredients", ingredient_id)
+
+                if (
+                    inc_ingredient
+                    and isinstance(inc_ingredient.relationships, IngredientRelationships)
+                    and isinstance(
+                        inc_ingredient.relationships.culinary_ingredient_specification.data, ResourceIdentifier
+                    )
+                ):
+                    spec_inc = included_index.get(
+                        "culinary-ingredient-specifications",
+                        inc_ingredient.relationships.culinary_ingredient_specification.data.id,
+                    )
+
+                    if spec_inc and isinstance(spec_inc.relationships, CulinaryIngredientSpecificationRelationships):
+                        sources.append((ingredient_id, int(spec_inc.id), spec_inc.attributes.culinary_ingredient_id))
+        return sources
 
     @staticmethod
     def _match_recipe_constraint_tags(
@@ -0,0 +1,22 @@
+from typing import TypeVar
+
+import orjson
+from pydantic import BaseModel, ValidationError
+
+M = TypeVar("M", bound=BaseModel)
+
+
+def validate_response(model: type[M], content: bytes) -> M:
+    """Validate a CulOps response body as ``model`` without going through ``Response.json()``.
+
+    orjson decodes the body: the included-resource discriminators then read each resource's type from a plain
+    dict, where in pydantic's JSON mode every resource is first copied out of the parser whole. A body that is not
+    JSON raises a ``json_invalid`` ValidationError, as ``model_validate_json`` would.
+    """
+    try:
+        payload = orjson.loads(content)
+    except orjson.JSONDecodeError as e:
+        raise ValidationError.from_exception_data(
+            model.__name__, [{"type": "json_invalid", "loc": (), "input": content, "ctx": {"error": str(e)}}]
+        ) from e
+    return model.model_validate(payload)
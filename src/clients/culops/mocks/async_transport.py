@@ -0,0 +1,34 @@
+import asyncio
+import json
+
+import httpx
+from requests.exceptions import HTTPError
+
+from src.clients.culops.mocks.session import MockedSession
+
+
+def mocked_async_transport() -> httpx.MockTransport:
+    """Serve async CulOps calls from the same canned handlers as MockedSession."""
+    session = MockedSession()
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        params = dict(request.url.params.multi_items())
+        # httpx lower-cases header names; the mocked session looks up "Authorization"
+        headers = {"Authorization": request.headers["authorization"]} if "authorization" in request.headers else {}
+        body = json.loads(request.content) if request.content else None
+        try:
+            res = await asyncio.to_thread(
+                session.request,
+                request.method,
+                str(request.url.copy_with(query=None)),
+                headers=headers,
+                params=params,
+                json=body,
+            )
+        except HTTPError as e:
+            if e.response is None:
+                raise
+            res = e.response
+        return httpx.Response(res.status_code, content=res.content, headers={"Content-Type": "application/json"})
+
+    return httpx.MockTransport(handler)
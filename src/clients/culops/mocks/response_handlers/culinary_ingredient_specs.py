@@ -32,6 +32,8 @@ def get_culinary_ingredient_specifications_response_handler(headers: dict, param
     content = json.dumps(paginated_data, ensure_ascii=False).encode("utf-8")
     response.status_code = 200
     response._content = content
+    # Lets iter_content() serve the canned body to stream=True callers
+    response._content_consumed = True
     response.raise_for_status()
     return response
 
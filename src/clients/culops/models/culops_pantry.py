@@ -1,7 +1,14 @@
 from datetime import UTC, datetime, timedelta
-from typing import Any
+from typing import Annotated, Any
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, Tag, field_validator
+
+from src.clients.culops.models.jsonapi import SKIPPED_RESOURCE, SkippedResource, resource_type_discriminator
+
+CULINARY_INGREDIENTS = "culinary-ingredients"
+SPECIFICATION_COSTS = "culinary-ingredient-specification-costs"
+SPECIFICATION_AVAILABILITIES = "culinary-ingredient-specification-availabilities"
+CULINARY_INGREDIENT_BRANDS = "culinary-ingredient-brands"
 
 
 class CulopsNestedItem(BaseModel):
@@ -115,15 +122,48 @@ class CulopsDataItem(BaseModel):
     relationships: CulopsRelationships | None = Field(default=None)
 
 
-class CulopsIncludedItem(BaseModel):
+class CulinaryIngredientResource(BaseModel):
     type: str
     id: str
-    attributes: (
-        CulinaryIngredientAttribute
-        | CulinaryIngredientSpecificationCostAttribute
-        | CulopsAvailabilityAttribute
-        | CulinaryIngredientBrand
-    )
+    attributes: CulinaryIngredientAttribute
+
+
+class CulinaryIngredientSpecificationCostResource(BaseModel):
+    type: str
+    id: str
+    attributes: CulinaryIngredientSpecificationCostAttribute
+
+
+class CulopsAvailabilityResource(BaseModel):
+    type: str
+    id: str
+    attributes: CulopsAvailabilityAttribute
+
+
+class CulinaryIngredientBrandResource(BaseModel):
+    type: str
+    id: str
+    attributes: CulinaryIngredientBrand
+
+
+# The pantry mappers read these four types of included resource; anything else is skipped
+CulopsMappedIncludedItem = (
+    CulinaryIngredientResource
+    | CulinaryIngredientSpecificationCostResource
+    | CulopsAvailabilityResource
+    | CulinaryIngredientBrandResource
+)
+
+CulopsIncludedItem = Annotated[
+    Annotated[CulinaryIngredientResource, Tag(CULINARY_INGREDIENTS)]
+    | Annotated[CulinaryIngredientSpecificationCostResource, Tag(SPECIFICATION_COSTS)]
+    | Annotated[CulopsAvailabilityResource, Tag(SPECIFICATION_AVAILABILITIES)]
+    | Annotated[CulinaryIngredientBrandResource, Tag(CULINARY_INGREDIENT_BRANDS)]
+    | Annotated[SkippedResource, Tag(SKIPPED_RESOURCE)],
+    resource_type_discriminator(
+        CULINARY_INGREDIENTS, SPECIFICATION_COSTS, SPECIFICATION_AVAILABILITIES, CULINARY_INGREDIENT_BRANDS
+    ),
+]
 
 
 class CulopsData(BaseModel):
@@ -131,6 +171,17 @@ class CulopsData(BaseModel):
     included: list[CulopsIncludedItem]
 
 
+class CulopsPagination(BaseModel):
+    """The top-level links and meta of a page, which is all pagination reads."""
+
+    links: dict[str, Any] = Field(default_factory=dict)
+    meta: dict[str, Any] | None = None
+
+
+class CulopsPantryPage(CulopsData, CulopsPagination):
+    """A culinary ingredient specifications page, validated straight from the response body."""
+
+
 class Links(BaseModel):
     self: str | None
     prev: str | None
@@ -1,4 +1,8 @@
-from pydantic import BaseModel, Field
+from typing import Annotated
+
+from pydantic import BaseModel, Field, Tag
+
+from src.clients.culops.models.jsonapi import SKIPPED_RESOURCE, SkippedResource, resource_type_discriminator
 
 
 class Links(BaseModel):
@@ -52,14 +56,6 @@ class IngredientRelationships(BaseModel):
     recipe: Relationship
 
 
-class CulinaryIngredientAttributes(BaseModel):
-    category: str
-    culinary_unit: str = Field(alias="culinary-unit")
-    is_archived: bool = Field(alias="is-archived")
-    latest_slotted_cycle: str = Field(alias="latest-slotted-cycle")
-    sub_category: str = Field(alias="sub-category")
-
-
 class CulinaryIngredientSpecificationAttributes(BaseModel):
     amount: float
     culinary_ingredient_id: int = Field(alias="culinary-ingredient-id")
@@ -72,19 +68,31 @@ class CulinaryIngredientSpecificationRelationships(BaseModel):
     culinary_ingredient: Relationship = Field(alias="culinary-ingredient")
 
 
-class CulinaryIngredientRelationships(BaseModel):
-    culinary_ingredient_specifications: Relationship = Field(alias="culinary-ingredient-specifications")
-    ingredients: Relationship
+class IncludedIngredient(BaseModel):
+    id: str
+    type: str
+    links: Links
+    attributes: IngredientAttributes
+    relationships: IngredientRelationships
 
 
-class IncludedData(BaseModel):
+class IncludedCulinaryIngredientSpecification(BaseModel):
     id: str
     type: str
     links: Links
-    attributes: IngredientAttributes | CulinaryIngredientSpecificationAttributes | CulinaryIngredientAttributes
-    relationships: (
-        IngredientRelationships | CulinaryIngredientSpecificationRelationships | CulinaryIngredientRelationships
-    )
+    attributes: CulinaryIngredientSpecificationAttributes
+    relationships: CulinaryIngredientSpecificationRelationships
+
+
+# Recipe mapping only follows ingredients to their specifications; culinary ingredients and others are skipped
+MappedIncludedData = IncludedIngredient | IncludedCulinaryIngredientSpecification
+
+IncludedData = Annotated[
+    Annotated[IncludedIngredient, Tag("ingredients")]
+    | Annotated[IncludedCulinaryIngredientSpecification, Tag("culinary-ingredient-specifications")]
+    | Annotated[SkippedResource, Tag(SKIPPED_RESOURCE)],
+    resource_type_discriminator("ingredients", "culinary-ingredient-specifications"),
+]
 
 
 class CulopsRecipeUpdateResponse(BaseModel):
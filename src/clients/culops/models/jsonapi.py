@@ -0,0 +1,81 @@
+from collections.abc import Iterable
+from typing import Any, Generic, Protocol, TypeVar
+
+from pydantic import BaseModel, Discriminator
+
+
+class Resource(Protocol):
+    """Anything carrying a JSON:API type and id: included resources and the identifiers that point at them."""
+
+    @property
+    def type(self) -> str: ...
+
+    @property
+    def id(self) -> str: ...
+
+
+R = TypeVar("R", bound=Resource)
+
+SKIPPED_RESOURCE = "skipped"
+
+
+class SkippedResource(BaseModel):
+    """An included resource of a type no mapper reads. Only its identifier is parsed, the rest of the body is not."""
+
+    type: str
+    id: str
+
+
+def resource_type_discriminator(*types: str) -> Discriminator:
+    """Pick the model of an included resource by its JSON:API type, tagging any other type ``SKIPPED_RESOURCE``.
+
+    Validation then builds one model per resource instead of trying each member of an attributes union in turn.
+    """
+    known_types = frozenset(types)
+
+    def tag(value: Any) -> str:
+        type_ = value.get("type") if isinstance(value, dict) else getattr(value, "type", None)
+        return type_ if type_ in known_types else SKIPPED_RESOURCE
+
+    return Discriminator(tag)
+
+
+class JsonApiIndex(Generic[R]):
+    """The ``included`` resources of a JSON:API document keyed by type and id, built once per response.
+
+    Mappers resolve relationship identifiers through the index instead of scanning ``included`` for each one.
+    Skipped resources are left out, so the index only returns the types its mappers read.
+    """
+
+    def __init__(self, included: Iterable[R | SkippedResource] | None) -> None:
+        self._resources: dict[tuple[str, str], R] = {
+            (resource.type, resource.id): resource
+            for resource in included or []
+            if not isinstance(resource, SkippedResource)
+        }
+
+    def __len__(self) -> int:
+        return len(self._resources)
+
+    def get(self, type_: str, id_: str) -> R | None:
+        return self._resources.get((type_, id_))
+
+    def resolve(self, identifier: Resource | None) -> R | None:
+        """The included resource a relationship identifier points at, or None when it was not included."""
+        if identifier is None:
+            return None
+        return self.get(identifier.type, identifier.id)
+
+    def resolve_all(self, identifiers: Iterable[Resource] | None, type_: str | None = None) -> list[R]:
+        """The included resources of a to-many relationship in relationship order, optionally of one type only.
+
+        Identifiers whose resource was not included are skipped.
+        """
+        resolved = []
+        for identifier in identifiers or []:
+            if type_ is not None and identifier.type != type_:
+                continue
+            resource = self.get(identifier.type, identifier.id)
+            if resource is not None:
+                resolved.append(resource)
+        return resolved
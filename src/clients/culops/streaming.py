@@ -0,0 +1,109 @@
+import sys
+from collections.abc import Iterable, Iterator
+from tempfile import SpooledTemporaryFile
+from typing import IO, Any
+
+import ijson
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from requests import Response
+
+from src.clients.culops.models.culops_pantry import (
+    CulopsDataItem,
+    CulopsIncludedItem,
+    CulopsMappedIncludedItem,
+    CulopsPagination,
+)
+from src.clients.culops.models.jsonapi import JsonApiIndex, SkippedResource
+
+# Bodies up to this size stay in memory while spooled; larger ones roll over to a temporary file
+SPOOL_MAX_MEMORY_BYTES = 1024 * 1024
+READ_CHUNK_BYTES = 64 * 1024
+
+# What a malformed page body raises, whether it is streamed or decoded whole
+PAGE_PARSE_ERRORS: tuple[type[Exception], ...] = (ValidationError, ijson.JSONError)
+
+_data_item_adapter: TypeAdapter[CulopsDataItem] = TypeAdapter(CulopsDataItem)
+_included_item_adapter: TypeAdapter[CulopsIncludedItem] = TypeAdapter(CulopsIncludedItem)
+
+# An included resource as CompactIncludedIndex holds it: its model, its attributes model and the attribute values
+_CompactResource = tuple[type[CulopsMappedIncludedItem], type[BaseModel], tuple[Any, ...]]
+
+
+def spool_response_body(res: Response) -> IO[bytes]:
+    """Copy a ``stream=True`` response body into a spooled temporary file, rewound for reading."""
+    body: IO[bytes] = SpooledTemporaryFile(max_size=SPOOL_MAX_MEMORY_BYTES)
+    try:
+        for chunk in res.iter_content(READ_CHUNK_BYTES):
+            body.write(chunk)
+    except BaseException:
+        body.close()
+        raise
+    finally:
+        res.close()
+    body.seek(0)
+    return body
+
+
+class StreamedPantryPage:
+    """A culinary ingredient specifications page read incrementally from its spooled body.
+
+    JSON:API puts no order on a document's top-level members, so ``included`` may well follow ``data``. The
+    links, the meta and an index of the included resources the pantry mapper reads are collected first; the
+    specifications are then validated one at a time by ``data_items`` in a last pass over the body. Neither the
+    parsed document nor the full page model is ever held in memory.
+    """
+
+    def __init__(self, body: IO[bytes]) -> None:
+        self._body = body
+        self.included_index, self.pagination = self._scan_envelope()
+
+    def data_items(self) -> Iterator[CulopsDataItem]:
+        for raw_item in self._items("data.item"):
+            yield _data_item_adapter.validate_python(raw_item)
+
+    def _scan_envelope(self) -> tuple[JsonApiIndex[CulopsMappedIncludedItem], CulopsPagination]:
+        # ijson filters by prefix in its C backend, so a pass per member beats one pass over every event in Python
+        envelope = {member: value for member in ("links", "meta") for value in self._items(member)}
+        included_index = CompactIncludedIndex(
+            resource
+            for resource in map(_included_item_adapter.validate_python, self._items("included.item"))
+            # Only the resource types the mapper resolves are worth keeping in the index
+            if not isinstance(resource, SkippedResource)
+        )
+        return included_index, CulopsPagination.model_validate(envelope)
+
+    def _items(self, prefix: str) -> Iterator[Any]:
+        self._body.seek(0)
+        items: Iterator[Any] = ijson.items(self._body, prefix, use_float=True)
+        return items
+
+
+class CompactIncludedIndex(JsonApiIndex[CulopsMappedIncludedItem]):
+    """An index of included resources that holds each one's validated attribute values as a tuple.
+
+    A page includes several resources per specification, so keeping tuples instead of models keeps the index a
+    fraction of the size. A resource is rebuilt from its tuple, without validating it again, when it is resolved.
+    """
+
+    def __init__(self, included: Iterable[CulopsMappedIncludedItem]) -> None:
+        super().__init__(None)
+        self._compact: dict[tuple[str, str], _CompactResource] = {
+            # Every resource repeats its type string; one interned copy serves them all
+            (sys.intern(resource.type), resource.id): (
+                type(resource),
+                type(resource.attributes),
+                tuple(resource.attributes.__dict__.values()),
+            )
+            for resource in included
+        }
+
+    def __len__(self) -> int:
+        return len(self._compact)
+
+    def get(self, type_: str, id_: str) -> CulopsMappedIncludedItem | None:
+        compact = self._compact.get((type_, id_))
+        if compact is None:
+            return None
+        resource_model, attributes_model, values = compact
+        attributes = attributes_model.model_construct(**dict(zip(attributes_model.model_fields, values, strict=True)))
+        return resource_model.model_construct(type=type_, id=id_, attributes=attributes)
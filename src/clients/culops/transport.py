@@ -0,0 +1,308 @@
+import asyncio
+import random
+import re
+import threading
+import time
+from bisect import bisect_left
+from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from typing import Any, TypeVar
+from urllib.parse import urlparse
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3 import Retry
+
+from src.core.config import settings
+from src.utils.logger import ServiceLogger
+from src.utils.single_flight import AsyncSingleFlight, FlightStats, SingleFlight
+from src.utils.singleton import singleton
+
+logger = ServiceLogger().get_logger(__name__)
+
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+LATENCY_BUCKETS_MS = (25.0, 50.0, 100.0, 250.0, 500.0, 1000.0, 2500.0, 5000.0, 10000.0)
+
+_ID_SEGMENT = re.compile(r"^\d+$")
+
+R = TypeVar("R")
+
+
+@dataclass
+class LatencyHistogram:
+    buckets_ms: tuple[float, ...] = LATENCY_BUCKETS_MS
+    counts: list[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS_MS) + 1))
+    count: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def observe(self, elapsed_ms: float) -> None:
+        with self._lock:
+            self.counts[bisect_left(self.buckets_ms, elapsed_ms)] += 1
+            self.count += 1
+            self.total_ms += elapsed_ms
+            self.max_ms = max(self.max_ms, elapsed_ms)
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            buckets = {f"le_{int(bound)}ms": count for bound, count in zip(self.buckets_ms, self.counts, strict=False)}
+            buckets["le_inf"] = self.counts[-1]
+            return {
+                "count": self.count,
+                "avg_ms": round(self.total_ms / self.count, 3) if self.count else 0.0,
+                "max_ms": round(self.max_ms, 3),
+                "buckets": buckets,
+            }
+
+
+class TimeoutHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter that applies a default (connect, read) timeout to requests that do not set one."""
+
+    def __init__(self, *args: Any, timeout: tuple[float, float], **kwargs: Any) -> None:
+        self.timeout = timeout
+        super().__init__(*args, **kwargs)
+
+    def send(self, request: requests.PreparedRequest, **kwargs: Any) -> requests.Response:  # type: ignore[override]
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = self.timeout
+        return super().send(request, **kwargs)
+
+
+def endpoint_name(method: str, url: str) -> str:
+    """Collapse numeric path segments so /api/recipes/123 and /api/recipes/456 share one histogram."""
+    path = urlparse(url).path
+    segments = ["{id}" if _ID_SEGMENT.match(segment) else segment for segment in path.split("/")]
+    return f"{method.upper()} {'/'.join(segments)}"
+
+
+def request_key(
+    method: str, url: str, headers: Mapping[str, str] | None, params: Mapping[str, Any] | None
+) -> tuple[str, str, str]:
+    """Identify a request by method, URL with its encoded query string, and credentials.
+
+    The query string is encoded the way requests sends it, so the same params in the same order give the same key.
+    Requests made with different tokens are never shared.
+    """
+    prepared = requests.PreparedRequest()
+    prepared.prepare_url(url, params)
+    return method.upper(), prepared.url or url, (headers or {}).get("Authorization", "")
+
+
+def retry_after_seconds(response: httpx.Response) -> float | None:
+    """The wait a response asks for in its Retry-After header, given as seconds or an HTTP date."""
+    value = response.headers.get("Retry-After")
+    if value is None:
+        return None
+    if value.strip().isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max((retry_at - datetime.now(UTC)).total_seconds(), 0.0)
+
+
+def retry_backoff(retry_number: int) -> float:
+    """Seconds to wait before the given retry when CulOps sends no Retry-After, on urllib3's Retry schedule.
+
+    The first retry is immediate; later ones wait the backoff factor doubled per retry plus up to the jitter.
+    """
+    if retry_number <= 1:
+        return 0.0
+    backoff = settings.CULOPS_HTTP_RETRY_BACKOFF_FACTOR * (2 ** (retry_number - 1))
+    backoff += random.uniform(0, settings.CULOPS_HTTP_RETRY_BACKOFF_JITTER)
+    return float(min(Retry.DEFAULT_BACKOFF_MAX, backoff))
+
+
+@singleton
+class CulOpsTransport:
+    """Process-wide CulOps HTTP session with pooled keep-alive connections, retries and latency histograms.
+
+    Reads go through ``coalesce``/``coalesce_async`` so identical requests in flight at the same time, from any
+    CulOpsService instance, share one CulOps call.
+    """
+
+    def __init__(self) -> None:
+        self._session: requests.Session | None = None
+        self._async_client: httpx.AsyncClient | None = None
+        self._histograms: dict[str, LatencyHistogram] = {}
+        self._flights: SingleFlight[Any] = SingleFlight()
+        self._async_flights: AsyncSingleFlight[Any] = AsyncSingleFlight()
+        self._coalescing: dict[str, FlightStats] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def session(self) -> requests.Session:
+        session = self._session
+        if session is None:
+            with self._lock:
+                if self._session is None:
+                    self._session = self._build_session()
+                session = self._session
+        return session
+
+    @property
+    def async_client(self) -> httpx.AsyncClient:
+        client = self._async_client
+        if client is None:
+            with self._lock:
+                if self._async_client is None:
+                    self._async_client = self._build_async_client()
+                client = self._async_client
+        return client
+
+    def shutdown(self) -> None:
+        with self._lock:
+            session, self._session = self._session, None
+
+        if session is not None:
+            logger.info(
+                "Closing CulOps HTTP session",
+                extra={"latency": self.metrics(), "coalescing": self.coalescing_metrics()},
+            )
+            session.close()
+
+    async def shutdown_async(self) -> None:
+        with self._lock:
+            client, self._async_client = self._async_client, None
+
+        if client is not None:
+            logger.info("Closing async CulOps HTTP client")
+            await client.aclose()
+
+    def metrics(self) -> dict[str, dict[str, Any]]:
+        with self._lock:
+            histograms = list(self._histograms.items())
+        return {endpoint: histogram.snapshot() for endpoint, histogram in histograms}
+
+    def coalesce(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str] | None,
+        params: Mapping[str, Any] | None,
+        call: Callable[[], R],
+    ) -> R:
+        """Run ``call`` for this request, or wait for the identical one already in flight and share its result."""
+        if not settings.CULOPS_HTTP_SINGLE_FLIGHT_ENABLED:
+            return call()
+        result, shared = self._flights.do(request_key(method, url, headers, params), call)
+        self._count_flight(endpoint_name(method, url), shared)
+        return result  # type: ignore[no-any-return]
+
+    async def coalesce_async(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str] | None,
+        params: Mapping[str, Any] | None,
+        call: Callable[[], Awaitable[R]],
+    ) -> R:
+        if not settings.CULOPS_HTTP_SINGLE_FLIGHT_ENABLED:
+            return await call()
+        result, shared = await self._async_flights.do(request_key(method, url, headers, params), call)
+        self._count_flight(endpoint_name(method, url), shared)
+        return result  # type: ignore[no-any-return]
+
+    def coalescing_metrics(self) -> dict[str, dict[str, int]]:
+        """Per endpoint, the CulOps calls made and the callers that shared another caller's call instead."""
+        with self._lock:
+            return {endpoint: stats.snapshot() for endpoint, stats in self._coalescing.items()}
+
+    async def retry_async(self, send: Callable[[], Awaitable[httpx.Response]]) -> httpx.Response:
+        """Send a CulOps GET, retrying 429 and 5xx responses the way the pooled session's Retry does.
+
+        The async transport's own retries only cover connection errors. The last response is returned whatever its
+        status, so callers still see the error once retries run out.
+        """
+        retry_number = 0
+        while True:
+            response = await send()
+            if response.status_code not in RETRYABLE_STATUS_CODES or retry_number >= settings.CULOPS_HTTP_RETRY_COUNT:
+                return response
+            retry_number += 1
+            delay = retry_after_seconds(response)
+            await asyncio.sleep(retry_backoff(retry_number) if delay is None else delay)
+
+    def _count_flight(self, endpoint: str, shared: bool) -> None:
+        with self._lock:
+            stats = self._coalescing.setdefault(endpoint, FlightStats())
+            if shared:
+                stats.coalesced += 1
+            else:
+                stats.executed += 1
+
+    def _build_session(self) -> requests.Session:
+        session = requests.Session()
+
+        # Only GETs are retried; CulOps writes are not idempotent
+        retry = Retry(
+            total=settings.CULOPS_HTTP_RETRY_COUNT,
+            backoff_factor=settings.CULOPS_HTTP_RETRY_BACKOFF_FACTOR,
+            backoff_jitter=settings.CULOPS_HTTP_RETRY_BACKOFF_JITTER,
+            status_forcelist=RETRYABLE_STATUS_CODES,
+            allowed_methods=frozenset(["GET"]),
+            raise_on_status=False,
+            respect_retry_after_header=True,
+        )
+
+        adapter = TimeoutHTTPAdapter(
+            timeout=(settings.CULOPS_HTTP_CONNECT_TIMEOUT, settings.CULOPS_HTTP_READ_TIMEOUT),
+            pool_connections=settings.CULOPS_HTTP_POOL_CONNECTIONS,
+            pool_maxsize=settings.CULOPS_HTTP_POOL_MAXSIZE,
+            max_retries=retry,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.hooks["response"].append(self._record_latency)
+        return session
+
+    def _build_async_client(self) -> httpx.AsyncClient:
+        transport: httpx.AsyncBaseTransport
+        if settings.MOCK_CULOPS_API:
+            from src.clients.culops.mocks.async_transport import mocked_async_transport
+
+            transport = mocked_async_transport()
+        else:
+            # httpx retries only cover connection errors, which is safe for writes as well; reads retry 429 and 5xx
+            # through retry_async
+            transport = httpx.AsyncHTTPTransport(
+                retries=settings.CULOPS_HTTP_RETRY_COUNT,
+                limits=httpx.Limits(
+                    max_connections=settings.CULOPS_HTTP_POOL_MAXSIZE,
+                    max_keepalive_connections=settings.CULOPS_HTTP_POOL_CONNECTIONS,
+                ),
+            )
+
+        return httpx.AsyncClient(
+            transport=transport,
+            timeout=httpx.Timeout(settings.CULOPS_HTTP_READ_TIMEOUT, connect=settings.CULOPS_HTTP_CONNECT_TIMEOUT),
+            event_hooks={"request": [self._mark_request_start], "response": [self._record_async_latency]},
+        )
+
+    @staticmethod
+    async def _mark_request_start(request: httpx.Request) -> None:
+        request.extensions["started_at"] = time.perf_counter()
+
+    async def _record_async_latency(self, response: httpx.Response) -> None:
+        # The hook runs before the body is read, so this measures time to response headers
+        started_at = response.request.extensions.get("started_at")
+        if started_at is None:
+            return
+        elapsed_ms = (time.perf_counter() - started_at) * 1000
+        self._observe(endpoint_name(response.request.method, str(response.request.url)), elapsed_ms)
+
+    def _record_latency(self, response: requests.Response, *args: Any, **kwargs: Any) -> None:
+        endpoint = endpoint_name(response.request.method or "", response.request.url or "")
+        self._observe(endpoint, response.elapsed.total_seconds() * 1000)
+
+    def _observe(self, endpoint: str, elapsed_ms: float) -> None:
+        histogram = self._histograms.get(endpoint)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.setdefault(endpoint, LatencyHistogram())
+        histogram.observe(elapsed_ms)
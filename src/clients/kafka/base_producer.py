@@ -1,4 +1,7 @@
-from typing import cast
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, cast
 
 import kafka
 from google.protobuf.message import EncodeError, Message as ProtobufMessage
@@ -10,6 +13,8 @@ from src.utils.logger import ServiceLogger
 
 logger = ServiceLogger().get_logger(__name__)
 
+DeliveryErrorCallback = Callable[[Exception], None]
+
 
 class BaseProducer:
     def __init__(self, topic: str):
@@ -24,15 +29,23 @@ class BaseProducer:
             "retries": 3,
             "retry_backoff_ms": 300,
             "request_timeout_ms": 5000,
+            "linger_ms": self.settings.KAFKA_PRODUCER_LINGER_MS,
+            "batch_size": self.settings.KAFKA_PRODUCER_BATCH_SIZE,
+            "compression_type": self.settings.KAFKA_PRODUCER_COMPRESSION_TYPE,
+            "max_block_ms": int(self.settings.KAFKA_PRODUCER_ENQUEUE_TIMEOUT * 1000),
         }
         self.producer = kafka.KafkaProducer(**config)
+        # Bounds the number of async messages awaiting delivery so callers feel backpressure
+        # instead of growing the producer buffer without limit.
+        self._pending = threading.BoundedSemaphore(self.settings.KAFKA_PRODUCER_MAX_PENDING_MESSAGES)
+        # Delivery callbacks run off the Kafka I/O thread so slow handlers never stall sends.
+        self._callback_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"kafka-{topic}-callbacks")
 
     def __enter__(self) -> "BaseProducer":
         return self
 
     def __exit__(self, exc_type: type | None, exc_val: BaseException | None, exc_tb: object | None) -> None:
-        self.producer.flush()
-        self.producer.close()
+        self.close()
 
     def produce(self, message: str | ProtobufMessage | bytes, key: str | None = None) -> None:
         try:
@@ -43,6 +56,54 @@ class BaseProducer:
             logger.error("Error producing message to Kafka", exc_info=e)
             raise ServerError("Failed to produce message to Kafka") from e
 
+    def produce_async(
+        self,
+        message: str | ProtobufMessage | bytes,
+        key: str | None = None,
+        on_error: DeliveryErrorCallback | None = None,
+    ) -> Any:
+        """Queue a message for batched delivery and return the Kafka future without waiting for acks."""
+        if not self._pending.acquire(timeout=self.settings.KAFKA_PRODUCER_ENQUEUE_TIMEOUT):
+            raise ServerError(f"Kafka producer queue for topic {self.topic} is full")
+
+        try:
+            future = self.producer.send(topic=self.topic, value=message, key=key)
+        except (KafkaError, EncodeError) as e:
+            self._pending.release()
+            logger.error("Error producing message to Kafka", exc_info=e)
+            raise ServerError("Failed to produce message to Kafka") from e
+
+        def _on_success(_: Any) -> None:
+            self._pending.release()
+
+        def _on_error(error: Exception) -> None:
+            self._pending.release()
+            logger.error(f"Failed to deliver message to Kafka topic {self.topic}", exc_info=error)
+            if on_error is not None:
+                self._callback_executor.submit(self._run_error_callback, on_error, error)
+
+        future.add_callback(_on_success)
+        future.add_errback(_on_error)
+        return future
+
+    def flush(self, timeout: float | None = None) -> None:
+        try:
+            self.producer.flush(timeout=timeout)
+        except KafkaError as e:
+            logger.error(f"Failed to flush Kafka producer for topic {self.topic}", exc_info=e)
+
+    def close(self, timeout: float | None = None) -> None:
+        self.flush(timeout)
+        self._callback_executor.shutdown(wait=True)
+        self.producer.close()
+
+    @staticmethod
+    def _run_error_callback(callback: DeliveryErrorCallback, error: Exception) -> None:
+        try:
+            callback(error)
+        except Exception as e:
+            logger.error("Kafka delivery error callback failed", exc_info=e)
+
     @staticmethod
     def _key_serializer(key: str | None) -> bytes | None:
         if key is None:
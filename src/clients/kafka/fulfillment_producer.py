@@ -1,3 +1,5 @@
+from collections.abc import Callable
+
 from blueapron.proto.FulfillmentManagementService.Brand_pb2 import Brand
 from blueapron.proto.FulfillmentManagementService.MessageFlow_pb2 import (
     ConsumerToFulfillmentMessage,
@@ -24,8 +26,10 @@ from src.services.models.orders import LocationType, Order, SpecialHandlings
 
 
 class FulfillmentProducer(BaseProducer):
-    def __init__(self) -> None:
+    def __init__(self, on_delivery_failure: Callable[[Order, Exception], None] | None = None) -> None:
         super().__init__(topic=settings.FULFILLMENT_TOPIC)
+        # When set, messages are produced asynchronously and delivery failures are reported through this hook.
+        self._on_delivery_failure = on_delivery_failure
 
     def send_fulfillment_message(self, order: Order) -> None:
         postal_address = PostalAddress(
@@ -88,7 +92,14 @@ class FulfillmentProducer(BaseProducer):
         consumer_fulfillment_msg = ConsumerToFulfillmentMessage(fulfillment_request=fulfillment_req)
 
         try:
-            self.produce(consumer_fulfillment_msg)
+            if self._on_delivery_failure is None:
+                self.produce(consumer_fulfillment_msg)
+            else:
+                on_delivery_failure = self._on_delivery_failure
+                self.produce_async(
+                    consumer_fulfillment_msg,
+                    on_error=lambda error: on_delivery_failure(order, error),
+                )
         except Exception as e:
             raise ServerError(
                 f"Failed to produce fulfillment message to topic{settings.FULFILLMENT_TOPIC} for order {order.id}"
@@ -0,0 +1,67 @@
+import threading
+from collections.abc import Callable
+from typing import TypeVar
+
+from src.clients.kafka.base_producer import BaseProducer
+from src.core.config import settings
+from src.utils.logger import ServiceLogger
+from src.utils.singleton import singleton
+
+logger = ServiceLogger().get_logger(__name__)
+
+P = TypeVar("P", bound=BaseProducer)
+
+
+@singleton
+class ProducerRegistry:
+    """Holds one long-lived Kafka producer per topic for the lifetime of the process."""
+
+    def __init__(self) -> None:
+        self._producers: dict[str, BaseProducer] = {}
+        self._reports_to: dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def get(self, topic: str, factory: Callable[[], P], reports_to: str | None = None) -> P:
+        """The producer for ``topic``, created by ``factory`` on first use.
+
+        ``reports_to`` names the topic the producer's delivery callbacks send to, so shutdown closes this producer
+        first, while the one it reports to still accepts messages.
+        """
+        producer = self._producers.get(topic)
+        if producer is None:
+            with self._lock:
+                producer = self._producers.get(topic)
+                if producer is None:
+                    producer = factory()
+                    self._producers[topic] = producer
+                    if reports_to is not None:
+                        self._reports_to[topic] = reports_to
+        return producer  # type: ignore[return-value]
+
+    def shutdown(self) -> None:
+        """Flush and close every producer, including any a delivery callback creates while the others close.
+
+        Producers stay registered until all of them are closed, so a callback run by a closing producer reaches the
+        live producer of the topic it reports to instead of creating a new one.
+        """
+        closed: set[str] = set()
+        while True:
+            with self._lock:
+                remaining = [topic for topic in self._producers if topic not in closed]
+                # Producers that report to another topic go first, in registration order
+                remaining.sort(key=lambda topic: topic not in self._reports_to)
+                producers = [(topic, self._producers[topic]) for topic in remaining]
+            if not producers:
+                break
+
+            for topic, producer in producers:
+                logger.info(f"Flushing Kafka producer for topic {topic}")
+                try:
+                    producer.close(timeout=settings.KAFKA_PRODUCER_FLUSH_TIMEOUT)
+                except Exception as e:
+                    logger.error(f"Failed to close Kafka producer for topic {topic}", exc_info=e)
+                closed.add(topic)
+
+        with self._lock:
+            self._producers.clear()
+            self._reports_to.clear()
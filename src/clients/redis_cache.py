@@ -0,0 +1,42 @@
+from typing import cast
+
+from src.core.exceptions import ServerError
+from src.interfaces.cache_backend_interface import CacheBackendInterface
+
+# Optional Redis import; the shared cache tier is disabled when the package is not installed
+try:
+    import redis
+except ImportError:
+    redis = None  # type: ignore[assignment]
+
+
+class RedisCache(CacheBackendInterface):
+    def __init__(self, host: str, port: int, db: int, socket_timeout: float) -> None:
+        if redis is None:
+            raise ServerError("The redis package is not installed")
+        self.client = redis.Redis(
+            host=host,
+            port=port,
+            db=db,
+            socket_timeout=socket_timeout,
+            socket_connect_timeout=socket_timeout,
+        )
+
+    def get(self, key: str) -> bytes | None:
+        try:
+            value = self.client.get(key)
+        except redis.RedisError as e:
+            raise ServerError(f"Failed to read cache key {key}") from e
+        return cast(bytes | None, value)
+
+    def set(self, key: str, value: bytes, ttl_seconds: int) -> None:
+        try:
+            self.client.set(key, value, ex=ttl_seconds)
+        except redis.RedisError as e:
+            raise ServerError(f"Failed to write cache key {key}") from e
+
+    def delete(self, key: str) -> None:
+        try:
+            self.client.delete(key)
+        except redis.RedisError as e:
+            raise ServerError(f"Failed to delete cache key {key}") from e
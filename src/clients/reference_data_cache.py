@@ -0,0 +1,66 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from typing import Any
+
+from src.core.config import settings
+from src.services.models.recipe import RecipeSlotCode
+from src.utils.logger import ServiceLogger
+from src.utils.read_through_cache import ReadThroughCache
+from src.utils.singleton import singleton
+
+logger = ServiceLogger().get_logger(__name__)
+
+# (plan description, short code) of every CulOps recipe slot
+CulopsRecipeSlots = list[tuple[str, str]]
+
+
+@singleton
+class ReferenceDataCache:
+    """Process-wide caches for CulOps and Cabinet reference data that almost never changes.
+
+    Cycle ids, cycle existence and recipe slots are looked up on every recipe creation and slot assignment, by
+    per-request client instances, so the caches live here rather than on the clients.
+    """
+
+    def __init__(self) -> None:
+        enabled = settings.REFERENCE_CACHE_ENABLED
+        self.ttl_seconds = settings.REFERENCE_CACHE_TTL_SECONDS if enabled else 0
+        self.past_cycle_ttl_seconds = settings.REFERENCE_CACHE_PAST_CYCLE_TTL_SECONDS if enabled else 0
+        self._refresh_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="reference-cache-refresh")
+
+        self.culops_cycle_ids: ReadThroughCache[str | None] = self._cache()
+        self.culops_recipe_slots: ReadThroughCache[CulopsRecipeSlots] = self._cache()
+        self.cabinet_cycles: ReadThroughCache[bool] = self._cache()
+        self.cabinet_recipe_slots: ReadThroughCache[list[RecipeSlotCode]] = self._cache()
+
+    def cycle_ttl_seconds(self, cycle_date: date) -> float:
+        """Lookups for cycles already past no longer change, so they are kept longer than current ones."""
+        return self.past_cycle_ttl_seconds if cycle_date < date.today() else self.ttl_seconds
+
+    def clear(self) -> None:
+        for cache in self._caches().values():
+            cache.clear()
+
+    def metrics(self) -> dict[str, dict[str, Any]]:
+        return {name: cache.metrics() for name, cache in self._caches().items()}
+
+    def shutdown(self) -> None:
+        logger.info("Shutting down reference data caches", extra={"reference_cache": self.metrics()})
+        self._refresh_executor.shutdown(wait=False, cancel_futures=True)
+
+    def _cache(self) -> ReadThroughCache[Any]:
+        return ReadThroughCache(
+            max_entries=settings.REFERENCE_CACHE_MAX_ENTRIES,
+            ttl_seconds=self.ttl_seconds,
+            negative_ttl_seconds=settings.REFERENCE_CACHE_NEGATIVE_TTL_SECONDS if self.ttl_seconds else 0,
+            stale_seconds=settings.REFERENCE_CACHE_STALE_SECONDS,
+            refresh_executor=self._refresh_executor,
+        )
+
+    def _caches(self) -> dict[str, ReadThroughCache[Any]]:
+        return {
+            "culops_cycle_ids": self.culops_cycle_ids,
+            "culops_recipe_slots": self.culops_recipe_slots,
+            "cabinet_cycles": self.cabinet_cycles,
+            "cabinet_recipe_slots": self.cabinet_recipe_slots,
+        }
@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -35,6 +37,24 @@ class Settings(BaseSettings):
         default=6,
         description="Client-side timeout in seconds for waiting on a synchronous Kafka produce call to complete.",
     )
+    KAFKA_PRODUCER_LINGER_MS: int = Field(
+        default=20, description="Time in milliseconds the Kafka producer waits to batch messages before sending."
+    )
+    KAFKA_PRODUCER_BATCH_SIZE: int = Field(
+        default=65536, description="Kafka producer per-partition batch size in bytes."
+    )
+    KAFKA_PRODUCER_COMPRESSION_TYPE: str | None = Field(default="gzip")
+    KAFKA_PRODUCER_MAX_PENDING_MESSAGES: int = Field(
+        default=1000,
+        description="Maximum number of asynchronously produced messages awaiting delivery before producers block.",
+    )
+    KAFKA_PRODUCER_ENQUEUE_TIMEOUT: float = Field(
+        default=1.0,
+        description="Seconds an asynchronous produce call waits for room in the pending queue before failing.",
+    )
+    KAFKA_PRODUCER_FLUSH_TIMEOUT: int = Field(
+        default=10, description="Seconds to wait for pending Kafka messages to be delivered on shutdown."
+    )
     FULFILLMENT_TOPIC: str = Field(default="fes-async-in")
     FES_GRPC_HOST: str = Field(default="fulfillment-engine-grpc.wms.svc.cluster.local")
     GRPC_PORT: int = Field(default=50051)
@@ -60,11 +80,111 @@ class Settings(BaseSettings):
 
     # CulOps client config
     CULOPS_PANTRY_FETCH_SIZE: int = Field(default=100)
+    CULOPS_PANTRY_FETCH_CONCURRENCY: int = Field(
+        default=4, description="Maximum number of CulOps pantry pages fetched concurrently during a full crawl"
+    )
+    CULOPS_PANTRY_STREAMING: bool = Field(
+        default=False, description="Read CulOps pantry pages incrementally with ijson instead of decoding them whole"
+    )
+    CULOPS_HTTP_POOL_CONNECTIONS: int = Field(default=10, description="Number of host pools kept by the CulOps session")
+    CULOPS_HTTP_POOL_MAXSIZE: int = Field(default=20, description="Keep-alive connections kept per CulOps host")
+    CULOPS_HTTP_CONNECT_TIMEOUT: float = Field(default=3.05)
+    CULOPS_HTTP_READ_TIMEOUT: float = Field(default=30.0)
+    CULOPS_HTTP_RETRY_COUNT: int = Field(
+        default=2, description="Retries per CulOps GET on connection errors, 429 and 5xx"
+    )
+    CULOPS_HTTP_RETRY_BACKOFF_FACTOR: float = Field(default=0.5)
+    CULOPS_HTTP_RETRY_BACKOFF_JITTER: float = Field(
+        default=0.5, description="Upper bound in seconds of the random delay added to each CulOps retry backoff"
+    )
+    CULOPS_HTTP_SINGLE_FLIGHT_ENABLED: bool = Field(
+        default=True, description="Share one CulOps call between identical GETs that are in flight at the same time"
+    )
+    CULOPS_RECIPE_FETCH_CHUNK_SIZE: int = Field(
+        default=25, description="Number of CulOps recipe ids requested per filter[id][] call"
+    )
+    CULOPS_RECIPE_FETCH_CONCURRENCY: int = Field(
+        default=4, description="Maximum number of CulOps recipe chunks fetched concurrently"
+    )
 
     # Database connection pooling
     DB_POOL_SIZE: int = Field(default=20, description="SQLAlchemy connection pool size")
     DB_MAX_OVERFLOW: int = Field(default=10, description="SQLAlchemy max overflow connections")
     DB_POOL_TIMEOUT: int = Field(default=30, description="Connection pool timeout in seconds")
+    METRICS_LOG_INTERVAL_SECONDS: int = Field(
+        default=300, description="Seconds between logs of pool and cache metrics; 0 only logs them on shutdown"
+    )
+
+    # Pantry response cache
+    PANTRY_CACHE_ENABLED: bool = Field(default=True)
+    PANTRY_CACHE_TTL_SECONDS: int = Field(default=600)
+    PANTRY_CACHE_MAX_ENTRIES: int = Field(default=256, description="Pantry responses kept in the in-process tier")
+    PANTRY_CACHE_REDIS_RETRY_SECONDS: int = Field(
+        default=30, description="How long the Redis tier is bypassed after an error"
+    )
+
+    # CulOps and Cabinet reference data (cycles, recipe slots) cache
+    REFERENCE_CACHE_ENABLED: bool = Field(default=True)
+    REFERENCE_CACHE_TTL_SECONDS: int = Field(default=900)
+    REFERENCE_CACHE_PAST_CYCLE_TTL_SECONDS: int = Field(
+        default=86400, description="TTL of cycle lookups for dates already past, which no longer change"
+    )
+    REFERENCE_CACHE_NEGATIVE_TTL_SECONDS: int = Field(
+        default=60, description="How long a cycle or recipe slot lookup that found nothing is cached"
+    )
+    REFERENCE_CACHE_STALE_SECONDS: int = Field(
+        default=3600, description="How long past its TTL an entry is still served while it is refreshed"
+    )
+    REFERENCE_CACHE_MAX_ENTRIES: int = Field(default=512, description="Entries kept per reference data cache")
+
+    # Pantry snapshot crawls
+    PANTRY_CRAWL_MAX_WORKERS: int = Field(default=4, description="Pantry snapshot crawls run concurrently per process")
+    PANTRY_CRAWL_MAX_QUEUED: int = Field(
+        default=16, description="Crawls allowed to wait for a worker before new ones are rejected"
+    )
+    PANTRY_CRAWL_STALE_SECONDS: int = Field(
+        default=300, description="A running crawl that has not committed a page for this long is resumed"
+    )
+    PANTRY_CRAWL_MAX_ATTEMPTS: int = Field(default=3, description="Crawl attempts before a snapshot is marked failed")
+    PANTRY_COPY_LOADER_ENABLED: bool = Field(
+        default=True, description="Write pantry snapshot pages with binary COPY when the engine is psycopg"
+    )
+    PANTRY_STORAGE_MODE: Literal["relational", "blob"] = Field(
+        default="relational", description="Storage for new pantry snapshots; each snapshot records the mode it used"
+    )
+    PANTRY_BLOB_CODEC: Literal["zstd-msgpack", "zlib-json"] = Field(
+        default="zstd-msgpack", description="Codec of the compressed item chunks written in blob storage mode"
+    )
+    PANTRY_SHARED_SNAPSHOTS_ENABLED: bool = Field(
+        default=False, description="Crawl CulOps once per availability window and reference it from partner snapshots"
+    )
+    PANTRY_SHARED_SNAPSHOT_MAX_AGE_SECONDS: int = Field(
+        default=3600, description="New partner snapshots reuse a shared snapshot of their window up to this age"
+    )
+    PANTRY_PRICE_CACHE_MAX_ENTRIES: int = Field(
+        default=50_000, description="Marked-up item costs of shared snapshots kept in process"
+    )
+    PANTRY_PRICE_CACHE_TTL_SECONDS: int = Field(default=3600)
+    PANTRY_PREWARM_CONCURRENCY: int = Field(default=2, description="Partner pantries the pre-warm job crawls at once")
+    PANTRY_PREWARM_WINDOW_DAYS: int = Field(
+        default=0, description="Pre-warmed window: today through this many days ahead, or the open window when 0"
+    )
+    PANTRY_PREWARM_MAX_AGE_SECONDS: int = Field(
+        default=5400, description="Pre-warmed snapshots are served up to this age after publishing; 0 stops serving"
+    )
+    PANTRY_CRAWL_RECOVERY_BATCH_SIZE: int = Field(default=10, description="Stale crawls claimed per recovery run")
+    PANTRY_SNAPSHOT_RETENTION_DAYS: int = Field(
+        default=30, description="Daily pantry snapshot partitions older than this are dropped by the retention job"
+    )
+    PANTRY_PARTITION_PRECREATE_DAYS: int = Field(
+        default=7, description="Daily pantry snapshot partitions the retention job creates ahead of today"
+    )
+
+    # Redis (optional - the shared cache tier is skipped when REDIS_HOST is not set)
+    REDIS_HOST: str | None = Field(default=None)
+    REDIS_PORT: int = Field(default=6379)
+    REDIS_DB: int = Field(default=0)
+    REDIS_SOCKET_TIMEOUT: float = Field(default=0.25)
 
 
 def get_settings() -> Settings:
@@ -46,6 +46,11 @@ class UnprocessableException(HTTPException):
         super().__init__(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=detail)
 
 
+class ServiceUnavailableException(HTTPException):
+    def __init__(self, detail: str = "Service Unavailable"):
+        super().__init__(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=detail)
+
+
 class ServerError(Exception):
     def __init__(self, message: str):
         super().__init__(message)
@@ -1,8 +1,8 @@
 from contextvars import ContextVar
 
 import jwt
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from src.core.exceptions import AccessDeniedException
 from src.utils.logger import ServiceLogger
@@ -22,7 +22,7 @@ def _extract_partner_id_from_auth_header(auth_header: str | None) -> str | None:
             return None
         token = parts[1]
         payload = jwt.decode(token, options={"verify_signature": False, "verify_exp": False})
-        logger.info(f"payload: {payload}")
+        logger.debug("JWT payload decoded", extra={"claims": sorted(payload)})
         value = payload.get("custom:partner_id")
         if isinstance(value, str) and value:
             return value
@@ -31,24 +31,29 @@ def _extract_partner_id_from_auth_header(auth_header: str | None) -> str | None:
         return None
 
 
-class PartnerIDMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
-        if request.url.path == "/health":
-            return await call_next(request)
+class PartnerIDMiddleware:
+    """Pure ASGI middleware that decodes the access token once per request.
 
-        if request.method == "OPTIONS":
-            return await call_next(request)
-        logger.info(f"headers: {request.headers}")
+    The partner id is exposed through ``partner_id_ctx``, the logger context and ``request.state.partner_id``.
+    """
 
-        auth_header = request.headers.get("Authorization")
-        partner_id = _extract_partner_id_from_auth_header(auth_header)
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] == "/health" or scope["method"] == "OPTIONS":
+            await self.app(scope, receive, send)
+            return
+
+        partner_id = _extract_partner_id_from_auth_header(Headers(scope=scope).get("authorization"))
         if not partner_id:
             raise AccessDeniedException("No partner ID found in access token")
+
+        scope.setdefault("state", {})["partner_id"] = partner_id
         token = partner_id_ctx.set(partner_id)
         set_logger_context_value("partner_id", partner_id)
 
         try:
-            response = await call_next(request)
+            await self.app(scope, receive, send)
         finally:
             partner_id_ctx.reset(token)
-        return response
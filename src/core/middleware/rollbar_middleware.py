@@ -1,30 +1,33 @@
 """Rollbar middleware for FastAPI applications."""
 
-from collections.abc import Callable
-
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from src.core.config import settings
 
+# Optional Rollbar import (safe if not installed/initialized)
+try:
+    import rollbar
+except ImportError:
+    rollbar = None  # type: ignore[assignment]
 
-class RollbarMiddleware(BaseHTTPMiddleware):
-    """Middleware to automatically report exceptions to Rollbar with request context."""
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        if not settings.ROLLBAR_SERVER_TOKEN:
-            return await call_next(request)
+class RollbarMiddleware:
+    """Pure ASGI middleware to automatically report exceptions to Rollbar with request context."""
 
-        try:
-            import rollbar
-        except ImportError:
-            return await call_next(request)
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
 
-        try:
-            response = await call_next(request)
-            return response
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not settings.ROLLBAR_SERVER_TOKEN or rollbar is None:
+            await self.app(scope, receive, send)
+            return
 
-        except Exception as exc:
+        try:
+            await self.app(scope, receive, send)
+        except Exception:
+            # The request is only materialised on the error path
+            request = Request(scope)
             partner_id = getattr(request.state, "partner_id", None)
             user_id = getattr(request.state, "user_id", None)
 
@@ -51,4 +54,4 @@ class RollbarMiddleware(BaseHTTPMiddleware):
             }
 
             rollbar.report_exc_info(extra_data=extra_data)
-            raise exc
+            raise
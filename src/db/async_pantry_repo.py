@@ -0,0 +1,54 @@
+from uuid import UUID
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from src.core.exceptions import ServerError
+from src.db.async_repo_base import AsyncRepositoryBase
+from src.db.pantry_queries import (
+    current_pantry_state_stmt,
+    pantry_snapshot_progress_from_row,
+    pantry_state_stmt,
+    read_pantry_page,
+    run_statements_async,
+)
+from src.interfaces.pantry_db_interface import AsyncPantryDBInterface
+from src.services.models.pantry import CurrentPantryState, Pantry, PantrySnapshotProgress
+
+
+class AsyncPantryRepo(AsyncRepositoryBase, AsyncPantryDBInterface):
+    async def get_partner_pantry_by_id(
+        self,
+        pantry_state_id: str,
+        partner_id: str,
+        page_size: int,
+        page: int = 1,
+        after: str | None = None,
+    ) -> tuple[Pantry | None, int]:
+        steps = read_pantry_page(pantry_state_id, partner_id, page_size, page, after)
+        try:
+            async with self._connection() as conn:
+                return await run_statements_async(steps, conn.execute)
+        except SQLAlchemyError as e:
+            raise ServerError(f"failed to get partner {partner_id} pantry {pantry_state_id}") from e
+
+    async def get_pantry_snapshot_progress(
+        self, pantry_state_id: str, partner_id: str
+    ) -> PantrySnapshotProgress | None:
+        try:
+            async with self._connection() as conn:
+                result = await conn.execute(pantry_state_stmt(UUID(pantry_state_id), partner_id))
+                row = result.mappings().fetchone()
+        except SQLAlchemyError as e:
+            raise ServerError(f"failed to get crawl progress for pantry state {pantry_state_id}") from e
+
+        return pantry_snapshot_progress_from_row(row, pantry_state_id) if row else None
+
+    async def get_current_pantry_state(self, partner_id: str) -> CurrentPantryState | None:
+        try:
+            async with self._connection() as conn:
+                result = await conn.execute(current_pantry_state_stmt(partner_id))
+                row = result.mappings().fetchone()
+        except SQLAlchemyError as e:
+            raise ServerError(f"failed to get the current pantry state of partner {partner_id}") from e
+
+        return CurrentPantryState.model_validate(dict(row)) if row else None
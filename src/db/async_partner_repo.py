@@ -0,0 +1,51 @@
+from dateutil import parser
+from sqlalchemy import select
+from sqlalchemy.exc import SQLAlchemyError
+
+from src.core.exceptions import ServerError
+from src.db.async_repo_base import AsyncRepositoryBase
+from src.db.schema import cost_markups, partner_brands, partners
+from src.interfaces.partner_repo_interface import AsyncPartnerRepoInterface
+from src.services.models.partner import Brand, CostMarkup
+
+
+class AsyncPartnerRepo(AsyncRepositoryBase, AsyncPartnerRepoInterface):
+    async def find_partner_id(self, partner_id: str) -> bool:
+        try:
+            async with self._connection() as conn:
+                stmt = select(partners).where(partners.c.partner_id == partner_id)
+                return bool((await conn.execute(stmt)).first())
+        except SQLAlchemyError as e:
+            raise ServerError(f"Failed to find partner {partner_id}") from e
+
+    async def get_partner_cost_markups(self, partner_id: str) -> list[CostMarkup]:
+        try:
+            async with self._connection() as conn:
+                stmt = select(cost_markups).where(cost_markups.c.partner_id == partner_id)
+                rows = (await conn.execute(stmt)).mappings().fetchall()
+                return [
+                    CostMarkup(
+                        applied_from=parser.parse(row["applied_from"]) if row.get("applied_from") else None,
+                        applied_until=parser.parse(row["applied_until"]) if row.get("applied_until") else None,
+                        markup_percent=row["markup_percent"],
+                    )
+                    for row in rows
+                ]
+        except SQLAlchemyError as e:
+            raise ServerError(f"failed to get cost markups for partner {partner_id}") from e
+
+    async def get_branding(self, partner_id: str) -> list[Brand]:
+        try:
+            async with self._connection() as conn:
+                stmt = select(partner_brands).where(partner_brands.c.partner_id == partner_id)
+                rows = (await conn.execute(stmt)).mappings().fetchall()
+                return [
+                    Brand(
+                        partner_id=row["partner_id"],
+                        name=row["name"],
+                        fes_name=row["fes_name"],
+                    )
+                    for row in rows
+                ]
+        except SQLAlchemyError as e:
+            raise ServerError(f"Failed to find brands for partner {partner_id}") from e
@@ -0,0 +1,15 @@
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from src.core.config import settings
+from src.db.engine_registry import EngineRegistry, default_engine_key
+
+
+class AsyncRepositoryBase:
+    def __init__(self) -> None:
+        self._config = settings
+        self._engine_key = default_engine_key()
+        self._registry = EngineRegistry()
+        self._engine = self._registry.get_async_engine(self._engine_key)
+
+    def _connection(self) -> AsyncConnection:
+        return self._registry.async_connect(self._engine_key)
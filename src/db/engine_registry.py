@@ -0,0 +1,228 @@
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry, QueuePool
+
+from src.core.config import settings
+from src.utils.logger import ServiceLogger
+from src.utils.singleton import singleton
+
+logger = ServiceLogger().get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class EngineKey:
+    dsn: str
+    pool_size: int
+    max_overflow: int
+    pool_timeout: int
+    echo: bool
+
+
+@dataclass
+class PoolMetrics:
+    checkouts: int = 0
+    checkins: int = 0
+    connects: int = 0
+    wait_count: int = 0
+    wait_seconds_total: float = 0.0
+    wait_seconds_max: float = 0.0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def record_wait(self, elapsed: float) -> None:
+        with self._lock:
+            self.wait_count += 1
+            self.wait_seconds_total += elapsed
+            self.wait_seconds_max = max(self.wait_seconds_max, elapsed)
+
+    def record_connect(self) -> None:
+        with self._lock:
+            self.connects += 1
+
+    def record_checkout(self) -> None:
+        with self._lock:
+            self.checkouts += 1
+
+    def record_checkin(self) -> None:
+        with self._lock:
+            self.checkins += 1
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "checkouts_total": self.checkouts,
+                "checkins_total": self.checkins,
+                "connects_total": self.connects,
+                "wait_count": self.wait_count,
+                "wait_seconds_total": round(self.wait_seconds_total, 6),
+                "wait_seconds_max": round(self.wait_seconds_max, 6),
+            }
+
+
+class TimedQueuePool(QueuePool):
+    """Records how long each checkout took to get a connection from the pool, waiting included.
+
+    Pre-ping and the Connection wrapper are not part of the wait; a checkout that opens a new connection is.
+    """
+
+    metrics: PoolMetrics
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            self.metrics.record_wait(time.perf_counter() - started)
+
+    def recreate(self) -> QueuePool:
+        pool = super().recreate()
+        pool.metrics = self.metrics  # type: ignore[attr-defined]
+        return pool
+
+
+class TimedAsyncAdaptedQueuePool(TimedQueuePool, AsyncAdaptedQueuePool):
+    pass
+
+
+def default_dsn() -> str:
+    return (
+        f"postgresql+psycopg://{settings.DATABASE_USER}:{settings.DATABASE_PASSWORD}"
+        f"@{settings.DATABASE_URL}/{settings.DATABASE_NAME}"
+    )
+
+
+def default_engine_key() -> EngineKey:
+    return EngineKey(
+        dsn=default_dsn(),
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        echo=settings.DEPLOY_ENV != "production",
+    )
+
+
+@singleton
+class EngineRegistry:
+    """Process-wide SQLAlchemy engines keyed by DSN and pool settings.
+
+    Repositories borrow connections from the shared pools instead of creating an engine per instance.
+    """
+
+    def __init__(self) -> None:
+        self._engines: dict[EngineKey, Engine] = {}
+        self._async_engines: dict[EngineKey, AsyncEngine] = {}
+        self._metrics: dict[EngineKey, PoolMetrics] = {}
+        self._async_metrics: dict[EngineKey, PoolMetrics] = {}
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        self.get_engine(default_engine_key())
+
+    def shutdown(self) -> None:
+        with self._lock:
+            engines = list(self._engines.items())
+            self._engines.clear()
+
+        for key, engine in engines:
+            logger.info("Disposing database engine", extra=self._pool_stats(key, engine))
+            engine.dispose()
+
+    async def shutdown_async(self) -> None:
+        with self._lock:
+            engines = list(self._async_engines.items())
+            self._async_engines.clear()
+
+        for key, engine in engines:
+            logger.info("Disposing async database engine", extra=self._pool_stats(key, engine.sync_engine, async_=True))
+            await engine.dispose()
+
+    def get_engine(self, key: EngineKey | None = None) -> Engine:
+        key = key or default_engine_key()
+        engine = self._engines.get(key)
+        if engine is not None:
+            return engine
+
+        with self._lock:
+            engine = self._engines.get(key)
+            if engine is None:
+                engine = create_engine(
+                    key.dsn,
+                    echo=key.echo,
+                    future=True,
+                    pool_size=key.pool_size,
+                    max_overflow=key.max_overflow,
+                    pool_timeout=key.pool_timeout,
+                    pool_pre_ping=True,
+                    poolclass=TimedQueuePool,
+                )
+                self._metrics[key] = self._metrics.get(key) or PoolMetrics()
+                self._register_pool_events(engine, self._metrics[key])
+                self._engines[key] = engine
+        return engine
+
+    def connect(self, key: EngineKey | None = None) -> Connection:
+        return self.get_engine(key).connect()
+
+    def get_async_engine(self, key: EngineKey | None = None) -> AsyncEngine:
+        key = key or default_engine_key()
+        engine = self._async_engines.get(key)
+        if engine is not None:
+            return engine
+
+        with self._lock:
+            engine = self._async_engines.get(key)
+            if engine is None:
+                engine = create_async_engine(
+                    key.dsn,
+                    echo=key.echo,
+                    pool_size=key.pool_size,
+                    max_overflow=key.max_overflow,
+                    pool_timeout=key.pool_timeout,
+                    pool_pre_ping=True,
+                    poolclass=TimedAsyncAdaptedQueuePool,
+                )
+                self._async_metrics[key] = self._async_metrics.get(key) or PoolMetrics()
+                self._register_pool_events(engine.sync_engine, self._async_metrics[key])
+                self._async_engines[key] = engine
+        return engine
+
+    def async_connect(self, key: EngineKey | None = None) -> AsyncConnection:
+        """Return an AsyncConnection to use as ``async with registry.async_connect() as conn``."""
+        return self.get_async_engine(key).connect()
+
+    def metrics(self) -> list[dict[str, Any]]:
+        with self._lock:
+            engines = list(self._engines.items())
+            async_engines = list(self._async_engines.items())
+        return [self._pool_stats(key, engine) for key, engine in engines] + [
+            self._pool_stats(key, engine.sync_engine, async_=True) for key, engine in async_engines
+        ]
+
+    def _pool_stats(self, key: EngineKey, engine: Engine, async_: bool = False) -> dict[str, Any]:
+        metrics = self._async_metrics[key] if async_ else self._metrics[key]
+        stats: dict[str, Any] = {
+            "async": async_,
+            "database": engine.url.render_as_string(hide_password=True),
+            "pool_size": key.pool_size,
+            "max_overflow": key.max_overflow,
+            **metrics.snapshot(),
+        }
+        pool = engine.pool
+        if isinstance(pool, QueuePool):
+            stats["checked_out"] = pool.checkedout()
+            stats["checked_in"] = pool.checkedin()
+            stats["overflow"] = max(pool.overflow(), 0)
+        return stats
+
+    @staticmethod
+    def _register_pool_events(engine: Engine, metrics: PoolMetrics) -> None:
+        # The checkout wait is timed by the pool class, which needs the same metrics
+        engine.pool.metrics = metrics  # type: ignore[attr-defined]
+        event.listen(engine, "connect", lambda *_: metrics.record_connect())
+        event.listen(engine, "checkout", lambda *_: metrics.record_checkout())
+        event.listen(engine, "checkin", lambda *_: metrics.record_checkin())
@@ -1,9 +1,18 @@
-from datetime import datetime
+from datetime import UTC, date, datetime
 from uuid import UUID
 
 from src.core.exceptions import NotFoundException
-from src.interfaces.pantry_db_interface import PantryDBInterface
-from src.services.models.pantry import Pantry, PantryItem, PantryItemCulinaryIngredientSpecification
+from src.interfaces.pantry_db_interface import AsyncPantryDBInterface, PantryDBInterface
+from src.services.models.pantry import (
+    CurrentPantryState,
+    Pantry,
+    PantryCrawlCheckpoint,
+    PantryItem,
+    PantryItemCulinaryIngredientSpecification,
+    PantrySnapshotProgress,
+    PantrySnapshotStatus,
+    SharedPantrySnapshot,
+)
 from src.services.models.recipe import RecipePantryItemData
 from src.utils.generate_pantry_mocks import generate_mock_pantry_items
 
@@ -39,6 +48,9 @@ class MockPantryDB(PantryDBInterface):
                 partner_cost_markup=[],
             ),
         ]
+        self.crawl_statuses: dict[str, PantrySnapshotStatus] = {}
+        self.current_pantry_states: dict[str, CurrentPantryState] = {}
+        self.pages_fetched: dict[str, int] = {}
 
     def get_partner_pantry_by_id(
         self,
@@ -46,6 +58,7 @@ class MockPantryDB(PantryDBInterface):
         partner_id: str,
         page_size: int,
         page: int = 1,
+        after: str | None = None,
     ) -> tuple[Pantry | None, int]:
         if not isinstance(pantry_state_id, str):
             pantry_state_id = str(pantry_state_id)
@@ -59,6 +72,9 @@ class MockPantryDB(PantryDBInterface):
 
         total_count = len(pantry.pantry_items)
         offset = (page - 1) * page_size
+        if after:
+            item_ids = [item.id for item in pantry.pantry_items]
+            offset = item_ids.index(after) + 1 if after in item_ids else total_count
         paginated_items = pantry.pantry_items[offset : offset + page_size]
 
         paginated_pantry = Pantry(
@@ -84,27 +100,96 @@ class MockPantryDB(PantryDBInterface):
     ) -> RecipePantryItemData | None:
         return None
 
+    def get_pantry_item_data_by_culops_culinary_ingredient_and_specification_ids(
+        self, culinary_ingredient_pairs: list[tuple[int, int]]
+    ) -> dict[tuple[int, int], RecipePantryItemData]:
+        return {}
+
     def save_pantry_state(
         self,
         pantry_state_id: UUID,
-        partner_id: str,
+        partner_id: str | None,
         pantry_state_timestamp: datetime,
         items_available_from: datetime | None,
         items_available_until: datetime | None,
+        brand_name: str = "",
+        crawl_page_size: int | None = None,
     ) -> None:
         string_pantry_state_id = str(pantry_state_id)
         pantry = Pantry(
             pantry_state_id=string_pantry_state_id,
             pantry_items=[],
-            partner_id=partner_id,
+            partner_id=partner_id or "",
             pantry_state_timestamp=pantry_state_timestamp,
             ingredients_available_from=items_available_from,
             ingredients_available_until=items_available_until,
             partner_cost_markup=[],
         )
         self.mock_data.append(pantry)
+        self.crawl_statuses[string_pantry_state_id] = PantrySnapshotStatus.RUNNING
+
+    def find_shared_pantry_snapshot(
+        self,
+        items_available_from: datetime | None,
+        items_available_until: datetime | None,
+        fresh_after: datetime,
+    ) -> SharedPantrySnapshot | None:
+        return None
+
+    def save_pantry_reference(
+        self,
+        pantry_state_id: UUID,
+        partner_id: str,
+        source: SharedPantrySnapshot,
+        items_available_from: datetime | None,
+        items_available_until: datetime | None,
+        brand_name: str = "",
+    ) -> None:
+        pass
 
-    def save_pantry_items(self, pantry_state_id: UUID, items: list[PantryItem]) -> None:
+    def publish_current_pantry_state(
+        self,
+        partner_id: str,
+        pantry_state_id: UUID,
+        items_available_from: datetime | None,
+        items_available_until: datetime | None,
+    ) -> None:
+        self.current_pantry_states[partner_id] = CurrentPantryState(
+            partner_id=partner_id,
+            pantry_state_id=pantry_state_id,
+            items_available_from=items_available_from,
+            items_available_until=items_available_until,
+            published_at=datetime.now(UTC),
+        )
+
+    def get_current_pantry_state(self, partner_id: str) -> CurrentPantryState | None:
+        return self.current_pantry_states.get(partner_id)
+
+    def finish_pantry_crawl(self, pantry_state_id: UUID, status: PantrySnapshotStatus) -> None:
+        self.crawl_statuses[str(pantry_state_id)] = status
+
+    def claim_stale_pantry_crawls(self, stale_before: datetime, limit: int) -> list[PantryCrawlCheckpoint]:
+        return []
+
+    def get_pantry_snapshot_progress(self, pantry_state_id: str, partner_id: str) -> PantrySnapshotProgress | None:
+        pantry = next(
+            (p for p in self.mock_data if p.pantry_state_id == pantry_state_id and p.partner_id == partner_id),
+            None,
+        )
+        if not pantry:
+            return None
+
+        return PantrySnapshotProgress(
+            pantry_state_id=pantry_state_id,
+            status=self.crawl_statuses.get(pantry_state_id, PantrySnapshotStatus.COMPLETE),
+            pages_fetched=self.pages_fetched.get(pantry_state_id, 0),
+            item_count=len(pantry.pantry_items),
+            finished_at=None,
+        )
+
+    def save_pantry_items(
+        self, pantry_state_id: UUID, items: list[PantryItem], page_number: int | None = None
+    ) -> None:
         string_pantry_state_id = str(pantry_state_id)
         pantry = next(
             (p for p in self.mock_data if p.pantry_state_id == string_pantry_state_id),
@@ -113,6 +198,31 @@ class MockPantryDB(PantryDBInterface):
         if not pantry:
             raise NotFoundException(f"No pantry found with id: {pantry_state_id}")
         pantry.pantry_items.extend(items)
+        self.pages_fetched[string_pantry_state_id] = self.pages_fetched.get(string_pantry_state_id, 0) + 1
 
     def delete_pantry(self, pantry_state_id: UUID) -> None:
         pass
+
+    def create_pantry_partitions(self, first_day: date, last_day: date) -> int:
+        return 0
+
+    def drop_pantry_partitions_before(self, cutoff: date) -> list[date]:
+        return []
+
+
+class MockAsyncPantryDB(AsyncPantryDBInterface):
+    def __init__(self) -> None:
+        self.pantry_db = MockPantryDB()
+
+    async def get_partner_pantry_by_id(
+        self, pantry_state_id: str, partner_id: str, page_size: int, page: int, after: str | None = None
+    ) -> tuple[Pantry | None, int]:
+        return self.pantry_db.get_partner_pantry_by_id(pantry_state_id, partner_id, page_size, page, after)
+
+    async def get_pantry_snapshot_progress(
+        self, pantry_state_id: str, partner_id: str
+    ) -> PantrySnapshotProgress | None:
+        return self.pantry_db.get_pantry_snapshot_progress(pantry_state_id, partner_id)
+
+    async def get_current_pantry_state(self, partner_id: str) -> CurrentPantryState | None:
+        return self.pantry_db.get_current_pantry_state(partner_id)
@@ -1,4 +1,4 @@
-from src.interfaces.partner_repo_interface import PartnerRepoInterface
+from src.interfaces.partner_repo_interface import AsyncPartnerRepoInterface, PartnerRepoInterface
 from src.services.models.pantry import PartnerCostMarkup
 from src.services.models.partner import Brand, CostMarkup, Partner, PartnerRecipePlanMap, SalesChannel
 from src.services.models.recipe import PackagingConfigurationTag, RecipeConstraintTag, TagListType
@@ -6,6 +6,9 @@ from src.utils.datetime_helper import parse_to_datetime
 
 
 class MockPartnerDB(PartnerRepoInterface):
+    def get_partner_ids(self) -> list[str]:
+        return ["123", "BA-MAIN", "partner_123"]
+
     def find_partner_id(self, partner_id: str) -> bool:
         return partner_id in ["123", "partner_123", "BA-MAIN"]
 
@@ -88,3 +91,17 @@ class MockPartnerDB(PartnerRepoInterface):
     def get_sales_channels(self, partner_id: str) -> list[SalesChannel]:
         sc: list[SalesChannel] = []
         return sc
+
+
+class MockAsyncPartnerDB(AsyncPartnerRepoInterface):
+    def __init__(self) -> None:
+        self.partner_db = MockPartnerDB()
+
+    async def find_partner_id(self, partner_id: str) -> bool:
+        return self.partner_db.find_partner_id(partner_id)
+
+    async def get_partner_cost_markups(self, partner_id: str) -> list[CostMarkup]:
+        return self.partner_db.get_partner_cost_markups(partner_id)
+
+    async def get_branding(self, partner_id: str) -> list[Brand]:
+        return self.partner_db.get_branding(partner_id)
@@ -0,0 +1,188 @@
+"""Blob storage mode for pantry snapshots: compressed chunks of items, one per saved page, keyed by snapshot.
+
+Items are encoded as positional rows holding exactly what the relational read path returns, so a page reads the
+same in either mode except for its order: chunks keep the crawl order instead of sorting by pantry item id.
+"""
+
+import json
+import zlib
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any
+from uuid import UUID
+
+import msgpack
+import zstandard
+from sqlalchemy import RowMapping, Select, any_, func, select
+
+from src.core.exceptions import ServerError
+from src.db.schema import pantry_item_chunks
+from src.services.models.pantry import (
+    PantryItem,
+    PantryItemAvailability,
+    PantryItemCost,
+    PantryItemCustomField,
+)
+
+ZSTD_LEVEL = 3
+ZLIB_LEVEL = 6
+
+
+@dataclass(frozen=True)
+class PantryChunkCodec:
+    name: str
+    encode: Callable[[list[Any]], bytes]
+    decode: Callable[[bytes], list[Any]]
+
+
+def _zstd_msgpack_encode(rows: list[Any]) -> bytes:
+    packed: bytes = msgpack.packb(rows)
+    return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(packed)
+
+
+def _zstd_msgpack_decode(payload: bytes) -> list[Any]:
+    rows: list[Any] = msgpack.unpackb(zstandard.ZstdDecompressor().decompress(payload))
+    return rows
+
+
+def _zlib_json_encode(rows: list[Any]) -> bytes:
+    return zlib.compress(json.dumps(rows, separators=(",", ":")).encode(), ZLIB_LEVEL)
+
+
+def _zlib_json_decode(payload: bytes) -> list[Any]:
+    rows: list[Any] = json.loads(zlib.decompress(payload))
+    return rows
+
+
+CHUNK_CODECS: dict[str, PantryChunkCodec] = {
+    codec.name: codec
+    for codec in (
+        PantryChunkCodec("zstd-msgpack", _zstd_msgpack_encode, _zstd_msgpack_decode),
+        PantryChunkCodec("zlib-json", _zlib_json_encode, _zlib_json_decode),
+    )
+}
+
+
+def get_chunk_codec(name: str) -> PantryChunkCodec:
+    codec = CHUNK_CODECS.get(name)
+    if codec is None:
+        raise ServerError(f"Unknown pantry chunk codec {name}")
+    return codec
+
+
+def pantry_chunk_values(
+    pantry_state_id: UUID,
+    snapshot_date: date,
+    chunk_no: int,
+    item_offset: int,
+    items: Sequence[PantryItem],
+    codec: PantryChunkCodec,
+) -> dict[str, Any]:
+    return {
+        "pantry_state_id": pantry_state_id,
+        "snapshot_date": snapshot_date,
+        "chunk_no": chunk_no,
+        "item_offset": item_offset,
+        "item_count": len(items),
+        "item_ids": [UUID(item.id) for item in items],
+        "encoding": codec.name,
+        "payload": codec.encode([_encode_item(item) for item in items]),
+    }
+
+
+def pantry_chunk_page_stmt(pantry_state_id: UUID, snapshot_date: date, offset: int, page_size: int) -> Select:
+    """The chunks overlapping items ``offset`` to ``offset + page_size`` of the snapshot, in crawl order."""
+    return (
+        select(pantry_item_chunks.c.item_offset, pantry_item_chunks.c.encoding, pantry_item_chunks.c.payload)
+        .where(
+            pantry_item_chunks.c.pantry_state_id == pantry_state_id,
+            pantry_item_chunks.c.snapshot_date == snapshot_date,
+            pantry_item_chunks.c.item_offset < offset + page_size,
+            pantry_item_chunks.c.item_offset + pantry_item_chunks.c.item_count > offset,
+        )
+        .order_by(pantry_item_chunks.c.item_offset)
+    )
+
+
+def pantry_chunk_cursor_offset_stmt(pantry_state_id: UUID, snapshot_date: date, after: UUID) -> Select:
+    """Offset of the item following the cursor item; array positions are 1-based, so no adjustment is needed."""
+    return select(pantry_item_chunks.c.item_offset + func.array_position(pantry_item_chunks.c.item_ids, after)).where(
+        pantry_item_chunks.c.pantry_state_id == pantry_state_id,
+        pantry_item_chunks.c.snapshot_date == snapshot_date,
+        any_(pantry_item_chunks.c.item_ids) == after,
+    )
+
+
+def pantry_items_from_chunks(rows: Iterable[RowMapping], offset: int, page_size: int) -> list[PantryItem]:
+    """Decode the page's items from its chunk rows; the rows must be in ``item_offset`` order."""
+    items: list[PantryItem] = []
+    for row in rows:
+        remaining = page_size - len(items)
+        if remaining <= 0:
+            break
+        codec = CHUNK_CODECS.get(row["encoding"])
+        if codec is None:
+            raise ServerError(f"Cannot decode pantry chunk encoded with {row['encoding']}")
+
+        start = max(offset - row["item_offset"], 0)
+        items.extend(_decode_item(encoded) for encoded in codec.decode(row["payload"])[start : start + remaining])
+    return items
+
+
+def _encode_item(item: PantryItem) -> list[Any]:
+    # Amounts and costs are rounded and dates truncated the way the relational columns store them
+    return [
+        item.id,
+        item.description,
+        round(item.amount, 2),
+        item.units,
+        item.is_prepped_and_ready,
+        item.brand_name or None,
+        [
+            [round(cost.production_cost_us_dollars, 2), _encode_date(cost.start_date), _encode_date(cost.end_date)]
+            for cost in item.cost
+        ],
+        [
+            [_encode_date(availability.available_from), _encode_date(availability.available_until)]
+            for availability in item.availability
+        ],
+        [[custom_field.key, custom_field.value] for custom_field in item.custom_fields or []],
+    ]
+
+
+def _decode_item(encoded: list[Any]) -> PantryItem:
+    item_id, description, amount, units, is_prepped_and_ready, brand_name, costs, availabilities, custom_fields = (
+        encoded
+    )
+    return PantryItem(
+        id=item_id,
+        description=description,
+        amount=amount,
+        units=units,
+        is_prepped_and_ready=is_prepped_and_ready,
+        cost=[
+            PantryItemCost(
+                production_cost_us_dollars=production_cost_us_dollars,
+                start_date=_decode_date(start_date),
+                end_date=_decode_date(end_date),
+            )
+            for production_cost_us_dollars, start_date, end_date in costs
+        ],
+        availability=[
+            PantryItemAvailability(
+                available_from=_decode_date(available_from), available_until=_decode_date(available_until)
+            )
+            for available_from, available_until in availabilities
+        ],
+        custom_fields=[PantryItemCustomField(key=key, value=value) for key, value in custom_fields],
+        brand_name=brand_name,
+    )
+
+
+def _encode_date(value: datetime | None) -> str | None:
+    return value.date().isoformat() if value else None
+
+
+def _decode_date(value: str | None) -> datetime | None:
+    return datetime.fromisoformat(value) if value else None
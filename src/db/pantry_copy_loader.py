@@ -0,0 +1,183 @@
+"""Bulk writes of pantry item rows, streamed with PostgreSQL binary COPY where the driver supports it."""
+
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import date
+from decimal import Decimal
+from typing import Any, cast
+from uuid import UUID
+
+import psycopg
+from sqlalchemy import Table
+from sqlalchemy.engine import Connection
+
+from src.db.schema import (
+    pantry_item_availabilities,
+    pantry_item_costs,
+    pantry_item_custom_fields,
+    pantry_item_data_sources,
+    pantry_items,
+)
+from src.services.models.pantry import PantryItem
+
+Row = tuple[Any, ...]
+
+
+@dataclass(frozen=True)
+class CopyTarget:
+    table: Table
+    columns: tuple[str, ...]
+    # Binary COPY sends values in the server's wire format, so every column needs its exact Postgres type
+    pg_types: tuple[str, ...]
+
+    @property
+    def copy_sql(self) -> str:
+        return f"COPY {self.table.name} ({', '.join(self.columns)}) FROM STDIN (FORMAT BINARY)"
+
+
+# In foreign key order: the item rows must exist before the rows that reference them
+PANTRY_ITEMS = CopyTarget(
+    pantry_items,
+    (
+        "pantry_item_id",
+        "snapshot_date",
+        "pantry_state_id",
+        "description",
+        "amount",
+        "units",
+        "is_prepped_and_ready",
+        "brand_name",
+    ),
+    ("uuid", "date", "uuid", "varchar", "numeric", "varchar", "bool", "varchar"),
+)
+DATA_SOURCES = CopyTarget(
+    pantry_item_data_sources,
+    ("pantry_item_id", "snapshot_date", "culops_culinary_ingredient_id", "culops_culinary_ingredient_specification_id"),
+    ("uuid", "date", "int8", "int8"),
+)
+COSTS = CopyTarget(
+    pantry_item_costs,
+    ("pantry_item_id", "snapshot_date", "applied_from", "applied_until", "production_cost_us_dollars"),
+    ("uuid", "date", "varchar", "varchar", "numeric"),
+)
+AVAILABILITIES = CopyTarget(
+    pantry_item_availabilities,
+    ("pantry_item_id", "snapshot_date", "applied_from", "applied_until"),
+    ("uuid", "date", "varchar", "varchar"),
+)
+CUSTOM_FIELDS = CopyTarget(
+    pantry_item_custom_fields,
+    ("pantry_item_id", "snapshot_date", "key", "value"),
+    ("uuid", "date", "varchar", "varchar"),
+)
+
+COPY_TARGETS = (PANTRY_ITEMS, DATA_SOURCES, COSTS, AVAILABILITIES, CUSTOM_FIELDS)
+# The tables recipes resolve pantry items through; blob-mode snapshots write only these
+LOOKUP_TARGETS = (PANTRY_ITEMS, DATA_SOURCES)
+
+
+@dataclass
+class PantryItemRows:
+    rows: dict[CopyTarget, list[Row]] = field(default_factory=lambda: {target: [] for target in COPY_TARGETS})
+
+    @property
+    def item_count(self) -> int:
+        return len(self.rows[PANTRY_ITEMS])
+
+
+def build_pantry_item_rows(
+    pantry_state_id: UUID,
+    snapshot_date: date,
+    items: Iterable[PantryItem],
+    targets: tuple[CopyTarget, ...] = COPY_TARGETS,
+) -> PantryItemRows:
+    result = PantryItemRows({target: [] for target in targets})
+    rows = result.rows
+    # Lookup-only rows skip the per-item detail tables
+    with_details = COSTS in rows
+
+    for item in items:
+        if not item.pantry_item_data_source:
+            raise ValueError("Pantry item data source is required")
+
+        item_id_uuid = UUID(item.id)
+        rows[PANTRY_ITEMS].append(
+            (
+                item_id_uuid,
+                snapshot_date,
+                pantry_state_id,
+                item.description,
+                _to_decimal(item.amount),
+                item.units,
+                item.is_prepped_and_ready,
+                item.brand_name if item.brand_name else None,
+            )
+        )
+        rows[DATA_SOURCES].append(
+            (
+                item_id_uuid,
+                snapshot_date,
+                item.pantry_item_data_source.culops_culinary_ingredient_id,
+                item.pantry_item_data_source.culops_culinary_ingredient_specification_id,
+            )
+        )
+        if not with_details:
+            continue
+
+        for cost in item.cost:
+            rows[COSTS].append(
+                (
+                    item_id_uuid,
+                    snapshot_date,
+                    _to_iso(cost.start_date) if cost.start_date else None,
+                    _to_iso(cost.end_date) if cost.end_date else None,
+                    _to_decimal(cost.production_cost_us_dollars),
+                )
+            )
+        for availability in item.availability:
+            rows[AVAILABILITIES].append(
+                (
+                    item_id_uuid,
+                    snapshot_date,
+                    _to_iso(availability.available_from) if availability.available_from else "",
+                    _to_iso(availability.available_until) if availability.available_until else "",
+                )
+            )
+        for custom_field in item.custom_fields or []:
+            rows[CUSTOM_FIELDS].append((item_id_uuid, snapshot_date, custom_field.key, custom_field.value))
+
+    return result
+
+
+def supports_copy(conn: Connection) -> bool:
+    return conn.dialect.name == "postgresql" and conn.dialect.driver == "psycopg"
+
+
+def copy_pantry_item_rows(conn: Connection, pantry_item_rows: PantryItemRows) -> None:
+    """Stream every table's rows with binary COPY on the connection's current transaction."""
+    # supports_copy() has checked the driver, so the DBAPI connection is psycopg's
+    driver_connection = cast(psycopg.Connection[Any], conn.connection.driver_connection)
+    with driver_connection.cursor() as cursor:
+        for target, rows in pantry_item_rows.rows.items():
+            if not rows:
+                continue
+            with cursor.copy(target.copy_sql) as copy:
+                copy.set_types(list(target.pg_types))
+                for row in rows:
+                    copy.write_row(row)
+
+
+def insert_pantry_item_rows(conn: Connection, pantry_item_rows: PantryItemRows) -> None:
+    """Portable fallback: one executemany INSERT per table."""
+    for target, rows in pantry_item_rows.rows.items():
+        if rows:
+            conn.execute(target.table.insert(), [dict(zip(target.columns, row, strict=True)) for row in rows])
+
+
+def _to_iso(value: date) -> str:
+    return value.isoformat().replace("+00:00", "Z")
+
+
+def _to_decimal(value: float) -> Decimal:
+    # The binary numeric dumper only takes Decimal; going through str keeps the float's shortest repr
+    return Decimal(str(value))
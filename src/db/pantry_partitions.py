@@ -0,0 +1,117 @@
+"""Daily range partitions of the pantry snapshot tables: naming, creation ahead of the crawls, and expiry."""
+
+import re
+from datetime import UTC, date, datetime, timedelta
+
+from sqlalchemy import Table, text
+from sqlalchemy.engine import Connection
+
+from src.db.schema import (
+    pantry_item_availabilities,
+    pantry_item_chunks,
+    pantry_item_costs,
+    pantry_item_custom_fields,
+    pantry_item_data_sources,
+    pantry_items,
+)
+
+# In foreign key order: partitions are created in this order and dropped in reverse
+PARTITIONED_TABLES: tuple[Table, ...] = (
+    pantry_items,
+    pantry_item_data_sources,
+    pantry_item_costs,
+    pantry_item_availabilities,
+    pantry_item_custom_fields,
+    pantry_item_chunks,
+)
+
+# Partition DDL needs an exclusive lock on the parent table; give up instead of queueing every reader behind it
+PARTITION_DDL_LOCK_TIMEOUT_MS = 5000
+
+_PARTITION_SUFFIX = re.compile(r"_p(\d{8})$")
+
+_LIST_PARTITIONS_SQL = text(
+    "SELECT child.relname FROM pg_inherits JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+    "WHERE pg_inherits.inhparent = to_regclass(:parent)"
+)
+
+
+def snapshot_date_for(pantry_state_timestamp: datetime) -> date:
+    """The partition day of a snapshot: the UTC date it was taken on."""
+    if pantry_state_timestamp.tzinfo is None:
+        return pantry_state_timestamp.date()
+    return pantry_state_timestamp.astimezone(UTC).date()
+
+
+def partition_name(table: Table, day: date) -> str:
+    return f"{table.name}_p{day:%Y%m%d}"
+
+
+def list_partition_days(conn: Connection) -> list[date]:
+    """Days that have a pantry_items partition; the default partition is not included."""
+    days = []
+    for name in conn.execute(_LIST_PARTITIONS_SQL, {"parent": pantry_items.name}).scalars():
+        match = _PARTITION_SUFFIX.search(name)
+        if match:
+            days.append(datetime.strptime(match.group(1), "%Y%m%d").date())
+    return sorted(days)
+
+
+def create_pantry_partitions(conn: Connection, first_day: date, last_day: date) -> int:
+    """Create the missing daily partitions from ``first_day`` through ``last_day`` on the current transaction."""
+    existing = set(list_partition_days(conn))
+    missing = [
+        first_day + timedelta(days=offset)
+        for offset in range((last_day - first_day).days + 1)
+        if first_day + timedelta(days=offset) not in existing
+    ]
+    if not missing:
+        return 0
+
+    _set_ddl_lock_timeout(conn)
+    for day in missing:
+        _create_day_partitions(conn, day)
+    return len(missing)
+
+
+def _create_day_partitions(conn: Connection, day: date) -> None:
+    """Create one day's partitions, moving in any rows of that day that were written to the default partitions.
+
+    Postgres refuses a ``PARTITION OF`` for a range the default partition already holds rows for, so each day is
+    built as a plain table, filled from the default partition and then attached. Child rows are moved before their
+    items, so the cascade from deleting the items finds nothing left to delete, and the items are attached before
+    the child tables, whose foreign keys are checked on attach.
+    """
+    start, end = day.isoformat(), (day + timedelta(days=1)).isoformat()
+    for table in PARTITIONED_TABLES:
+        conn.execute(text(f"CREATE TABLE {partition_name(table, day)} (LIKE {table.name} INCLUDING DEFAULTS)"))
+    for table in reversed(PARTITIONED_TABLES):
+        conn.execute(
+            text(
+                f"WITH moved AS (DELETE FROM {table.name}_default "
+                f"WHERE snapshot_date >= '{start}' AND snapshot_date < '{end}' RETURNING *) "
+                f"INSERT INTO {partition_name(table, day)} SELECT * FROM moved"
+            )
+        )
+    for table in PARTITIONED_TABLES:
+        conn.execute(
+            text(
+                f"ALTER TABLE {table.name} ATTACH PARTITION {partition_name(table, day)} "
+                f"FOR VALUES FROM ('{start}') TO ('{end}')"
+            )
+        )
+
+
+def drop_pantry_partition(conn: Connection, day: date) -> None:
+    """Drop one day's partitions on the current transaction, child tables first."""
+    _set_ddl_lock_timeout(conn)
+    for table in reversed(PARTITIONED_TABLES):
+        name = partition_name(table, day)
+        if table is pantry_items:
+            # The child tables' foreign keys keep referencing the item partition until it is detached
+            conn.execute(text(f"ALTER TABLE {table.name} DETACH PARTITION {name}"))
+        conn.execute(text(f"DROP TABLE IF EXISTS {name}"))
+
+
+def _set_ddl_lock_timeout(conn: Connection) -> None:
+    conn.execute(text(f"SET LOCAL lock_timeout = {PARTITION_DDL_LOCK_TIMEOUT_MS}"))
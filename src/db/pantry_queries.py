@@ -0,0 +1,400 @@
+"""Statements and row mapping for reading stored pantry snapshots, shared by the sync and async pantry repos."""
+
+from collections.abc import Awaitable, Callable, Generator
+from datetime import date, datetime
+from typing import Any, TypeVar
+from uuid import UUID
+
+from sqlalchemy import (
+    TIMESTAMP,
+    Date,
+    Result,
+    RowMapping,
+    Select,
+    Table,
+    and_,
+    cast,
+    func,
+    literal_column,
+    or_,
+    select,
+)
+from sqlalchemy.sql.elements import ColumnElement
+from sqlalchemy.sql.selectable import ScalarSelect
+
+from src.db.models import PantryState
+from src.db.pantry_chunks import pantry_chunk_cursor_offset_stmt, pantry_chunk_page_stmt, pantry_items_from_chunks
+from src.db.schema import (
+    cost_markups,
+    current_pantry_states,
+    pantry_item_availabilities,
+    pantry_item_costs,
+    pantry_item_custom_fields,
+    pantry_items,
+    pantry_states,
+)
+from src.services.models.pantry import (
+    Pantry,
+    PantryCrawlCheckpoint,
+    PantryItem,
+    PantryItemAvailability,
+    PantryItemCost,
+    PantryItemCustomField,
+    PantrySnapshotProgress,
+    PantrySnapshotStatus,
+    PantryStorageMode,
+    PartnerCostMarkup,
+)
+
+R = TypeVar("R")
+
+# Steps of a read: each yields a statement to execute and is sent back its result
+Statements = Generator[Select, Result[Any], R]
+
+
+def parse_pantry_cursor(after: str) -> UUID:
+    try:
+        return UUID(after)
+    except ValueError as e:
+        raise ValueError(f"Invalid pantry page cursor: {after}") from e
+
+
+# A partner snapshot of a shared snapshot stores no items: these columns describe the shared snapshot's items
+_SOURCE_COLUMNS = ("snapshot_date", "storage_mode", "item_count", "crawl_status", "pages_fetched", "crawl_finished_at")
+
+
+def pantry_state_stmt(pantry_state_id: UUID, partner_id: str, with_cost_markups: bool = False) -> Select:
+    """The partner's pantry state; for a reference to a shared snapshot, the item columns come from the source and
+    ``items_pantry_state_id`` is the snapshot whose items are read.
+
+    ``with_cost_markups`` nests the partner's cost markups in the same row, so a page read needs no markups query.
+    """
+    source = pantry_states.alias("source_state")
+    columns = [
+        func.coalesce(source.c[column.name], column).label(column.name) if column.name in _SOURCE_COLUMNS else column
+        for column in pantry_states.c
+    ]
+    if with_cost_markups:
+        columns.append(_nested_cost_markups(partner_id).label("cost_markups"))
+    return (
+        select(
+            *columns,
+            func.coalesce(source.c.pantry_state_id, pantry_states.c.pantry_state_id).label("items_pantry_state_id"),
+        )
+        .select_from(
+            pantry_states.outerjoin(source, source.c.pantry_state_id == pantry_states.c.source_pantry_state_id)
+        )
+        .where(
+            pantry_states.c.pantry_state_id == pantry_state_id,
+            pantry_states.c.partner_id == partner_id,
+        )
+    )
+
+
+def shared_pantry_snapshot_stmt(
+    items_available_from: datetime | None,
+    items_available_until: datetime | None,
+    fresh_after: datetime,
+    stale_before: datetime,
+) -> Select:
+    """The newest usable shared snapshot of an availability window: complete, or running with a live crawl."""
+    return (
+        select(pantry_states.c.pantry_state_id, pantry_states.c.pantry_state_timestamp)
+        .where(
+            pantry_states.c.partner_id.is_(None),
+            pantry_states.c.items_available_from.is_not_distinct_from(items_available_from),
+            pantry_states.c.items_available_until.is_not_distinct_from(items_available_until),
+            pantry_states.c.pantry_state_timestamp >= fresh_after,
+            or_(
+                pantry_states.c.crawl_status == PantrySnapshotStatus.COMPLETE,
+                and_(
+                    pantry_states.c.crawl_status == PantrySnapshotStatus.RUNNING,
+                    pantry_states.c.crawl_updated_at >= stale_before,
+                ),
+            ),
+        )
+        .order_by(pantry_states.c.pantry_state_timestamp.desc())
+        .limit(1)
+    )
+
+
+def current_pantry_state_stmt(partner_id: str) -> Select:
+    return select(current_pantry_states).where(current_pantry_states.c.partner_id == partner_id)
+
+
+def pantry_state_from_row(row: RowMapping, pantry_state_id: UUID, partner_id: str) -> PantryState:
+    return PantryState(
+        partner_id=partner_id,
+        pantry_state_id=pantry_state_id,
+        pantry_state_timestamp=row["pantry_state_timestamp"],
+        items_available_from=_parse_datetime(row.get("items_available_from")),
+        items_available_until=_parse_datetime(row.get("items_available_until")),
+    )
+
+
+def pantry_snapshot_progress_from_row(row: RowMapping, pantry_state_id: str) -> PantrySnapshotProgress:
+    return PantrySnapshotProgress(
+        pantry_state_id=pantry_state_id,
+        status=row["crawl_status"],
+        pages_fetched=row["pages_fetched"],
+        item_count=row.get("item_count"),
+        finished_at=row.get("crawl_finished_at"),
+    )
+
+
+def pantry_crawl_checkpoint_from_row(row: RowMapping) -> PantryCrawlCheckpoint:
+    return PantryCrawlCheckpoint(
+        pantry_state_id=row["pantry_state_id"],
+        partner_id=row["partner_id"],
+        pantry_state_timestamp=row["pantry_state_timestamp"],
+        items_available_from=_parse_datetime(row.get("items_available_from")),
+        items_available_until=_parse_datetime(row.get("items_available_until")),
+        brand_name=row.get("brand_name") or "",
+        page_size=row["crawl_page_size"],
+        last_page_saved=row["last_page_saved"],
+        attempts=row["crawl_attempts"],
+    )
+
+
+def pantry_item_count_stmt(pantry_state_id: UUID, snapshot_date: date | None = None) -> Select:
+    stmt = select(func.count()).select_from(pantry_items).where(pantry_items.c.pantry_state_id == pantry_state_id)
+    return _in_partition(stmt, pantry_items, snapshot_date)
+
+
+def hydrated_pantry_items_stmt(
+    pantry_state_id: UUID, page_size: int, offset: int, after: UUID | None, snapshot_date: date | None = None
+) -> Select:
+    """One page of a snapshot's items; with the snapshot's date every table is read from that day's partition only."""
+    page_stmt = (
+        select(pantry_items)
+        .where(pantry_items.c.pantry_state_id == pantry_state_id)
+        .order_by(pantry_items.c.pantry_item_id)
+        .limit(page_size)
+    )
+    page_stmt = _in_partition(page_stmt, pantry_items, snapshot_date)
+    if after is not None:
+        # Keyset pagination: seek past the cursor on the primary key index instead of scanning offset rows
+        page_stmt = page_stmt.where(pantry_items.c.pantry_item_id > after)
+    else:
+        page_stmt = page_stmt.offset(offset)
+
+    # Costs, availabilities and custom fields come back pre-nested per item in the same round trip
+    page = page_stmt.subquery("page")
+    return select(
+        page,
+        _nested_costs(page.c.pantry_item_id, snapshot_date).label("costs"),
+        _nested_availabilities(page.c.pantry_item_id, snapshot_date).label("availabilities"),
+        _nested_custom_fields(page.c.pantry_item_id, snapshot_date).label("custom_fields"),
+    ).order_by(page.c.pantry_item_id)
+
+
+def pantry_item_from_row(row: RowMapping) -> PantryItem:
+    return PantryItem(
+        id=str(row["pantry_item_id"]),
+        description=row["description"],
+        amount=row["amount"],
+        units=row["units"],
+        is_prepped_and_ready=row["is_prepped_and_ready"],
+        cost=[
+            PantryItemCost(
+                production_cost_us_dollars=cost["production_cost_us_dollars"],
+                start_date=_from_iso_date(cost["applied_from"]),
+                end_date=_from_iso_date(cost["applied_until"]),
+            )
+            for cost in row["costs"] or []
+        ],
+        availability=[
+            PantryItemAvailability(
+                available_from=_from_iso_date(availability["applied_from"]),
+                available_until=_from_iso_date(availability["applied_until"]),
+            )
+            for availability in row["availabilities"] or []
+        ],
+        custom_fields=[
+            PantryItemCustomField(key=custom_field["key"], value=custom_field["value"])
+            for custom_field in row["custom_fields"] or []
+        ],
+        brand_name=row.get("brand_name"),
+    )
+
+
+def partner_cost_markups_from_row(row: RowMapping) -> list[PartnerCostMarkup]:
+    """The cost markups nested in a pantry state row read with ``with_cost_markups``."""
+    return [
+        PartnerCostMarkup(
+            applied_from=_parse_datetime(markup["applied_from"]),
+            applied_until=_parse_datetime(markup["applied_until"]),
+            markup_percent=markup["markup_percent"],
+        )
+        for markup in row["cost_markups"] or []
+    ]
+
+
+def build_pantry(
+    pantry_state_id: str,
+    partner_id: str,
+    pantry_state: PantryState,
+    items: list[PantryItem],
+    markups: list[PartnerCostMarkup],
+    partner_costs_applied: bool = True,
+) -> Pantry:
+    return Pantry(
+        pantry_state_id=pantry_state_id,
+        partner_id=partner_id,
+        pantry_state_timestamp=pantry_state.pantry_state_timestamp,
+        pantry_items=items,
+        partner_cost_markup=markups,
+        partner_costs_applied=partner_costs_applied,
+        ingredients_available_from=pantry_state.items_available_from,
+        ingredients_available_until=pantry_state.items_available_until,
+    )
+
+
+def read_pantry_page(
+    pantry_state_id: str, partner_id: str, page_size: int, page: int = 1, after: str | None = None
+) -> Statements[tuple[Pantry | None, int]]:
+    """Read one page of a stored pantry and its total item count; ``(None, 0)`` when the state does not exist.
+
+    The sync and async repos only differ in how they execute the statements, so both drive these steps with
+    ``run_statements``/``run_statements_async``.
+    """
+    pantry_state_id_uuid = UUID(pantry_state_id)
+    offset = (page - 1) * page_size
+    after_uuid = parse_pantry_cursor(after) if after else None
+
+    result = yield pantry_state_stmt(pantry_state_id_uuid, partner_id, with_cost_markups=True)
+    pantry_data = result.mappings().fetchone()
+    if not pantry_data:
+        return None, 0
+
+    pantry_state = pantry_state_from_row(pantry_data, pantry_state_id_uuid, partner_id)
+    # References to a shared snapshot read its items, which are stored without the partner's markups
+    items_state_id = pantry_data.get("items_pantry_state_id") or pantry_state_id_uuid
+    costs_applied = pantry_data.get("source_pantry_state_id") is None
+
+    # The crawl keeps item_count current as it saves pages; only snapshots stored before that was tracked need
+    # their rows counted
+    snapshot_date = pantry_data.get("snapshot_date")
+    total_count = pantry_data.get("item_count")
+    if total_count is None:
+        total_count = (yield pantry_item_count_stmt(items_state_id, snapshot_date)).scalar() or 0
+
+    if pantry_data.get("storage_mode") == PantryStorageMode.BLOB:
+        # Blob snapshots were all stored after snapshot dates were, so theirs is always set
+        chunk_date = pantry_data["snapshot_date"]
+        if after_uuid is not None:
+            cursor_stmt = pantry_chunk_cursor_offset_stmt(items_state_id, chunk_date, after_uuid)
+            # An unknown cursor reads past the end, like an id beyond the last item does
+            offset = (yield cursor_stmt).scalar() or total_count
+        result = yield pantry_chunk_page_stmt(items_state_id, chunk_date, offset, page_size)
+        items = pantry_items_from_chunks(result.mappings(), offset, page_size)
+    else:
+        result = yield hydrated_pantry_items_stmt(items_state_id, page_size, offset, after_uuid, snapshot_date)
+        items = [pantry_item_from_row(row) for row in result.mappings().fetchall()]
+    if not items:
+        return build_pantry(pantry_state_id, partner_id, pantry_state, [], []), total_count
+
+    markups = partner_cost_markups_from_row(pantry_data)
+    return build_pantry(pantry_state_id, partner_id, pantry_state, items, markups, costs_applied), total_count
+
+
+def run_statements(steps: Statements[R], execute: Callable[[Select], Result[Any]]) -> R:
+    statement = next(steps)
+    while True:
+        try:
+            statement = steps.send(execute(statement))
+        except StopIteration as done:
+            result: R = done.value
+            return result
+
+
+async def run_statements_async(steps: Statements[R], execute: Callable[[Select], Awaitable[Result[Any]]]) -> R:
+    statement = next(steps)
+    while True:
+        try:
+            statement = steps.send(await execute(statement))
+        except StopIteration as done:
+            result: R = done.value
+            return result
+
+
+def _parse_datetime(value: datetime | str | None) -> datetime | None:
+    # Timestamp columns already come back as datetimes; strings only appear with drivers that do not decode them
+    if value is None or value == "":
+        return None
+    if isinstance(value, datetime):
+        return value
+    # Postgres renders timestamptz in JSON as ISO 8601, which fromisoformat reads without dateutil's guessing
+    return datetime.fromisoformat(value)
+
+
+def _as_date(column: ColumnElement) -> ColumnElement:
+    # Applied dates are stored as ISO strings with "" for open ranges; let Postgres decode them
+    return cast(func.nullif(column, ""), Date)
+
+
+def _as_timestamp(column: ColumnElement) -> ColumnElement:
+    return cast(func.nullif(column, ""), TIMESTAMP(timezone=True))
+
+
+def _json_object(**fields: ColumnElement) -> ColumnElement:
+    args: list[ColumnElement] = []
+    for key, value in fields.items():
+        args.extend((literal_column(f"'{key}'"), value))
+    return func.json_build_object(*args)
+
+
+def _from_iso_date(value: str | None) -> datetime | None:
+    return datetime.fromisoformat(value) if value else None
+
+
+def _in_partition(stmt: Select, table: Table, snapshot_date: date | None) -> Select:
+    # Snapshot rows are partitioned by day; a literal date lets the planner skip every other partition
+    if snapshot_date is None:
+        return stmt
+    return stmt.where(table.c.snapshot_date == snapshot_date)
+
+
+def _nested_cost_markups(partner_id: str) -> ScalarSelect:
+    stmt = select(
+        func.json_agg(
+            _json_object(
+                applied_from=_as_timestamp(cost_markups.c.applied_from),
+                applied_until=_as_timestamp(cost_markups.c.applied_until),
+                markup_percent=cost_markups.c.markup_percent,
+            )
+        )
+    ).where(cost_markups.c.partner_id == partner_id)
+    return stmt.scalar_subquery()
+
+
+def _nested_costs(pantry_item_id: ColumnElement, snapshot_date: date | None) -> ScalarSelect:
+    stmt = select(
+        func.json_agg(
+            _json_object(
+                production_cost_us_dollars=pantry_item_costs.c.production_cost_us_dollars,
+                applied_from=_as_date(pantry_item_costs.c.applied_from),
+                applied_until=_as_date(pantry_item_costs.c.applied_until),
+            )
+        )
+    ).where(pantry_item_costs.c.pantry_item_id == pantry_item_id)
+    return _in_partition(stmt, pantry_item_costs, snapshot_date).scalar_subquery()
+
+
+def _nested_availabilities(pantry_item_id: ColumnElement, snapshot_date: date | None) -> ScalarSelect:
+    stmt = select(
+        func.json_agg(
+            _json_object(
+                applied_from=_as_date(pantry_item_availabilities.c.applied_from),
+                applied_until=_as_date(pantry_item_availabilities.c.applied_until),
+            )
+        )
+    ).where(pantry_item_availabilities.c.pantry_item_id == pantry_item_id)
+    return _in_partition(stmt, pantry_item_availabilities, snapshot_date).scalar_subquery()
+
+
+def _nested_custom_fields(pantry_item_id: ColumnElement, snapshot_date: date | None) -> ScalarSelect:
+    stmt = select(
+        func.json_agg(_json_object(key=pantry_item_custom_fields.c.key, value=pantry_item_custom_fields.c.value))
+    ).where(pantry_item_custom_fields.c.pantry_item_id == pantry_item_id)
+    return _in_partition(stmt, pantry_item_custom_fields, snapshot_date).scalar_subquery()
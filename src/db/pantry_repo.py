@@ -1,16 +1,42 @@
-from datetime import datetime
+from datetime import UTC, date, datetime, timedelta
 from uuid import UUID
 
-from dateutil import parser
-from sqlalchemy import and_, func, select
+import psycopg
+from sqlalchemy import and_, func, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.exc import SQLAlchemyError
 
+from src.core.config import settings
 from src.core.exceptions import ServerError
-from src.db.models import PantryState
+from src.db.pantry_chunks import get_chunk_codec, pantry_chunk_values
+from src.db.pantry_copy_loader import (
+    COPY_TARGETS,
+    LOOKUP_TARGETS,
+    build_pantry_item_rows,
+    copy_pantry_item_rows,
+    insert_pantry_item_rows,
+    supports_copy,
+)
+from src.db.pantry_partitions import (
+    create_pantry_partitions,
+    drop_pantry_partition,
+    list_partition_days,
+    snapshot_date_for,
+)
+from src.db.pantry_queries import (
+    current_pantry_state_stmt,
+    pantry_crawl_checkpoint_from_row,
+    pantry_snapshot_progress_from_row,
+    pantry_state_stmt,
+    read_pantry_page,
+    run_statements,
+    shared_pantry_snapshot_stmt,
+)
 from src.db.repo_base import RepositoryBase
 from src.db.schema import (
-    cost_markups,
+    current_pantry_states,
     pantry_item_availabilities,
+    pantry_item_chunks,
     pantry_item_costs,
     pantry_item_custom_fields,
     pantry_item_data_sources,
@@ -19,13 +45,15 @@ from src.db.schema import (
 )
 from src.interfaces.pantry_db_interface import PantryDBInterface
 from src.services.models.pantry import (
+    CurrentPantryState,
     Pantry,
+    PantryCrawlCheckpoint,
     PantryItem,
-    PantryItemAvailability,
-    PantryItemCost,
     PantryItemCulinaryIngredientSpecification,
-    PantryItemCustomField,
-    PartnerCostMarkup,
+    PantrySnapshotProgress,
+    PantrySnapshotStatus,
+    PantryStorageMode,
+    SharedPantrySnapshot,
 )
 from src.services.models.recipe import RecipePantryItemData
 
@@ -37,156 +65,24 @@ class PantryRepo(RepositoryBase, PantryDBInterface):
         partner_id: str,
         page_size: int,
         page: int = 1,
+        after: str | None = None,
     ) -> tuple[Pantry | None, int]:
+        steps = read_pantry_page(pantry_state_id, partner_id, page_size, page, after)
         try:
-            pantry_state_id_uuid = UUID(pantry_state_id)
-            offset = (page - 1) * page_size
-
             with self._connection() as conn:
-                find_pantry_stmt = select(pantry_states).where(
-                    pantry_states.c.pantry_state_id == pantry_state_id_uuid,
-                    pantry_states.c.partner_id == partner_id,
-                )
-                pantry_data = conn.execute(find_pantry_stmt).mappings().fetchone()
-                if not pantry_data:
-                    return None, 0
-
-                # Handle datetime values from database (already datetime objects)
-                def _parse_datetime(value):
-                    if value is None or value == "":
-                        return None
-                    # If already a datetime, return as-is
-                    from datetime import datetime
-                    if isinstance(value, datetime):
-                        return value
-                    # Otherwise parse the string
-                    return parser.parse(value)
-
-                pantry_state = PantryState(
-                    partner_id=partner_id,
-                    pantry_state_id=pantry_state_id_uuid,
-                    pantry_state_timestamp=pantry_data["pantry_state_timestamp"],
-                    items_available_from=_parse_datetime(pantry_data.get("items_available_from")),
-                    items_available_until=_parse_datetime(pantry_data.get("items_available_until")),
-                )
-
-                total_count_stmt = (
-                    select(func.count())
-                    .select_from(pantry_items)
-                    .where(pantry_items.c.pantry_state_id == pantry_state_id_uuid)
-                )
-                total_count = conn.execute(total_count_stmt).scalar() or 0
-
-                get_pantry_items_stmt = (
-                    select(pantry_items)
-                    .where(pantry_items.c.pantry_state_id == pantry_state_id_uuid)
-                    .order_by(pantry_items.c.pantry_item_id)
-                    .limit(page_size)
-                    .offset(offset)
-                )
-                pantry_items_result = conn.execute(get_pantry_items_stmt).mappings().fetchall()
-                pantry_items_lookup: dict[UUID, PantryItem] = {}
-                for row in pantry_items_result:
-                    pantry_item = PantryItem(
-                        id=str(row["pantry_item_id"]),
-                        description=row["description"],
-                        amount=row["amount"],
-                        units=row["units"],
-                        is_prepped_and_ready=row["is_prepped_and_ready"],
-                        cost=[],
-                        availability=[],
-                        custom_fields=[],
-                        brand_name=row.get("brand_name"),
-                    )
-                    pantry_items_lookup[row["pantry_item_id"]] = pantry_item
-
-                if not pantry_items_lookup:
-                    return Pantry(
-                        pantry_state_id=pantry_state_id,
-                        partner_id=partner_id,
-                        pantry_state_timestamp=pantry_state.pantry_state_timestamp,
-                        pantry_items=[],
-                        partner_cost_markup=[],
-                        ingredients_available_from=pantry_state.items_available_from,
-                        ingredients_available_until=pantry_state.items_available_until,
-                    ), total_count
-
-                pantry_items_ids = list(pantry_items_lookup.keys())
-                # Costs
-                pantry_item_costs_stmt = select(pantry_item_costs).where(
-                    pantry_item_costs.c.pantry_item_id.in_(pantry_items_ids)
-                )
-                for row in conn.execute(pantry_item_costs_stmt).mappings():
-                    pantry_item = pantry_items_lookup[row["pantry_item_id"]]
-                    start_date = parser.parse(row["applied_from"]).date() if row["applied_from"] else None
-                    end_date = parser.parse(row["applied_until"]).date() if row["applied_until"] else None
-                    pantry_item.add_cost(
-                        PantryItemCost(
-                            production_cost_us_dollars=row["production_cost_us_dollars"],
-                            start_date=start_date,
-                            end_date=end_date,
-                        )
-                    )
-
-                # Availabilities
-                pantry_item_avail_stmt = select(pantry_item_availabilities).where(
-                    pantry_item_availabilities.c.pantry_item_id.in_(pantry_items_ids)
-                )
-                for row in conn.execute(pantry_item_avail_stmt).mappings():
-                    pantry_item = pantry_items_lookup[row["pantry_item_id"]]
-                    available_from = parser.parse(row["applied_from"]).date() if row.get("applied_from") else None
-                    available_until = parser.parse(row["applied_until"]).date() if row.get("applied_until") else None
-                    pantry_item.add_availability(
-                        PantryItemAvailability(available_from=available_from, available_until=available_until)
-                    )
-
-                # Custom fields
-                pantry_item_cf_stmt = select(pantry_item_custom_fields).where(
-                    pantry_item_custom_fields.c.pantry_item_id.in_(pantry_items_ids)
-                )
-                for row in conn.execute(pantry_item_cf_stmt).mappings():
-                    pantry_item = pantry_items_lookup[row["pantry_item_id"]]
-                    pantry_item.add_custom_field(
-                        PantryItemCustomField(
-                            key=row["key"],
-                            value=row["value"],
-                        )
-                    )
-
-                # Partner markups
-                partner_cost_markups = []
-                partner_cost_markups_stmt = select(cost_markups).where(cost_markups.c.partner_id == partner_id)
-                for row in conn.execute(partner_cost_markups_stmt).mappings():
-                    partner_cost_markups.append(
-                        PartnerCostMarkup(
-                            applied_from=parser.parse(row["applied_from"]) if row.get("applied_from") else None,
-                            applied_until=parser.parse(row["applied_until"]) if row.get("applied_until") else None,
-                            markup_percent=row["markup_percent"],
-                        )
-                    )
-
+                return run_statements(steps, conn.execute)
         except SQLAlchemyError as e:
             raise ServerError(f"failed to get partner {partner_id} pantry {pantry_state_id}") from e
 
-        pantry = Pantry(
-            pantry_state_id=pantry_state_id,
-            partner_id=partner_id,
-            pantry_state_timestamp=pantry_state.pantry_state_timestamp,
-            pantry_items=list(pantry_items_lookup.values()),
-            partner_cost_markup=partner_cost_markups,
-            ingredients_available_from=pantry_state.items_available_from,
-            ingredients_available_until=pantry_state.items_available_until,
-        )
-
-        return pantry, total_count
-
     def save_pantry_state(
         self,
         pantry_state_id: UUID,
-        partner_id: str,
+        partner_id: str | None,
         pantry_state_timestamp: datetime,
         items_available_from: datetime | None,
         items_available_until: datetime | None,
+        brand_name: str = "",
+        crawl_page_size: int | None = None,
     ) -> None:
         try:
             with self._connection() as conn:
@@ -194,123 +90,264 @@ class PantryRepo(RepositoryBase, PantryDBInterface):
                     pantry_state_id=pantry_state_id,
                     partner_id=partner_id,
                     pantry_state_timestamp=pantry_state_timestamp,
+                    snapshot_date=snapshot_date_for(pantry_state_timestamp),
                     items_available_from=items_available_from,
                     items_available_until=items_available_until,
+                    crawl_status=PantrySnapshotStatus.RUNNING,
+                    pages_fetched=0,
+                    item_count=0,
+                    brand_name=brand_name or None,
+                    crawl_page_size=crawl_page_size,
+                    crawl_updated_at=func.now(),
+                    storage_mode=settings.PANTRY_STORAGE_MODE,
                 )
                 conn.execute(pantry_state_stmt)
                 conn.commit()
         except SQLAlchemyError as e:
             raise ServerError(f"failed to save pantry state {pantry_state_id}") from e
 
-    def save_pantry_items(self, pantry_state_id: UUID, items: list[PantryItem]) -> None:
-        """Save pantry items using bulk inserts for better performance."""
+    def find_shared_pantry_snapshot(
+        self,
+        items_available_from: datetime | None,
+        items_available_until: datetime | None,
+        fresh_after: datetime,
+    ) -> SharedPantrySnapshot | None:
+        """The newest shared snapshot of the window taken since ``fresh_after`` that is complete or still crawling."""
+        stale_before = datetime.now(UTC) - timedelta(seconds=settings.PANTRY_CRAWL_STALE_SECONDS)
+        stmt = shared_pantry_snapshot_stmt(items_available_from, items_available_until, fresh_after, stale_before)
         try:
             with self._connection() as conn:
-                # Prepare bulk insert data
-                items_data: list[dict] = []
-                data_sources_data: list[dict] = []
-                costs_data: list[dict] = []
-                availabilities_data: list[dict] = []
-                custom_fields_data: list[dict] = []
-
-                for item in items:
-                    if not item.pantry_item_data_source:
-                        raise ValueError("Pantry item data source is required")
-
-                    item_id_uuid = UUID(item.id)
-
-                    # Collect pantry items data
-                    items_data.append({
-                        "pantry_item_id": item_id_uuid,
-                        "pantry_state_id": pantry_state_id,
-                        "description": item.description,
-                        "amount": item.amount,
-                        "units": item.units,
-                        "is_prepped_and_ready": item.is_prepped_and_ready,
-                        "brand_name": item.brand_name if item.brand_name else None,
-                    })
-
-                    # Collect data sources
-                    data_sources_data.append({
-                        "pantry_item_id": item_id_uuid,
-                        "culops_culinary_ingredient_id": item.pantry_item_data_source.culops_culinary_ingredient_id,
-                        "culops_culinary_ingredient_specification_id": item.pantry_item_data_source.culops_culinary_ingredient_specification_id,
-                    })
-
-                    # Collect costs
-                    for cost in item.cost:
-                        costs_data.append({
-                            "pantry_item_id": item_id_uuid,
-                            "applied_from": cost.start_date.isoformat().replace("+00:00", "Z") if cost.start_date else None,
-                            "applied_until": cost.end_date.isoformat().replace("+00:00", "Z") if cost.end_date else None,
-                            "production_cost_us_dollars": cost.production_cost_us_dollars,
-                        })
-
-                    # Collect availabilities
-                    for availability in item.availability:
-                        availabilities_data.append({
-                            "pantry_item_id": item_id_uuid,
-                            "applied_from": availability.available_from.isoformat().replace("+00:00", "Z") if availability.available_from else "",
-                            "applied_until": availability.available_until.isoformat().replace("+00:00", "Z") if availability.available_until else "",
-                        })
-
-                    # Collect custom fields
-                    if item.custom_fields:
-                        for custom_field in item.custom_fields:
-                            custom_fields_data.append({
-                                "pantry_item_id": item_id_uuid,
-                                "key": custom_field.key,
-                                "value": custom_field.value,
-                            })
-
-                # Execute bulk inserts
-                if items_data:
-                    conn.execute(pantry_items.insert(), items_data)
-                if data_sources_data:
-                    conn.execute(pantry_item_data_sources.insert(), data_sources_data)
-                if costs_data:
-                    conn.execute(pantry_item_costs.insert(), costs_data)
-                if availabilities_data:
-                    conn.execute(pantry_item_availabilities.insert(), availabilities_data)
-                if custom_fields_data:
-                    conn.execute(pantry_item_custom_fields.insert(), custom_fields_data)
+                row = conn.execute(stmt).mappings().fetchone()
+        except SQLAlchemyError as e:
+            raise ServerError("failed to find a shared pantry snapshot") from e
+
+        return SharedPantrySnapshot.model_validate(dict(row)) if row else None
+
+    def save_pantry_reference(
+        self,
+        pantry_state_id: UUID,
+        partner_id: str,
+        source: SharedPantrySnapshot,
+        items_available_from: datetime | None,
+        items_available_until: datetime | None,
+        brand_name: str = "",
+    ) -> None:
+        """Save a partner snapshot that reads its items from a shared snapshot instead of storing its own.
 
+        The reference takes the shared snapshot's timestamp and day, so both expire together.
+        """
+        try:
+            with self._connection() as conn:
+                stmt = pantry_states.insert().values(
+                    pantry_state_id=pantry_state_id,
+                    partner_id=partner_id,
+                    pantry_state_timestamp=source.pantry_state_timestamp,
+                    snapshot_date=snapshot_date_for(source.pantry_state_timestamp),
+                    items_available_from=items_available_from,
+                    items_available_until=items_available_until,
+                    # Crawl progress is read from the source; these only show until its row is written
+                    crawl_status=PantrySnapshotStatus.RUNNING,
+                    pages_fetched=0,
+                    item_count=0,
+                    brand_name=brand_name or None,
+                    source_pantry_state_id=source.pantry_state_id,
+                )
+                conn.execute(stmt)
                 conn.commit()
         except SQLAlchemyError as e:
-            raise ServerError("failed to save pantry items") from e
+            raise ServerError(f"failed to save pantry reference {pantry_state_id}") from e
 
-    def delete_pantry(self, pantry_state_id: UUID) -> None:
+    def publish_current_pantry_state(
+        self,
+        partner_id: str,
+        pantry_state_id: UUID,
+        items_available_from: datetime | None,
+        items_available_until: datetime | None,
+    ) -> None:
+        """Make the snapshot the one served to the partner for its window, replacing the previous one."""
+        stmt = insert(current_pantry_states).values(
+            partner_id=partner_id,
+            pantry_state_id=pantry_state_id,
+            items_available_from=items_available_from,
+            items_available_until=items_available_until,
+            published_at=func.now(),
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[current_pantry_states.c.partner_id],
+            set_={
+                column: stmt.excluded[column]
+                for column in ("pantry_state_id", "items_available_from", "items_available_until", "published_at")
+            },
+        )
         try:
             with self._connection() as conn:
-                delete_costs_stmt = pantry_item_costs.delete().where(
-                    pantry_item_costs.c.pantry_item_id.in_(
-                        select(pantry_items.c.pantry_item_id).where(pantry_items.c.pantry_state_id == pantry_state_id)
-                    )
-                )
-                conn.execute(delete_costs_stmt)
+                conn.execute(stmt)
+                conn.commit()
+        except SQLAlchemyError as e:
+            raise ServerError(f"failed to publish pantry state {pantry_state_id} for partner {partner_id}") from e
 
-                delete_avails_stmt = pantry_item_availabilities.delete().where(
-                    pantry_item_availabilities.c.pantry_item_id.in_(
-                        select(pantry_items.c.pantry_item_id).where(pantry_items.c.pantry_state_id == pantry_state_id)
-                    )
+    def get_current_pantry_state(self, partner_id: str) -> CurrentPantryState | None:
+        try:
+            with self._connection() as conn:
+                row = conn.execute(current_pantry_state_stmt(partner_id)).mappings().fetchone()
+        except SQLAlchemyError as e:
+            raise ServerError(f"failed to get the current pantry state of partner {partner_id}") from e
+
+        return CurrentPantryState.model_validate(dict(row)) if row else None
+
+    def finish_pantry_crawl(self, pantry_state_id: UUID, status: PantrySnapshotStatus) -> None:
+        try:
+            with self._connection() as conn:
+                stmt = (
+                    update(pantry_states)
+                    .where(pantry_states.c.pantry_state_id == pantry_state_id)
+                    .values(crawl_status=status, crawl_finished_at=func.now())
                 )
-                conn.execute(delete_avails_stmt)
+                conn.execute(stmt)
+                conn.commit()
+        except SQLAlchemyError as e:
+            raise ServerError(f"failed to finish crawl for pantry state {pantry_state_id}") from e
+
+    def claim_stale_pantry_crawls(self, stale_before: datetime, limit: int) -> list[PantryCrawlCheckpoint]:
+        """Claim running crawls that have not committed a page since ``stale_before`` so they can be resumed.
+
+        Claiming bumps the heartbeat and attempt count; rows locked by a concurrent sweep are skipped, so each
+        stale crawl is handed to one caller.
+        """
+        stale = (
+            select(pantry_states.c.pantry_state_id)
+            .where(
+                pantry_states.c.crawl_status == PantrySnapshotStatus.RUNNING,
+                pantry_states.c.crawl_updated_at < stale_before,
+                pantry_states.c.last_page_saved.is_not(None),
+                pantry_states.c.crawl_page_size.is_not(None),
+            )
+            .order_by(pantry_states.c.crawl_updated_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        stmt = (
+            update(pantry_states)
+            .where(pantry_states.c.pantry_state_id.in_(stale))
+            .values(crawl_updated_at=func.now(), crawl_attempts=pantry_states.c.crawl_attempts + 1)
+            .returning(pantry_states)
+        )
+
+        try:
+            with self._connection() as conn:
+                rows = conn.execute(stmt).mappings().fetchall()
+                conn.commit()
+        except SQLAlchemyError as e:
+            raise ServerError("failed to claim stale pantry crawls") from e
+
+        return [pantry_crawl_checkpoint_from_row(row) for row in rows]
+
+    def get_pantry_snapshot_progress(self, pantry_state_id: str, partner_id: str) -> PantrySnapshotProgress | None:
+        try:
+            with self._connection() as conn:
+                row = conn.execute(pantry_state_stmt(UUID(pantry_state_id), partner_id)).mappings().fetchone()
+        except SQLAlchemyError as e:
+            raise ServerError(f"failed to get crawl progress for pantry state {pantry_state_id}") from e
+
+        return pantry_snapshot_progress_from_row(row, pantry_state_id) if row else None
 
-                delete_cfs_stmt = pantry_item_custom_fields.delete().where(
-                    pantry_item_custom_fields.c.pantry_item_id.in_(
-                        select(pantry_items.c.pantry_item_id).where(pantry_items.c.pantry_state_id == pantry_state_id)
+    def save_pantry_items(
+        self, pantry_state_id: UUID, items: list[PantryItem], page_number: int | None = None
+    ) -> None:
+        """Save pantry items with binary COPY on Postgres, or bulk inserts on other engines.
+
+        ``page_number`` is the CulOps page the items came from; it is recorded as the crawl checkpoint in the same
+        transaction as the rows, so a resumed crawl never saves a page twice.
+        """
+        # Progress moves in the same transaction as the rows, so item_count always matches what is stored
+        progress: dict = {
+            "item_count": func.coalesce(pantry_states.c.item_count, 0) + len(items),
+            "pages_fetched": pantry_states.c.pages_fetched + 1,
+            "crawl_updated_at": func.now(),
+        }
+        if page_number is not None:
+            progress["last_page_saved"] = page_number
+        progress_stmt = (
+            update(pantry_states)
+            .where(pantry_states.c.pantry_state_id == pantry_state_id)
+            .values(**progress)
+            .returning(
+                pantry_states.c.snapshot_date,
+                pantry_states.c.storage_mode,
+                pantry_states.c.pages_fetched,
+                pantry_states.c.item_count,
+            )
+        )
+
+        try:
+            with self._connection() as conn:
+                # The state's snapshot date picks the partition the rows go to, and its storage mode the layout
+                state = conn.execute(progress_stmt).mappings().fetchone()
+                if state is None:
+                    raise ServerError(f"pantry state {pantry_state_id} not found")
+                snapshot_date = state["snapshot_date"]
+                blob_mode = state["storage_mode"] == PantryStorageMode.BLOB
+
+                pantry_item_rows = build_pantry_item_rows(
+                    pantry_state_id, snapshot_date, items, LOOKUP_TARGETS if blob_mode else COPY_TARGETS
+                )
+                if settings.PANTRY_COPY_LOADER_ENABLED and supports_copy(conn):
+                    copy_pantry_item_rows(conn, pantry_item_rows)
+                else:
+                    insert_pantry_item_rows(conn, pantry_item_rows)
+
+                if blob_mode and items:
+                    # The returned counters already include this page
+                    chunk = pantry_chunk_values(
+                        pantry_state_id,
+                        snapshot_date,
+                        chunk_no=state["pages_fetched"] - 1,
+                        item_offset=state["item_count"] - len(items),
+                        items=items,
+                        codec=get_chunk_codec(settings.PANTRY_BLOB_CODEC),
                     )
+                    conn.execute(pantry_item_chunks.insert().values(**chunk))
+
+                conn.commit()
+        except (SQLAlchemyError, psycopg.Error) as e:
+            raise ServerError("failed to save pantry items") from e
+
+    def delete_pantry(self, pantry_state_id: UUID) -> None:
+        try:
+            with self._connection() as conn:
+                snapshot_date = conn.execute(
+                    select(pantry_states.c.snapshot_date).where(pantry_states.c.pantry_state_id == pantry_state_id)
+                ).scalar()
+                if snapshot_date is None:
+                    return
+
+                # Matching on the snapshot date keeps every statement on that day's partitions
+                state_item_ids = select(pantry_items.c.pantry_item_id).where(
+                    pantry_items.c.pantry_state_id == pantry_state_id,
+                    pantry_items.c.snapshot_date == snapshot_date,
                 )
-                conn.execute(delete_cfs_stmt)
+                for table in (
+                    pantry_item_costs,
+                    pantry_item_availabilities,
+                    pantry_item_custom_fields,
+                    pantry_item_data_sources,
+                ):
+                    conn.execute(
+                        table.delete().where(
+                            table.c.snapshot_date == snapshot_date, table.c.pantry_item_id.in_(state_item_ids)
+                        )
+                    )
 
-                delete_sources_stmt = pantry_item_data_sources.delete().where(
-                    pantry_item_data_sources.c.pantry_item_id.in_(
-                        select(pantry_items.c.pantry_item_id).where(pantry_items.c.pantry_state_id == pantry_state_id)
+                conn.execute(
+                    pantry_item_chunks.delete().where(
+                        pantry_item_chunks.c.pantry_state_id == pantry_state_id,
+                        pantry_item_chunks.c.snapshot_date == snapshot_date,
                     )
                 )
-                conn.execute(delete_sources_stmt)
 
-                delete_items_stmt = pantry_items.delete().where(pantry_items.c.pantry_state_id == pantry_state_id)
+                delete_items_stmt = pantry_items.delete().where(
+                    pantry_items.c.pantry_state_id == pantry_state_id, pantry_items.c.snapshot_date == snapshot_date
+                )
                 conn.execute(delete_items_stmt)
 
                 delete_state_stmt = pantry_states.delete().where(pantry_states.c.pantry_state_id == pantry_state_id)
@@ -320,6 +357,43 @@ class PantryRepo(RepositoryBase, PantryDBInterface):
         except SQLAlchemyError as e:
             raise ServerError(f"failed to delete pantry {pantry_state_id}") from e
 
+    def create_pantry_partitions(self, first_day: date, last_day: date) -> int:
+        """Create the daily snapshot partitions from ``first_day`` through ``last_day`` that do not exist yet."""
+        try:
+            with self._connection() as conn:
+                created = create_pantry_partitions(conn, first_day, last_day)
+                conn.commit()
+        except SQLAlchemyError as e:
+            raise ServerError(f"failed to create pantry partitions from {first_day} to {last_day}") from e
+
+        return created
+
+    def drop_pantry_partitions_before(self, cutoff: date) -> list[date]:
+        """Drop the daily snapshot partitions older than ``cutoff`` together with their pantry states.
+
+        Each day is dropped in its own transaction, so a run that times out on the parent table lock keeps the
+        days it already dropped. Returns the days dropped.
+        """
+        dropped: list[date] = []
+        try:
+            with self._connection() as conn:
+                expired_days = [day for day in list_partition_days(conn) if day < cutoff]
+                conn.commit()
+
+                for day in expired_days:
+                    drop_pantry_partition(conn, day)
+                    conn.execute(pantry_states.delete().where(pantry_states.c.snapshot_date == day))
+                    conn.commit()
+                    dropped.append(day)
+
+                # Snapshots whose rows landed in the default partition are removed through the cascading keys
+                conn.execute(pantry_states.delete().where(pantry_states.c.snapshot_date < cutoff))
+                conn.commit()
+        except SQLAlchemyError as e:
+            raise ServerError(f"failed to drop pantry partitions before {cutoff}") from e
+
+        return dropped
+
     def get_pantry_item_data_sources(
         self, pantry_item_ids: list[str]
     ) -> dict[UUID, PantryItemCulinaryIngredientSpecification]:
@@ -382,3 +456,49 @@ class PantryRepo(RepositoryBase, PantryDBInterface):
                 f"failed to get pantry item by culinary ingredient id {culinary_ingredient_id} "
                 f"and specification id {culinary_ingredient_specification_id}"
             ) from e
+
+    def get_pantry_item_data_by_culops_culinary_ingredient_and_specification_ids(
+        self, culinary_ingredient_pairs: list[tuple[int, int]]
+    ) -> dict[tuple[int, int], RecipePantryItemData]:
+        """Resolve (specification id, culinary ingredient id) pairs to pantry item data in one query."""
+        pairs = list(dict.fromkeys(culinary_ingredient_pairs))
+        if not pairs:
+            return {}
+
+        try:
+            with self._connection() as conn:
+                stmt = (
+                    select(
+                        pantry_items.c.pantry_item_id,
+                        pantry_items.c.is_prepped_and_ready,
+                        pantry_item_data_sources.c.culops_culinary_ingredient_specification_id,
+                        pantry_item_data_sources.c.culops_culinary_ingredient_id,
+                    )
+                    .join(
+                        pantry_item_data_sources,
+                        pantry_items.c.pantry_item_id == pantry_item_data_sources.c.pantry_item_id,
+                    )
+                    .where(
+                        tuple_(
+                            pantry_item_data_sources.c.culops_culinary_ingredient_specification_id,
+                            pantry_item_data_sources.c.culops_culinary_ingredient_id,
+                        ).in_(pairs)
+                    )
+                )
+
+                pantry_item_data: dict[tuple[int, int], RecipePantryItemData] = {}
+                for row in conn.execute(stmt).mappings():
+                    key = (
+                        row["culops_culinary_ingredient_specification_id"],
+                        row["culops_culinary_ingredient_id"],
+                    )
+                    # Several snapshots may carry the same source pair; keep the first match like the single lookup
+                    if key not in pantry_item_data:
+                        pantry_item_data[key] = RecipePantryItemData(
+                            pantry_item_id=str(row["pantry_item_id"]),
+                            is_prepped_and_ready=row["is_prepped_and_ready"],
+                        )
+
+                return pantry_item_data
+        except SQLAlchemyError as e:
+            raise ServerError(f"failed to get pantry items for {len(pairs)} culinary ingredient specifications") from e
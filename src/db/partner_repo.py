@@ -22,6 +22,14 @@ from src.services.models.recipe import PackagingConfigurationTag, RecipeConstrai
 
 
 class PartnerRepo(RepositoryBase, PartnerRepoInterface):
+    def get_partner_ids(self) -> list[str]:
+        try:
+            with self._connection() as conn:
+                stmt = select(partners.c.partner_id).order_by(partners.c.partner_id)
+                return list(conn.execute(stmt).scalars())
+        except SQLAlchemyError as e:
+            raise ServerError("Failed to list partners") from e
+
     def find_partner_id(self, partner_id: str) -> bool:
         try:
             with self._connection() as conn:
@@ -48,6 +48,40 @@ class RecipesRepo(RepositoryBase, RecipesRepoInterface):
                 f"with culops_recipe_id {culops_recipe_id}"
             ) from e
 
+    def store_recipe_sources(self, partner_id: str, recipe_refs: list[RecipeRef], is_external: bool = False) -> None:
+        """Store several recipes and their CulOps sources in one transaction."""
+        if not recipe_refs:
+            return None
+
+        try:
+            with self._connection() as conn:
+                conn.execute(
+                    recipes.insert(),
+                    [
+                        {"recipe_id": ref.recipe_id, "partner_id": partner_id, "externally_created": is_external}
+                        for ref in recipe_refs
+                    ],
+                )
+                conn.execute(
+                    recipe_data_sources.insert(),
+                    [
+                        {
+                            "recipe_id": ref.recipe_id,
+                            "culops_recipe_id": ref.culops_recipe_id,
+                            "culops_product_sku": ref.culops_product_sku,
+                        }
+                        for ref in recipe_refs
+                    ],
+                )
+                conn.commit()
+            return None
+
+        except SQLAlchemyError as e:
+            raise ServerError(
+                f"failed to create recipe data sources for culops_recipe_ids "
+                f"{[ref.culops_recipe_id for ref in recipe_refs]}"
+            ) from e
+
     def get_culops_recipe_ref_by_id(self, partner_id: str, recipe_id: UUID) -> CulopsRecipeRef | None:
         try:
             with self._connection() as conn:
@@ -127,6 +161,21 @@ class RecipesRepo(RepositoryBase, RecipesRepoInterface):
         except SQLAlchemyError as e:
             raise ServerError(f"failed to look up recipe_id for culops_recipe_id {culops_recipe_id}") from e
 
+    def get_recipe_ids_by_culops_recipe_ids(self, culops_recipe_ids: list[int]) -> dict[int, UUID]:
+        if not culops_recipe_ids:
+            return {}
+
+        try:
+            with self._connection() as conn:
+                stmt = select(recipe_data_sources.c.culops_recipe_id, recipe_data_sources.c.recipe_id).where(
+                    recipe_data_sources.c.culops_recipe_id.in_(set(culops_recipe_ids))
+                )
+
+                return {row["culops_recipe_id"]: row["recipe_id"] for row in conn.execute(stmt).mappings()}
+
+        except SQLAlchemyError as e:
+            raise ServerError(f"failed to look up recipe_ids for culops_recipe_ids {culops_recipe_ids}") from e
+
     def get_culops_recipe_ref_by_sku(self, partner_id: str, sku: str) -> RecipeRef | None:
         try:
             with self._connection() as conn:
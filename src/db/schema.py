@@ -6,15 +6,19 @@ from sqlalchemy import (
     BigInteger,
     Boolean,
     Column,
+    Date,
     Enum,
     ForeignKey,
     ForeignKeyConstraint,
+    Index,
     Integer,
+    LargeBinary,
     MetaData,
     String,
     Table,
+    text,
 )
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
 
 metadata = MetaData()
 
@@ -110,15 +114,46 @@ pantry_states = Table(
     metadata,
     Column("pantry_state_id", UUID(as_uuid=True), primary_key=True),
     Column("pantry_state_timestamp", TIMESTAMP(timezone=True), nullable=False),
-    Column("partner_id", String(8), ForeignKey("partners.partner_id"), nullable=False),
+    # Shared snapshots have no partner; partner snapshots of a shared snapshot reference it by source id
+    Column("partner_id", String(8), ForeignKey("partners.partner_id"), nullable=True),
     Column("items_available_from", TIMESTAMP(timezone=True)),
     Column("items_available_until", TIMESTAMP(timezone=True)),
+    Column("item_count", Integer, nullable=True),
+    Column("crawl_status", String(16), nullable=False, server_default="running"),
+    Column("pages_fetched", Integer, nullable=False, server_default="0"),
+    Column("crawl_finished_at", TIMESTAMP(timezone=True), nullable=True),
+    Column("brand_name", String, nullable=True),
+    Column("crawl_page_size", Integer, nullable=True),
+    Column("last_page_saved", Integer, nullable=True),
+    Column("crawl_updated_at", TIMESTAMP(timezone=True), nullable=True),
+    Column("crawl_attempts", Integer, nullable=False, server_default="1"),
+    Column("snapshot_date", Date, nullable=False, index=True),
+    Column("storage_mode", String(16), nullable=False, server_default="relational"),
+    # Not a foreign key: the shared snapshot's row is written by its background crawl, possibly after the reference
+    Column("source_pantry_state_id", UUID(as_uuid=True), nullable=True),
+)
+
+Index(
+    "ix_pantry_states_running_crawls",
+    pantry_states.c.crawl_updated_at,
+    postgresql_where=text("crawl_status = 'running'"),
 )
 
+Index(
+    "ix_pantry_states_shared_snapshots",
+    pantry_states.c.items_available_from,
+    pantry_states.c.items_available_until,
+    pantry_states.c.pantry_state_timestamp,
+    postgresql_where=text("partner_id IS NULL"),
+)
+
+# Snapshot rows are range-partitioned by the UTC day the snapshot was taken, so expiring a day of snapshots drops
+# whole partitions instead of deleting rows. Partitions are created ahead of time by the pantry retention job.
 pantry_items = Table(
     "pantry_items",
     metadata,
     Column("pantry_item_id", UUID(as_uuid=True), primary_key=True),
+    Column("snapshot_date", Date, primary_key=True),
     Column("pantry_state_id", UUID(as_uuid=True), nullable=False, index=True),
     Column("description", String),
     Column("units", String, nullable=False),
@@ -126,6 +161,7 @@ pantry_items = Table(
     Column("is_prepped_and_ready", Boolean, nullable=False),
     Column("brand_name", String, nullable=True),
     ForeignKeyConstraint(["pantry_state_id"], ["pantry_states.pantry_state_id"], ondelete="CASCADE"),
+    postgresql_partition_by="RANGE (snapshot_date)",
 )
 
 pantry_item_costs = Table(
@@ -134,8 +170,14 @@ pantry_item_costs = Table(
     Column("pantry_item_id", UUID(as_uuid=True), primary_key=True),
     Column("applied_from", String, primary_key=True, default=""),
     Column("applied_until", String, primary_key=True, default=""),
+    Column("snapshot_date", Date, primary_key=True),
     Column("production_cost_us_dollars", DECIMAL(10, 2), nullable=False),
-    ForeignKeyConstraint(["pantry_item_id"], ["pantry_items.pantry_item_id"]),
+    ForeignKeyConstraint(
+        ["pantry_item_id", "snapshot_date"],
+        ["pantry_items.pantry_item_id", "pantry_items.snapshot_date"],
+        ondelete="CASCADE",
+    ),
+    postgresql_partition_by="RANGE (snapshot_date)",
 )
 
 pantry_item_availabilities = Table(
@@ -144,7 +186,13 @@ pantry_item_availabilities = Table(
     Column("pantry_item_id", UUID(as_uuid=True), primary_key=True),
     Column("applied_from", String, primary_key=True, default=""),
     Column("applied_until", String, primary_key=True, default=""),
-    ForeignKeyConstraint(["pantry_item_id"], ["pantry_items.pantry_item_id"], ondelete="CASCADE"),
+    Column("snapshot_date", Date, primary_key=True),
+    ForeignKeyConstraint(
+        ["pantry_item_id", "snapshot_date"],
+        ["pantry_items.pantry_item_id", "pantry_items.snapshot_date"],
+        ondelete="CASCADE",
+    ),
+    postgresql_partition_by="RANGE (snapshot_date)",
 )
 
 pantry_item_custom_fields = Table(
@@ -152,17 +200,58 @@ pantry_item_custom_fields = Table(
     metadata,
     Column("pantry_item_id", UUID(as_uuid=True), primary_key=True),
     Column("key", String, primary_key=True),
+    Column("snapshot_date", Date, primary_key=True),
     Column("value", String),
-    ForeignKeyConstraint(["pantry_item_id"], ["pantry_items.pantry_item_id"], ondelete="CASCADE"),
+    ForeignKeyConstraint(
+        ["pantry_item_id", "snapshot_date"],
+        ["pantry_items.pantry_item_id", "pantry_items.snapshot_date"],
+        ondelete="CASCADE",
+    ),
+    postgresql_partition_by="RANGE (snapshot_date)",
 )
 
 pantry_item_data_sources = Table(
     "pantry_item_data_sources",
     metadata,
     Column("pantry_item_id", UUID(as_uuid=True), primary_key=True),
+    Column("snapshot_date", Date, primary_key=True),
     Column("culops_culinary_ingredient_id", BigInteger, nullable=False, index=True),
     Column("culops_culinary_ingredient_specification_id", BigInteger, nullable=False, index=True),
-    ForeignKeyConstraint(["pantry_item_id"], ["pantry_items.pantry_item_id"], ondelete="CASCADE"),
+    ForeignKeyConstraint(
+        ["pantry_item_id", "snapshot_date"],
+        ["pantry_items.pantry_item_id", "pantry_items.snapshot_date"],
+        ondelete="CASCADE",
+    ),
+    postgresql_partition_by="RANGE (snapshot_date)",
+)
+
+# Blob storage mode: each saved page of a snapshot is one compressed chunk of items, in crawl order
+pantry_item_chunks = Table(
+    "pantry_item_chunks",
+    metadata,
+    Column("pantry_state_id", UUID(as_uuid=True), primary_key=True),
+    Column("snapshot_date", Date, primary_key=True),
+    Column("chunk_no", Integer, primary_key=True),
+    Column("item_offset", Integer, nullable=False),
+    Column("item_count", Integer, nullable=False),
+    Column("item_ids", ARRAY(UUID(as_uuid=True)), nullable=False),
+    Column("encoding", String(16), nullable=False),
+    Column("payload", LargeBinary, nullable=False),
+    ForeignKeyConstraint(["pantry_state_id"], ["pantry_states.pantry_state_id"], ondelete="CASCADE"),
+    postgresql_partition_by="RANGE (snapshot_date)",
+)
+
+# The latest complete snapshot the pre-warm job built for each partner; expiring the snapshot unpublishes it
+current_pantry_states = Table(
+    "current_pantry_states",
+    metadata,
+    Column("partner_id", String(8), primary_key=True),
+    Column("pantry_state_id", UUID(as_uuid=True), nullable=False),
+    Column("items_available_from", TIMESTAMP(timezone=True)),
+    Column("items_available_until", TIMESTAMP(timezone=True)),
+    Column("published_at", TIMESTAMP(timezone=True), nullable=False),
+    ForeignKeyConstraint(["partner_id"], ["partners.partner_id"], ondelete="CASCADE"),
+    ForeignKeyConstraint(["pantry_state_id"], ["pantry_states.pantry_state_id"], ondelete="CASCADE"),
 )
 
 assemblies = Table(
@@ -1,6 +1,22 @@
+from uuid import UUID
+
 from src.clients.kafka.fulfillment_producer import FulfillmentProducer
+from src.clients.kafka.producer_registry import ProducerRegistry
+from src.core.config import settings
+from src.dependancies.fulfillment_response_producer import get_fulfillment_response_producer
 from src.interfaces.fulfillment_producer_interface import FulfillmentProducerInterface
+from src.services.models.orders import Order
+
+
+def _report_delivery_failure(order: Order, error: Exception) -> None:
+    get_fulfillment_response_producer().send_fulfillment_response_failed(
+        UUID(order.id), f"Failed to deliver fulfillment message: {error}", order.sales_channel_id
+    )
 
 
 def get_fulfillment_producer() -> FulfillmentProducerInterface:
-    return FulfillmentProducer()
+    return ProducerRegistry().get(
+        settings.FULFILLMENT_TOPIC,
+        lambda: FulfillmentProducer(on_delivery_failure=_report_delivery_failure),
+        reports_to=settings.FULFILLMENT_RESPONSE_TOPIC,
+    )
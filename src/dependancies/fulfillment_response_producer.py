@@ -1,6 +1,8 @@
 from src.clients.kafka.fulfillment_response_producer import FulfillmentResponseProducer
+from src.clients.kafka.producer_registry import ProducerRegistry
+from src.core.config import settings
 from src.interfaces.fulfillment_response_producer_interface import FulfillmentResponseProducerInterface
 
 
 def get_fulfillment_response_producer() -> FulfillmentResponseProducerInterface:
-    return FulfillmentResponseProducer()
+    return ProducerRegistry().get(settings.FULFILLMENT_RESPONSE_TOPIC, FulfillmentResponseProducer)
@@ -0,0 +1,21 @@
+from functools import cache
+from typing import Any
+
+from src.core.config import settings
+from src.services.pantry_cache import PantryResponseCache
+
+
+@cache
+def get_pantry_cache() -> PantryResponseCache | None:
+    # One cache per process so every request shares the in-process tier
+    if not settings.PANTRY_CACHE_ENABLED:
+        return None
+    return PantryResponseCache.from_settings()
+
+
+def get_pantry_cache_metrics() -> dict[str, Any] | None:
+    """Metrics of the process's pantry cache, without building it before a request has."""
+    if get_pantry_cache.cache_info().currsize == 0:
+        return None
+    pantry_cache = get_pantry_cache()
+    return pantry_cache.metrics() if pantry_cache is not None else None
@@ -0,0 +1,36 @@
+from collections.abc import Callable
+
+from src.core.middleware.partner_id_middleware import partner_id_ctx
+from src.dependancies.culops_client import get_culops_client
+from src.dependancies.pantry_db import get_pantry_db
+from src.dependancies.param_store_client import get_param_store_client
+from src.dependancies.partner_db import get_partner_db
+from src.dependancies.recipe_db import get_recipes_db
+from src.dependancies.token_service import get_token_service
+from src.services.pantry import PantryService
+from src.services.partner import PartnerService
+
+
+def get_pantry_crawl_service_factory() -> Callable[[], PantryService]:
+    """Builds the sync service that runs background pantry crawls only when a request starts one.
+
+    Its repos and token-backed CulOps client are not needed for stored snapshots or cached responses.
+    """
+    partner_id = partner_id_ctx.get() or ""
+
+    def build() -> PantryService:
+        partner_db = get_partner_db()
+        pantry_db = get_pantry_db()
+        culops_client = get_culops_client(
+            partner_repo=partner_db,
+            recipe_repo=get_recipes_db(),
+            pantry_repo=pantry_db,
+            token_svc=get_token_service(param_store_client=get_param_store_client()),
+        )
+        return PantryService(
+            pantry_db=pantry_db,
+            culops_service=culops_client,
+            partner_service=PartnerService(partner_id=partner_id, partner_db=partner_db),
+        )
+
+    return build
@@ -1,6 +1,11 @@
+from src.db.async_pantry_repo import AsyncPantryRepo
 from src.db.pantry_repo import PantryRepo
-from src.interfaces.pantry_db_interface import PantryDBInterface
+from src.interfaces.pantry_db_interface import AsyncPantryDBInterface, PantryDBInterface
 
 
 def get_pantry_db() -> PantryDBInterface:
     return PantryRepo()
+
+
+async def get_async_pantry_db() -> AsyncPantryDBInterface:
+    return AsyncPantryRepo()
@@ -1,6 +1,11 @@
+from src.db.async_partner_repo import AsyncPartnerRepo
 from src.db.partner_repo import PartnerRepo
-from src.interfaces.partner_repo_interface import PartnerRepoInterface
+from src.interfaces.partner_repo_interface import AsyncPartnerRepoInterface, PartnerRepoInterface
 
 
 def get_partner_db() -> PartnerRepoInterface:
     return PartnerRepo()
+
+
+async def get_async_partner_db() -> AsyncPartnerRepoInterface:
+    return AsyncPartnerRepo()
@@ -0,0 +1,13 @@
+from fastapi import Request
+
+from src.utils.logger_context import set_logger_context_value
+
+
+async def set_route_logger_context(request: Request) -> None:
+    """Copy the resolved route's path params into the logger context.
+
+    Runs as an async router dependency so it reuses the router's match instead of re-matching every route, and
+    its context changes are visible to the endpoint, including sync endpoints run in the threadpool.
+    """
+    for key, value in request.path_params.items():
+        set_logger_context_value(key, value)
@@ -2,7 +2,12 @@ from collections.abc import Iterator
 from datetime import datetime
 from typing import Protocol
 
-from src.services.models.pantry import PantryItem, PantryItemCulinaryIngredientSpecification, PantryItemStatus
+from src.services.models.pantry import (
+    PantryItem,
+    PantryItemCulinaryIngredientSpecification,
+    PantryItemStatus,
+    PantryPageInfo,
+)
 from src.services.models.recipe import CreateCulopsRecipeResponse, CulopsRecipe, Recipe
 
 
@@ -15,8 +20,20 @@ class CulopsClientInterface(Protocol):
         brand_name: str = "",
         page: int | None = None,
         page_size: int | None = None,
+        concurrency: int | None = None,
+        ordered: bool = True,
+        start_page: int = 1,
     ) -> Iterator[tuple[list[PantryItem], bool]]: ...
 
+    def get_partner_culops_pantry_page(
+        self,
+        available_from: datetime | None = None,
+        available_until: datetime | None = None,
+        partner_id: str = "",
+        page: int = 1,
+        page_size: int | None = None,
+    ) -> tuple[list[PantryItem], PantryPageInfo]: ...
+
     def get_recipe_pantry_item_data(
         self,
         item_ids: list[int],
@@ -47,6 +64,8 @@ class CulopsClientInterface(Protocol):
         partner_id: str,
     ) -> CulopsRecipe: ...
 
+    def get_recipes(self, partner_id: str, culops_recipe_ids: list[int]) -> list[CulopsRecipe]: ...
+
     def get_cycle_recipes_by_plan(
         self, partner_id: str, cycle_date: datetime, plan_name: str
     ) -> list[CulopsRecipe]: ...
@@ -72,3 +91,14 @@ class CulopsClientInterface(Protocol):
         self,
         recipe_id: int,
     ) -> None: ...
+
+
+class AsyncCulopsClientInterface(Protocol):
+    async def get_partner_culops_pantry_page(
+        self,
+        available_from: datetime | None = None,
+        available_until: datetime | None = None,
+        partner_id: str = "",
+        page: int = 1,
+        page_size: int | None = None,
+    ) -> tuple[list[PantryItem], PantryPageInfo]: ...
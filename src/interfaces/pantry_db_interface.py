@@ -1,29 +1,79 @@
-from datetime import datetime
+from datetime import date, datetime
 from typing import Protocol
 from uuid import UUID
 
-from src.services.models.pantry import Pantry, PantryItem, PantryItemCulinaryIngredientSpecification
+from src.services.models.pantry import (
+    CurrentPantryState,
+    Pantry,
+    PantryCrawlCheckpoint,
+    PantryItem,
+    PantryItemCulinaryIngredientSpecification,
+    PantrySnapshotProgress,
+    PantrySnapshotStatus,
+    SharedPantrySnapshot,
+)
 from src.services.models.recipe import RecipePantryItemData
 
 
 class PantryDBInterface(Protocol):
     def get_partner_pantry_by_id(
-        self, pantry_state_id: str, partner_id: str, page_size: int, page: int
+        self, pantry_state_id: str, partner_id: str, page_size: int, page: int, after: str | None = None
     ) -> tuple[Pantry | None, int]: ...
 
     def save_pantry_state(
         self,
         pantry_state_id: UUID,
-        partner_id: str,
+        partner_id: str | None,
         pantry_state_timestamp: datetime,
         items_available_from: datetime | None,
         items_available_until: datetime | None,
+        brand_name: str = "",
+        crawl_page_size: int | None = None,
+    ) -> None: ...
+
+    def find_shared_pantry_snapshot(
+        self,
+        items_available_from: datetime | None,
+        items_available_until: datetime | None,
+        fresh_after: datetime,
+    ) -> SharedPantrySnapshot | None: ...
+
+    def save_pantry_reference(
+        self,
+        pantry_state_id: UUID,
+        partner_id: str,
+        source: SharedPantrySnapshot,
+        items_available_from: datetime | None,
+        items_available_until: datetime | None,
+        brand_name: str = "",
+    ) -> None: ...
+
+    def publish_current_pantry_state(
+        self,
+        partner_id: str,
+        pantry_state_id: UUID,
+        items_available_from: datetime | None,
+        items_available_until: datetime | None,
+    ) -> None: ...
+
+    def get_current_pantry_state(self, partner_id: str) -> CurrentPantryState | None: ...
+
+    def finish_pantry_crawl(self, pantry_state_id: UUID, status: PantrySnapshotStatus) -> None: ...
+
+    def get_pantry_snapshot_progress(self, pantry_state_id: str, partner_id: str) -> PantrySnapshotProgress | None: ...
+
+    def save_pantry_items(
+        self, pantry_state_id: UUID, items: list[PantryItem], page_number: int | None = None
     ) -> None: ...
 
-    def save_pantry_items(self, pantry_state_id: UUID, items: list[PantryItem]) -> None: ...
+    def claim_stale_pantry_crawls(self, stale_before: datetime, limit: int) -> list[PantryCrawlCheckpoint]: ...
 
     def delete_pantry(self, pantry_state_id: UUID) -> None: ...
 
+    def create_pantry_partitions(self, first_day: date, last_day: date) -> int: ...
+
+    def drop_pantry_partitions_before(self, cutoff: date) -> list[date]: ...
+
     def get_pantry_item_data_sources(
         self,
         pantry_item_ids: list[str],
@@ -32,3 +82,19 @@ class PantryDBInterface(Protocol):
     def get_pantry_item_data_by_culops_culinary_ingredient_and_specification_id(
         self, culinary_ingredient_specification_id: int, culinary_ingredient_id: int
     ) -> RecipePantryItemData | None: ...
+
+    def get_pantry_item_data_by_culops_culinary_ingredient_and_specification_ids(
+        self, culinary_ingredient_pairs: list[tuple[int, int]]
+    ) -> dict[tuple[int, int], RecipePantryItemData]: ...
+
+
+class AsyncPantryDBInterface(Protocol):
+    async def get_partner_pantry_by_id(
+        self, pantry_state_id: str, partner_id: str, page_size: int, page: int, after: str | None = None
+    ) -> tuple[Pantry | None, int]: ...
+
+    async def get_pantry_snapshot_progress(
+        self, pantry_state_id: str, partner_id: str
+    ) -> PantrySnapshotProgress | None: ...
+
+    async def get_current_pantry_state(self, partner_id: str) -> CurrentPantryState | None: ...
@@ -5,6 +5,8 @@ from src.services.models.recipe import PackagingConfigurationTag, RecipeConstrai
 
 
 class PartnerRepoInterface(Protocol):
+    def get_partner_ids(self) -> list[str]: ...
+
     def find_partner_id(self, partner_id: str) -> bool: ...
 
     def get_partner_by_id(self, partner_id: str) -> Partner: ...
@@ -28,3 +30,11 @@ class PartnerRepoInterface(Protocol):
     def get_branding(self, partner_id: str) -> list[Brand]: ...
 
     def get_sales_channels(self, partner_id: str) -> list[SalesChannel]: ...
+
+
+class AsyncPartnerRepoInterface(Protocol):
+    async def find_partner_id(self, partner_id: str) -> bool: ...
+
+    async def get_partner_cost_markups(self, partner_id: str) -> list[CostMarkup]: ...
+
+    async def get_branding(self, partner_id: str) -> list[Brand]: ...
@@ -16,6 +16,10 @@ class RecipesRepoInterface(Protocol):
         is_external: bool = False,
     ) -> None: ...
 
+    def store_recipe_sources(
+        self, partner_id: str, recipe_refs: list[RecipeRef], is_external: bool = False
+    ) -> None: ...
+
     def get_culops_recipe_ref_by_id(self, partner_id: str, recipe_id: UUID) -> CulopsRecipeRef | None: ...
 
     def get_recipe_sku_by_id(self, partner_id: str, recipe_id: UUID) -> tuple[str, RecipeStatus] | None: ...
@@ -26,6 +30,8 @@ class RecipesRepoInterface(Protocol):
 
     def get_recipe_id_by_culops_recipe_id(self, culops_recipe_id: int) -> UUID | None: ...
 
+    def get_recipe_ids_by_culops_recipe_ids(self, culops_recipe_ids: list[int]) -> dict[int, UUID]: ...
+
     def get_culops_recipe_ref_by_sku(self, partner_id: str, sku: str) -> RecipeRef | None: ...
 
     def get_culops_recipe_refs_by_skus(self, partner_id: str, skus: list[str]) -> list[RecipeRef]: ...
@@ -6,6 +6,9 @@ from fastapi.middleware.trustedhost import TrustedHostMiddleware
 
 from src.api.router import api_router
 from src.clients.culops.mocks.session import MockedSession
+from src.clients.culops.transport import CulOpsTransport
+from src.clients.kafka.producer_registry import ProducerRegistry
+from src.clients.reference_data_cache import ReferenceDataCache
 from src.core.config import settings
 from src.core.datadog_init import init_datadog
 from src.core.exception_handlers import (
@@ -14,9 +17,12 @@ from src.core.exception_handlers import (
 )
 from src.core.middleware.partner_id_middleware import PartnerIDMiddleware
 from src.core.middleware.rollbar_middleware import RollbarMiddleware
-from src.core.middleware.route_context_middleware import RouteContextMiddleware
 from src.core.rollbar_init import init_rollbar
+from src.db.engine_registry import EngineRegistry
+from src.dependancies.pantry_cache import get_pantry_cache_metrics
+from src.services.pantry_crawl_scheduler import PantryCrawlScheduler
 from src.utils.logger import ServiceLogger
+from src.utils.metrics_reporter import MetricsReporter
 from src.utils.task_scheduler import TaskScheduler
 
 init_rollbar()
@@ -37,7 +43,6 @@ app = FastAPI(
 )
 
 app.add_middleware(PartnerIDMiddleware)
-app.add_middleware(RouteContextMiddleware)
 app.add_middleware(RollbarMiddleware)
 
 app.add_exception_handler(Exception, general_exception_handler)
@@ -46,5 +51,31 @@ app.add_exception_handler(RequestValidationError, request_validation_exception_h
 app.include_router(api_router)
 
 task_scheduler = TaskScheduler()
+metrics_reporter = MetricsReporter()
 app.add_event_handler("startup", task_scheduler.start)
+app.add_event_handler("startup", metrics_reporter.start)
+app.add_event_handler("shutdown", metrics_reporter.shutdown)
 app.add_event_handler("shutdown", task_scheduler.shutdown)
+
+# Crawls write through the pooled engines, so stop them before the engines are disposed
+pantry_crawl_scheduler = PantryCrawlScheduler()
+metrics_reporter.register("pantry_crawls", pantry_crawl_scheduler.metrics)
+app.add_event_handler("shutdown", pantry_crawl_scheduler.shutdown)
+
+engine_registry = EngineRegistry()
+metrics_reporter.register("db_pools", engine_registry.metrics)
+app.add_event_handler("startup", engine_registry.start)
+app.add_event_handler("shutdown", engine_registry.shutdown)
+app.add_event_handler("shutdown", engine_registry.shutdown_async)
+
+producer_registry = ProducerRegistry()
+app.add_event_handler("shutdown", producer_registry.shutdown)
+
+culops_transport = CulOpsTransport()
+app.add_event_handler("shutdown", culops_transport.shutdown)
+app.add_event_handler("shutdown", culops_transport.shutdown_async)
+
+metrics_reporter.register("pantry_cache", get_pantry_cache_metrics)
+
+reference_data_cache = ReferenceDataCache()
+app.add_event_handler("shutdown", reference_data_cache.shutdown)
@@ -0,0 +1,44 @@
+import sys
+
+from src.clients.culops.culops import CulOpsService
+from src.clients.param_store.client import ParamStoreClient
+from src.core.exceptions import ServerError
+from src.db.pantry_repo import PantryRepo
+from src.db.partner_repo import PartnerRepo
+from src.db.recipes_repo import RecipesRepo
+from src.services.pantry_prewarm import PantryPrewarmService
+from src.services.token import TokenService
+from src.utils.logger import ServiceLogger
+
+logger = ServiceLogger().get_logger(__name__)
+
+
+def main() -> None:
+    try:
+        logger.info("Starting pantry pre-warm process")
+
+        pantry_db = PantryRepo()
+        partner_db = PartnerRepo()
+        culops_service = CulOpsService(
+            partner_repo=partner_db,
+            recipe_repo=RecipesRepo(),
+            pantry_repo=pantry_db,
+            token_svc=TokenService(param_store_client=ParamStoreClient()),
+        )
+        prewarm_service = PantryPrewarmService(pantry_db, culops_service, partner_db)
+        published = prewarm_service.prewarm()
+
+        logger.info(f"Pantry pre-warm completed: {published} partner pantries published")
+        sys.exit(0)
+
+    except ServerError:
+        logger.exception("Pantry pre-warm process failed")
+        sys.exit(1)
+
+    except Exception:
+        logger.exception("Pantry pre-warm process failed with unexpected error")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
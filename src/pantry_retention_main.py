@@ -0,0 +1,31 @@
+import sys
+
+from src.core.exceptions import ServerError
+from src.db.pantry_repo import PantryRepo
+from src.services.pantry_retention import PantryRetentionService
+from src.utils.logger import ServiceLogger
+
+logger = ServiceLogger().get_logger(__name__)
+
+
+def main() -> None:
+    try:
+        logger.info("Starting pantry retention process")
+
+        retention_service = PantryRetentionService(PantryRepo())
+        dropped = retention_service.maintain_partitions()
+
+        logger.info(f"Pantry retention completed: {len(dropped)} expired partitions dropped")
+        sys.exit(0)
+
+    except ServerError:
+        logger.exception("Pantry retention process failed")
+        sys.exit(1)
+
+    except Exception:
+        logger.exception("Pantry retention process failed with unexpected error")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
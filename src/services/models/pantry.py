@@ -1,4 +1,5 @@
 from datetime import datetime
+from enum import StrEnum
 from typing import Protocol, runtime_checkable
 from uuid import UUID
 
@@ -87,6 +88,64 @@ class Pantry(BaseModel):
     pantry_state_timestamp: datetime
     pantry_items: list[PantryItem]
     partner_cost_markup: list[PartnerCostMarkup]
+    # Items read through a shared snapshot carry CulOps costs; the partner's markups are applied on read
+    partner_costs_applied: bool = True
+
+
+class PantrySnapshotStatus(StrEnum):
+    RUNNING = "running"
+    COMPLETE = "complete"
+    FAILED = "failed"
+
+
+class PantryStorageMode(StrEnum):
+    # Items are stored in the normalized pantry item tables
+    RELATIONAL = "relational"
+    # Item pages are stored as compressed chunks; only pantry_items and data sources are kept for recipe lookups
+    BLOB = "blob"
+
+
+class PantrySnapshotProgress(BaseModel):
+    pantry_state_id: str
+    status: PantrySnapshotStatus
+    pages_fetched: int
+    item_count: int | None
+    finished_at: datetime | None
+
+
+class PantryPageInfo(BaseModel):
+    """Where a fetched CulOps pantry page sits in the listing; ``last_page`` is None when CulOps does not say."""
+
+    has_next: bool
+    last_page: int | None = None
+
+
+class SharedPantrySnapshot(BaseModel):
+    pantry_state_id: UUID
+    pantry_state_timestamp: datetime
+
+
+class CurrentPantryState(BaseModel):
+    """A partner's pre-warmed snapshot of an availability window, as published by the pre-warm job."""
+
+    partner_id: str
+    pantry_state_id: UUID
+    items_available_from: datetime | None
+    items_available_until: datetime | None
+    published_at: datetime
+
+
+class PantryCrawlCheckpoint(BaseModel):
+    pantry_state_id: UUID
+    # None for shared snapshots, which are crawled once for every partner and stored without markups
+    partner_id: str | None
+    pantry_state_timestamp: datetime
+    items_available_from: datetime | None
+    items_available_until: datetime | None
+    brand_name: str
+    page_size: int
+    last_page_saved: int
+    attempts: int
 
 
 class PantryItemCulinaryIngredientSpecification(BaseModel):
@@ -1,6 +1,9 @@
+import asyncio
 import logging
-from concurrent.futures import ThreadPoolExecutor
-from datetime import UTC, datetime
+import threading
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from functools import partial
 from uuid import UUID, uuid4
 
 from src.api.routes.v1.models import (
@@ -10,22 +13,36 @@ from src.api.routes.v1.models import (
     PantryItemCost as ResponsePantryItemCost,
     PantryItemCustomField,
 )
-
-log = logging.getLogger(__name__)
 from src.core.config import get_settings
-from src.core.exceptions import NotFoundException, ServerError
-from src.interfaces.culops_client_interface import CulopsClientInterface
-from src.interfaces.pantry_db_interface import PantryDBInterface
+from src.core.exceptions import NotFoundException, ServerError, ServiceUnavailableException
+from src.interfaces.culops_client_interface import AsyncCulopsClientInterface, CulopsClientInterface
+from src.interfaces.pantry_db_interface import AsyncPantryDBInterface, PantryDBInterface
+from src.interfaces.partner_repo_interface import AsyncPartnerRepoInterface
 from src.services.models.pantry import (
-    DateRange,
+    CurrentPantryState,
     Pantry,
+    PantryCrawlCheckpoint,
     PantryItem,
     PantryItemCost,
+    PantryPageInfo,
+    PantrySnapshotStatus,
     PartnerCostMarkup,
+    SharedPantrySnapshot,
 )
+from src.services.models.partner import CostMarkup
+from src.services.pantry_cache import PantryResponseCache
+from src.services.pantry_cost import (
+    MarkupTimeline,
+    PartnerPriceCache,
+    SharedPantryPriceCache,
+    price_item,
+    price_items,
+)
+from src.services.pantry_crawl_scheduler import CrawlKey, CrawlScheduler, PantryCrawlScheduler
 from src.services.partner import PartnerService
-from src.utils.datetime_helper import UTC_MAX, UTC_MIN, parse_from_datetime
+from src.utils.datetime_helper import parse_from_datetime
 
+log = logging.getLogger(__name__)
 settings = get_settings()
 
 
@@ -35,11 +52,16 @@ class PantryService:
         pantry_db: PantryDBInterface,
         culops_service: CulopsClientInterface,
         partner_service: PartnerService,
+        cache: PantryResponseCache | None = None,
+        crawl_scheduler: CrawlScheduler | None = None,
+        price_cache: PartnerPriceCache | None = None,
     ) -> None:
         self.pantry_db = pantry_db
         self.culops_service = culops_service
         self.partner_service = partner_service
-        self._executor = ThreadPoolExecutor(max_workers=1)
+        self.cache = cache
+        self.crawl_scheduler = crawl_scheduler or PantryCrawlScheduler()
+        self.price_cache = price_cache or SharedPantryPriceCache()
 
     def get_pantry(
         self,
@@ -52,107 +74,431 @@ class PantryService:
         brand_name: str = "",
         page_size: int = settings.DEFAULT_PAGE_SIZE,
         page: int = 1,
+        after: str | None = None,
     ) -> tuple[ResponsePantry, int]:
-        if not partner_id:
-            raise ValueError("Missing partner id")
+        self._check_page_request(partner_id, pantry_state_id, after)
 
         try:
             # If pantry_state_id is provided, retrieve cached pantry from database
             if pantry_state_id:
                 log.info(f"Retrieving cached pantry for partner {partner_id} with state ID {pantry_state_id}")
-                pantry, total_count = self.pantry_db.get_partner_pantry_by_id(
+                stored = self.pantry_db.get_partner_pantry_by_id(
                     pantry_state_id=pantry_state_id,
                     partner_id=partner_id,
                     page_size=page_size,
                     page=page,
+                    after=after,
+                )
+                return self._stored_pantry_response(
+                    stored, partner_id, pantry_state_id, self.price_cache, cost_start_date, cost_end_date
                 )
 
-                if pantry is None:
-                    raise NotFoundException(f"Pantry state {pantry_state_id} not found for partner {partner_id}")
-
-                return self._build_pantry_response(pantry, cost_start_date, cost_end_date), total_count
-
-            # Otherwise, fetch fresh data from CulOps
-            def _to_utc(dt: datetime | None) -> datetime | None:
-                if dt is None:
-                    return None
-                return dt if dt.tzinfo else dt.replace(tzinfo=UTC)
+            # Otherwise, serve a recently built pantry or fetch fresh data from CulOps
+            items_available_from = self._to_utc(available_from)
+            items_available_until = self._to_utc(available_until)
 
-            items_available_from = _to_utc(available_from)
-            items_available_until = _to_utc(available_until)
+            cache_key = self._cache_key(
+                partner_id,
+                items_available_from,
+                items_available_until,
+                cost_start_date,
+                cost_end_date,
+                brand_name,
+                page_size,
+                page,
+            )
+            if self.cache is not None and (cached := self.cache.get(cache_key)) is not None:
+                return cached
 
-            partner_cost_markups = self.partner_service.get_partner_cost_markups()
-            markups = [
-                PartnerCostMarkup(
-                    markup_percent=cm.markup_percent,
-                    applied_from=cm._applied_from,
-                    applied_until=cm._applied_until,
+            if not brand_name and (
+                prewarmed := self.get_prewarmed_pantry(
+                    partner_id, items_available_from, items_available_until, page_size, page
                 )
-                for cm in partner_cost_markups
-            ]
+            ):
+                pantry, total_count = prewarmed
+                response = self._build_pantry_response(pantry, cost_start_date, cost_end_date)
+                if self.cache is not None:
+                    self.cache.set(cache_key, response, total_count)
+                return response, total_count
+
+            cost_markups = self.partner_service.get_partner_cost_markups()
 
             # Fetch first page immediately for fast response
             log.info(f"Fetching first page of pantry items for partner {partner_id}")
-            generator = self.culops_service.get_partner_culops_pantry_data(
+            first_page_items, page_info = self.culops_service.get_partner_culops_pantry_page(
                 available_from=items_available_from,
                 available_until=items_available_until,
                 partner_id=partner_id,
-                brand_name=brand_name,
                 page=page,
                 page_size=page_size,
             )
+            pantry = self._fresh_pantry(
+                partner_id, first_page_items, cost_markups, items_available_from, items_available_until
+            )
 
-            # Get the first page to return immediately
-            first_page_items, has_next_page = next(generator)
-            for pantry_item in first_page_items:
-                pantry_item.cost = self.get_partner_cost(pantry_item, markups)
-
-            # Build response with new pantry_state_id for stateful pagination
-            pantry_state_id_uuid = uuid4()
-            pantry_state_timestamp = datetime.now(UTC)
-
-            pantry = Pantry(
-                pantry_state_id=str(pantry_state_id_uuid),
-                partner_id=partner_id,
-                pantry_items=first_page_items,
-                ingredients_available_from=items_available_from,
-                ingredients_available_until=items_available_until,
-                pantry_state_timestamp=pantry_state_timestamp,
-                partner_cost_markup=markups,
+            crawl_failed = threading.Event()
+            pantry = self.cache_pantry_in_background(
+                pantry,
+                first_page_items,
+                brand_name,
+                on_failure=partial(self._evict_fresh_response, self.cache, cache_key, crawl_failed),
             )
+            response, total_count = self._fresh_pantry_response(
+                pantry, page, page_size, page_info, cost_start_date, cost_end_date
+            )
+            if self.cache is not None:
+                self.cache.set(cache_key, response, total_count)
+                # The crawl may have failed before the entry was written
+                if crawl_failed.is_set():
+                    self.cache.delete(cache_key)
+            return response, total_count
+
+        except (NotFoundException, ServiceUnavailableException, ValueError):
+            raise
+        except Exception as e:
+            raise ServerError(f"Failed to get pantry for partner {partner_id}") from e
 
-            # Fetch and cache ALL remaining pages in background (fire and forget)
-            # This enables true stateful pagination through the entire dataset
-            log.info(f"Starting background fetch of all pantry items for partner {partner_id}")
-            self._executor.submit(
-                self._fetch_and_cache_all_items,
-                pantry_state_id_uuid,
+    def get_prewarmed_pantry(
+        self,
+        partner_id: str,
+        items_available_from: datetime | None,
+        items_available_until: datetime | None,
+        page_size: int,
+        page: int,
+    ) -> tuple[Pantry, int] | None:
+        """A page of the partner's pre-warmed snapshot when one of the window is published and fresh."""
+        if settings.PANTRY_PREWARM_MAX_AGE_SECONDS <= 0:
+            return None
+        current = self.pantry_db.get_current_pantry_state(partner_id)
+        if current is None or not self._serves_window(current, items_available_from, items_available_until):
+            return None
+
+        stored = self.pantry_db.get_partner_pantry_by_id(
+            pantry_state_id=str(current.pantry_state_id),
+            partner_id=partner_id,
+            page_size=page_size,
+            page=page,
+        )
+        return self._prewarmed_page(current, stored, self.price_cache)
+
+    def crawl_snapshot(self, items_available_from: datetime | None, items_available_until: datetime | None) -> UUID:
+        """Crawl every CulOps page of the window into a new snapshot of the service's partner, in this thread.
+
+        Returns the snapshot id once the crawl is complete; a failed crawl is marked failed and re-raised.
+        """
+        partner_id = self.partner_service.partner_id
+        markups = self._to_partner_cost_markups(self.partner_service.get_partner_cost_markups())
+        pantry_state_id = uuid4()
+        page_size = settings.CULOPS_PANTRY_FETCH_SIZE
+        self.pantry_db.save_pantry_state(
+            pantry_state_id=pantry_state_id,
+            partner_id=partner_id,
+            pantry_state_timestamp=datetime.now(UTC),
+            items_available_from=items_available_from,
+            items_available_until=items_available_until,
+            crawl_page_size=page_size,
+        )
+        try:
+            self._crawl_pages(
+                pantry_state_id,
                 partner_id,
-                pantry_state_timestamp,
                 items_available_from,
                 items_available_until,
-                first_page_items,
                 markups,
+                "",
+                page_size,
+                start_page=1,
+            )
+        except Exception:
+            self._mark_crawl_failed(pantry_state_id)
+            raise
+        return pantry_state_id
+
+    def crawl_shared_snapshot(
+        self, items_available_from: datetime | None, items_available_until: datetime | None
+    ) -> SharedPantrySnapshot:
+        """Crawl a new shared snapshot of the window in this thread and return it once complete."""
+        source = SharedPantrySnapshot(pantry_state_id=uuid4(), pantry_state_timestamp=datetime.now(UTC))
+        self._crawl_shared_snapshot(
+            source.pantry_state_id, source.pantry_state_timestamp, items_available_from, items_available_until
+        )
+        return source
+
+    def cache_pantry_in_background(
+        self,
+        pantry: Pantry,
+        first_page_items: list[PantryItem],
+        brand_name: str,
+        on_failure: Callable[[], None] | None = None,
+    ) -> Pantry:
+        """Fetch and cache ALL remaining pages in background (fire and forget).
+
+        This enables true stateful pagination through the entire dataset. When an identical crawl is already in
+        flight no new one is started; the returned pantry then points at that crawl's snapshot instead.
+        With shared snapshots enabled the partner's snapshot references a shared crawl of the window instead.
+        ``on_failure`` is called from the crawl's worker thread if the crawl behind the returned pantry fails.
+        """
+        if settings.PANTRY_SHARED_SNAPSHOTS_ENABLED:
+            return self.reference_shared_snapshot(pantry, brand_name, on_failure)
+
+        pantry_state_id = UUID(pantry.pantry_state_id)
+        job = self.crawl_scheduler.submit(
+            key=CrawlKey(
+                partner_id=pantry.partner_id,
+                available_from=pantry.ingredients_available_from,
+                available_until=pantry.ingredients_available_until,
+                brand_name=brand_name,
+            ),
+            pantry_state_id=pantry_state_id,
+            pantry_state_timestamp=pantry.pantry_state_timestamp,
+            task=partial(
+                self._fetch_and_cache_all_items,
+                pantry_state_id,
+                pantry.partner_id,
+                pantry.pantry_state_timestamp,
+                pantry.ingredients_available_from,
+                pantry.ingredients_available_until,
+                first_page_items,
+                pantry.partner_cost_markup,
                 brand_name,
+            ),
+            on_failure=on_failure,
+        )
+
+        if job.pantry_state_id == pantry_state_id:
+            log.info(f"Starting background fetch of all pantry items for partner {pantry.partner_id}")
+            return pantry
+
+        log.info(f"Attaching to in-flight pantry crawl {job.pantry_state_id} for partner {pantry.partner_id}")
+        return pantry.model_copy(
+            update={
+                "pantry_state_id": str(job.pantry_state_id),
+                "pantry_state_timestamp": job.pantry_state_timestamp,
+            }
+        )
+
+    def reference_shared_snapshot(
+        self, pantry: Pantry, brand_name: str, on_failure: Callable[[], None] | None = None
+    ) -> Pantry:
+        """Point the partner's new snapshot at the shared snapshot of its availability window.
+
+        A recent shared snapshot stored by any process is reused; otherwise a shared crawl is started, or joined if
+        one for the window is already running here. The reference takes the shared snapshot's timestamp.
+        """
+        fresh_after = datetime.now(UTC) - timedelta(seconds=settings.PANTRY_SHARED_SNAPSHOT_MAX_AGE_SECONDS)
+        source = self.pantry_db.find_shared_pantry_snapshot(
+            pantry.ingredients_available_from, pantry.ingredients_available_until, fresh_after
+        )
+        if source is None:
+            source = self._start_shared_crawl(
+                pantry.ingredients_available_from, pantry.ingredients_available_until, on_failure
             )
+        else:
+            log.info(f"Reusing shared pantry snapshot {source.pantry_state_id} for partner {pantry.partner_id}")
 
-            # Return estimated total count (will be updated once background fetch completes)
-            # Use first page count as a lower bound estimate
-            total_count = len(first_page_items) if not has_next_page else len(first_page_items) * 20
-            return self._build_pantry_response(pantry, cost_start_date, cost_end_date), total_count
+        self.pantry_db.save_pantry_reference(
+            pantry_state_id=UUID(pantry.pantry_state_id),
+            partner_id=pantry.partner_id,
+            source=source,
+            items_available_from=pantry.ingredients_available_from,
+            items_available_until=pantry.ingredients_available_until,
+            brand_name=brand_name,
+        )
+        return pantry.model_copy(update={"pantry_state_timestamp": source.pantry_state_timestamp})
 
-        except NotFoundException:
-            raise
-        except Exception as e:
-            if isinstance(e, ValueError):
-                raise
-            raise ServerError(f"Failed to get pantry for partner {partner_id}") from e
+    @staticmethod
+    def price_shared_snapshot(pantry: Pantry, price_cache: PartnerPriceCache) -> None:
+        """Price items read through a shared snapshot with the partner's markups; other pantries are left as is."""
+        if pantry.partner_costs_applied:
+            return
+        costs = price_cache.price_items(pantry.pantry_items, pantry.partner_cost_markup)
+        for item, cost in zip(pantry.pantry_items, costs, strict=True):
+            item.cost = cost
+        pantry.partner_costs_applied = True
+
+    def _start_shared_crawl(
+        self,
+        items_available_from: datetime | None,
+        items_available_until: datetime | None,
+        on_failure: Callable[[], None] | None = None,
+    ) -> SharedPantrySnapshot:
+        pantry_state_id = uuid4()
+        pantry_state_timestamp = datetime.now(UTC)
+        # CulOps serves the same catalog to every partner; only the availability window tells shared crawls apart
+        job = self.crawl_scheduler.submit(
+            key=CrawlKey(
+                partner_id="",
+                available_from=items_available_from,
+                available_until=items_available_until,
+                brand_name="",
+            ),
+            pantry_state_id=pantry_state_id,
+            pantry_state_timestamp=pantry_state_timestamp,
+            task=partial(
+                self._crawl_shared_snapshot,
+                pantry_state_id,
+                pantry_state_timestamp,
+                items_available_from,
+                items_available_until,
+            ),
+            on_failure=on_failure,
+        )
+        if job.pantry_state_id == pantry_state_id:
+            log.info(f"Starting shared pantry crawl {pantry_state_id}")
+        return SharedPantrySnapshot(
+            pantry_state_id=job.pantry_state_id, pantry_state_timestamp=job.pantry_state_timestamp
+        )
+
+    @staticmethod
+    def _cache_key(
+        partner_id: str,
+        available_from: datetime | None,
+        available_until: datetime | None,
+        cost_start_date: datetime | None,
+        cost_end_date: datetime | None,
+        brand_name: str,
+        page_size: int,
+        page: int,
+    ) -> str:
+        return PantryResponseCache.key(
+            partner_id,
+            available_from=available_from,
+            available_until=available_until,
+            cost_start_date=cost_start_date,
+            cost_end_date=cost_end_date,
+            brand_name=brand_name,
+            page_size=page_size,
+            page=page,
+        )
+
+    @staticmethod
+    def _evict_fresh_response(cache: PantryResponseCache | None, cache_key: str, crawl_failed: threading.Event) -> None:
+        """Drop a cached fresh response once the crawl behind its pantry state id has failed."""
+        crawl_failed.set()
+        if cache is not None:
+            cache.delete(cache_key)
+
+    @staticmethod
+    def _serves_window(
+        current: CurrentPantryState,
+        items_available_from: datetime | None,
+        items_available_until: datetime | None,
+    ) -> bool:
+        if (current.items_available_from, current.items_available_until) != (
+            items_available_from,
+            items_available_until,
+        ):
+            return False
+        fresh_after = datetime.now(UTC) - timedelta(seconds=settings.PANTRY_PREWARM_MAX_AGE_SECONDS)
+        return current.published_at >= fresh_after
+
+    @staticmethod
+    def _to_utc(dt: datetime | None) -> datetime | None:
+        if dt is None:
+            return None
+        return dt if dt.tzinfo else dt.replace(tzinfo=UTC)
+
+    @staticmethod
+    def _to_partner_cost_markups(cost_markups: list[CostMarkup]) -> list[PartnerCostMarkup]:
+        return [
+            PartnerCostMarkup(
+                markup_percent=cm.markup_percent,
+                applied_from=cm._applied_from,
+                applied_until=cm._applied_until,
+            )
+            for cm in cost_markups
+        ]
+
+    @staticmethod
+    def _check_page_request(partner_id: str, pantry_state_id: str | None, after: str | None) -> None:
+        if not partner_id:
+            raise ValueError("Missing partner id")
+        if after is not None and not pantry_state_id:
+            raise ValueError("Cursor pagination requires a pantry state id")
+
+    @staticmethod
+    def _stored_pantry_response(
+        stored: tuple[Pantry | None, int],
+        partner_id: str,
+        pantry_state_id: str,
+        price_cache: PartnerPriceCache,
+        cost_start_date: datetime | None,
+        cost_end_date: datetime | None,
+    ) -> tuple[ResponsePantry, int]:
+        """The response for a page read from a stored pantry state."""
+        pantry, total_count = stored
+        if pantry is None:
+            raise NotFoundException(f"Pantry state {pantry_state_id} not found for partner {partner_id}")
+
+        PantryService.price_shared_snapshot(pantry, price_cache)
+        return PantryService._build_pantry_response(pantry, cost_start_date, cost_end_date), total_count
+
+    @staticmethod
+    def _prewarmed_page(
+        current: CurrentPantryState, stored: tuple[Pantry | None, int], price_cache: PartnerPriceCache
+    ) -> tuple[Pantry, int] | None:
+        pantry, total_count = stored
+        if pantry is None:
+            return None
+        log.info(f"Serving pre-warmed pantry {current.pantry_state_id} for partner {pantry.partner_id}")
+        PantryService.price_shared_snapshot(pantry, price_cache)
+        return pantry, total_count
+
+    @staticmethod
+    def _fresh_pantry(
+        partner_id: str,
+        first_page_items: list[PantryItem],
+        cost_markups: list[CostMarkup],
+        items_available_from: datetime | None,
+        items_available_until: datetime | None,
+    ) -> Pantry:
+        """A new pantry state holding the priced first CulOps page; its id is used for stateful pagination."""
+        markups = PantryService._to_partner_cost_markups(cost_markups)
+        PantryService.apply_partner_costs(first_page_items, markups)
+        return Pantry(
+            pantry_state_id=str(uuid4()),
+            partner_id=partner_id,
+            pantry_items=first_page_items,
+            ingredients_available_from=items_available_from,
+            ingredients_available_until=items_available_until,
+            pantry_state_timestamp=datetime.now(UTC),
+            partner_cost_markup=markups,
+        )
+
+    @staticmethod
+    def _fresh_pantry_response(
+        pantry: Pantry,
+        page: int,
+        page_size: int,
+        page_info: PantryPageInfo,
+        cost_start_date: datetime | None,
+        cost_end_date: datetime | None,
+    ) -> tuple[ResponsePantry, int]:
+        total_count, estimated = PantryService._first_page_total_count(pantry.pantry_items, page, page_size, page_info)
+        return PantryService._build_pantry_response(pantry, cost_start_date, cost_end_date, estimated), total_count
+
+    @staticmethod
+    def _first_page_total_count(
+        first_page_items: list[PantryItem], page: int, page_size: int, page_info: PantryPageInfo
+    ) -> tuple[int, bool]:
+        """The total count of a fresh pantry from its first fetched page, and whether that total is estimated.
+
+        Until the crawl is complete the total comes from CulOps' last page number, which counts whole pages and
+        items the mapper may drop, so it is only exact when the fetched page is the whole pantry.
+        """
+        if not page_info.has_next:
+            return (page - 1) * page_size + len(first_page_items), page > 1
+        if page_info.last_page is not None and page_info.last_page > page:
+            return page_info.last_page * page_size, True
+        # Without a last page, count one more page so clients keep following the next link
+        return (page + 1) * page_size, True
 
     @staticmethod
     def _build_pantry_response(
         pantry: Pantry,
         cost_start_date: datetime | None = None,
         cost_end_date: datetime | None = None,
+        total_count_estimated: bool = False,
     ) -> ResponsePantry:
         pantry_items = []
 
@@ -215,6 +561,7 @@ class PantryService:
             if pantry.ingredients_available_until
             else "",
             pantryStateTimestamp=pantry.pantry_state_timestamp,
+            totalCountEstimated=total_count_estimated,
         )
 
     @staticmethod
@@ -247,51 +594,42 @@ class PantryService:
 
         return True
 
-    @staticmethod
-    def _split_ranges(ranges: list[DateRange]) -> list[DateRange]:
-        """Split date ranges into non-overlapping, consecutive segments."""
-        points = {r.start or UTC_MIN for r in ranges} | {r.end or UTC_MAX for r in ranges}
-        sorted_points = sorted(points)
-
-        return [DateRange(start=sorted_points[i], end=sorted_points[i + 1]) for i in range(len(sorted_points) - 1)]
-
-    def _overlaps(self, range1: DateRange, range2: DateRange) -> bool:
-        """Check if two date ranges overlap."""
-        start1, end1 = range1.start or UTC_MIN, range1.end or UTC_MAX
-        start2, end2 = range2.start or UTC_MIN, range2.end or UTC_MAX
-
-        return start1 < end2 and end1 > start2
-
     def get_partner_cost(self, item: PantryItem, partner_markups: list[PartnerCostMarkup]) -> list[PantryItemCost]:
-        result: list[PantryItemCost] = []
-
-        availabilities = item.availability
-        costs = item.cost
-        all_ranges = [x.get_date_range() for x in (availabilities + costs + partner_markups)]
-        flat_ranges = self._split_ranges(all_ranges)
-
-        for date_slice in flat_ranges:
-            matching_costs = [c for c in costs if self._overlaps(date_slice, c.get_date_range())]
-            matching_avails = [a for a in availabilities if self._overlaps(date_slice, a.get_date_range())]
-            if not matching_costs or (availabilities and not matching_avails):
-                continue
-
-            for cost in matching_costs:
-                for markup in partner_markups:
-                    if self._overlaps(date_slice, markup.get_date_range()):
-                        applied_cost = round(cost.production_cost_us_dollars * (1 + markup.markup_percent / 100), 2)
-                        pantry_item_cost = PantryItemCost(
-                            start_date=None
-                            if not date_slice.start or date_slice.start == UTC_MIN
-                            else date_slice.start,
-                            end_date=None if not date_slice.end or date_slice.end == UTC_MAX else date_slice.end,
-                            production_cost_us_dollars=applied_cost,
-                        )
-
-                        result.append(pantry_item_cost)
-                        break
-
-        return result
+        return price_item(item, MarkupTimeline(partner_markups))
+
+    @staticmethod
+    def apply_partner_costs(items: list[PantryItem], partner_markups: list[PartnerCostMarkup]) -> None:
+        """Replace each item's production costs with marked-up costs, sharing one markup timeline per page."""
+        for item, cost in zip(items, price_items(items, partner_markups), strict=True):
+            item.cost = cost
+
+    def resume_crawl(self, checkpoint: PantryCrawlCheckpoint) -> None:
+        """Continue a crawl abandoned by another process from the page after its last checkpoint.
+
+        Failures are left for the next recovery sweep rather than marking the snapshot failed.
+        """
+        log.info(
+            f"Resuming pantry crawl for state {checkpoint.pantry_state_id} after page {checkpoint.last_page_saved}",
+            extra={
+                "pantry_state_id": str(checkpoint.pantry_state_id),
+                "partner_id": checkpoint.partner_id,
+                "attempt": checkpoint.attempts,
+            },
+        )
+        # Shared snapshots are stored without markups
+        markups = None
+        if checkpoint.partner_id is not None:
+            markups = self._to_partner_cost_markups(self.partner_service.get_partner_cost_markups())
+        self._crawl_pages(
+            checkpoint.pantry_state_id,
+            checkpoint.partner_id,
+            checkpoint.items_available_from,
+            checkpoint.items_available_until,
+            markups,
+            checkpoint.brand_name,
+            checkpoint.page_size,
+            start_page=checkpoint.last_page_saved + 1,
+        )
 
     def _fetch_and_cache_all_items(
         self,
@@ -305,62 +643,40 @@ class PantryService:
         brand_name: str,
     ) -> None:
         """Fetch all pantry items and cache in background using streaming batches."""
+        page_size = settings.CULOPS_PANTRY_FETCH_SIZE
         try:
             log.info(f"Background fetch started for partner {partner_id}, state {pantry_state_id_uuid}")
 
-            # Save pantry state first
+            # Save pantry state first, with what a resumed crawl needs to pick up where this one stops
             self.pantry_db.save_pantry_state(
                 pantry_state_id=pantry_state_id_uuid,
                 partner_id=partner_id,
                 pantry_state_timestamp=pantry_state_timestamp,
                 items_available_from=items_available_from,
                 items_available_until=items_available_until,
+                brand_name=brand_name,
+                crawl_page_size=page_size,
             )
             log.info(f"Saved pantry state {pantry_state_id_uuid}")
 
-            # Process and save first page items
-            for pantry_item in first_page_items:
-                pantry_item.cost = self.get_partner_cost(pantry_item, markups)
-
+            # First page items were already priced for the response; pricing them again would compound the markup.
+            # They are checkpointed as page 0 so a resumed crawl starts at CulOps page 1.
             self.pantry_db.save_pantry_items(
                 pantry_state_id=pantry_state_id_uuid,
                 items=first_page_items,
+                page_number=0,
             )
-            total_saved = len(first_page_items)
-            log.info(f"Saved first page: {total_saved} items")
-
-            # Fetch and save remaining pages in batches
-            generator = self.culops_service.get_partner_culops_pantry_data(
-                available_from=items_available_from,
-                available_until=items_available_until,
-                partner_id=partner_id,
-                brand_name=brand_name,
-                page=None,  # Get all pages
-                page_size=None,
-            )
+            log.info(f"Saved first page: {len(first_page_items)} items")
 
-            # Process each page as it arrives, then immediately save to DB
-            for page_items, has_next in generator:
-                for pantry_item in page_items:
-                    pantry_item.cost = self.get_partner_cost(pantry_item, markups)
-
-                self.pantry_db.save_pantry_items(
-                    pantry_state_id=pantry_state_id_uuid,
-                    items=page_items,
-                )
-                total_saved += len(page_items)
-                log.info(f"Saved batch: {len(page_items)} items, total: {total_saved}")
-
-                if not has_next:
-                    break
-
-            log.info(
-                f"Background fetch completed successfully: {total_saved} total items for partner {partner_id}, state {pantry_state_id_uuid}",
-                extra={
-                    "pantry_state_id": str(pantry_state_id_uuid),
-                    "partner_id": partner_id,
-                    "item_count": total_saved,
-                }
+            self._crawl_pages(
+                pantry_state_id_uuid,
+                partner_id,
+                items_available_from,
+                items_available_until,
+                markups,
+                brand_name,
+                page_size,
+                start_page=1,
             )
 
         except Exception as e:
@@ -372,3 +688,242 @@ class PantryService:
                     "error": str(e),
                 }
             )
+            self._mark_crawl_failed(pantry_state_id_uuid)
+            # Let the crawl scheduler record the job as failed
+            raise
+
+    def _crawl_shared_snapshot(
+        self,
+        pantry_state_id_uuid: UUID,
+        pantry_state_timestamp: datetime,
+        items_available_from: datetime | None,
+        items_available_until: datetime | None,
+    ) -> None:
+        """Crawl every CulOps page of the window into a shared snapshot, keeping CulOps costs as they are."""
+        page_size = settings.CULOPS_PANTRY_FETCH_SIZE
+        try:
+            self.pantry_db.save_pantry_state(
+                pantry_state_id=pantry_state_id_uuid,
+                partner_id=None,
+                pantry_state_timestamp=pantry_state_timestamp,
+                items_available_from=items_available_from,
+                items_available_until=items_available_until,
+                crawl_page_size=page_size,
+            )
+            self._crawl_pages(
+                pantry_state_id_uuid,
+                None,
+                items_available_from,
+                items_available_until,
+                None,
+                "",
+                page_size,
+                start_page=1,
+            )
+        except Exception as e:
+            log.error(
+                f"Failed to crawl shared pantry snapshot {pantry_state_id_uuid}",
+                extra={"pantry_state_id": str(pantry_state_id_uuid), "error": str(e)},
+            )
+            self._mark_crawl_failed(pantry_state_id_uuid)
+            raise
+
+    def _crawl_pages(
+        self,
+        pantry_state_id_uuid: UUID,
+        partner_id: str | None,
+        items_available_from: datetime | None,
+        items_available_until: datetime | None,
+        markups: list[PartnerCostMarkup] | None,
+        brand_name: str,
+        page_size: int,
+        start_page: int,
+    ) -> None:
+        # Pages arrive in order, so each save can checkpoint its CulOps page number along with the rows
+        generator = self.culops_service.get_partner_culops_pantry_data(
+            available_from=items_available_from,
+            available_until=items_available_until,
+            partner_id=partner_id or "",
+            brand_name=brand_name,
+            page=None,  # Get all pages
+            page_size=page_size,
+            start_page=start_page,
+        )
+
+        saved = 0
+        for page_number, (page_items, has_next) in enumerate(generator, start=start_page):
+            if markups is not None:
+                self.apply_partner_costs(page_items, markups)
+
+            self.pantry_db.save_pantry_items(
+                pantry_state_id=pantry_state_id_uuid,
+                items=page_items,
+                page_number=page_number,
+            )
+            saved += len(page_items)
+            log.info(f"Saved page {page_number}: {len(page_items)} items, total this run: {saved}")
+
+            if not has_next:
+                break
+
+        self.pantry_db.finish_pantry_crawl(pantry_state_id_uuid, PantrySnapshotStatus.COMPLETE)
+        log.info(
+            f"Background fetch completed successfully for partner {partner_id}, state {pantry_state_id_uuid}",
+            extra={
+                "pantry_state_id": str(pantry_state_id_uuid),
+                "partner_id": partner_id,
+                "items_saved": saved,
+                "start_page": start_page,
+            }
+        )
+
+    def _mark_crawl_failed(self, pantry_state_id_uuid: UUID) -> None:
+        try:
+            self.pantry_db.finish_pantry_crawl(pantry_state_id_uuid, PantrySnapshotStatus.FAILED)
+        except Exception as e:
+            log.error(f"Failed to mark crawl for state {pantry_state_id_uuid} as failed", exc_info=e)
+
+
+class AsyncPantryService:
+    """Serves pantry pages without blocking the event loop.
+
+    Stored snapshots and the first CulOps page are read through the async clients; caching the rest of a fresh
+    pantry still runs on the sync crawl service's crawl scheduler. That service is only built, through
+    ``crawl_service_factory``, when a fresh pantry needs a crawl.
+    """
+
+    def __init__(
+        self,
+        pantry_db: AsyncPantryDBInterface,
+        culops_service: AsyncCulopsClientInterface,
+        partner_db: AsyncPartnerRepoInterface,
+        crawl_service_factory: Callable[[], PantryService],
+        cache: PantryResponseCache | None = None,
+        price_cache: PartnerPriceCache | None = None,
+    ) -> None:
+        self.pantry_db = pantry_db
+        self.culops_service = culops_service
+        self.partner_db = partner_db
+        self.crawl_service_factory = crawl_service_factory
+        self.cache = cache
+        self.price_cache = price_cache or SharedPantryPriceCache()
+
+    async def get_prewarmed_pantry(
+        self,
+        partner_id: str,
+        items_available_from: datetime | None,
+        items_available_until: datetime | None,
+        page_size: int,
+        page: int,
+    ) -> tuple[Pantry, int] | None:
+        """A page of the partner's pre-warmed snapshot when one of the window is published and fresh."""
+        if settings.PANTRY_PREWARM_MAX_AGE_SECONDS <= 0:
+            return None
+        current = await self.pantry_db.get_current_pantry_state(partner_id)
+        if current is None or not PantryService._serves_window(current, items_available_from, items_available_until):
+            return None
+
+        stored = await self.pantry_db.get_partner_pantry_by_id(
+            pantry_state_id=str(current.pantry_state_id),
+            partner_id=partner_id,
+            page_size=page_size,
+            page=page,
+        )
+        return PantryService._prewarmed_page(current, stored, self.price_cache)
+
+    async def get_pantry(
+        self,
+        partner_id: str,
+        available_from: datetime | None = None,
+        available_until: datetime | None = None,
+        cost_start_date: datetime | None = None,
+        cost_end_date: datetime | None = None,
+        pantry_state_id: str | None = None,
+        brand_name: str = "",
+        page_size: int = settings.DEFAULT_PAGE_SIZE,
+        page: int = 1,
+        after: str | None = None,
+    ) -> tuple[ResponsePantry, int]:
+        PantryService._check_page_request(partner_id, pantry_state_id, after)
+
+        try:
+            if pantry_state_id:
+                log.info(f"Retrieving cached pantry for partner {partner_id} with state ID {pantry_state_id}")
+                stored = await self.pantry_db.get_partner_pantry_by_id(
+                    pantry_state_id=pantry_state_id,
+                    partner_id=partner_id,
+                    page_size=page_size,
+                    page=page,
+                    after=after,
+                )
+                return PantryService._stored_pantry_response(
+                    stored, partner_id, pantry_state_id, self.price_cache, cost_start_date, cost_end_date
+                )
+
+            items_available_from = PantryService._to_utc(available_from)
+            items_available_until = PantryService._to_utc(available_until)
+
+            cache_key = PantryService._cache_key(
+                partner_id,
+                items_available_from,
+                items_available_until,
+                cost_start_date,
+                cost_end_date,
+                brand_name,
+                page_size,
+                page,
+            )
+            if self.cache is not None and (cached := await self.cache.aget(cache_key)) is not None:
+                return cached
+
+            if not brand_name and (
+                prewarmed := await self.get_prewarmed_pantry(
+                    partner_id, items_available_from, items_available_until, page_size, page
+                )
+            ):
+                pantry, total_count = prewarmed
+                response = PantryService._build_pantry_response(pantry, cost_start_date, cost_end_date)
+                if self.cache is not None:
+                    await self.cache.aset(cache_key, response, total_count)
+                return response, total_count
+
+            # Markups and the first CulOps page are independent, so fetch them concurrently
+            log.info(f"Fetching first page of pantry items for partner {partner_id}")
+            cost_markups, (first_page_items, page_info) = await asyncio.gather(
+                self.partner_db.get_partner_cost_markups(partner_id),
+                self.culops_service.get_partner_culops_pantry_page(
+                    available_from=items_available_from,
+                    available_until=items_available_until,
+                    partner_id=partner_id,
+                    page=page,
+                    page_size=page_size,
+                ),
+            )
+            pantry = PantryService._fresh_pantry(
+                partner_id, first_page_items, cost_markups, items_available_from, items_available_until
+            )
+
+            # Starting a crawl can hit the database (shared snapshots), so it runs off the event loop
+            crawl_service = self.crawl_service_factory()
+            crawl_failed = threading.Event()
+            pantry = await asyncio.to_thread(
+                crawl_service.cache_pantry_in_background,
+                pantry,
+                first_page_items,
+                brand_name,
+                on_failure=partial(PantryService._evict_fresh_response, self.cache, cache_key, crawl_failed),
+            )
+            response, total_count = PantryService._fresh_pantry_response(
+                pantry, page, page_size, page_info, cost_start_date, cost_end_date
+            )
+            if self.cache is not None:
+                await self.cache.aset(cache_key, response, total_count)
+                # The crawl may have failed before the entry was written
+                if crawl_failed.is_set():
+                    await self.cache.adelete(cache_key)
+            return response, total_count
+
+        except (NotFoundException, ServiceUnavailableException, ValueError):
+            raise
+        except Exception as e:
+            raise ServerError(f"Failed to get pantry for partner {partner_id}") from e
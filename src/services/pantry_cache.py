@@ -0,0 +1,165 @@
+import asyncio
+import hashlib
+import json
+import threading
+import time
+from typing import Any
+
+from pydantic import ValidationError
+
+from src.api.routes.v1.models import Pantry as ResponsePantry
+from src.clients.redis_cache import RedisCache
+from src.core.config import settings
+from src.core.exceptions import ServerError
+from src.interfaces.cache_backend_interface import CacheBackendInterface
+from src.utils.logger import ServiceLogger
+from src.utils.ttl_lru_cache import CacheStats, TTLLRUCache
+
+logger = ServiceLogger().get_logger(__name__)
+
+CachedPantry = tuple[ResponsePantry, int]
+
+
+class PantryResponseCache:
+    """Caches fresh pantry responses in an in-process LRU tier backed by an optional shared tier (Redis).
+
+    Failures of the shared tier are logged and counted, and the tier is bypassed for a cool-down period, so a Redis
+    outage degrades to local caching instead of failing pantry requests.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: int,
+        max_entries: int,
+        remote: CacheBackendInterface | None = None,
+        remote_retry_seconds: float = 30.0,
+    ) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.local: TTLLRUCache[CachedPantry] = TTLLRUCache(max_entries=max_entries, ttl_seconds=ttl_seconds)
+        self.remote = remote
+        self.remote_stats = CacheStats()
+        self._remote_retry_seconds = remote_retry_seconds
+        self._remote_disabled_until = 0.0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_settings(cls) -> "PantryResponseCache":
+        remote: CacheBackendInterface | None = None
+        if settings.REDIS_HOST:
+            try:
+                remote = RedisCache(
+                    host=settings.REDIS_HOST,
+                    port=settings.REDIS_PORT,
+                    db=settings.REDIS_DB,
+                    socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+                )
+            except ServerError as e:
+                logger.warning("Redis pantry cache tier disabled", exc_info=e)
+
+        return cls(
+            ttl_seconds=settings.PANTRY_CACHE_TTL_SECONDS,
+            max_entries=settings.PANTRY_CACHE_MAX_ENTRIES,
+            remote=remote,
+            remote_retry_seconds=settings.PANTRY_CACHE_REDIS_RETRY_SECONDS,
+        )
+
+    @staticmethod
+    def key(partner_id: str, **params: Any) -> str:
+        params_hash = hashlib.sha256(json.dumps(params, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+        return f"pantry:{partner_id}:{params_hash[:32]}"
+
+    def get(self, key: str) -> CachedPantry | None:
+        cached = self.local.get(key)
+        if cached is not None or not self._remote_available():
+            return cached
+        return self._get_remote(key)
+
+    async def aget(self, key: str) -> CachedPantry | None:
+        cached = self.local.get(key)
+        if cached is not None or not self._remote_available():
+            return cached
+        return await asyncio.to_thread(self._get_remote, key)
+
+    def set(self, key: str, pantry: ResponsePantry, total_count: int) -> None:
+        self.local.set(key, (pantry, total_count))
+        if self._remote_available():
+            self._set_remote(key, pantry, total_count)
+
+    async def aset(self, key: str, pantry: ResponsePantry, total_count: int) -> None:
+        self.local.set(key, (pantry, total_count))
+        if self._remote_available():
+            await asyncio.to_thread(self._set_remote, key, pantry, total_count)
+
+    def delete(self, key: str) -> None:
+        self.local.delete(key)
+        if self._remote_available():
+            self._delete_remote(key)
+
+    async def adelete(self, key: str) -> None:
+        self.local.delete(key)
+        if self._remote_available():
+            await asyncio.to_thread(self._delete_remote, key)
+
+    def metrics(self) -> dict[str, Any]:
+        with self._lock:
+            remote_stats = self.remote_stats.snapshot()
+        return {"local": self.local.metrics(), "remote": {"enabled": self.remote is not None, **remote_stats}}
+
+    def _remote_available(self) -> bool:
+        return self.remote is not None and time.monotonic() >= self._remote_disabled_until
+
+    def _get_remote(self, key: str) -> CachedPantry | None:
+        assert self.remote is not None
+        try:
+            payload = self.remote.get(key)
+        except ServerError as e:
+            self._remote_failed(e)
+            return None
+
+        if payload is None:
+            self._count_remote(hit=False)
+            return None
+
+        try:
+            data = json.loads(payload)
+            cached = ResponsePantry.model_validate(data["pantry"]), int(data["total_count"])
+        except (ValueError, KeyError, TypeError, ValidationError) as e:
+            # Entries written by an older response model are treated as misses and overwritten on the next set
+            logger.warning(f"Discarding unreadable pantry cache entry {key}", exc_info=e)
+            self._count_remote(hit=False)
+            return None
+
+        self._count_remote(hit=True)
+        self.local.set(key, cached)
+        return cached
+
+    def _set_remote(self, key: str, pantry: ResponsePantry, total_count: int) -> None:
+        assert self.remote is not None
+        payload = json.dumps({"pantry": pantry.model_dump(mode="json", by_alias=True), "total_count": total_count})
+        try:
+            self.remote.set(key, payload.encode("utf-8"), self.ttl_seconds)
+        except ServerError as e:
+            self._remote_failed(e)
+
+    def _delete_remote(self, key: str) -> None:
+        assert self.remote is not None
+        try:
+            self.remote.delete(key)
+        except ServerError as e:
+            self._remote_failed(e)
+
+    def _count_remote(self, hit: bool) -> None:
+        # Remote reads run on request threads and asyncio.to_thread workers alike
+        with self._lock:
+            if hit:
+                self.remote_stats.hits += 1
+            else:
+                self.remote_stats.misses += 1
+
+    def _remote_failed(self, error: Exception) -> None:
+        with self._lock:
+            self.remote_stats.errors += 1
+            self._remote_disabled_until = time.monotonic() + self._remote_retry_seconds
+        logger.warning(
+            f"Pantry cache shared tier unavailable, bypassing it for {self._remote_retry_seconds}s", exc_info=error
+        )
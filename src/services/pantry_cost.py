@@ -0,0 +1,171 @@
+"""Sweep-line pricing of pantry item costs against partner cost markups.
+
+Every boundary of an item's costs and availabilities and of the partner's markups splits time into elementary
+slices. A cost is priced on a slice when the cost is active, the item is available (or has no availability
+windows at all) and a markup applies; the first applicable markup in partner order wins. Instead of rescanning
+every interval per slice, intervals are turned into start/end events and swept once in boundary order.
+"""
+
+import hashlib
+import json
+from bisect import bisect_right, insort
+from datetime import UTC, datetime
+from heapq import heappop, heappush
+from typing import Any
+
+from src.core.config import settings
+from src.services.models.pantry import DateRange, PantryItem, PantryItemCost, PartnerCostMarkup
+from src.utils.datetime_helper import UTC_MAX, UTC_MIN
+from src.utils.singleton import singleton
+from src.utils.ttl_lru_cache import TTLLRUCache
+
+
+def _bounds(date_range: DateRange) -> tuple[datetime, datetime]:
+    return _as_utc(date_range.start) or UTC_MIN, _as_utc(date_range.end) or UTC_MAX
+
+
+def _as_utc(point: datetime | None) -> datetime | None:
+    # Stored snapshots keep cost and availability days without a zone, while markups are zoned timestamps
+    if point is None or point.tzinfo is not None:
+        return point
+    return point.replace(tzinfo=UTC)
+
+
+class MarkupTimeline:
+    """Partner markups flattened once into elementary segments, so a whole page of items can share them."""
+
+    def __init__(self, markups: list[PartnerCostMarkup]) -> None:
+        bounds = [_bounds(markup.get_date_range()) for markup in markups]
+        self.points: list[datetime] = sorted({point for interval in bounds for point in interval})
+
+        # segment_markups[i] is the markup applied on [points[i], points[i + 1])
+        index = {point: i for i, point in enumerate(self.points)}
+        starts: list[list[tuple[int, int]]] = [[] for _ in self.points]
+        for order, (start, end) in enumerate(bounds):
+            if start < end:
+                starts[index[start]].append((order, index[end]))
+
+        active: list[tuple[int, int]] = []
+        self.segment_markups: list[PartnerCostMarkup | None] = []
+        for i in range(len(self.points) - 1):
+            for event in starts[i]:
+                heappush(active, event)
+            # Lazily drop markups that ended at or before this segment
+            while active and active[0][1] <= i:
+                heappop(active)
+            self.segment_markups.append(markups[active[0][0]] if active else None)
+
+    def markup_at(self, point: datetime) -> PartnerCostMarkup | None:
+        i = bisect_right(self.points, point) - 1
+        if 0 <= i < len(self.segment_markups):
+            return self.segment_markups[i]
+        return None
+
+
+def price_item(item: PantryItem, timeline: MarkupTimeline) -> list[PantryItemCost]:
+    costs = item.cost
+    cost_bounds = [_bounds(cost.get_date_range()) for cost in costs]
+    availability_bounds = [_bounds(availability.get_date_range()) for availability in item.availability]
+
+    points = sorted(
+        {point for interval in cost_bounds for point in interval}
+        | {point for interval in availability_bounds for point in interval}
+        | set(timeline.points)
+    )
+    index = {point: i for i, point in enumerate(points)}
+
+    cost_starts: list[list[int]] = [[] for _ in points]
+    cost_ends: list[list[int]] = [[] for _ in points]
+    for order, (start, end) in enumerate(cost_bounds):
+        # Empty or inverted ranges never cover an elementary slice
+        if start < end:
+            cost_starts[index[start]].append(order)
+            cost_ends[index[end]].append(order)
+
+    availability_delta = [0] * len(points)
+    for start, end in availability_bounds:
+        if start < end:
+            availability_delta[index[start]] += 1
+            availability_delta[index[end]] -= 1
+
+    result: list[PantryItemCost] = []
+    active_costs: list[int] = []
+    active_availabilities = 0
+    for i in range(len(points) - 1):
+        for order in cost_ends[i]:
+            active_costs.remove(order)
+        for order in cost_starts[i]:
+            insort(active_costs, order)
+        active_availabilities += availability_delta[i]
+
+        if not active_costs or (item.availability and not active_availabilities):
+            continue
+        markup = timeline.markup_at(points[i])
+        if markup is None:
+            continue
+
+        start_date = None if points[i] == UTC_MIN else points[i]
+        end_date = None if points[i + 1] == UTC_MAX else points[i + 1]
+        for order in active_costs:
+            result.append(
+                PantryItemCost(
+                    start_date=start_date,
+                    end_date=end_date,
+                    production_cost_us_dollars=round(
+                        costs[order].production_cost_us_dollars * (1 + markup.markup_percent / 100), 2
+                    ),
+                )
+            )
+
+    return result
+
+
+def price_items(items: list[PantryItem], markups: list[PartnerCostMarkup]) -> list[list[PantryItemCost]]:
+    """Price a page of items against the same partner markups, flattening the markups only once."""
+    timeline = MarkupTimeline(markups)
+    return [price_item(item, timeline) for item in items]
+
+
+def markups_fingerprint(markups: list[PartnerCostMarkup]) -> str:
+    # Partner order decides which overlapping markup wins, so it is part of the fingerprint
+    payload = json.dumps([markup.model_dump(mode="json") for markup in markups], separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]
+
+
+class PartnerPriceCache:
+    """Marked-up costs of shared snapshot items, keyed by item and markup set.
+
+    Shared snapshot items never change, so partners with identical markups share entries and a markup change only
+    causes misses; entries expire just to bound how long unused prices are kept.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float) -> None:
+        self.cache: TTLLRUCache[list[PantryItemCost]] = TTLLRUCache(max_entries=max_entries, ttl_seconds=ttl_seconds)
+
+    def price_items(self, items: list[PantryItem], markups: list[PartnerCostMarkup]) -> list[list[PantryItemCost]]:
+        fingerprint = markups_fingerprint(markups)
+        timeline: MarkupTimeline | None = None
+        priced: list[list[PantryItemCost]] = []
+        for item in items:
+            key = f"{fingerprint}:{item.id}"
+            costs = self.cache.get(key)
+            if costs is None:
+                # Only pages with misses pay for flattening the markups
+                timeline = timeline or MarkupTimeline(markups)
+                costs = price_item(item, timeline)
+                self.cache.set(key, costs)
+            priced.append(list(costs))
+        return priced
+
+    def metrics(self) -> dict[str, Any]:
+        return self.cache.metrics()
+
+
+@singleton
+class SharedPantryPriceCache(PartnerPriceCache):
+    """Process-wide price cache for pantry pages read through shared snapshots."""
+
+    def __init__(self) -> None:
+        super().__init__(
+            max_entries=settings.PANTRY_PRICE_CACHE_MAX_ENTRIES, ttl_seconds=settings.PANTRY_PRICE_CACHE_TTL_SECONDS
+        )
@@ -0,0 +1,68 @@
+from datetime import UTC, datetime, timedelta
+
+from src.core.config import settings
+from src.interfaces.culops_client_interface import CulopsClientInterface
+from src.interfaces.pantry_db_interface import PantryDBInterface
+from src.interfaces.partner_repo_interface import PartnerRepoInterface
+from src.services.models.pantry import PantryCrawlCheckpoint, PantrySnapshotStatus
+from src.services.pantry import PantryService
+from src.services.partner import PartnerService
+from src.utils.logger import ServiceLogger
+
+log = ServiceLogger().get_logger(__name__)
+
+
+class PantryCrawlRecoveryService:
+    """Resumes pantry snapshot crawls left unfinished when the process running them went away."""
+
+    def __init__(
+        self,
+        pantry_db: PantryDBInterface,
+        culops_service: CulopsClientInterface,
+        partner_db: PartnerRepoInterface,
+    ) -> None:
+        self.pantry_db = pantry_db
+        self.culops_service = culops_service
+        self.partner_db = partner_db
+
+    def recover_stale_crawls(self) -> int:
+        """Claim one batch of stale crawls and resume them from their checkpoints; returns how many completed."""
+        stale_before = datetime.now(UTC) - timedelta(seconds=settings.PANTRY_CRAWL_STALE_SECONDS)
+        checkpoints = self.pantry_db.claim_stale_pantry_crawls(stale_before, settings.PANTRY_CRAWL_RECOVERY_BATCH_SIZE)
+        log.info(f"Claimed {len(checkpoints)} stale pantry crawls")
+
+        completed = 0
+        for checkpoint in checkpoints:
+            if checkpoint.attempts > settings.PANTRY_CRAWL_MAX_ATTEMPTS:
+                log.warning(
+                    f"Giving up on pantry crawl for state {checkpoint.pantry_state_id} "
+                    f"after {checkpoint.attempts - 1} attempts",
+                    extra={"pantry_state_id": str(checkpoint.pantry_state_id), "partner_id": checkpoint.partner_id},
+                )
+                self.pantry_db.finish_pantry_crawl(checkpoint.pantry_state_id, PantrySnapshotStatus.FAILED)
+                continue
+
+            if self._resume(checkpoint):
+                completed += 1
+
+        return completed
+
+    def _resume(self, checkpoint: PantryCrawlCheckpoint) -> bool:
+        # Shared snapshots have no partner; resuming them never reads partner markups, so no partner is looked up
+        partner_id = checkpoint.partner_id if checkpoint.partner_id is not None else ""
+        pantry_service = PantryService(
+            pantry_db=self.pantry_db,
+            culops_service=self.culops_service,
+            partner_service=PartnerService(partner_id=partner_id, partner_db=self.partner_db),
+        )
+        try:
+            pantry_service.resume_crawl(checkpoint)
+        except Exception as e:
+            # The crawl stays running; once its heartbeat goes stale again the next sweep retries it
+            log.error(
+                f"Failed to resume pantry crawl for state {checkpoint.pantry_state_id}",
+                extra={"pantry_state_id": str(checkpoint.pantry_state_id), "partner_id": checkpoint.partner_id},
+                exc_info=e,
+            )
+            return False
+        return True
@@ -0,0 +1,200 @@
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import StrEnum
+from typing import Any
+from uuid import UUID
+
+from src.core.config import settings
+from src.core.exceptions import ServiceUnavailableException
+from src.utils.logger import ServiceLogger
+from src.utils.singleton import singleton
+
+logger = ServiceLogger().get_logger(__name__)
+
+
+class CrawlStatus(StrEnum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+@dataclass(frozen=True)
+class CrawlKey:
+    """Identifies crawls that would produce the same snapshot."""
+
+    partner_id: str
+    available_from: datetime | None
+    available_until: datetime | None
+    brand_name: str
+
+
+@dataclass
+class CrawlJob:
+    key: CrawlKey
+    pantry_state_id: UUID
+    pantry_state_timestamp: datetime
+    status: CrawlStatus = CrawlStatus.QUEUED
+    submitted_at: float = field(default_factory=time.monotonic)
+    started_at: float | None = None
+    finished_at: float | None = None
+    error: str | None = None
+    on_failure: list[Callable[[], None]] = field(default_factory=list, repr=False)
+
+    @property
+    def queue_seconds(self) -> float | None:
+        return None if self.started_at is None else self.started_at - self.submitted_at
+
+    @property
+    def run_seconds(self) -> float | None:
+        if self.started_at is None or self.finished_at is None:
+            return None
+        return self.finished_at - self.started_at
+
+
+@dataclass
+class _Timing:
+    count: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.count += 1
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+
+    def snapshot(self) -> dict[str, float]:
+        return {
+            "count": self.count,
+            "avg_seconds": round(self.total_seconds / self.count, 3) if self.count else 0.0,
+            "max_seconds": round(self.max_seconds, 3),
+        }
+
+
+class CrawlScheduler:
+    """Runs snapshot crawls on a bounded worker pool.
+
+    Identical crawls are single-flight: while a job for a key is queued or running, submitting the same key returns
+    that job instead of starting another. New crawls are rejected once ``max_queued`` jobs are waiting for a worker.
+    """
+
+    def __init__(self, max_workers: int, max_queued: int) -> None:
+        self.max_workers = max_workers
+        self.max_queued = max_queued
+        self._executor: ThreadPoolExecutor | None = None
+        self._in_flight: dict[CrawlKey, CrawlJob] = {}
+        self._queued = 0
+        self._counters = {"submitted": 0, "deduplicated": 0, "rejected": 0, "succeeded": 0, "failed": 0}
+        self._queue_timing = _Timing()
+        self._run_timing = _Timing()
+        self._lock = threading.Lock()
+
+    def submit(
+        self,
+        key: CrawlKey,
+        pantry_state_id: UUID,
+        pantry_state_timestamp: datetime,
+        task: Callable[[], None],
+        on_failure: Callable[[], None] | None = None,
+    ) -> CrawlJob:
+        """Schedule ``task`` for ``key``, or return the in-flight job for the same key without running ``task``.
+
+        ``on_failure`` is called from the worker thread if the job, new or joined, fails.
+        """
+        with self._lock:
+            job = self._in_flight.get(key)
+            if job is not None:
+                self._counters["deduplicated"] += 1
+                if on_failure is not None:
+                    job.on_failure.append(on_failure)
+                return job
+
+            if self._queued >= self.max_queued:
+                self._counters["rejected"] += 1
+                raise ServiceUnavailableException("Too many pantry crawls queued, retry later")
+
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="pantry-crawl")
+
+            job = CrawlJob(key=key, pantry_state_id=pantry_state_id, pantry_state_timestamp=pantry_state_timestamp)
+            if on_failure is not None:
+                job.on_failure.append(on_failure)
+            self._in_flight[key] = job
+            self._queued += 1
+            self._counters["submitted"] += 1
+            self._executor.submit(self._run, job, task)
+        return job
+
+    def metrics(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "queued": self._queued,
+                "running": len(self._in_flight) - self._queued,
+                "max_workers": self.max_workers,
+                "max_queued": self.max_queued,
+                **{f"{name}_total": value for name, value in self._counters.items()},
+                "queue_wait": self._queue_timing.snapshot(),
+                "run_time": self._run_timing.snapshot(),
+            }
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+
+        if executor is not None:
+            logger.info("Shutting down pantry crawl scheduler", extra=self.metrics())
+            # Queued crawls are dropped; running ones are allowed to finish their current snapshot
+            executor.shutdown(wait=True, cancel_futures=True)
+
+        with self._lock:
+            self._in_flight.clear()
+            self._queued = 0
+
+    def _run(self, job: CrawlJob, task: Callable[[], None]) -> None:
+        with self._lock:
+            self._queued -= 1
+            job.status = CrawlStatus.RUNNING
+            job.started_at = time.monotonic()
+            self._queue_timing.observe(job.started_at - job.submitted_at)
+
+        try:
+            task()
+        except Exception as e:
+            job.error = str(e)
+            job.status = CrawlStatus.FAILED
+            logger.error(
+                f"Pantry crawl failed for state {job.pantry_state_id}",
+                extra={"pantry_state_id": str(job.pantry_state_id), "partner_id": job.key.partner_id},
+                exc_info=e,
+            )
+        else:
+            job.status = CrawlStatus.SUCCEEDED
+        finally:
+            with self._lock:
+                job.finished_at = time.monotonic()
+                self._run_timing.observe(job.finished_at - job.started_at)
+                self._counters["failed" if job.status == CrawlStatus.FAILED else "succeeded"] += 1
+                self._in_flight.pop(job.key, None)
+                # Nothing can join the job once it has left ``_in_flight``, so the callbacks are final here
+                callbacks = job.on_failure if job.status == CrawlStatus.FAILED else []
+
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as e:
+                logger.warning(f"Pantry crawl failure callback raised for state {job.pantry_state_id}", exc_info=e)
+
+
+@singleton
+class PantryCrawlScheduler(CrawlScheduler):
+    """Process-wide scheduler for the background crawls that persist fresh pantry snapshots."""
+
+    def __init__(self) -> None:
+        super().__init__(
+            max_workers=settings.PANTRY_CRAWL_MAX_WORKERS,
+            max_queued=settings.PANTRY_CRAWL_MAX_QUEUED,
+        )
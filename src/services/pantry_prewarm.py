@@ -0,0 +1,131 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime, time, timedelta
+from uuid import UUID, uuid4
+
+from src.core.config import settings
+from src.interfaces.culops_client_interface import CulopsClientInterface
+from src.interfaces.pantry_db_interface import PantryDBInterface
+from src.interfaces.partner_repo_interface import PartnerRepoInterface
+from src.services.models.pantry import SharedPantrySnapshot
+from src.services.pantry import PantryService
+from src.services.partner import PartnerService
+from src.utils.logger import ServiceLogger
+
+log = ServiceLogger().get_logger(__name__)
+
+
+class PantryPrewarmService:
+    """Crawls a complete pantry snapshot per partner ahead of requests and publishes it as the partner's current one.
+
+    The pantry API serves a fresh published snapshot of the requested window from the database instead of
+    fetching its first page from CulOps.
+    """
+
+    def __init__(
+        self,
+        pantry_db: PantryDBInterface,
+        culops_service: CulopsClientInterface,
+        partner_db: PartnerRepoInterface,
+    ) -> None:
+        self.pantry_db = pantry_db
+        self.culops_service = culops_service
+        self.partner_db = partner_db
+
+    def prewarm(self, now: datetime | None = None) -> int:
+        """Refresh every partner's current pantry; returns how many were published."""
+        items_available_from, items_available_until = self.prewarm_window(now or datetime.now(UTC))
+        partner_ids = self.partner_db.get_partner_ids()
+        log.info(
+            f"Pre-warming pantries of {len(partner_ids)} partners",
+            extra={
+                "available_from": items_available_from.isoformat() if items_available_from else None,
+                "available_until": items_available_until.isoformat() if items_available_until else None,
+            },
+        )
+
+        # CulOps serves every partner the same catalog, so with shared snapshots it is crawled once per run
+        source = None
+        if settings.PANTRY_SHARED_SNAPSHOTS_ENABLED and partner_ids:
+            source = self._crawl_shared_snapshot(partner_ids[0], items_available_from, items_available_until)
+
+        with ThreadPoolExecutor(
+            max_workers=settings.PANTRY_PREWARM_CONCURRENCY, thread_name_prefix="pantry-prewarm"
+        ) as executor:
+            published = executor.map(
+                lambda partner_id: self._refresh(partner_id, items_available_from, items_available_until, source),
+                partner_ids,
+            )
+            return sum(published)
+
+    @staticmethod
+    def prewarm_window(now: datetime) -> tuple[datetime | None, datetime | None]:
+        """The availability window kept warm, as the pantry API normalizes request dates to UTC midnights."""
+        if settings.PANTRY_PREWARM_WINDOW_DAYS <= 0:
+            return None, None
+        today = datetime.combine(now.astimezone(UTC).date(), time(), tzinfo=UTC)
+        return today, today + timedelta(days=settings.PANTRY_PREWARM_WINDOW_DAYS)
+
+    def _crawl_shared_snapshot(
+        self,
+        partner_id: str,
+        items_available_from: datetime | None,
+        items_available_until: datetime | None,
+    ) -> SharedPantrySnapshot | None:
+        """The run's shared snapshot, or None to have every partner crawl its own when it cannot be built."""
+        try:
+            return self._pantry_service(partner_id).crawl_shared_snapshot(items_available_from, items_available_until)
+        except Exception as e:
+            log.error("Failed to crawl the shared pantry snapshot, crawling per partner instead", exc_info=e)
+            return None
+
+    def _refresh(
+        self,
+        partner_id: str,
+        items_available_from: datetime | None,
+        items_available_until: datetime | None,
+        source: SharedPantrySnapshot | None,
+    ) -> bool:
+        try:
+            pantry_state_id = self._build_snapshot(partner_id, items_available_from, items_available_until, source)
+            self.pantry_db.publish_current_pantry_state(
+                partner_id, pantry_state_id, items_available_from, items_available_until
+            )
+        except Exception as e:
+            # The previously published snapshot keeps being served until it is too old
+            log.error(
+                f"Failed to pre-warm pantry for partner {partner_id}", extra={"partner_id": partner_id}, exc_info=e
+            )
+            return False
+
+        log.info(
+            f"Published pantry {pantry_state_id} for partner {partner_id}",
+            extra={"pantry_state_id": str(pantry_state_id), "partner_id": partner_id},
+        )
+        return True
+
+    def _build_snapshot(
+        self,
+        partner_id: str,
+        items_available_from: datetime | None,
+        items_available_until: datetime | None,
+        source: SharedPantrySnapshot | None,
+    ) -> UUID:
+        if source is None:
+            return self._pantry_service(partner_id).crawl_snapshot(items_available_from, items_available_until)
+
+        pantry_state_id = uuid4()
+        self.pantry_db.save_pantry_reference(
+            pantry_state_id=pantry_state_id,
+            partner_id=partner_id,
+            source=source,
+            items_available_from=items_available_from,
+            items_available_until=items_available_until,
+        )
+        return pantry_state_id
+
+    def _pantry_service(self, partner_id: str) -> PantryService:
+        return PantryService(
+            pantry_db=self.pantry_db,
+            culops_service=self.culops_service,
+            partner_service=PartnerService(partner_id=partner_id, partner_db=self.partner_db),
+        )
@@ -0,0 +1,40 @@
+from datetime import UTC, date, datetime, timedelta
+
+from src.core.config import settings
+from src.core.exceptions import ServerError
+from src.interfaces.pantry_db_interface import PantryDBInterface
+from src.utils.logger import ServiceLogger
+
+log = ServiceLogger().get_logger(__name__)
+
+
+class PantryRetentionService:
+    """Keeps the daily pantry snapshot partitions created ahead of the crawls and drops the expired ones."""
+
+    def __init__(self, pantry_db: PantryDBInterface) -> None:
+        self.pantry_db = pantry_db
+
+    def maintain_partitions(self, today: date | None = None) -> list[date]:
+        """Create the upcoming partitions, then drop the ones past retention even if creating failed.
+
+        Returns the days dropped.
+        """
+        today = today or datetime.now(UTC).date()
+
+        # Today is included so a fresh database or a long outage of this job never leaves crawls without a partition
+        try:
+            created = self.pantry_db.create_pantry_partitions(
+                today, today + timedelta(days=settings.PANTRY_PARTITION_PRECREATE_DAYS)
+            )
+            log.info(f"Created {created} pantry snapshot partitions")
+        except ServerError as e:
+            # Expired days are still dropped; the next run retries the missing partitions
+            log.error("Failed to create pantry snapshot partitions", exc_info=e)
+
+        cutoff = today - timedelta(days=settings.PANTRY_SNAPSHOT_RETENTION_DAYS)
+        dropped = self.pantry_db.drop_pantry_partitions_before(cutoff)
+        log.info(
+            f"Dropped {len(dropped)} pantry snapshot partitions older than {cutoff}",
+            extra={"dropped_days": [day.isoformat() for day in dropped]},
+        )
+        return dropped
@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import TypeVar
 from uuid import UUID, uuid4
@@ -12,6 +13,7 @@ from src.api.routes.v1.models import (
     RecipeSku,
     RecipeTags,
 )
+from src.core.config import settings
 from src.core.constants import blue_apron_partner_id
 from src.core.exceptions import (
     NotFoundException,
@@ -169,50 +171,53 @@ class RecipeService(RecipeServiceInterface):
             if not all_recipe_refs:
                 return []
 
-            recipe_responses: list[RecipeResponse] = []
+            culops_recipe_ids = [ref.culops_recipe_id for ref in all_recipe_refs if not ref.deleted]
+            chunk_size = max(settings.CULOPS_RECIPE_FETCH_CHUNK_SIZE, 1)
+            chunks = [culops_recipe_ids[i : i + chunk_size] for i in range(0, len(culops_recipe_ids), chunk_size)]
+            if not chunks:
+                return []
 
-            for recipe_ref in all_recipe_refs:
-                if recipe_ref.deleted:
-                    continue
+            max_workers = min(max(settings.CULOPS_RECIPE_FETCH_CONCURRENCY, 1), len(chunks))
+            with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="culops-recipes") as executor:
+                futures = [executor.submit(self._culops_client.get_recipes, partner_id, chunk) for chunk in chunks]
 
-                try:
-                    # Get recipe details from CulOps
-                    culops_recipe = self._culops_client.get_recipe(
-                        culops_recipe_id=recipe_ref.culops_recipe_id,
-                        partner_id=partner_id
-                    )
+                recipe_responses: list[RecipeResponse] = []
+                for chunk, future in zip(chunks, futures, strict=True):
+                    try:
+                        culops_recipes = future.result()
+                    except (RecipeNotFoundError, ServerError) as e:
+                        # A failed chunk only drops its own recipes; the rest of the partner's recipes still return
+                        logger.warning(f"Skipping CulOps recipes {chunk}: {e}")
+                        continue
+
+                    for culops_recipe in culops_recipes:
+                        recipe_ingredients: list[RecipeIngredient] = []
+                        for pantry_item in culops_recipe.pantry_items:
+                            recipe_ingredients.append(RecipeIngredient(pantry_item_id=pantry_item.pantry_item_id))
+
+                        recipe_card_ids = [card.card_id for card in culops_recipe.recipe_card_assignments]
+                        packaging_configuration_tags = [
+                            tag.tag_value for tag in culops_recipe.packaging_configuration_tags
+                        ]
+                        recipe_constraint_tags = [tag.tag_value for tag in culops_recipe.recipe_constraint_tags]
 
-                    recipe_ingredients: list[RecipeIngredient] = []
-                    for pantry_item in culops_recipe.pantry_items:
-                        recipe_ingredients.append(
-                            RecipeIngredient(pantry_item_id=pantry_item.pantry_item_id)
+                        recipe_tags = RecipeTags(
+                            recipe_constraint_tags=recipe_constraint_tags,
+                            packaging_configuration_tags=packaging_configuration_tags,
                         )
 
-                    recipe_card_ids = [card.card_id for card in culops_recipe.recipe_card_assignments]
-                    packaging_configuration_tags = [tag.tag_value for tag in culops_recipe.packaging_configuration_tags]
-                    recipe_constraint_tags = [tag.tag_value for tag in culops_recipe.recipe_constraint_tags]
-
-                    recipe_tags = RecipeTags(
-                        recipe_constraint_tags=recipe_constraint_tags,
-                        packaging_configuration_tags=packaging_configuration_tags,
-                    )
-
-                    recipe_response = RecipeResponse(
-                        recipeId=str(culops_recipe.recipe_id),
-                        cycleDate=culops_recipe.cycle_date.strftime("%Y-%m-%d"),
-                        title=culops_recipe.title,
-                        subtitle=culops_recipe.subtitle,
-                        pantryItems=recipe_ingredients,
-                        servings=culops_recipe.servings,
-                        isAddOn=culops_recipe.add_on,
-                        recipeCardIds=recipe_card_ids,
-                        recipeTags=recipe_tags,
-                    )
-                    recipe_responses.append(recipe_response)
-
-                except (RecipeNotFoundError, ServerError) as e:
-                    logger.warning(f"Skipping recipe {recipe_ref.recipe_id}: {e}")
-                    continue
+                        recipe_response = RecipeResponse(
+                            recipeId=str(culops_recipe.recipe_id),
+                            cycleDate=culops_recipe.cycle_date.strftime("%Y-%m-%d"),
+                            title=culops_recipe.title,
+                            subtitle=culops_recipe.subtitle,
+                            pantryItems=recipe_ingredients,
+                            servings=culops_recipe.servings,
+                            isAddOn=culops_recipe.add_on,
+                            recipeCardIds=recipe_card_ids,
+                            recipeTags=recipe_tags,
+                        )
+                        recipe_responses.append(recipe_response)
 
             return recipe_responses
 
@@ -0,0 +1,62 @@
+import asyncio
+import concurrent.futures
+import threading
+from collections.abc import Callable
+from typing import Any
+
+from src.core.config import settings
+from src.utils.logger import ServiceLogger
+from src.utils.singleton import singleton
+from src.utils.task_scheduler import TaskScheduler
+
+logger = ServiceLogger().get_logger(__name__)
+
+
+@singleton
+class MetricsReporter:
+    """Logs the metrics of process-wide components every ``METRICS_LOG_INTERVAL_SECONDS``.
+
+    Reports run on the TaskScheduler loop, so ``start`` must run after the scheduler has started.
+    """
+
+    def __init__(self) -> None:
+        self._sources: dict[str, Callable[[], Any]] = {}
+        self._future: concurrent.futures.Future | None = None
+        self._lock = threading.Lock()
+
+    def register(self, name: str, source: Callable[[], Any]) -> None:
+        with self._lock:
+            self._sources[name] = source
+
+    def report(self) -> dict[str, Any]:
+        with self._lock:
+            sources = list(self._sources.items())
+
+        metrics: dict[str, Any] = {}
+        for name, source in sources:
+            try:
+                metrics[name] = source()
+            except Exception as e:
+                logger.warning(f"Failed to collect {name} metrics", extra={"error": str(e)})
+        logger.info("Runtime metrics", extra=metrics)
+        return metrics
+
+    def start(self) -> None:
+        interval = settings.METRICS_LOG_INTERVAL_SECONDS
+        if interval <= 0 or self._future is not None:
+            return
+        self._future = TaskScheduler().schedule_async_task(self._report_every(interval))
+
+    def shutdown(self) -> None:
+        """Stop the periodic reports and log a last one."""
+        # Cancel before the scheduler shuts down: it waits for its tasks, and this one never finishes
+        future, self._future = self._future, None
+        if future is not None:
+            future.cancel()
+        if self._sources:
+            self.report()
+
+    async def _report_every(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            self.report()
@@ -41,11 +41,29 @@ def paginate_response(
     url_params: Mapping[str, str] | None = None,
     data_model: BaseModel | None = None,
     list_attr_path: str | None = None,
+    cursor: str | None = None,
+    next_cursor: str | None = None,
 ) -> PaginatedResponse:
     paginated_items = items
     query_string = urlencode(url_params or [])
 
-    if page and page_size:
+    if cursor is not None and page_size:
+        # Keyset pages are addressed by the last item id seen, so there is no stable prev/last page.
+        total_count = item_count or 0
+        meta = Meta(
+            pagination=Pagination(
+                total=total_count,
+                per_page=page_size,
+                current_page=None,
+                total_pages=((total_count + page_size - 1) // page_size) or 1,
+            )
+        )
+        links = Links(
+            self=f"{base_url}?{query_string}&after={cursor}",
+            first=f"{base_url}?{query_string}&after=",
+            next=f"{base_url}?{query_string}&after={next_cursor}" if next_cursor else None,
+        )
+    elif page and page_size:
         total_count = item_count or len(items)
         total_pages = ((total_count + page_size - 1) // page_size) or 1
         start = (page - 1) * page_size
@@ -0,0 +1,163 @@
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from typing import Any, Generic, TypeVar
+
+from src.utils.logger import ServiceLogger
+from src.utils.single_flight import SingleFlight
+from src.utils.ttl_lru_cache import TTLLRUCache
+
+logger = ServiceLogger().get_logger(__name__)
+
+V = TypeVar("V")
+
+
+@dataclass
+class ReadThroughStats:
+    hits: int = 0
+    negative_hits: int = 0
+    stale_hits: int = 0
+    misses: int = 0
+    load_errors: int = 0
+    refreshes: int = 0
+    refresh_errors: int = 0
+
+    def snapshot(self) -> dict[str, Any]:
+        served = self.hits + self.negative_hits + self.stale_hits
+        lookups = served + self.misses
+        return {
+            "hits": self.hits,
+            "negative_hits": self.negative_hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "load_errors": self.load_errors,
+            "refreshes": self.refreshes,
+            "refresh_errors": self.refresh_errors,
+            "hit_rate": round(served / lookups, 4) if lookups else 0.0,
+        }
+
+
+@dataclass(frozen=True)
+class _Entry(Generic[V]):
+    value: V
+    fresh_until: float
+    negative: bool
+
+
+class ReadThroughCache(Generic[V]):
+    """In-process read-through cache for slow-changing values, with negative caching and stale-while-revalidate.
+
+    ``get_or_load`` serves a fresh entry, or calls the loader on a miss; concurrent misses for one key share a
+    single load. Values ``is_negative`` considers "not found" are kept for ``negative_ttl_seconds`` instead of the
+    TTL. A positive entry past its TTL is still served for up to ``stale_seconds`` while one refresh runs on
+    ``refresh_executor``; a failed refresh keeps the stale value. Loader errors are never cached. A TTL of zero or
+    less stores nothing.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_seconds: float,
+        negative_ttl_seconds: float = 0.0,
+        stale_seconds: float = 0.0,
+        is_negative: Callable[[V], bool] = lambda value: not value,
+        refresh_executor: Executor | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self.stale_seconds = stale_seconds if refresh_executor is not None else 0.0
+        self.stats = ReadThroughStats()
+        self._is_negative = is_negative
+        self._refresh_executor = refresh_executor
+        self._clock = clock
+        self._entries: TTLLRUCache[_Entry[V]] = TTLLRUCache(
+            max_entries=max_entries, ttl_seconds=ttl_seconds, clock=clock
+        )
+        self._loads: SingleFlight[V] = SingleFlight()
+        self._refreshing: set[str] = set()
+        self._lock = threading.Lock()
+
+    def get_or_load(self, key: str, loader: Callable[[], V], ttl_seconds: float | None = None) -> V:
+        """The cached value for ``key``, loading it on a miss; ``ttl_seconds`` overrides the TTL for this key."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self._count("misses")
+            value, _ = self._loads.do(key, lambda: self._load(key, loader, ttl_seconds))
+            return value
+
+        if entry.fresh_until > self._clock():
+            self._count("negative_hits" if entry.negative else "hits")
+        else:
+            self._count("stale_hits")
+            self._schedule_refresh(key, loader, ttl_seconds)
+        return entry.value
+
+    def invalidate(self, key: str) -> None:
+        self._entries.delete(key)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def metrics(self) -> dict[str, Any]:
+        entries = self._entries.metrics()
+        with self._lock:
+            stats = self.stats.snapshot()
+        return {
+            "size": entries["size"],
+            "max_entries": entries["max_entries"],
+            "evictions": entries["evictions"],
+            **stats,
+        }
+
+    def _load(self, key: str, loader: Callable[[], V], ttl_seconds: float | None) -> V:
+        try:
+            value = loader()
+        except Exception:
+            self._count("load_errors")
+            raise
+        self._store(key, value, ttl_seconds)
+        return value
+
+    def _store(self, key: str, value: V, ttl_seconds: float | None) -> None:
+        negative = self._is_negative(value)
+        if negative:
+            ttl = self.negative_ttl_seconds
+        else:
+            ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        if ttl <= 0:
+            return
+        # A "not found" is never served stale, so something created since shows up once its short TTL is over
+        kept_for = ttl if negative else ttl + self.stale_seconds
+        self._entries.set(key, _Entry(value, self._clock() + ttl, negative), ttl_seconds=kept_for)
+
+    def _schedule_refresh(self, key: str, loader: Callable[[], V], ttl_seconds: float | None) -> None:
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+            self.stats.refreshes += 1
+
+        assert self._refresh_executor is not None
+        try:
+            self._refresh_executor.submit(self._refresh, key, loader, ttl_seconds)
+        except RuntimeError:
+            # The executor is shut down; the stale value is served until the entry expires
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def _refresh(self, key: str, loader: Callable[[], V], ttl_seconds: float | None) -> None:
+        try:
+            self._store(key, loader(), ttl_seconds)
+        except Exception as e:
+            self._count("refresh_errors")
+            logger.warning("Refreshing a cached value failed, serving it stale", extra={"key": key}, exc_info=e)
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def _count(self, stat: str) -> None:
+        with self._lock:
+            setattr(self.stats, stat, getattr(self.stats, stat) + 1)
@@ -0,0 +1,111 @@
+import asyncio
+import threading
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass
+from typing import Any, Generic, TypeVar
+
+V = TypeVar("V")
+
+
+@dataclass
+class FlightStats:
+    executed: int = 0
+    coalesced: int = 0
+
+    def snapshot(self) -> dict[str, int]:
+        return {"executed": self.executed, "coalesced": self.coalesced}
+
+
+class _Call(Generic[V]):
+    __slots__ = ("done", "error", "result")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: V | None = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight(Generic[V]):
+    """Thread-safe duplicate call suppression: concurrent calls for one key share a single execution.
+
+    The first caller for a key runs ``fn``; callers arriving while it is in flight wait for it and get its result,
+    or its exception, instead of running ``fn`` themselves. Nothing is kept once the call returns, so a later call
+    for the same key runs ``fn`` again.
+    """
+
+    def __init__(self) -> None:
+        self.stats = FlightStats()
+        self._calls: dict[Hashable, _Call[V]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    def do(self, key: Hashable, fn: Callable[[], V]) -> tuple[V, bool]:
+        """Run ``fn`` for ``key`` or join the call already in flight; also returns whether the result was shared."""
+        with self._lock:
+            call = self._calls.get(key)
+            shared = call is not None
+            if call is None:
+                call = self._calls[key] = _Call()
+                self.stats.executed += 1
+            else:
+                self.stats.coalesced += 1
+
+        if shared:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True  # type: ignore[return-value]
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result, False
+
+    def metrics(self) -> dict[str, Any]:
+        with self._lock:
+            return {"in_flight": len(self._calls), **self.stats.snapshot()}
+
+
+class AsyncSingleFlight(Generic[V]):
+    """Duplicate call suppression for coroutines running on one event loop.
+
+    The first caller for a key starts ``fn()`` as a task that every concurrent caller awaits. Callers are shielded
+    from each other: one being cancelled leaves the shared task running for the rest.
+    """
+
+    def __init__(self) -> None:
+        self.stats = FlightStats()
+        self._tasks: dict[Hashable, asyncio.Future[V]] = {}
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[V]]) -> tuple[V, bool]:
+        """Await ``fn()`` for ``key`` or join the call already in flight; also returns whether it was shared."""
+        task = self._tasks.get(key)
+        shared = task is not None
+        if task is None:
+            task = self._tasks[key] = asyncio.ensure_future(fn())
+            task.add_done_callback(lambda done: self._finish(key, done))
+            self.stats.executed += 1
+        else:
+            self.stats.coalesced += 1
+        return await asyncio.shield(task), shared
+
+    def metrics(self) -> dict[str, Any]:
+        return {"in_flight": len(self._tasks), **self.stats.snapshot()}
+
+    def _finish(self, key: Hashable, task: "asyncio.Future[V]") -> None:
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+        # Every caller may have been cancelled; retrieve the exception so it is not reported as never retrieved
+        if not task.cancelled():
+            task.exception()
@@ -1,5 +1,6 @@
 from math import ceil
 from typing import Any
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from fastapi import status
@@ -7,6 +8,9 @@ from fastapi.testclient import TestClient
 
 from src.api.routes.v1.models import GetPantry
 from src.core.exceptions import AccessDeniedException
+from src.dependancies.pantry_db import get_async_pantry_db
+from src.main import app
+from src.services.models.pantry import PantrySnapshotProgress, PantrySnapshotStatus
 from src.utils.paginator import PaginatedResponse
 from tests.conftest import encode_jwt
 
@@ -163,3 +167,38 @@ def test_get_pantry_with_non_existing_brand_filters_out_matching_items(test_clie
 
     for item in pantry_items:
         assert "brand" not in item or item["brand"] in (None, "")
+
+
+def test_get_pantry_snapshot_status(test_client: TestClient) -> None:
+    async_pantry_db = MagicMock()
+    async_pantry_db.get_pantry_snapshot_progress = AsyncMock(
+        return_value=PantrySnapshotProgress(
+            pantry_state_id="12345",
+            status=PantrySnapshotStatus.RUNNING,
+            pages_fetched=2,
+            item_count=200,
+            finished_at=None,
+        )
+    )
+    app.dependency_overrides[get_async_pantry_db] = lambda: async_pantry_db
+    headers = {"Authorization": f"Bearer {encode_jwt({'custom:partner_id': 'BA-MAIN'})}"}
+
+    response = test_client.get("/v1/recipes/recipeelements/pantry/12345/status", headers=headers)
+
+    assert response.status_code == status.HTTP_200_OK
+    snapshot = response.json()["data"]["snapshot"]
+    assert snapshot["status"] == "running"
+    assert snapshot["pagesFetched"] == 2
+    assert snapshot["itemCount"] == 200
+    async_pantry_db.get_pantry_snapshot_progress.assert_awaited_once_with("12345", "BA-MAIN")
+
+
+def test_get_pantry_snapshot_status_not_found(test_client: TestClient) -> None:
+    async_pantry_db = MagicMock()
+    async_pantry_db.get_pantry_snapshot_progress = AsyncMock(return_value=None)
+    app.dependency_overrides[get_async_pantry_db] = lambda: async_pantry_db
+    headers = {"Authorization": f"Bearer {encode_jwt({'custom:partner_id': 'BA-MAIN'})}"}
+
+    response = test_client.get("/v1/recipes/recipeelements/pantry/12345/status", headers=headers)
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
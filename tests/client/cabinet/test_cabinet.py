@@ -5,6 +5,7 @@ import pytest
 from requests import HTTPError, RequestException
 
 from src.clients.cabinet.cabinet import CabinetService
+from src.clients.reference_data_cache import ReferenceDataCache
 from src.core.exceptions import ServerError
 from src.services.models.recipe import RecipeSlotCode
 from src.utils.datetime_helper import parse_to_datetime
@@ -12,6 +13,8 @@ from src.utils.datetime_helper import parse_to_datetime
 
 @pytest.fixture
 def cabinet_service() -> CabinetService:
+    # Cycles and recipe slots are cached process-wide; every test starts from Cabinet
+    ReferenceDataCache().clear()
     return CabinetService()
 
 
@@ -122,3 +125,56 @@ def test_find_cycle_validation_error(cabinet_service: CabinetService) -> None:
     with patch.object(cabinet_service.session, "get", return_value=mock_response):
         with pytest.raises(ServerError):
             cabinet_service.find_cycle(cycle_date)
+
+
+def test_find_cycle_is_cached_and_errors_are_not(cabinet_service: CabinetService) -> None:
+    cycle_date = datetime.strptime("2025-07-07", "%Y-%m-%d")
+    hits_before = cabinet_service.reference_cache.cabinet_cycles.metrics()["hits"]
+    mock_response = Mock()
+    mock_response.json.return_value = {
+        "data": [{"id": "1", "type": "cycles", "attributes": {"date": "2025-07-07", "is-active": True}}]
+    }
+
+    with patch.object(cabinet_service.session, "get", side_effect=RequestException("network error")):
+        with pytest.raises(ServerError):
+            cabinet_service.find_cycle(cycle_date)
+    with patch.object(cabinet_service.session, "get", return_value=mock_response) as mock_get:
+        assert cabinet_service.find_cycle(cycle_date) is True
+        assert CabinetService().find_cycle(cycle_date) is True
+
+    mock_get.assert_called_once()
+    assert cabinet_service.reference_cache.cabinet_cycles.metrics()["hits"] == hits_before + 1
+
+
+def test_get_recipe_slots_are_cached_per_date(cabinet_service: CabinetService) -> None:
+    mock_response = Mock()
+    mock_response.json.return_value = {
+        "data": [
+            {
+                "id": "WC09",
+                "type": "recipe-slots",
+                "attributes": {
+                    "culinary-code": "WC09",
+                    "meal-type": "WildCard09",
+                    "activates-at": "2025-06-01T00:00:00Z",
+                    "deactivates-at": None,
+                    "plan-id": 10,
+                    "plan-name": "Wild Card plan",
+                    "plan-description": "Wild Card",
+                    "short-code": "WC09",
+                    "color-code": "f2be20",
+                    "sort-order": 5106,
+                    "presentation-sort-order": 5106,
+                },
+            }
+        ]
+    }
+
+    with patch.object(cabinet_service.session, "get", return_value=mock_response) as mock_get:
+        first = cabinet_service.get_recipe_slots(filter_date=parse_to_datetime("2025-06-01"))
+        first.clear()
+        second = cabinet_service.get_recipe_slots(filter_date=parse_to_datetime("2025-06-01"))
+        cabinet_service.get_recipe_slots(filter_date=None)
+
+    assert [slot.slot_code for slot in second] == ["WC09"]
+    assert mock_get.call_count == 2
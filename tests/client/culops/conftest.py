@@ -14,6 +14,8 @@ from requests import Response
 
 from src.clients.culops.culops import CulOpsService
 from src.clients.culops.mocks.session import MockedSession
+from src.clients.culops.transport import CulOpsTransport
+from src.clients.reference_data_cache import ReferenceDataCache
 from src.core.middleware.partner_id_middleware import partner_id_ctx
 from src.interfaces.pantry_db_interface import PantryDBInterface
 from src.interfaces.partner_repo_interface import PartnerRepoInterface
@@ -23,9 +25,19 @@ from src.services.models.recipe import PackagingConfigurationTag, RecipeConstrai
 from tests.client.culops.sample_recipe_res import SAMPLE_SINGLE_RECIPE_RES
 
 
+@pytest.fixture(autouse=True)
+def clear_reference_data_cache() -> Generator[None, None, None]:
+    # Cycle ids and recipe slots are cached process-wide; every test starts from CulOps
+    ReferenceDataCache().clear()
+    yield
+    ReferenceDataCache().clear()
+
+
 @pytest.fixture
 def simple_culops_service() -> CulOpsService:
     requests.Session = MockedSession
+    # Rebuild the shared transport so its session picks up the mocked session class
+    CulOpsTransport().shutdown()
 
     mock_partner_repo = MagicMock()
     mock_recipe_repo = MagicMock()
@@ -147,6 +159,7 @@ def mock_culops_recipe_repo() -> Callable[..., AbstractContextManager[RecipesRep
             recipe_id = uuid4()
         mock_recipe_repo = MagicMock(spec=RecipesRepoInterface)
         mock_recipe_repo.get_recipe_id_by_culops_recipe_id.return_value = recipe_id
+        mock_recipe_repo.get_recipe_ids_by_culops_recipe_ids.side_effect = lambda ids: dict.fromkeys(ids, recipe_id)
         yield mock_recipe_repo
 
     return _use
@@ -163,6 +176,9 @@ def mock_culops_pantry_repo(
         mock_pantry_repo.get_pantry_item_data_by_culops_culinary_ingredient_and_specification_id.return_value = (
             pantry_data
         )
+        mock_pantry_repo.get_pantry_item_data_by_culops_culinary_ingredient_and_specification_ids.side_effect = (
+            lambda pairs: dict.fromkeys(pairs, pantry_data)
+        )
         yield mock_pantry_repo
 
     return _use
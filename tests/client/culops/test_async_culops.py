@@ -0,0 +1,99 @@
+from collections.abc import AsyncIterator
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+import pytest_asyncio
+
+from src.clients.culops.async_culops import AsyncCulOpsService
+from src.clients.culops.culops import CulOpsService
+from src.clients.culops.transport import CulOpsTransport
+from src.core.config import settings
+from src.core.exceptions import ServerError
+from src.services.models.pantry import PantryItem
+from src.utils.datetime_helper import parse_to_datetime
+
+
+@pytest_asyncio.fixture
+async def async_culops_service(simple_culops_service: CulOpsService) -> AsyncIterator[AsyncCulOpsService]:
+    # Reuse the signed test token; the transport serves the mocked CulOps API while MOCK_CULOPS_API is set
+    service = AsyncCulOpsService(token_svc=simple_culops_service.token_svc)
+    yield service
+    await CulOpsTransport().shutdown_async()
+
+
+@pytest.mark.asyncio
+async def test_get_partner_culops_pantry_page_valid(async_culops_service: AsyncCulOpsService) -> None:
+    pantry_items, page_info = await async_culops_service.get_partner_culops_pantry_page(
+        available_from=parse_to_datetime("2025-06-01"),
+        available_until=parse_to_datetime("2025-06-30"),
+        page=1,
+    )
+
+    assert page_info.has_next is True
+    assert page_info.last_page is not None and page_info.last_page > 1
+    assert pantry_items
+    assert all(isinstance(item, PantryItem) for item in pantry_items)
+
+
+@pytest.mark.asyncio
+async def test_get_partner_culops_pantry_page_http_error_raises(async_culops_service: AsyncCulOpsService) -> None:
+    async_culops_service.client = httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda request: httpx.Response(400, json={"error": "Missing parameters"}))
+    )
+
+    with pytest.raises(ServerError, match="status code 400"):
+        await async_culops_service.get_partner_culops_pantry_page(page=1)
+
+
+@pytest.mark.asyncio
+async def test_get_partner_culops_pantry_page_invalid_body_raises(async_culops_service: AsyncCulOpsService) -> None:
+    async_culops_service.client = httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, json={"data": "not-a-list"}))
+    )
+
+    with pytest.raises(ServerError, match="Failed to parse"):
+        await async_culops_service.get_partner_culops_pantry_page(page=1)
+
+
+@pytest.mark.asyncio
+async def test_get_partner_culops_pantry_page_retries_server_errors(
+    async_culops_service: AsyncCulOpsService, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    sleep = AsyncMock()
+    monkeypatch.setattr("src.clients.culops.transport.asyncio.sleep", sleep)
+    responses = iter([httpx.Response(503), httpx.Response(429, headers={"Retry-After": "3"})])
+    ok = async_culops_service.client
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        response = next(responses, None)
+        if response is not None:
+            return response
+        return await ok.send(request)
+
+    async_culops_service.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    pantry_items, _ = await async_culops_service.get_partner_culops_pantry_page(page=1)
+
+    assert pantry_items
+    # The first retry is immediate; the second waits as long as CulOps' Retry-After asks
+    assert [call.args[0] for call in sleep.await_args_list] == [0.0, 3.0]
+
+
+@pytest.mark.asyncio
+async def test_get_partner_culops_pantry_page_raises_once_retries_run_out(
+    async_culops_service: AsyncCulOpsService, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr("src.clients.culops.transport.asyncio.sleep", AsyncMock())
+    calls = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        return httpx.Response(502)
+
+    async_culops_service.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    with pytest.raises(ServerError, match="status code 502"):
+        await async_culops_service.get_partner_culops_pantry_page(page=1)
+    assert calls == settings.CULOPS_HTTP_RETRY_COUNT + 1
@@ -1,5 +1,9 @@
 import copy
+import json
+import threading
+import time
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import AbstractContextManager
 from typing import Any, cast
 from unittest.mock import MagicMock, patch
@@ -41,6 +45,19 @@ def test_get_partner_culops_pantry_data_valid(simple_culops_service: CulOpsServi
     assert len(prepped_and_ready_items) == 1
 
 
+def test_get_partner_culops_pantry_page_reports_page_info(simple_culops_service: CulOpsService) -> None:
+    pantry_items, page_info = simple_culops_service.get_partner_culops_pantry_page(
+        available_from=parse_to_datetime("2025-06-01"),
+        available_until=parse_to_datetime("2025-06-30"),
+        page=1,
+        page_size=2,
+    )
+
+    assert len(pantry_items) == 2
+    assert page_info.has_next is True
+    assert page_info.last_page == 2
+
+
 def test_get_partner_culops_pantry_data_missing_bearer_token(simple_culops_service: CulOpsService) -> None:
     with pytest.raises(ServerError):
         with patch.object(simple_culops_service.session, "get", side_effect=RequestException("Missing bearer token")):
@@ -73,8 +90,8 @@ def test_get_partner_culops_pantry_data_validation_error(simple_culops_service:
 
     with patch.object(simple_culops_service.session, "get", return_value=response):
         with patch(
-            "src.clients.culops.culops.CulopsData.model_validate",
-            side_effect=ValidationError.from_exception_data("CulopsData", []),
+            "src.clients.culops.culops.validate_response",
+            side_effect=ValidationError.from_exception_data("CulopsPantryPage", []),
         ):
             with pytest.raises(ServerError):
                 for _ in simple_culops_service.get_partner_culops_pantry_data(
@@ -127,6 +144,110 @@ def test_get_partner_culops_pantry_data_mapping_value_error(simple_culops_servic
                 pass
 
 
+def _pantry_page_response(page: int, last_page: int, status_code: int = 200) -> Response:
+    import json
+
+    links: dict[str, str] = {
+        "last": f"https://culops.test/api/culinary-ingredient-specifications?page%5Bnumber%5D={last_page}"
+    }
+    if page < last_page:
+        links["next"] = f"https://culops.test/api/culinary-ingredient-specifications?page%5Bnumber%5D={page + 1}"
+    payload = {
+        "data": [
+            {
+                "type": "culinary-ingredient-specifications",
+                "id": str(page),
+                "attributes": {"amount": 1.0, "cost": 2.5, "unit": "g", "culinary-ingredient-id": 1000 + page},
+                "relationships": {
+                    "culinary-ingredient": {"data": {"type": "culinary-ingredients", "id": str(1000 + page)}},
+                },
+            }
+        ],
+        "included": [
+            {
+                "type": "culinary-ingredients",
+                "id": str(1000 + page),
+                "attributes": {"display-name": f"Item {page}", "category": "Sauces"},
+            }
+        ],
+        "links": links,
+    }
+    response = Response()
+    response.status_code = status_code
+    response._content = json.dumps(payload).encode("utf-8")
+    return response
+
+
+def _spec_ids(pages: list[tuple[list[PantryItem], bool]]) -> list[int]:
+    return [
+        item.pantry_item_data_source.culops_culinary_ingredient_specification_id
+        for items, _ in pages
+        for item in items
+        if item.pantry_item_data_source
+    ]
+
+
+def test_get_partner_culops_pantry_data_concurrent_pages_in_order(simple_culops_service: CulOpsService) -> None:
+    last_page = 7
+
+    def get_page(url: str, headers: dict, params: dict, stream: bool = False) -> Response:
+        return _pantry_page_response(params["page[number]"], last_page)
+
+    with patch.object(simple_culops_service.session, "get", side_effect=get_page) as mock_get:
+        pages = list(simple_culops_service.get_partner_culops_pantry_data(concurrency=3))
+
+    assert mock_get.call_count == last_page
+    assert _spec_ids(pages) == list(range(1, last_page + 1))
+    assert [has_next for _, has_next in pages] == [True] * (last_page - 1) + [False]
+
+
+def test_get_partner_culops_pantry_data_concurrent_pages_as_completed(simple_culops_service: CulOpsService) -> None:
+    last_page = 5
+
+    def get_page(url: str, headers: dict, params: dict, stream: bool = False) -> Response:
+        return _pantry_page_response(params["page[number]"], last_page)
+
+    with patch.object(simple_culops_service.session, "get", side_effect=get_page):
+        pages = list(simple_culops_service.get_partner_culops_pantry_data(concurrency=2, ordered=False))
+
+    assert sorted(_spec_ids(pages)) == list(range(1, last_page + 1))
+    assert pages[-1][1] is False
+
+
+def test_get_partner_culops_pantry_data_single_worker_follows_next_links(
+    simple_culops_service: CulOpsService,
+) -> None:
+    def get_page(url: str, headers: dict, params: dict, stream: bool = False) -> Response:
+        return _pantry_page_response(params["page[number]"], 3)
+
+    with patch.object(simple_culops_service.session, "get", side_effect=get_page):
+        pages = list(simple_culops_service.get_partner_culops_pantry_data(concurrency=1))
+
+    assert _spec_ids(pages) == [1, 2, 3]
+
+
+def test_get_partner_culops_pantry_data_resumes_from_start_page(simple_culops_service: CulOpsService) -> None:
+    def get_page(url: str, headers: dict, params: dict, stream: bool = False) -> Response:
+        return _pantry_page_response(params["page[number]"], 6)
+
+    with patch.object(simple_culops_service.session, "get", side_effect=get_page) as mock_get:
+        pages = list(simple_culops_service.get_partner_culops_pantry_data(concurrency=2, start_page=4))
+
+    assert mock_get.call_count == 3
+    assert _spec_ids(pages) == [4, 5, 6]
+
+
+def test_get_partner_culops_pantry_data_concurrent_page_error(simple_culops_service: CulOpsService) -> None:
+    def get_page(url: str, headers: dict, params: dict, stream: bool = False) -> Response:
+        if params["page[number]"] == 3:
+            return _pantry_page_response(3, 4, status_code=400)
+        return _pantry_page_response(params["page[number]"], 4)
+
+    with patch.object(simple_culops_service.session, "get", side_effect=get_page):
+        with pytest.raises(ServerError, match="status code 400"):
+            list(simple_culops_service.get_partner_culops_pantry_data(concurrency=2))
+
+
 def test_get_partner_culops_pantry_data_recipe_pantry_item_data_valid(simple_culops_service: CulOpsService) -> None:
     item_statuses = simple_culops_service.get_recipe_pantry_item_data(item_ids=[4768, 34768])
     assert len(item_statuses) > 0
@@ -288,7 +409,7 @@ def test_get_recipe_no_mapping_id_stores_externally_created(
     with mock_culops_partner_repo() as partner_repo:
         with mock_culops_pantry_repo() as pantry_repo:
             mock_recipe_repo = MagicMock()
-            mock_recipe_repo.get_recipe_id_by_culops_recipe_id.return_value = None
+            mock_recipe_repo.get_recipe_ids_by_culops_recipe_ids.return_value = {}
             mock_culops_token_svc = MagicMock()
             culops_service = CulOpsService(
                 partner_repo=partner_repo,
@@ -300,10 +421,40 @@ def test_get_recipe_no_mapping_id_stores_externally_created(
             with patch.object(culops_service.session, "get", return_value=mock_culops_recipe_response()):
                 culops_service.get_recipe(12345, "partner-123")
 
-            mock_recipe_repo.store_recipe_source.assert_called_once()
-            args, kwargs = mock_recipe_repo.store_recipe_source.call_args
+            mock_recipe_repo.store_recipe_sources.assert_called_once()
+            args, kwargs = mock_recipe_repo.store_recipe_sources.call_args
+
+            assert [ref.culops_recipe_id for ref in args[1]] == [12345]
+            assert args[2] is True
+
+
+def test_get_recipes_sends_all_ids_and_skips_missing(
+    partner_ctx: None,
+    mock_culops_partner_repo: Callable[..., AbstractContextManager[Any]],
+    mock_culops_recipe_repo: Callable[..., AbstractContextManager[Any]],
+    mock_culops_pantry_repo: Callable[..., AbstractContextManager[Any]],
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    with mock_culops_partner_repo() as partner_repo:
+        with mock_culops_recipe_repo() as recipe_repo:
+            with mock_culops_pantry_repo() as pantry_repo:
+                culops_service = CulOpsService(
+                    partner_repo=partner_repo,
+                    recipe_repo=recipe_repo,
+                    pantry_repo=pantry_repo,
+                    token_svc=MagicMock(),
+                )
+
+                with patch.object(
+                    culops_service.session, "get", return_value=mock_culops_recipe_response()
+                ) as mock_get:
+                    recipes = culops_service.get_recipes("partner-123", [12345, 67890])
 
-            assert args[4] is True
+                params = mock_get.call_args.kwargs["params"]
+                assert params["filter[id][]"] == ["12345", "67890"]
+                assert params["page[size]"] == "2"
+                assert [recipe.culops_recipe_id for recipe in recipes] == [12345]
+                assert "CulOps recipe 67890 not found, skipping" in caplog.text
 
 
 def test_get_recipe_pantry_mapping_failure(
@@ -318,17 +469,9 @@ def test_get_recipe_pantry_mapping_failure(
     with mock_culops_partner_repo() as partner_repo:
         with mock_culops_recipe_repo(recipe_id) as recipe_repo:
             with mock_culops_pantry_repo() as pantry_repo:
-                pantry_repo.get_pantry_item_data_by_culops_culinary_ingredient_and_specification_id.side_effect = [
-                    MagicMock(),
-                    None,
-                    MagicMock(),
-                    MagicMock(),
-                    MagicMock(),
-                    MagicMock(),
-                    MagicMock(),
-                    MagicMock(),
-                    MagicMock(),
-                ]
+                pantry_repo.get_pantry_item_data_by_culops_culinary_ingredient_and_specification_ids.side_effect = (
+                    lambda pairs: {pair: MagicMock() for pair in pairs if pair != (2113, 1096)}
+                )
                 mock_culops_token_svc = MagicMock()
                 culops_service = CulOpsService(
                     partner_repo=partner_repo,
@@ -1210,6 +1353,66 @@ def test__get_culops_cycle_id_missing_data_raises_value_error(simple_culops_serv
             simple_culops_service._get_culops_cycle_id("2025-12-01")
 
 
+def test__fetch_culops_cycle_id_concurrent_lookups_share_one_call(simple_culops_service: CulOpsService) -> None:
+    flights = simple_culops_service.transport._flights
+    coalesced_before = flights.stats.coalesced
+    release = threading.Event()
+    mock_response = MagicMock()
+    mock_response.json.return_value = {"data": [{"id": "679"}]}
+
+    def slow_get(**kwargs: Any) -> MagicMock:
+        release.wait(timeout=5)
+        return mock_response
+
+    with patch.object(simple_culops_service.session, "get", side_effect=slow_get) as mock_get:
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            futures = [pool.submit(simple_culops_service._fetch_culops_cycle_id, "2025-12-01") for _ in range(3)]
+            while flights.stats.coalesced < coalesced_before + 2:
+                time.sleep(0.001)
+            release.set()
+
+    assert [future.result() for future in futures] == ["679"] * 3
+    mock_get.assert_called_once()
+    assert simple_culops_service.transport.coalescing_metrics()["GET /api/cycles"]["coalesced"] >= 2
+
+
+def test__get_culops_cycle_id_caches_found_and_missing_cycles(simple_culops_service: CulOpsService) -> None:
+    cache = simple_culops_service.reference_cache.culops_cycle_ids
+    before = cache.metrics()
+    found, missing = MagicMock(), MagicMock()
+    found.json.return_value = {"data": [{"id": "679"}]}
+    missing.json.return_value = {"data": []}
+
+    with patch.object(simple_culops_service.session, "get", side_effect=[found, missing]) as mock_get:
+        assert simple_culops_service._get_culops_cycle_id("2025-12-01") == "679"
+        assert simple_culops_service._get_culops_cycle_id("2025-12-01") == "679"
+        for _ in range(2):
+            with pytest.raises(ValueError, match="not found"):
+                simple_culops_service._get_culops_cycle_id("2030-12-01")
+
+    assert mock_get.call_count == 2
+    after = cache.metrics()
+    assert [after[stat] - before[stat] for stat in ("hits", "negative_hits", "misses")] == [1, 1, 2]
+
+
+def test_get_available_recipe_slots_fetches_once_for_all_plans(simple_culops_service: CulOpsService) -> None:
+    mock_response = MagicMock()
+    mock_response.json.return_value = {
+        "data": [
+            {"attributes": {"plan-description": "Two Person", "short-code": "B2"}},
+            {"attributes": {"plan-description": "Two Person", "short-code": "A1"}},
+            {"attributes": {"plan-description": "Add Ons", "short-code": "AO1"}},
+            {"attributes": {"plan-description": "Add Ons", "short-code": None}},
+        ]
+    }
+
+    with patch.object(simple_culops_service.session, "get", return_value=mock_response) as mock_get:
+        assert simple_culops_service.get_available_recipe_slots("Two Person") == ["A1", "B2"]
+        assert simple_culops_service.get_available_recipe_slots("Add Ons") == ["AO1"]
+
+    mock_get.assert_called_once()
+
+
 def test__set_recipe_cycle_success(simple_culops_service: CulOpsService) -> None:
     recipe_id = 55741
     cycle_id = "679"
@@ -1252,3 +1455,33 @@ def test__set_recipe_cycle_request_exception_raises_server_error(
     with patch.object(simple_culops_service.session, "post", side_effect=RequestException("boom")):
         with pytest.raises(ServerError):
             simple_culops_service._set_recipe_cycle(recipe_id, cycle_id)
+
+
+def test_get_recipe_pantry_item_data_missing_ingredient_raises(simple_culops_service: CulOpsService) -> None:
+    culinary_ingredient_specs_res = Response()
+    culinary_ingredient_specs_res.status_code = 200
+    culinary_ingredient_specs_res._content = json.dumps(
+        {
+            "data": [
+                {
+                    "type": "culinary-ingredient-specifications",
+                    "id": "4768",
+                    "attributes": {"amount": 50.0, "cost": "1.65", "unit": "dry g", "culinary-ingredient-id": 1328},
+                    "relationships": {
+                        "culinary-ingredient": {"data": {"type": "culinary-ingredients", "id": "1328"}},
+                    },
+                }
+            ],
+            # An included resource of another type with the ingredient's id must not be taken for it
+            "included": [
+                {
+                    "type": "culinary-ingredient-specification-costs",
+                    "id": "1328",
+                    "attributes": {"cost": "1.75", "cycle-date": "2025-06-02"},
+                }
+            ],
+        }
+    ).encode()
+    with patch.object(simple_culops_service.session, "get", return_value=culinary_ingredient_specs_res):
+        with pytest.raises(ValueError, match="missing culinary-ingredient: 1328"):
+            simple_culops_service.get_recipe_pantry_item_data(item_ids=[4768])
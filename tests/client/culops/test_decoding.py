@@ -0,0 +1,44 @@
+import json
+
+import pytest
+from pydantic import ValidationError
+
+from src.clients.culops.decoding import validate_response
+from src.clients.culops.mocks.response_data.culinary_ingredient_specs import culinary_ingredient_specifications
+from src.clients.culops.models.culops_pantry import (
+    CulinaryIngredientBrandResource,
+    CulinaryIngredientResource,
+    CulinaryIngredientSpecificationCostResource,
+    CulopsPantryPage,
+)
+from src.clients.culops.models.jsonapi import SkippedResource
+
+
+def _page_body() -> bytes:
+    page = {
+        "data": [spec["data"] for spec in culinary_ingredient_specifications],
+        "included": [resource for spec in culinary_ingredient_specifications for resource in spec["included"]],
+        "links": {"next": "https://culops.test/api/culinary-ingredient-specifications?page[number]=2"},
+    }
+    page["included"].append({"type": "vendors", "id": "1", "attributes": {"name": "Vendor", "cost": "n/a"}})
+    return json.dumps(page).encode()
+
+
+def test_validate_response_picks_included_models_by_type() -> None:
+    page = validate_response(CulopsPantryPage, _page_body())
+
+    assert len(page.data) == len(culinary_ingredient_specifications)
+    assert page.links["next"].endswith("page[number]=2")
+    types = {resource.type: type(resource) for resource in page.included}
+    assert types["culinary-ingredients"] is CulinaryIngredientResource
+    assert types["culinary-ingredient-specification-costs"] is CulinaryIngredientSpecificationCostResource
+    assert types["culinary-ingredient-brands"] is CulinaryIngredientBrandResource
+    # Resource types no mapper reads are kept as bare identifiers
+    assert page.included[-1] == SkippedResource(type="vendors", id="1")
+
+
+def test_validate_response_rejects_a_body_that_is_not_json() -> None:
+    with pytest.raises(ValidationError) as exc_info:
+        validate_response(CulopsPantryPage, b'{"data": [')
+
+    assert exc_info.value.errors()[0]["type"] == "json_invalid"
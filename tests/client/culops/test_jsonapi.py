@@ -0,0 +1,42 @@
+from src.clients.culops.models.culops_recipe import ResourceIdentifier
+from src.clients.culops.models.jsonapi import JsonApiIndex, SkippedResource
+
+
+def _resource(type_: str, id_: str) -> ResourceIdentifier:
+    return ResourceIdentifier(type=type_, id=id_)
+
+
+def test_index_resolves_by_type_and_id() -> None:
+    ingredient = _resource("culinary-ingredients", "7")
+    # Ids are only unique per type
+    cost = _resource("culinary-ingredient-specification-costs", "7")
+    index = JsonApiIndex([ingredient, cost])
+
+    assert len(index) == 2
+    assert index.get("culinary-ingredients", "7") is ingredient
+    assert index.resolve(_resource("culinary-ingredient-specification-costs", "7")) is cost
+    assert index.resolve(_resource("culinary-ingredients", "8")) is None
+    assert index.resolve(None) is None
+
+
+def test_index_resolve_all_keeps_relationship_order_and_skips_missing() -> None:
+    first, second = _resource("costs", "1"), _resource("costs", "2")
+    index = JsonApiIndex([first, second, _resource("brands", "3")])
+
+    identifiers = [_resource("costs", "2"), _resource("costs", "9"), _resource("brands", "3"), _resource("costs", "1")]
+
+    assert index.resolve_all(identifiers, "costs") == [second, first]
+    assert len(index.resolve_all(identifiers)) == 3
+    assert index.resolve_all(None) == []
+
+
+def test_index_of_missing_included_is_empty() -> None:
+    assert len(JsonApiIndex(None)) == 0
+
+
+def test_index_leaves_out_skipped_resources() -> None:
+    brand = _resource("culinary-ingredient-brands", "3")
+    index = JsonApiIndex([brand, SkippedResource(type="vendors", id="1")])
+
+    assert len(index) == 1
+    assert index.get("vendors", "1") is None
@@ -0,0 +1,77 @@
+import io
+import json
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from requests import Response
+
+from src.clients.culops import streaming
+from src.clients.culops.culops import CulOpsService
+from src.clients.culops.mocks.response_data.culinary_ingredient_specs import culinary_ingredient_specifications
+from src.clients.culops.streaming import StreamedPantryPage
+from src.core.config import settings
+from src.core.exceptions import ServerError
+from src.services.models.pantry import PantryItem
+
+
+def _page(included_first: bool) -> dict[str, Any]:
+    data = [spec["data"] for spec in culinary_ingredient_specifications]
+    included = [resource for spec in culinary_ingredient_specifications for resource in spec["included"]]
+    included.append({"type": "vendors", "id": "1", "attributes": {"name": "Vendor"}})
+    links = {"next": "https://culops.test/api/culinary-ingredient-specifications?page[number]=2"}
+    if included_first:
+        return {"included": included, "meta": None, "links": links, "data": data}
+    return {"data": data, "links": links, "included": included}
+
+
+def _response(body: bytes) -> Response:
+    response = Response()
+    response.status_code = 200
+    response._content = body
+    response._content_consumed = True
+    return response
+
+
+def _comparable(items: list[PantryItem]) -> list[dict[str, Any]]:
+    return [item.model_dump(exclude={"id"}) for item in items]
+
+
+@pytest.mark.parametrize("included_first", [False, True], ids=["included-after-data", "included-before-data"])
+def test_streamed_page_maps_like_a_whole_page(
+    simple_culops_service: CulOpsService, monkeypatch: pytest.MonkeyPatch, included_first: bool
+) -> None:
+    body = json.dumps(_page(included_first)).encode()
+
+    with patch.object(simple_culops_service.session, "get", return_value=_response(body)):
+        whole_items, whole_pagination = simple_culops_service._fetch_pantry_page("token", 1, 5, "p1", None, None)
+    monkeypatch.setattr(settings, "CULOPS_PANTRY_STREAMING", True)
+    with patch.object(simple_culops_service.session, "get", return_value=_response(body)) as mock_get:
+        items, pagination = simple_culops_service._fetch_pantry_page("token", 1, 5, "p1", None, None)
+
+    assert mock_get.call_args.kwargs["stream"] is True
+    assert len(items) == len(culinary_ingredient_specifications)
+    assert _comparable(items) == _comparable(whole_items)
+    assert pagination.links == whole_pagination.links
+
+
+def test_streamed_page_indexes_only_resources_the_mapper_reads() -> None:
+    page = StreamedPantryPage(io.BytesIO(json.dumps(_page(included_first=False)).encode()))
+
+    assert page.included_index.get("vendors", "1") is None
+    assert page.included_index.get("culinary-ingredients", "1328") is not None
+    assert page.pagination.links["next"].endswith("page[number]=2")
+    assert [item.id for item in page.data_items()] == [
+        spec["data"]["id"] for spec in culinary_ingredient_specifications
+    ]
+
+
+def test_streamed_malformed_page_raises_server_error(
+    simple_culops_service: CulOpsService, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(settings, "CULOPS_PANTRY_STREAMING", True)
+    body = json.dumps(_page(included_first=True)).encode()[:-200]
+
+    with patch.object(simple_culops_service.session, "get", return_value=_response(body)):
+        with pytest.raises(ServerError, match="Failed to parse"):
+            simple_culops_service._fetch_pantry_page("token", 1, 5, "p1", None, None)
@@ -0,0 +1,183 @@
+from collections.abc import Iterator
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+from unittest.mock import patch
+
+import httpx
+import pytest
+import requests
+from requests import PreparedRequest, Response
+
+from src.clients.culops.transport import (
+    CulOpsTransport,
+    LatencyHistogram,
+    TimeoutHTTPAdapter,
+    endpoint_name,
+    request_key,
+    retry_after_seconds,
+    retry_backoff,
+)
+from src.core.config import settings
+
+
+@pytest.fixture
+def transport() -> Iterator[CulOpsTransport]:
+    transport = CulOpsTransport()
+    transport.shutdown()
+    with patch("src.clients.culops.transport.requests.Session", requests.Session):
+        yield transport
+    transport.shutdown()
+
+
+def _response(method: str, url: str, elapsed_ms: float) -> Response:
+    request = PreparedRequest()
+    request.prepare(method=method, url=url)
+    response = Response()
+    response.request = request
+    response.status_code = 200
+    response.elapsed = timedelta(milliseconds=elapsed_ms)
+    return response
+
+
+def test_session_is_shared_and_rebuilt_after_shutdown(transport: CulOpsTransport) -> None:
+    session = transport.session
+
+    assert CulOpsTransport().session is session
+    transport.shutdown()
+    assert transport.session is not session
+
+
+def test_session_adapter_pools_retries_gets_and_sets_timeouts(transport: CulOpsTransport) -> None:
+    adapter = transport.session.get_adapter("https://culops.example.com")
+
+    assert isinstance(adapter, TimeoutHTTPAdapter)
+    assert adapter.timeout[0] > 0 and adapter.timeout[1] > 0
+    assert adapter.max_retries.allowed_methods == frozenset(["GET"])
+    assert adapter.max_retries.respect_retry_after_header is True
+    assert 503 in adapter.max_retries.status_forcelist
+    assert adapter.max_retries.is_retry("GET", 429, has_retry_after=True)
+    assert not adapter.max_retries.is_retry("POST", 503)
+
+
+def test_session_retries_back_off_with_jitter(transport: CulOpsTransport, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "CULOPS_HTTP_RETRY_BACKOFF_FACTOR", 1.0)
+    monkeypatch.setattr(settings, "CULOPS_HTTP_RETRY_BACKOFF_JITTER", 0.25)
+    transport.shutdown()
+    retry = transport.session.get_adapter("https://culops.example.com").max_retries
+
+    assert retry.backoff_jitter == 0.25
+    # The first retry does not back off; the second waits factor * 2 plus up to the jitter
+    for _ in range(2):
+        retry = retry.increment("GET", "/pantry", error=ConnectionError())
+    backoffs = {retry.get_backoff_time() for _ in range(20)}
+    assert all(2.0 <= backoff <= 2.25 for backoff in backoffs)
+    assert len(backoffs) > 1
+
+
+def test_timeout_adapter_applies_default_only_when_unset() -> None:
+    adapter = TimeoutHTTPAdapter(timeout=(1.0, 2.0))
+    request = PreparedRequest()
+    request.prepare(method="GET", url="https://culops.example.com/api/recipes")
+
+    with patch("requests.adapters.HTTPAdapter.send") as mock_send:
+        adapter.send(request, timeout=None)
+        adapter.send(request, timeout=15)
+
+    assert mock_send.call_args_list[0].kwargs["timeout"] == (1.0, 2.0)
+    assert mock_send.call_args_list[1].kwargs["timeout"] == 15
+
+
+def test_response_hook_records_latency_per_endpoint(transport: CulOpsTransport) -> None:
+    hook = transport.session.hooks["response"][0]
+
+    hook(_response("GET", "https://culops.example.com/api/recipes/123", 40))
+    hook(_response("GET", "https://culops.example.com/api/recipes/456", 400))
+    hook(_response("GET", "https://culops.example.com/api/culinary-ingredient-specifications", 20000))
+
+    metrics = transport.metrics()
+    recipe_stats = metrics["GET /api/recipes/{id}"]
+    assert recipe_stats["count"] == 2
+    assert recipe_stats["buckets"]["le_50ms"] == 1
+    assert recipe_stats["buckets"]["le_500ms"] == 1
+    assert metrics["GET /api/culinary-ingredient-specifications"]["buckets"]["le_inf"] == 1
+
+
+def test_endpoint_name_collapses_numeric_segments() -> None:
+    assert endpoint_name("patch", "https://host/api/recipes/42?x=1") == "PATCH /api/recipes/{id}"
+
+
+def test_request_key_encodes_params_and_separates_credentials() -> None:
+    url = "https://culops.example.com/api/recipes"
+    params = {"filter[cycle-date]": "2025-12-01", "page[size]": 1000}
+    key = request_key("get", url, {"Authorization": "Bearer a"}, params)
+
+    encoded_url = f"{url}?filter%5Bcycle-date%5D=2025-12-01&page%5Bsize%5D=1000"
+    assert key == request_key("GET", encoded_url, {"Authorization": "Bearer a"}, None)
+    assert key != request_key("GET", url, {"Authorization": "Bearer b"}, params)
+    assert key != request_key("GET", url, {"Authorization": "Bearer a"}, {**params, "page[size]": 10})
+
+
+def test_coalesce_counts_calls_per_endpoint(transport: CulOpsTransport) -> None:
+    url = "https://culops.example.com/api/cycles/42"
+    before = transport.coalescing_metrics().get("GET /api/cycles/{id}", {"executed": 0, "coalesced": 0})
+
+    assert transport.coalesce("GET", url, {"Authorization": "Bearer a"}, None, lambda: "679") == "679"
+    assert transport.coalescing_metrics()["GET /api/cycles/{id}"] == {
+        "executed": before["executed"] + 1,
+        "coalesced": before["coalesced"],
+    }
+
+
+def test_coalesce_can_be_disabled(transport: CulOpsTransport, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "CULOPS_HTTP_SINGLE_FLIGHT_ENABLED", False)
+    before = transport.coalescing_metrics()
+
+    assert transport.coalesce("GET", "https://culops.example.com/api/recipe-slots", None, None, lambda: 1) == 1
+    assert transport.coalescing_metrics() == before
+
+
+def test_latency_histogram_snapshot() -> None:
+    histogram = LatencyHistogram()
+    histogram.observe(10)
+    histogram.observe(30)
+
+    snapshot = histogram.snapshot()
+    assert snapshot["count"] == 2
+    assert snapshot["avg_ms"] == 20
+    assert snapshot["max_ms"] == 30
+    assert snapshot["buckets"]["le_25ms"] == 1
+    assert snapshot["buckets"]["le_50ms"] == 1
+
+
+@pytest.mark.asyncio
+async def test_async_client_is_shared_and_records_latency(transport: CulOpsTransport) -> None:
+    client = transport.async_client
+    assert CulOpsTransport().async_client is client
+
+    # Swap in a stub transport but keep the latency hooks installed by the shared client
+    client._transport = httpx.MockTransport(lambda request: httpx.Response(200, json={}))
+    await client.get("https://culops.example.com/api/cycles/42")
+
+    assert transport.metrics()["GET /api/cycles/{id}"]["count"] == 1
+
+    await transport.shutdown_async()
+    assert transport.async_client is not client
+    await transport.shutdown_async()
+
+
+def test_retry_after_seconds_reads_seconds_and_http_dates() -> None:
+    retry_at = format_datetime(datetime.now(UTC) + timedelta(seconds=30), usegmt=True)
+
+    assert retry_after_seconds(httpx.Response(429, headers={"Retry-After": "7"})) == 7.0
+    assert 25 < (retry_after_seconds(httpx.Response(503, headers={"Retry-After": retry_at})) or 0) <= 30
+    assert retry_after_seconds(httpx.Response(503, headers={"Retry-After": "soon"})) is None
+    assert retry_after_seconds(httpx.Response(503)) is None
+
+
+def test_retry_backoff_doubles_with_jitter(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "CULOPS_HTTP_RETRY_BACKOFF_FACTOR", 1.0)
+    monkeypatch.setattr(settings, "CULOPS_HTTP_RETRY_BACKOFF_JITTER", 0.25)
+
+    assert retry_backoff(1) == 0.0
+    assert 2.0 <= retry_backoff(2) <= 2.25
+    assert 4.0 <= retry_backoff(3) <= 4.25
@@ -73,3 +73,55 @@ def test_value_serializer() -> None:
     mock_proto_message.SerializeToString.side_effect = EncodeError("Serialization Error")
     with pytest.raises(EncodeError):
         BaseProducer._value_serializer(mock_proto_message)
+
+
+def test_produce_async_returns_future_without_waiting(
+    base_producer: BaseProducer, mock_kafka_producer: MagicMock
+) -> None:
+    mock_future = MagicMock()
+    mock_kafka_producer.send.return_value = mock_future
+
+    future = base_producer.produce_async(message="test_message", key="test_key")
+
+    assert future is mock_future
+    mock_kafka_producer.send.assert_called_once_with(topic="test-topic", value="test_message", key="test_key")
+    mock_future.get.assert_not_called()
+    mock_future.add_callback.assert_called_once()
+    mock_future.add_errback.assert_called_once()
+
+
+def test_produce_async_applies_backpressure_when_queue_full(mock_kafka_producer: MagicMock) -> None:
+    with patch("src.clients.kafka.base_producer.settings") as mock_settings:
+        mock_settings.KAFKA_PRODUCER_MAX_PENDING_MESSAGES = 1
+        mock_settings.KAFKA_PRODUCER_ENQUEUE_TIMEOUT = 0.01
+        producer = BaseProducer(topic="test-topic")
+
+    producer.produce_async(message="first")
+    with pytest.raises(ServerError, match="queue for topic test-topic is full"):
+        producer.produce_async(message="second")
+
+    # Delivering the first message frees a slot for the next one.
+    on_success = mock_kafka_producer.send.return_value.add_callback.call_args[0][0]
+    on_success(MagicMock())
+    producer.produce_async(message="third")
+
+
+def test_produce_async_reports_delivery_errors(base_producer: BaseProducer, mock_kafka_producer: MagicMock) -> None:
+    on_error = MagicMock()
+    mock_future = MagicMock()
+    mock_kafka_producer.send.return_value = mock_future
+
+    base_producer.produce_async(message="test_message", on_error=on_error)
+    errback = mock_future.add_errback.call_args[0][0]
+    error = KafkaError("delivery failed")
+    errback(error)
+    base_producer.close()
+
+    on_error.assert_called_once_with(error)
+
+
+def test_produce_async_send_error(base_producer: BaseProducer, mock_kafka_producer: MagicMock) -> None:
+    mock_kafka_producer.send.side_effect = KafkaError("Test Kafka Error")
+
+    with pytest.raises(ServerError, match="Failed to produce message to Kafka"):
+        base_producer.produce_async(message="test_message")
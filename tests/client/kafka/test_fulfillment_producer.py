@@ -207,3 +207,20 @@ def test_map_special_handlings() -> None:
 def test_map_order_location_type() -> None:
     assert FulfillmentProducer._map_order_location_type(LocationType.RESIDENTIAL) == ProtoLocationType.RESIDENTIAL
     assert FulfillmentProducer._map_order_location_type(LocationType.COMMERCIAL) == ProtoLocationType.COMMERCIAL
+
+
+def test_send_fulfillment_message_async_reports_delivery_failure(valid_order: Order) -> None:
+    on_delivery_failure = MagicMock()
+    with patch("src.clients.kafka.base_producer.kafka.KafkaProducer"):
+        producer = FulfillmentProducer(on_delivery_failure=on_delivery_failure)
+
+    with patch.object(FulfillmentProducer, "produce_async") as mock_produce_async:
+        producer.send_fulfillment_message(valid_order)
+
+    mock_produce_async.assert_called_once()
+    args, kwargs = mock_produce_async.call_args
+    assert isinstance(args[0], ConsumerToFulfillmentMessage)
+
+    error = Exception("delivery failed")
+    kwargs["on_error"](error)
+    on_delivery_failure.assert_called_once_with(valid_order, error)
@@ -0,0 +1,76 @@
+from unittest.mock import MagicMock
+
+from src.clients.kafka.producer_registry import ProducerRegistry
+
+
+def test_get_reuses_producer_per_topic() -> None:
+    registry = ProducerRegistry()
+    factory = MagicMock(side_effect=lambda: MagicMock())
+
+    first = registry.get("test-topic", factory)
+    second = registry.get("test-topic", factory)
+    other = registry.get("other-topic", factory)
+
+    assert first is second
+    assert first is not other
+    assert factory.call_count == 2
+    registry.shutdown()
+
+
+def test_shutdown_flushes_and_closes_producers() -> None:
+    registry = ProducerRegistry()
+    producer = MagicMock()
+    registry.get("test-topic", lambda: producer)
+
+    registry.shutdown()
+
+    producer.close.assert_called_once()
+    assert registry.get("test-topic", MagicMock) is not producer
+    registry.shutdown()
+
+
+def test_shutdown_continues_when_close_fails() -> None:
+    registry = ProducerRegistry()
+    failing, healthy = MagicMock(), MagicMock()
+    failing.close.side_effect = RuntimeError("broker down")
+    registry.get("failing-topic", lambda: failing)
+    registry.get("healthy-topic", lambda: healthy)
+
+    registry.shutdown()
+
+    healthy.close.assert_called_once()
+
+
+def test_delivery_failure_reported_during_shutdown_reaches_the_live_response_producer() -> None:
+    registry = ProducerRegistry()
+    responses = MagicMock()
+    response_factory = MagicMock(return_value=responses)
+    fulfillment = MagicMock()
+    registry.get("responses", response_factory)
+    registry.get("fulfillment", lambda: fulfillment, reports_to="responses")
+    closing_order: list[str] = []
+    responses.close.side_effect = lambda **_: closing_order.append("responses")
+    # Closing drains the delivery callbacks, one of which reports a failed delivery on the response topic
+    fulfillment.close.side_effect = lambda **_: (
+        registry.get("responses", response_factory).send("failed"),
+        closing_order.append("fulfillment"),
+    )
+
+    registry.shutdown()
+
+    assert closing_order == ["fulfillment", "responses"]
+    response_factory.assert_called_once()
+    responses.send.assert_called_once_with("failed")
+
+
+def test_producer_created_by_a_callback_during_shutdown_is_closed() -> None:
+    registry = ProducerRegistry()
+    responses = MagicMock()
+    fulfillment = MagicMock()
+    fulfillment.close.side_effect = lambda **_: registry.get("responses", lambda: responses).send("failed")
+    registry.get("fulfillment", lambda: fulfillment, reports_to="responses")
+
+    registry.shutdown()
+
+    responses.send.assert_called_once_with("failed")
+    responses.close.assert_called_once()
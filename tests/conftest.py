@@ -3,21 +3,24 @@ import json
 from collections.abc import Generator
 from datetime import UTC, datetime
 from typing import Any
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from fastapi.testclient import TestClient
 
 from src.db.mocks.idempotency_data import MockIdempotencyDB
-from src.db.mocks.pantry_data import MockPantryDB
-from src.db.mocks.partner_data import MockPartnerDB
-from src.dependancies.culops_client import get_culops_client
+from src.db.mocks.pantry_data import MockAsyncPantryDB, MockPantryDB
+from src.db.mocks.partner_data import MockAsyncPartnerDB, MockPartnerDB
+from src.dependancies.culops_client import get_async_culops_client, get_culops_client
 from src.dependancies.idempotency_db import get_idempotency_db
-from src.dependancies.pantry_db import get_pantry_db
-from src.dependancies.partner_db import get_partner_db
+from src.dependancies.pantry_crawl_service import get_pantry_crawl_service_factory
+from src.dependancies.pantry_db import get_async_pantry_db, get_pantry_db
+from src.dependancies.partner_db import get_async_partner_db, get_partner_db
 from src.dependancies.partner_service import get_partner_service
 from src.dependancies.token_service import get_token_service
 from src.main import app
+from src.services.models.pantry import PantryPageInfo
+from src.services.pantry import PantryService
 from src.services.partner import PartnerService
 from src.services.token import TokenName, TokenService
 from src.token_manager.models import Param
@@ -55,6 +58,12 @@ def test_client() -> Generator[TestClient, Any, None]:
     mock_culops_client = MagicMock()
     mock_culops_client.get_partner_culops_pantry_data.side_effect = mock_get_partner_culops_pantry_data
 
+    # The async pantry route fetches the first page through the async client, which does not filter by brand
+    mock_async_culops_client = MagicMock()
+    mock_async_culops_client.get_partner_culops_pantry_page = AsyncMock(
+        return_value=(mock_items, PantryPageInfo(has_next=False))
+    )
+
     app.dependency_overrides[get_partner_db] = lambda: MockPartnerDB()
     app.dependency_overrides[get_pantry_db] = lambda: MockPantryDB()
     app.dependency_overrides[get_idempotency_db] = lambda: MockIdempotencyDB()
@@ -63,6 +72,14 @@ def test_client() -> Generator[TestClient, Any, None]:
     )
     app.dependency_overrides[get_token_service] = lambda: TokenService(param_store_client=MockParamStoreClient())
     app.dependency_overrides[get_culops_client] = lambda: mock_culops_client
+    app.dependency_overrides[get_async_partner_db] = lambda: MockAsyncPartnerDB()
+    app.dependency_overrides[get_async_pantry_db] = lambda: MockAsyncPantryDB()
+    app.dependency_overrides[get_async_culops_client] = lambda: mock_async_culops_client
+    app.dependency_overrides[get_pantry_crawl_service_factory] = lambda: lambda: PantryService(
+        pantry_db=MockPantryDB(),
+        culops_service=mock_culops_client,
+        partner_service=PartnerService(partner_id="BA-MAIN", partner_db=MockPartnerDB()),
+    )
     with TestClient(app) as c:
         yield c
     app.dependency_overrides = {}
@@ -1,13 +1,15 @@
 from collections.abc import Awaitable, Callable
 from typing import Any
 
-from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi import APIRouter, Depends, FastAPI, HTTPException, Request, Response
 from fastapi.responses import JSONResponse
 from fastapi.testclient import TestClient
 from httpx import Response as HTTPXResponse
 from starlette.middleware.base import BaseHTTPMiddleware
 
 from src.core.middleware.partner_id_middleware import PartnerIDMiddleware, partner_id_ctx
+from src.dependancies.route_context import set_route_logger_context
+from src.utils.logger_context import get_logger_context
 from tests.conftest import encode_jwt
 
 
@@ -77,3 +79,33 @@ def test_dispatch_error_jwt_missing_custom_partner_id_claim() -> None:
     resp: HTTPXResponse = client.get("/ping", headers={"Authorization": f"Bearer {token}"})
     assert resp.status_code == 401
     assert resp.json()["detail"] == "No partner ID found in access token"
+
+
+def test_dispatch_exposes_partner_id_on_request_state() -> None:
+    app = FastAPI()
+
+    @app.get("/state")
+    def state(request: Request) -> dict[str, Any | None]:
+        return {"partner_id": request.state.partner_id}
+
+    app.add_middleware(PartnerIDMiddleware)
+    client = TestClient(app)
+    token = encode_jwt({"custom:partner_id": "BA-MAIN"})
+    resp: HTTPXResponse = client.get("/state", headers={"Authorization": f"Bearer {token}"})
+    assert resp.json()["partner_id"] == "BA-MAIN"
+
+
+def test_route_logger_context_uses_resolved_path_params() -> None:
+    router = APIRouter(dependencies=[Depends(set_route_logger_context)])
+
+    @router.get("/items/{item_id}")
+    def item(item_id: str) -> dict[str, Any]:
+        return get_logger_context()
+
+    app = FastAPI()
+    app.include_router(router)
+    app.add_middleware(PartnerIDMiddleware)
+    client = TestClient(app)
+    token = encode_jwt({"custom:partner_id": "BA-MAIN"})
+    resp: HTTPXResponse = client.get("/items/42", headers={"Authorization": f"Bearer {token}"})
+    assert resp.json() == {"partner_id": "BA-MAIN", "item_id": "42"}
@@ -0,0 +1,125 @@
+from collections.abc import Iterator
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.exc import SQLAlchemyError
+
+from src.core.exceptions import ServerError
+from src.db.async_pantry_repo import AsyncPantryRepo
+from src.db.async_partner_repo import AsyncPartnerRepo
+
+
+@pytest.fixture
+def mock_connection() -> AsyncMock:
+    conn = AsyncMock()
+    conn.__aenter__.return_value = conn
+    return conn
+
+
+@pytest.fixture
+def pantry_repo(mock_connection: AsyncMock) -> Iterator[AsyncPantryRepo]:
+    repo = AsyncPantryRepo()
+    with patch.object(repo, "_connection", return_value=mock_connection):
+        yield repo
+
+
+@pytest.fixture
+def partner_repo(mock_connection: AsyncMock) -> Iterator[AsyncPartnerRepo]:
+    repo = AsyncPartnerRepo()
+    with patch.object(repo, "_connection", return_value=mock_connection):
+        yield repo
+
+
+@pytest.mark.asyncio
+async def test_get_partner_pantry_by_id_success(pantry_repo: AsyncPantryRepo, mock_connection: AsyncMock) -> None:
+    pantry_state_id = uuid4()
+    now = datetime.now()
+    pantry_state_row = {
+        "pantry_state_id": pantry_state_id,
+        "pantry_state_timestamp": now,
+        "items_available_from": None,
+        "items_available_until": None,
+        "item_count": 1,
+        "cost_markups": [{"applied_from": None, "applied_until": None, "markup_percent": 10.0}],
+    }
+    pantry_items_rows = [
+        {
+            "pantry_item_id": uuid4(),
+            "description": "Test item",
+            "amount": 2.5,
+            "units": "kg",
+            "is_prepped_and_ready": False,
+            "costs": [{"production_cost_us_dollars": 1.5, "applied_from": "2024-01-01", "applied_until": None}],
+            "availabilities": None,
+            "custom_fields": None,
+        }
+    ]
+    mock_connection.execute.side_effect = [
+        MagicMock(mappings=MagicMock(return_value=MagicMock(fetchone=MagicMock(return_value=pantry_state_row)))),
+        MagicMock(mappings=MagicMock(return_value=MagicMock(fetchall=MagicMock(return_value=pantry_items_rows)))),
+    ]
+
+    pantry, total_count = await pantry_repo.get_partner_pantry_by_id(str(pantry_state_id), "TC-MAIN", page_size=10)
+
+    assert pantry is not None
+    assert total_count == 1
+    assert pantry.partner_id == "TC-MAIN"
+    assert pantry.pantry_items[0].cost[0].production_cost_us_dollars == 1.5
+    assert pantry.partner_cost_markup[0].markup_percent == 10.0
+    # The stored item count is used and markups come with the state, so only the state and page are read
+    assert mock_connection.execute.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_partner_pantry_by_id_not_found(pantry_repo: AsyncPantryRepo, mock_connection: AsyncMock) -> None:
+    mock_connection.execute.return_value = MagicMock(
+        mappings=MagicMock(return_value=MagicMock(fetchone=MagicMock(return_value=None)))
+    )
+
+    assert await pantry_repo.get_partner_pantry_by_id(str(uuid4()), "TC-MAIN", page_size=10) == (None, 0)
+
+
+@pytest.mark.asyncio
+async def test_get_partner_pantry_by_id_db_error(pantry_repo: AsyncPantryRepo, mock_connection: AsyncMock) -> None:
+    mock_connection.execute.side_effect = SQLAlchemyError("db error")
+
+    with pytest.raises(ServerError):
+        await pantry_repo.get_partner_pantry_by_id(str(uuid4()), "TC-MAIN", page_size=10)
+
+
+@pytest.mark.asyncio
+async def test_get_branding_success(partner_repo: AsyncPartnerRepo, mock_connection: AsyncMock) -> None:
+    rows = [{"partner_id": "TC-MAIN", "name": "brand", "fes_name": "fes-brand"}]
+    mock_connection.execute.return_value = MagicMock(
+        mappings=MagicMock(return_value=MagicMock(fetchall=MagicMock(return_value=rows)))
+    )
+
+    brands = await partner_repo.get_branding("TC-MAIN")
+
+    assert [brand.name for brand in brands] == ["brand"]
+
+
+@pytest.mark.asyncio
+async def test_get_partner_cost_markups_db_error(partner_repo: AsyncPartnerRepo, mock_connection: AsyncMock) -> None:
+    mock_connection.execute.side_effect = SQLAlchemyError("db error")
+
+    with pytest.raises(ServerError):
+        await partner_repo.get_partner_cost_markups("TC-MAIN")
+
+
+@pytest.mark.asyncio
+async def test_get_pantry_snapshot_progress(pantry_repo: AsyncPantryRepo, mock_connection: AsyncMock) -> None:
+    pantry_state_id = uuid4()
+    pantry_state_row = {"item_count": 120, "crawl_status": "running", "pages_fetched": 2, "crawl_finished_at": None}
+    mock_connection.execute.return_value = MagicMock(
+        mappings=MagicMock(return_value=MagicMock(fetchone=MagicMock(return_value=pantry_state_row)))
+    )
+
+    progress = await pantry_repo.get_pantry_snapshot_progress(str(pantry_state_id), "TC-MAIN")
+
+    assert progress is not None
+    assert progress.status == "running"
+    assert progress.pages_fetched == 2
+    assert progress.item_count == 120
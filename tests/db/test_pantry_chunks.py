@@ -0,0 +1,87 @@
+from datetime import date, datetime
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.core.exceptions import ServerError
+from src.db.pantry_chunks import (
+    CHUNK_CODECS,
+    get_chunk_codec,
+    pantry_chunk_page_stmt,
+    pantry_chunk_values,
+    pantry_items_from_chunks,
+)
+from tests.db.test_data import make_pantry_item
+
+SNAPSHOT_DATE = date(2026, 10, 18)
+
+
+def _chunk_rows(page_sizes: list[int]) -> tuple[list[dict], list[str]]:
+    codec = get_chunk_codec("zlib-json")
+    pantry_state_id = uuid4()
+    rows, item_ids, offset = [], [], 0
+    for chunk_no, size in enumerate(page_sizes):
+        items = [make_pantry_item() for _ in range(size)]
+        rows.append(pantry_chunk_values(pantry_state_id, SNAPSHOT_DATE, chunk_no, offset, items, codec))
+        item_ids.extend(item.id for item in items)
+        offset += size
+    return rows, item_ids
+
+
+@pytest.mark.parametrize("codec_name", sorted(CHUNK_CODECS))
+def test_pantry_chunk_values_round_trips_items(codec_name: str) -> None:
+    item = make_pantry_item()
+    item.amount = 2.456
+
+    row = pantry_chunk_values(uuid4(), SNAPSHOT_DATE, 0, 0, [item], get_chunk_codec(codec_name))
+
+    assert row["item_count"] == 1
+    assert row["item_ids"] == [UUID(item.id)]
+    [decoded] = pantry_items_from_chunks([row], 0, 10)
+    assert decoded.id == item.id
+    assert decoded.amount == 2.46
+    # Like the relational date columns, only the day is kept
+    assert decoded.cost[0].start_date == datetime(2024, 1, 1)
+    assert decoded.custom_fields == item.custom_fields
+    assert decoded.pantry_item_data_source is None
+
+
+def test_pantry_items_from_chunks_slices_page_across_chunks() -> None:
+    rows, item_ids = _chunk_rows([4, 4, 4])
+
+    # Items 3 to 8 span all three chunks; the reader receives only the overlapping ones
+    items = pantry_items_from_chunks(rows, 3, 6)
+
+    assert [item.id for item in items] == item_ids[3:9]
+
+
+def test_pantry_items_from_chunks_short_last_page() -> None:
+    rows, item_ids = _chunk_rows([4, 2])
+
+    items = pantry_items_from_chunks(rows[1:], 5, 4)
+
+    assert [item.id for item in items] == item_ids[5:]
+
+
+def test_pantry_items_from_chunks_unknown_encoding_raises() -> None:
+    rows, _ = _chunk_rows([1])
+    rows[0]["encoding"] = "lz4-arrow"
+
+    with pytest.raises(ServerError, match="lz4-arrow"):
+        pantry_items_from_chunks(rows, 0, 10)
+
+
+def test_get_chunk_codec_unknown_raises() -> None:
+    with pytest.raises(ServerError, match="Unknown pantry chunk codec"):
+        get_chunk_codec("lz4-arrow")
+
+
+def test_pantry_chunk_page_stmt_selects_overlapping_chunks() -> None:
+    stmt = pantry_chunk_page_stmt(uuid4(), SNAPSHOT_DATE, 100, 50)
+
+    compiled = stmt.compile(dialect=postgresql.dialect())
+    assert "pantry_item_chunks.item_offset <" in str(compiled)
+    assert "pantry_item_chunks.item_offset + pantry_item_chunks.item_count >" in str(compiled)
+    assert "ORDER BY pantry_item_chunks.item_offset" in str(compiled)
+    assert 150 in compiled.params.values()
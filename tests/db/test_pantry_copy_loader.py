@@ -0,0 +1,94 @@
+from datetime import date
+from decimal import Decimal
+from unittest.mock import MagicMock
+from uuid import UUID, uuid4
+
+import pytest
+
+from src.db.pantry_copy_loader import (
+    AVAILABILITIES,
+    COSTS,
+    CUSTOM_FIELDS,
+    DATA_SOURCES,
+    PANTRY_ITEMS,
+    build_pantry_item_rows,
+    copy_pantry_item_rows,
+    insert_pantry_item_rows,
+    supports_copy,
+)
+from tests.db.test_data import make_pantry_item
+
+SNAPSHOT_DATE = date(2026, 10, 18)
+
+
+def test_build_pantry_item_rows_flattens_items() -> None:
+    pantry_state_id = uuid4()
+    item = make_pantry_item()
+
+    result = build_pantry_item_rows(pantry_state_id, SNAPSHOT_DATE, [item])
+
+    assert result.item_count == 1
+    item_row = result.rows[PANTRY_ITEMS][0]
+    assert item_row[:3] == (UUID(item.id), SNAPSHOT_DATE, pantry_state_id)
+    assert item_row[4] == Decimal("2.5")
+    assert len(result.rows[DATA_SOURCES]) == 1
+    assert len(result.rows[COSTS]) == 1
+    assert isinstance(result.rows[COSTS][0][4], Decimal)
+    assert len(result.rows[AVAILABILITIES]) == 1
+    assert result.rows[CUSTOM_FIELDS][0][:2] == (UUID(item.id), SNAPSHOT_DATE)
+    for target, rows in result.rows.items():
+        assert all(len(row) == len(target.columns) == len(target.pg_types) for row in rows)
+
+
+def test_build_pantry_item_rows_requires_data_source() -> None:
+    item = make_pantry_item()
+    item.pantry_item_data_source = None
+
+    with pytest.raises(ValueError):
+        build_pantry_item_rows(uuid4(), SNAPSHOT_DATE, [item])
+
+
+def test_supports_copy_only_for_psycopg() -> None:
+    conn = MagicMock()
+    conn.dialect.name = "postgresql"
+    conn.dialect.driver = "psycopg"
+    assert supports_copy(conn)
+
+    conn.dialect.driver = "psycopg2"
+    assert not supports_copy(conn)
+
+    conn.dialect.name = "sqlite"
+    conn.dialect.driver = "pysqlite"
+    assert not supports_copy(conn)
+
+
+def test_copy_pantry_item_rows_streams_each_non_empty_table() -> None:
+    conn = MagicMock()
+    cursor = conn.connection.driver_connection.cursor.return_value.__enter__.return_value
+    copy = cursor.copy.return_value.__enter__.return_value
+    item = make_pantry_item()
+    item.custom_fields = []
+
+    copy_pantry_item_rows(conn, build_pantry_item_rows(uuid4(), SNAPSHOT_DATE, [item]))
+
+    statements = [call.args[0] for call in cursor.copy.call_args_list]
+    assert statements == [
+        PANTRY_ITEMS.copy_sql,
+        DATA_SOURCES.copy_sql,
+        COSTS.copy_sql,
+        AVAILABILITIES.copy_sql,
+    ]
+    assert copy.set_types.call_args_list[0].args[0] == list(PANTRY_ITEMS.pg_types)
+    assert copy.write_row.call_count == 4
+    conn.execute.assert_not_called()
+
+
+def test_insert_pantry_item_rows_uses_one_executemany_per_table() -> None:
+    conn = MagicMock()
+    items = [make_pantry_item(), make_pantry_item()]
+
+    insert_pantry_item_rows(conn, build_pantry_item_rows(uuid4(), SNAPSHOT_DATE, items))
+
+    assert conn.execute.call_count == 5
+    item_params = conn.execute.call_args_list[0].args[1]
+    assert [params["pantry_item_id"] for params in item_params] == [UUID(item.id) for item in items]
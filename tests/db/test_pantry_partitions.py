@@ -0,0 +1,65 @@
+from datetime import UTC, date, datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+from src.db.pantry_partitions import (
+    PARTITIONED_TABLES,
+    create_pantry_partitions,
+    partition_name,
+    snapshot_date_for,
+)
+from src.db.schema import pantry_item_costs
+
+
+def test_snapshot_date_is_the_utc_day() -> None:
+    late_evening_pacific = datetime(2026, 10, 18, 20, 0, tzinfo=timezone(timedelta(hours=-7)))
+
+    assert snapshot_date_for(late_evening_pacific) == date(2026, 10, 19)
+    assert snapshot_date_for(datetime(2026, 10, 18, 23, 59, tzinfo=UTC)) == date(2026, 10, 18)
+
+
+def test_partition_name() -> None:
+    assert partition_name(pantry_item_costs, date(2026, 1, 5)) == "pantry_item_costs_p20260105"
+
+
+def test_create_pantry_partitions_skips_existing_days() -> None:
+    conn = MagicMock()
+    conn.execute.return_value.scalars.return_value = ["pantry_items_p20261018", "pantry_items_default"]
+
+    created = create_pantry_partitions(conn, date(2026, 10, 18), date(2026, 10, 19))
+
+    assert created == 1
+    statements = [str(call.args[0]) for call in conn.execute.call_args_list]
+    attached = [statement for statement in statements if "ATTACH PARTITION" in statement]
+    assert len(attached) == len(PARTITIONED_TABLES)
+    assert attached[0] == (
+        "ALTER TABLE pantry_items ATTACH PARTITION pantry_items_p20261019 "
+        "FOR VALUES FROM ('2026-10-19') TO ('2026-10-20')"
+    )
+
+
+def test_create_pantry_partitions_moves_the_days_rows_out_of_the_default_partition() -> None:
+    conn = MagicMock()
+    conn.execute.return_value.scalars.return_value = []
+
+    create_pantry_partitions(conn, date(2026, 10, 19), date(2026, 10, 19))
+
+    statements = [str(call.args[0]) for call in conn.execute.call_args_list]
+    created = statements.index("CREATE TABLE pantry_items_p20261019 (LIKE pantry_items INCLUDING DEFAULTS)")
+    moves = [statement for statement in statements if statement.startswith("WITH moved AS")]
+    assert [move.split()[5] for move in moves] == [f"{table.name}_default" for table in reversed(PARTITIONED_TABLES)]
+    assert moves[-1] == (
+        "WITH moved AS (DELETE FROM pantry_items_default "
+        "WHERE snapshot_date >= '2026-10-19' AND snapshot_date < '2026-10-20' RETURNING *) "
+        "INSERT INTO pantry_items_p20261019 SELECT * FROM moved"
+    )
+    # Rows are moved before any partition is attached, so the attach never finds them in the default partition
+    first_attach = next(i for i, statement in enumerate(statements) if "ATTACH PARTITION" in statement)
+    assert created < statements.index(moves[-1]) < first_attach
+
+
+def test_create_pantry_partitions_without_missing_days_runs_no_ddl() -> None:
+    conn = MagicMock()
+    conn.execute.return_value.scalars.return_value = ["pantry_items_p20261018"]
+
+    assert create_pantry_partitions(conn, date(2026, 10, 18), date(2026, 10, 18)) == 0
+    assert conn.execute.call_count == 1
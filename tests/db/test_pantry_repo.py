@@ -1,15 +1,28 @@
 from collections.abc import Iterator
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from unittest.mock import MagicMock, patch
 from uuid import uuid4
 
 import pytest
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.exc import SQLAlchemyError
 
+from src.core.config import settings
 from src.core.exceptions import ServerError
+from src.db.pantry_chunks import get_chunk_codec, pantry_chunk_values
+from src.db.pantry_queries import pantry_state_stmt
 from src.db.pantry_repo import PantryRepo
-from src.services.models.pantry import Pantry
-from tests.db.test_data import make_pantry
+from src.services.models.pantry import Pantry, PantrySnapshotStatus, PantryStorageMode, SharedPantrySnapshot
+from tests.db.test_data import make_pantry, make_pantry_item
+
+
+def _saved_state(storage_mode: PantryStorageMode, item_count: int, pages_fetched: int = 1) -> dict:
+    return {
+        "snapshot_date": date(2026, 10, 18),
+        "storage_mode": storage_mode,
+        "pages_fetched": pages_fetched,
+        "item_count": item_count,
+    }
 
 
 @pytest.fixture
@@ -41,9 +54,17 @@ def test_get_partner_pantry_by_id_success(pantry_repo: PantryRepo, mock_connecti
         "pantry_state_timestamp": now,
         "items_available_from": yesterday_dt_str,
         "items_available_until": next_month_dt_str,
+        # Partner cost markups nested in the state row, as decoded from json_agg
+        "cost_markups": [
+            {
+                "applied_from": "2024-01-01T00:00:00+00:00",
+                "applied_until": "2024-12-31T00:00:00+00:00",
+                "markup_percent": 15.0,
+            }
+        ],
     }
 
-    # Pantry items DB row mock
+    # Hydrated pantry items DB row mock, with nested rows as decoded from json_agg
     pantry_item_id = uuid4()
     pantry_items_rows = [
         {
@@ -52,51 +73,22 @@ def test_get_partner_pantry_by_id_success(pantry_repo: PantryRepo, mock_connecti
             "amount": 2.5,
             "units": "kg",
             "is_prepped_and_ready": True,
+            "costs": [
+                {"production_cost_us_dollars": 12.34, "applied_from": "2024-01-01", "applied_until": "2024-12-31"}
+            ],
+            "availabilities": [{"applied_from": "2024-01-01", "applied_until": "2024-12-31"}],
+            "custom_fields": [{"key": "field1", "value": "value1"}],
         }
     ]
-
-    # Costs, availabilities, custom fields
-    pantry_item_costs_rows = [
-        {
-            "pantry_item_id": pantry_item_id,
-            "production_cost_us_dollars": 12.34,
-            "applied_from": "2024-01-01 00:00:00",
-            "applied_until": "2024-12-31 00:00:00",
-        }
-    ]
-    pantry_item_availabilities_rows = [
-        {
-            "pantry_item_id": pantry_item_id,
-            "applied_from": "2024-01-01 00:00:00",
-            "applied_until": "2024-12-31 00:00:00",
-        }
-    ]
-    pantry_item_custom_fields_rows = [{"pantry_item_id": pantry_item_id, "key": "field1", "value": "value1"}]
-    partner_cost_markups_rows = [
-        {
-            "applied_from": "2024-01-01 00:00:00",
-            "applied_until": "2024-12-31 00:00:00",
-            "markup_percent": 15.0,
-        }
-    ]
-
     # Set up the execute/mappings/return pattern per query in sequence
     mock_connection.__enter__.return_value = mock_connection
     mock_connection.execute.side_effect = [
-        # 1. pantry_states
+        # 1. pantry_states with nested cost_markups
         MagicMock(mappings=MagicMock(return_value=MagicMock(fetchone=MagicMock(return_value=pantry_state_row)))),
         # 2. total_count
         MagicMock(scalar=MagicMock(return_value=len(pantry_items_rows))),
-        # 3. pantry_items
+        # 3. pantry_items with nested costs, availabilities and custom fields
         MagicMock(mappings=MagicMock(return_value=MagicMock(fetchall=MagicMock(return_value=pantry_items_rows)))),
-        # 4. costs
-        MagicMock(mappings=MagicMock(return_value=pantry_item_costs_rows)),
-        # 5. availabilities
-        MagicMock(mappings=MagicMock(return_value=pantry_item_availabilities_rows)),
-        # 6. custom_fields
-        MagicMock(mappings=MagicMock(return_value=pantry_item_custom_fields_rows)),
-        # 7. cost_markups
-        MagicMock(mappings=MagicMock(return_value=partner_cost_markups_rows)),
     ]
 
     pantry, total_count = pantry_repo.get_partner_pantry_by_id(str(pantry_state_id), str(partner_id), 100)
@@ -121,6 +113,297 @@ def test_get_partner_pantry_by_id_success(pantry_repo: PantryRepo, mock_connecti
     assert item.custom_fields[0].key == "field1"
     assert len(pantry.partner_cost_markup) == 1
     assert pantry.partner_cost_markup[0].markup_percent == 15.0
+    assert pantry.partner_cost_markup[0].applied_from == datetime.fromisoformat("2024-01-01T00:00:00+00:00")
+    assert mock_connection.execute.call_count == 3
+
+
+def test_get_partner_pantry_by_id_handles_items_without_nested_rows(
+    pantry_repo: PantryRepo, mock_connection: MagicMock
+) -> None:
+    pantry_state_id = uuid4()
+    pantry_state_row = {
+        "partner_id": "TC-MAIN",
+        "pantry_state_id": pantry_state_id,
+        "pantry_state_timestamp": datetime.now(),
+        "items_available_from": None,
+        "items_available_until": None,
+        "item_count": 1,
+        "cost_markups": None,
+    }
+    pantry_items_rows = [
+        {
+            "pantry_item_id": uuid4(),
+            "description": "Bare item",
+            "amount": 1,
+            "units": "ea",
+            "is_prepped_and_ready": False,
+            "costs": None,
+            "availabilities": [{"applied_from": "2024-01-01", "applied_until": None}],
+            "custom_fields": None,
+        }
+    ]
+
+    mock_connection.__enter__.return_value = mock_connection
+    mock_connection.execute.side_effect = [
+        MagicMock(mappings=MagicMock(return_value=MagicMock(fetchone=MagicMock(return_value=pantry_state_row)))),
+        MagicMock(mappings=MagicMock(return_value=MagicMock(fetchall=MagicMock(return_value=pantry_items_rows)))),
+    ]
+
+    pantry, _ = pantry_repo.get_partner_pantry_by_id(str(pantry_state_id), "TC-MAIN", 100)
+
+    assert pantry is not None
+    item = pantry.pantry_items[0]
+    assert item.cost == []
+    assert item.custom_fields == []
+    assert item.availability[0].available_from == datetime(2024, 1, 1)
+    assert item.availability[0].available_until is None
+
+
+def test_get_partner_pantry_by_id_with_cursor_uses_stored_count(
+    pantry_repo: PantryRepo, mock_connection: MagicMock
+) -> None:
+    pantry_state_id = uuid4()
+    pantry_state_row = {
+        "partner_id": "TC-MAIN",
+        "pantry_state_id": pantry_state_id,
+        "pantry_state_timestamp": datetime.now(),
+        "items_available_from": None,
+        "items_available_until": None,
+        "item_count": 250,
+    }
+
+    mock_connection.__enter__.return_value = mock_connection
+    mock_connection.execute.side_effect = [
+        MagicMock(mappings=MagicMock(return_value=MagicMock(fetchone=MagicMock(return_value=pantry_state_row)))),
+        MagicMock(mappings=MagicMock(return_value=MagicMock(fetchall=MagicMock(return_value=[])))),
+    ]
+
+    pantry, total_count = pantry_repo.get_partner_pantry_by_id(
+        str(pantry_state_id), "TC-MAIN", 100, after=str(uuid4())
+    )
+
+    assert pantry is not None
+    assert pantry.pantry_items == []
+    assert total_count == 250
+    assert mock_connection.execute.call_count == 2
+    items_stmt = str(mock_connection.execute.call_args_list[1].args[0])
+    assert "pantry_items.pantry_item_id >" in items_stmt
+    assert "OFFSET" not in items_stmt
+
+
+def test_get_partner_pantry_by_id_blob_mode_reads_chunks(pantry_repo: PantryRepo, mock_connection: MagicMock) -> None:
+    pantry_state_id = uuid4()
+    items = [make_pantry_item() for _ in range(3)]
+    codec = get_chunk_codec("zlib-json")
+    chunk = pantry_chunk_values(pantry_state_id, date(2026, 10, 18), 0, 0, items, codec)
+    pantry_state_row = {
+        "partner_id": "TC-MAIN",
+        "pantry_state_id": pantry_state_id,
+        "pantry_state_timestamp": datetime.now(),
+        "items_available_from": None,
+        "items_available_until": None,
+        "snapshot_date": date(2026, 10, 18),
+        "storage_mode": PantryStorageMode.BLOB,
+        "item_count": len(items),
+        "cost_markups": None,
+    }
+
+    mock_connection.__enter__.return_value = mock_connection
+    mock_connection.execute.side_effect = [
+        MagicMock(mappings=MagicMock(return_value=MagicMock(fetchone=MagicMock(return_value=pantry_state_row)))),
+        # Cursor offset: the item after the first one
+        MagicMock(scalar=MagicMock(return_value=1)),
+        MagicMock(mappings=MagicMock(return_value=[chunk])),
+    ]
+
+    pantry, total_count = pantry_repo.get_partner_pantry_by_id(
+        str(pantry_state_id), "TC-MAIN", 100, after=items[0].id
+    )
+
+    assert pantry is not None
+    assert total_count == len(items)
+    assert [item.id for item in pantry.pantry_items] == [item.id for item in items[1:]]
+    chunks_stmt = str(mock_connection.execute.call_args_list[2].args[0])
+    assert "pantry_item_chunks.snapshot_date =" in chunks_stmt
+
+
+def test_get_partner_pantry_by_id_reference_reads_shared_snapshot(
+    pantry_repo: PantryRepo, mock_connection: MagicMock
+) -> None:
+    pantry_state_id, source_id = uuid4(), uuid4()
+    pantry_state_row = {
+        "partner_id": "TC-MAIN",
+        "pantry_state_id": pantry_state_id,
+        "pantry_state_timestamp": datetime.now(),
+        "items_available_from": None,
+        "items_available_until": None,
+        "snapshot_date": date(2026, 10, 18),
+        "item_count": 1,
+        "source_pantry_state_id": source_id,
+        "items_pantry_state_id": source_id,
+        "cost_markups": None,
+    }
+    item_row = {
+        "pantry_item_id": uuid4(),
+        "description": "Shared item",
+        "amount": 1,
+        "units": "oz",
+        "is_prepped_and_ready": False,
+        "costs": [],
+        "availabilities": [],
+        "custom_fields": [],
+    }
+
+    mock_connection.__enter__.return_value = mock_connection
+    mock_connection.execute.side_effect = [
+        MagicMock(mappings=MagicMock(return_value=MagicMock(fetchone=MagicMock(return_value=pantry_state_row)))),
+        MagicMock(mappings=MagicMock(return_value=MagicMock(fetchall=MagicMock(return_value=[item_row])))),
+    ]
+
+    pantry, _ = pantry_repo.get_partner_pantry_by_id(str(pantry_state_id), "TC-MAIN", 100)
+
+    assert pantry is not None
+    assert pantry.pantry_state_id == str(pantry_state_id)
+    assert pantry.partner_costs_applied is False
+    items_stmt = mock_connection.execute.call_args_list[1].args[0]
+    assert source_id in items_stmt.compile().params.values()
+
+
+def test_pantry_state_stmt_takes_item_columns_from_source() -> None:
+    stmt = str(pantry_state_stmt(uuid4(), "TC-MAIN").compile(dialect=postgresql.dialect()))
+
+    assert "LEFT OUTER JOIN pantry_states AS source_state" in stmt
+    assert "coalesce(source_state.item_count, pantry_states.item_count) AS item_count" in stmt
+    assert "AS items_pantry_state_id" in stmt
+    assert "cost_markups" not in stmt
+
+
+def test_pantry_state_stmt_can_nest_partner_cost_markups() -> None:
+    stmt = str(pantry_state_stmt(uuid4(), "TC-MAIN", with_cost_markups=True).compile(dialect=postgresql.dialect()))
+
+    assert "json_agg" in stmt
+    assert "cost_markups.partner_id = " in stmt
+    assert "AS cost_markups" in stmt
+
+
+def test_find_shared_pantry_snapshot_returns_newest_match(pantry_repo: PantryRepo, mock_connection: MagicMock) -> None:
+    mock_connection.__enter__.return_value = mock_connection
+    source_id = uuid4()
+    mock_connection.execute.return_value.mappings.return_value.fetchone.return_value = {
+        "pantry_state_id": source_id,
+        "pantry_state_timestamp": datetime(2026, 10, 18, 9),
+    }
+
+    shared = pantry_repo.find_shared_pantry_snapshot(None, datetime(2026, 11, 1), datetime(2026, 10, 18))
+
+    assert shared == SharedPantrySnapshot(pantry_state_id=source_id, pantry_state_timestamp=datetime(2026, 10, 18, 9))
+    stmt = str(mock_connection.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+    assert "pantry_states.partner_id IS NULL" in stmt
+    assert "pantry_states.items_available_from IS NOT DISTINCT FROM" in stmt
+    assert "ORDER BY pantry_states.pantry_state_timestamp DESC" in stmt
+
+
+def test_save_pantry_reference_takes_source_day(pantry_repo: PantryRepo, mock_connection: MagicMock) -> None:
+    mock_connection.__enter__.return_value = mock_connection
+    source = SharedPantrySnapshot(pantry_state_id=uuid4(), pantry_state_timestamp=datetime(2026, 10, 17, 23, 30))
+
+    pantry_repo.save_pantry_reference(uuid4(), "TC-MAIN", source, None, None)
+
+    params = mock_connection.execute.call_args.args[0].compile().params
+    assert params["source_pantry_state_id"] == source.pantry_state_id
+    assert params["snapshot_date"] == date(2026, 10, 17)
+    assert params["partner_id"] == "TC-MAIN"
+    mock_connection.commit.assert_called_once()
+
+
+def test_publish_current_pantry_state_upserts_partner_row(pantry_repo: PantryRepo, mock_connection: MagicMock) -> None:
+    mock_connection.__enter__.return_value = mock_connection
+    pantry_state_id = uuid4()
+
+    pantry_repo.publish_current_pantry_state("TC-MAIN", pantry_state_id, None, None)
+
+    compiled = mock_connection.execute.call_args.args[0].compile(dialect=postgresql.dialect())
+    assert "ON CONFLICT (partner_id) DO UPDATE SET pantry_state_id = excluded.pantry_state_id" in str(compiled)
+    assert compiled.params["pantry_state_id"] == pantry_state_id
+    mock_connection.commit.assert_called_once()
+
+
+def test_get_current_pantry_state_missing_returns_none(pantry_repo: PantryRepo, mock_connection: MagicMock) -> None:
+    mock_connection.__enter__.return_value = mock_connection
+    mock_connection.execute.return_value.mappings.return_value.fetchone.return_value = None
+
+    assert pantry_repo.get_current_pantry_state("TC-MAIN") is None
+
+
+def test_get_partner_pantry_by_id_invalid_cursor_raises(pantry_repo: PantryRepo) -> None:
+    with pytest.raises(ValueError, match="Invalid pantry page cursor"):
+        pantry_repo.get_partner_pantry_by_id(str(uuid4()), "TC-MAIN", 100, after="not-a-uuid")
+
+
+def test_finish_pantry_crawl_success(pantry_repo: PantryRepo, mock_connection: MagicMock) -> None:
+    mock_connection.__enter__.return_value = mock_connection
+
+    pantry_repo.finish_pantry_crawl(uuid4(), PantrySnapshotStatus.COMPLETE)
+
+    assert mock_connection.execute.call_count == 1
+    stmt = mock_connection.execute.call_args.args[0]
+    assert stmt.compile().params["crawl_status"] == PantrySnapshotStatus.COMPLETE
+    mock_connection.commit.assert_called_once()
+
+
+def test_get_pantry_snapshot_progress_success(pantry_repo: PantryRepo, mock_connection: MagicMock) -> None:
+    pantry_state_id = uuid4()
+    finished_at = datetime.now()
+    pantry_state_row = {
+        "pantry_state_id": pantry_state_id,
+        "item_count": 250,
+        "crawl_status": "complete",
+        "pages_fetched": 3,
+        "crawl_finished_at": finished_at,
+    }
+    mock_connection.__enter__.return_value = mock_connection
+    mock_connection.execute.return_value.mappings.return_value.fetchone.return_value = pantry_state_row
+
+    progress = pantry_repo.get_pantry_snapshot_progress(str(pantry_state_id), "TC-MAIN")
+
+    assert progress is not None
+    assert progress.status == PantrySnapshotStatus.COMPLETE
+    assert progress.pages_fetched == 3
+    assert progress.item_count == 250
+    assert progress.finished_at == finished_at
+
+
+def test_claim_stale_pantry_crawls_returns_checkpoints(pantry_repo: PantryRepo, mock_connection: MagicMock) -> None:
+    pantry_state_id = uuid4()
+    claimed_row = {
+        "pantry_state_id": pantry_state_id,
+        "partner_id": "TC-MAIN",
+        "pantry_state_timestamp": datetime.now(),
+        "items_available_from": None,
+        "items_available_until": None,
+        "brand_name": None,
+        "crawl_page_size": 50,
+        "last_page_saved": 4,
+        "crawl_attempts": 2,
+    }
+    mock_connection.__enter__.return_value = mock_connection
+    mock_connection.execute.return_value.mappings.return_value.fetchall.return_value = [claimed_row]
+
+    checkpoints = pantry_repo.claim_stale_pantry_crawls(datetime.now(), limit=5)
+
+    assert [checkpoint.pantry_state_id for checkpoint in checkpoints] == [pantry_state_id]
+    assert checkpoints[0].last_page_saved == 4
+    assert checkpoints[0].brand_name == ""
+    stmt = str(mock_connection.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+    assert "FOR UPDATE SKIP LOCKED" in stmt
+    mock_connection.commit.assert_called_once()
+
+
+def test_get_pantry_snapshot_progress_missing_state(pantry_repo: PantryRepo, mock_connection: MagicMock) -> None:
+    mock_connection.__enter__.return_value = mock_connection
+    mock_connection.execute.return_value.mappings.return_value.fetchone.return_value = None
+
+    assert pantry_repo.get_pantry_snapshot_progress(str(uuid4()), "TC-MAIN") is None
 
 
 def test_get_partner_pantry_by_id_db_error(pantry_repo: PantryRepo, mock_connection: MagicMock) -> None:
@@ -164,8 +447,68 @@ def test_save_pantry_items_success(pantry_repo: PantryRepo, mock_connection: Mag
     mock_connection.__enter__.return_value = mock_connection
 
     pantry = make_pantry()
+    mock_connection.execute.return_value.mappings.return_value.fetchone.return_value = _saved_state(
+        PantryStorageMode.RELATIONAL, item_count=len(pantry.pantry_items)
+    )
+
     pantry_repo.save_pantry_items(pantry_state_id=uuid4(), items=pantry.pantry_items)
-    assert mock_connection.execute.call_count == 5
+    assert mock_connection.execute.call_count == 6
+    # Progress is updated first: it returns the snapshot date that picks the rows' partition
+    progress_stmt = mock_connection.execute.call_args_list[0].args[0]
+    assert "pages_fetched=(pantry_states.pages_fetched +" in str(progress_stmt)
+    assert "RETURNING pantry_states.snapshot_date" in str(progress_stmt)
+    item_params = mock_connection.execute.call_args_list[1].args[1]
+    assert item_params[0]["snapshot_date"] == date(2026, 10, 18)
+
+
+def test_save_pantry_items_blob_mode_writes_lookup_rows_and_one_chunk(
+    pantry_repo: PantryRepo, mock_connection: MagicMock
+) -> None:
+    mock_connection.__enter__.return_value = mock_connection
+    pantry = make_pantry()
+    # Third page of the crawl: 10 items were saved before this one
+    mock_connection.execute.return_value.mappings.return_value.fetchone.return_value = _saved_state(
+        PantryStorageMode.BLOB, item_count=10 + len(pantry.pantry_items), pages_fetched=3
+    )
+
+    with patch.object(settings, "PANTRY_BLOB_CODEC", "zlib-json"):
+        pantry_repo.save_pantry_items(pantry_state_id=uuid4(), items=pantry.pantry_items)
+
+    # Progress, pantry items, data sources and the chunk; no cost, availability or custom field rows
+    assert mock_connection.execute.call_count == 4
+    chunk_stmt = mock_connection.execute.call_args_list[3].args[0]
+    assert chunk_stmt.table.name == "pantry_item_chunks"
+    chunk_params = chunk_stmt.compile().params
+    assert chunk_params["chunk_no"] == 2
+    assert chunk_params["item_offset"] == 10
+    assert chunk_params["item_count"] == len(pantry.pantry_items)
+    assert chunk_params["encoding"] == "zlib-json"
+    mock_connection.commit.assert_called_once()
+
+
+def test_save_pantry_items_blob_mode_unavailable_codec_raises(
+    pantry_repo: PantryRepo, mock_connection: MagicMock
+) -> None:
+    mock_connection.__enter__.return_value = mock_connection
+    pantry = make_pantry()
+    mock_connection.execute.return_value.mappings.return_value.fetchone.return_value = _saved_state(
+        PantryStorageMode.BLOB, item_count=len(pantry.pantry_items)
+    )
+
+    with patch.object(settings, "PANTRY_BLOB_CODEC", "lz4-arrow"), pytest.raises(ServerError, match="codec"):
+        pantry_repo.save_pantry_items(pantry_state_id=uuid4(), items=pantry.pantry_items)
+    mock_connection.commit.assert_not_called()
+
+
+def test_save_pantry_items_checkpoints_page(pantry_repo: PantryRepo, mock_connection: MagicMock) -> None:
+    mock_connection.__enter__.return_value = mock_connection
+
+    pantry = make_pantry()
+    pantry_repo.save_pantry_items(pantry_state_id=uuid4(), items=pantry.pantry_items, page_number=7)
+
+    progress_stmt = mock_connection.execute.call_args_list[0].args[0]
+    assert progress_stmt.compile().params["last_page_saved"] == 7
+    mock_connection.commit.assert_called_once()
 
 
 def test_save_pantry_items_missing_data_source_raises(pantry_repo: PantryRepo) -> None:
@@ -176,6 +519,16 @@ def test_save_pantry_items_missing_data_source_raises(pantry_repo: PantryRepo) -
         pantry_repo.save_pantry_items(pantry_state_id=uuid4(), items=pantry.pantry_items)
 
 
+def test_save_pantry_items_missing_state_raises(pantry_repo: PantryRepo, mock_connection: MagicMock) -> None:
+    mock_connection.__enter__.return_value = mock_connection
+    mock_connection.execute.return_value.mappings.return_value.fetchone.return_value = None
+
+    pantry = make_pantry()
+    with pytest.raises(ServerError, match="not found"):
+        pantry_repo.save_pantry_items(pantry_state_id=uuid4(), items=pantry.pantry_items)
+    mock_connection.commit.assert_not_called()
+
+
 def test_save_pantry_items_db_error_raises(pantry_repo: PantryRepo, mock_connection: MagicMock) -> None:
     mock_connection.__enter__.side_effect = SQLAlchemyError("DB broke")
     pantry = make_pantry()
@@ -185,12 +538,90 @@ def test_save_pantry_items_db_error_raises(pantry_repo: PantryRepo, mock_connect
 
 def test_delete_pantry_success(pantry_repo: PantryRepo, mock_connection: MagicMock) -> None:
     mock_connection.__enter__.return_value = mock_connection
+    mock_connection.execute.return_value.scalar.return_value = date(2026, 10, 18)
     pantry_repo.delete_pantry(uuid4())
 
-    assert mock_connection.execute.call_count == 6
+    assert mock_connection.execute.call_count == 8
+    costs_stmt = mock_connection.execute.call_args_list[1].args[0]
+    assert "pantry_item_costs.snapshot_date =" in str(costs_stmt)
+
+
+def test_delete_pantry_missing_state_is_noop(pantry_repo: PantryRepo, mock_connection: MagicMock) -> None:
+    mock_connection.__enter__.return_value = mock_connection
+    mock_connection.execute.return_value.scalar.return_value = None
+    pantry_repo.delete_pantry(uuid4())
+
+    assert mock_connection.execute.call_count == 1
+    mock_connection.commit.assert_not_called()
+
+
+def test_drop_pantry_partitions_before_drops_each_expired_day(
+    pantry_repo: PantryRepo, mock_connection: MagicMock
+) -> None:
+    mock_connection.__enter__.return_value = mock_connection
+    mock_connection.execute.return_value.scalars.return_value = [
+        "pantry_items_p20260902",
+        "pantry_items_default",
+        "pantry_items_p20260901",
+        "pantry_items_p20261018",
+    ]
+
+    dropped = pantry_repo.drop_pantry_partitions_before(date(2026, 10, 1))
+
+    assert dropped == [date(2026, 9, 1), date(2026, 9, 2)]
+    statements = [str(call.args[0]) for call in mock_connection.execute.call_args_list]
+    assert "DROP TABLE IF EXISTS pantry_items_p20260901" in statements
+    assert "ALTER TABLE pantry_items DETACH PARTITION pantry_items_p20260902" in statements
+    assert not any("p20261018" in statement for statement in statements)
+    # One commit after listing, one per dropped day and one after the sweep of leftover states
+    assert mock_connection.commit.call_count == 4
+
+
+def test_drop_pantry_partitions_before_db_error_raises(pantry_repo: PantryRepo, mock_connection: MagicMock) -> None:
+    mock_connection.__enter__.side_effect = SQLAlchemyError("DB broke")
+    with pytest.raises(ServerError):
+        pantry_repo.drop_pantry_partitions_before(date(2026, 10, 1))
 
 
 def test_delete_pantry_db_error_raises(pantry_repo: PantryRepo, mock_connection: MagicMock) -> None:
     mock_connection.__enter__.side_effect = SQLAlchemyError("DB broke")
     with pytest.raises(ServerError):
         pantry_repo.delete_pantry(uuid4())
+
+
+def test_get_pantry_item_data_by_culops_ids_resolves_pairs_in_one_query(
+    pantry_repo: PantryRepo, mock_connection: MagicMock
+) -> None:
+    mock_connection.__enter__.return_value = mock_connection
+    first_item_id, duplicate_item_id = uuid4(), uuid4()
+    mock_connection.execute.return_value.mappings.return_value = [
+        {
+            "pantry_item_id": first_item_id,
+            "is_prepped_and_ready": True,
+            "culops_culinary_ingredient_specification_id": 10,
+            "culops_culinary_ingredient_id": 1,
+        },
+        {
+            "pantry_item_id": duplicate_item_id,
+            "is_prepped_and_ready": False,
+            "culops_culinary_ingredient_specification_id": 10,
+            "culops_culinary_ingredient_id": 1,
+        },
+    ]
+
+    result = pantry_repo.get_pantry_item_data_by_culops_culinary_ingredient_and_specification_ids(
+        [(10, 1), (20, 2), (10, 1)]
+    )
+
+    assert mock_connection.execute.call_count == 1
+    assert list(result) == [(10, 1)]
+    assert result[(10, 1)].pantry_item_id == str(first_item_id)
+    assert result[(10, 1)].is_prepped_and_ready is True
+
+
+def test_get_pantry_item_data_by_culops_ids_db_error_raises(
+    pantry_repo: PantryRepo, mock_connection: MagicMock
+) -> None:
+    mock_connection.__enter__.side_effect = SQLAlchemyError("DB broke")
+    with pytest.raises(ServerError):
+        pantry_repo.get_pantry_item_data_by_culops_culinary_ingredient_and_specification_ids([(10, 1)])
@@ -8,6 +8,7 @@ from sqlalchemy.exc import SQLAlchemyError
 from src.core.constants import RecipeStatus
 from src.core.exceptions import ServerError
 from src.db.recipes_repo import RecipesRepo
+from src.services.models.recipe import RecipeRef
 
 partner_id = "TC-MAIN"
 
@@ -263,3 +264,41 @@ def test_get_culops_recipe_ref_by_sku_db_error(recipes_repo: RecipesRepo, mock_c
         recipes_repo.get_culops_recipe_ref_by_sku(partner_id=partner_id, sku=sku)
 
     assert f"failed to get recipe by sku {sku}" in str(exc_info.value)
+
+
+def test_store_recipe_sources_inserts_in_bulk(recipes_repo: RecipesRepo, mock_connection: MagicMock) -> None:
+    refs = [RecipeRef(culops_recipe_id=i, recipe_id=uuid4(), culops_product_sku=f"SKU-{i}") for i in range(3)]
+
+    recipes_repo.store_recipe_sources(partner_id, refs, is_external=True)
+
+    assert mock_connection.execute.call_count == 2
+    assert mock_connection.commit.call_count == 1
+    recipes_rows = mock_connection.execute.call_args_list[0][0][1]
+    sources_rows = mock_connection.execute.call_args_list[1][0][1]
+    assert [row["externally_created"] for row in recipes_rows] == [True, True, True]
+    assert [row["culops_recipe_id"] for row in sources_rows] == [0, 1, 2]
+
+
+def test_store_recipe_sources_empty_skips_db(recipes_repo: RecipesRepo, mock_connection: MagicMock) -> None:
+    recipes_repo.store_recipe_sources(partner_id, [])
+
+    mock_connection.execute.assert_not_called()
+
+
+def test_get_recipe_ids_by_culops_recipe_ids_success(recipes_repo: RecipesRepo, mock_connection: MagicMock) -> None:
+    recipe_id = uuid4()
+    mock_connection.execute.return_value.mappings.return_value = [
+        {"culops_recipe_id": 123, "recipe_id": recipe_id}
+    ]
+
+    result = recipes_repo.get_recipe_ids_by_culops_recipe_ids([123, 456])
+
+    assert result == {123: recipe_id}
+    assert mock_connection.execute.call_count == 1
+
+
+def test_get_recipe_ids_by_culops_recipe_ids_db_error(recipes_repo: RecipesRepo, mock_connection: MagicMock) -> None:
+    mock_connection.execute.side_effect = SQLAlchemyError("DB Error")
+
+    with pytest.raises(ServerError):
+        recipes_repo.get_recipe_ids_by_culops_recipe_ids([123])
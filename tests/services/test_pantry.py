@@ -1,9 +1,10 @@
 import base64
 import json
-from datetime import UTC, datetime
+import threading
+from datetime import UTC, datetime, timedelta
 from typing import Any
-from unittest.mock import MagicMock, patch
-from uuid import UUID
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import UUID, uuid4
 
 import pytest
 
@@ -11,19 +12,25 @@ from src.api.routes.v1.models import (
     PantryItemAvailability as ResponsePantryItemAvailability,
 )
 from src.clients.culops.culops import CulOpsService
-from src.core.exceptions import ServerError
+from src.core.exceptions import NotFoundException, ServerError
 from src.db.mocks.pantry_data import MockPantryDB
 from src.db.mocks.partner_data import MockPartnerDB
 from src.interfaces.pantry_db_interface import PantryDBInterface
 from src.interfaces.partner_repo_interface import PartnerRepoInterface
 from src.services.models.pantry import (
+    CurrentPantryState,
     Pantry,
     PantryItem,
     PantryItemAvailability,
     PantryItemCost,
+    PantryPageInfo,
+    PantrySnapshotStatus,
     PartnerCostMarkup,
+    SharedPantrySnapshot,
 )
-from src.services.pantry import PantryService
+from src.services.pantry import AsyncPantryService, PantryService
+from src.services.pantry_cost import PartnerPriceCache, price_items
+from src.services.pantry_crawl_scheduler import CrawlScheduler
 from src.services.partner import PartnerService
 from src.utils.datetime_helper import parse_to_datetime
 from src.utils.generate_pantry_mocks import generate_mock_pantry_items
@@ -190,6 +197,13 @@ def test_get_pantry_missing_partner_id_raises() -> None:
         svc.get_pantry(partner_id="")
 
 
+def test_get_pantry_cursor_without_pantry_state_id_raises() -> None:
+    svc = PantryService(MagicMock(), MagicMock(), MagicMock())
+
+    with pytest.raises(ValueError, match="Cursor pagination requires a pantry state id"):
+        svc.get_pantry(partner_id="123", after="00000000-0000-0000-0000-000000000000")
+
+
 def test_get_pantry_save_state_failure_raises_no_delete() -> None:
     from uuid import UUID
 
@@ -280,6 +294,238 @@ def test_get_pantry_no_pantry_found_raises() -> None:
             svc.get_pantry(partner_id="123")
 
 
+def test_crawl_marks_snapshot_complete() -> None:
+    mock_pantry_db = MagicMock()
+    mock_culops = MagicMock()
+    mock_culops.get_partner_culops_pantry_data.return_value = iter(
+        [(generate_mock_pantry_items(items_per_pantry=2, seed=1), False)]
+    )
+    svc = PantryService(mock_pantry_db, mock_culops, MagicMock())
+    state_id = UUID("00000000-0000-0000-0000-000000000001")
+
+    svc._fetch_and_cache_all_items(state_id, "123", datetime.now(UTC), None, None, [], [], "")
+
+    assert mock_pantry_db.save_pantry_items.call_count == 2
+    mock_pantry_db.finish_pantry_crawl.assert_called_once_with(state_id, PantrySnapshotStatus.COMPLETE)
+
+
+def test_crawl_failure_marks_snapshot_failed() -> None:
+    mock_pantry_db = MagicMock()
+    mock_culops = MagicMock()
+    mock_culops.get_partner_culops_pantry_data.side_effect = ServerError("culops down")
+    svc = PantryService(mock_pantry_db, mock_culops, MagicMock())
+    state_id = UUID("00000000-0000-0000-0000-000000000002")
+
+    with pytest.raises(ServerError):
+        svc._fetch_and_cache_all_items(state_id, "123", datetime.now(UTC), None, None, [], [], "")
+
+    mock_pantry_db.finish_pantry_crawl.assert_called_once_with(state_id, PantrySnapshotStatus.FAILED)
+
+
+def test_reference_shared_snapshot_reuses_stored_snapshot() -> None:
+    source = SharedPantrySnapshot(
+        pantry_state_id=UUID("00000000-0000-0000-0000-0000000000a1"), pantry_state_timestamp=datetime(2026, 10, 18)
+    )
+    mock_pantry_db = MagicMock()
+    mock_pantry_db.find_shared_pantry_snapshot.return_value = source
+    scheduler = MagicMock()
+    svc = PantryService(mock_pantry_db, MagicMock(), MagicMock(), crawl_scheduler=scheduler)
+    pantry = Pantry(
+        pantry_state_id="00000000-0000-0000-0000-0000000000b1",
+        partner_id="123",
+        pantry_state_timestamp=datetime.now(UTC),
+        pantry_items=[],
+        partner_cost_markup=[],
+    )
+
+    with patch("src.services.pantry.settings.PANTRY_SHARED_SNAPSHOTS_ENABLED", True):
+        result = svc.cache_pantry_in_background(pantry, [], "")
+
+    scheduler.submit.assert_not_called()
+    reference = mock_pantry_db.save_pantry_reference.call_args.kwargs
+    assert reference["pantry_state_id"] == UUID(pantry.pantry_state_id)
+    assert reference["source"] == source
+    assert result.pantry_state_id == pantry.pantry_state_id
+    assert result.pantry_state_timestamp == source.pantry_state_timestamp
+
+
+def test_reference_shared_snapshot_starts_one_crawl_per_window() -> None:
+    mock_pantry_db = MagicMock()
+    mock_pantry_db.find_shared_pantry_snapshot.return_value = None
+    scheduler = CrawlScheduler(max_workers=1, max_queued=4)
+    gate = threading.Event()
+    mock_culops = MagicMock()
+    mock_culops.get_partner_culops_pantry_data.side_effect = lambda **_: (gate.wait(5), iter([]))[1]
+    svc = PantryService(mock_pantry_db, mock_culops, MagicMock(), crawl_scheduler=scheduler)
+    window = parse_to_datetime("2025-01-01")
+
+    sources = []
+    with patch("src.services.pantry.settings.PANTRY_SHARED_SNAPSHOTS_ENABLED", True):
+        for partner_id in ("123", "456"):
+            pantry = Pantry(
+                pantry_state_id=str(uuid4()),
+                partner_id=partner_id,
+                pantry_state_timestamp=datetime.now(UTC),
+                ingredients_available_from=window,
+                pantry_items=[],
+                partner_cost_markup=[],
+            )
+            svc.cache_pantry_in_background(pantry, [], "")
+            sources.append(mock_pantry_db.save_pantry_reference.call_args.kwargs["source"])
+    gate.set()
+    scheduler.shutdown()
+
+    # Both partners reference the one shared crawl, which is stored without a partner
+    assert sources[0] == sources[1]
+    assert scheduler.metrics()["deduplicated_total"] == 1
+    state = mock_pantry_db.save_pantry_state.call_args.kwargs
+    assert state["pantry_state_id"] == sources[0].pantry_state_id
+    assert state["partner_id"] is None
+
+
+def test_shared_crawl_stores_culops_costs() -> None:
+    mock_pantry_db = MagicMock()
+    items = generate_mock_pantry_items(items_per_pantry=2, seed=1)
+    costs = [item.cost for item in items]
+    mock_culops = MagicMock()
+    mock_culops.get_partner_culops_pantry_data.return_value = iter([(items, False)])
+    svc = PantryService(mock_pantry_db, mock_culops, MagicMock())
+    state_id = UUID("00000000-0000-0000-0000-0000000000c1")
+
+    svc._crawl_shared_snapshot(state_id, datetime.now(UTC), None, None)
+
+    saved = mock_pantry_db.save_pantry_items.call_args.kwargs["items"]
+    assert [item.cost for item in saved] == costs
+    mock_pantry_db.finish_pantry_crawl.assert_called_once_with(state_id, PantrySnapshotStatus.COMPLETE)
+
+
+def test_get_pantry_prices_shared_snapshot_items_on_read() -> None:
+    items = generate_mock_pantry_items(items_per_pantry=3, seed=2)
+    markups = [PartnerCostMarkup(markup_percent=10, applied_from=None, applied_until=None)]
+    expected = price_items(items, markups)
+    mock_pantry_db = MagicMock()
+    mock_pantry_db.get_partner_pantry_by_id.return_value = (
+        Pantry(
+            pantry_state_id="12345",
+            partner_id="123",
+            pantry_state_timestamp=datetime.now(UTC),
+            pantry_items=items,
+            partner_cost_markup=markups,
+            partner_costs_applied=False,
+        ),
+        3,
+    )
+    price_cache = PartnerPriceCache(max_entries=10, ttl_seconds=60)
+    svc = PantryService(mock_pantry_db, MagicMock(), MagicMock(), price_cache=price_cache)
+
+    pantry, _ = svc.get_pantry(partner_id="123", pantry_state_id="12345")
+
+    assert [[cost.production_cost_us_dollars for cost in item.cost] for item in pantry.pantry_items] == [
+        [cost.production_cost_us_dollars for cost in item_costs] for item_costs in expected
+    ]
+    assert price_cache.metrics()["misses"] == 3
+
+
+def _published(pantry_state_id: UUID, age: timedelta, available_from: datetime | None = None) -> CurrentPantryState:
+    return CurrentPantryState(
+        partner_id="123",
+        pantry_state_id=pantry_state_id,
+        items_available_from=available_from,
+        items_available_until=None,
+        published_at=datetime.now(UTC) - age,
+    )
+
+
+def test_get_pantry_serves_fresh_prewarmed_snapshot() -> None:
+    state_id = uuid4()
+    items = generate_mock_pantry_items(items_per_pantry=3, seed=3)
+    mock_pantry_db = MagicMock()
+    mock_pantry_db.get_current_pantry_state.return_value = _published(state_id, timedelta(minutes=5))
+    mock_pantry_db.get_partner_pantry_by_id.return_value = (
+        Pantry(
+            pantry_state_id=str(state_id),
+            partner_id="123",
+            pantry_state_timestamp=datetime.now(UTC),
+            pantry_items=items,
+            partner_cost_markup=[],
+        ),
+        250,
+    )
+    mock_culops = MagicMock()
+    svc = PantryService(mock_pantry_db, mock_culops, MagicMock())
+
+    pantry, total_count = svc.get_pantry(partner_id="123", page_size=3, page=2)
+
+    assert pantry.pantry_state_id == str(state_id)
+    assert [item.id for item in pantry.pantry_items] == [item.id for item in items]
+    assert total_count == 250
+    mock_pantry_db.get_partner_pantry_by_id.assert_called_once_with(
+        pantry_state_id=str(state_id), partner_id="123", page_size=3, page=2
+    )
+    mock_culops.get_partner_culops_pantry_data.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "published",
+    [
+        _published(uuid4(), timedelta(hours=2)),
+        _published(uuid4(), timedelta(minutes=5), available_from=datetime(2025, 1, 1, tzinfo=UTC)),
+    ],
+    ids=["stale", "other-window"],
+)
+def test_get_pantry_fetches_from_culops_without_matching_prewarmed_snapshot(published: CurrentPantryState) -> None:
+    mock_pantry_db = MagicMock()
+    mock_pantry_db.get_current_pantry_state.return_value = published
+    mock_culops = MagicMock()
+    mock_culops.get_partner_culops_pantry_page.return_value = (
+        generate_mock_pantry_items(items_per_pantry=2, seed=1),
+        PantryPageInfo(has_next=False),
+    )
+    partner_service = MagicMock()
+    partner_service.get_partner_cost_markups.return_value = []
+    svc = PantryService(mock_pantry_db, mock_culops, partner_service, crawl_scheduler=MagicMock())
+
+    with patch("src.services.pantry.settings.PANTRY_PREWARM_MAX_AGE_SECONDS", 3600):
+        pantry, _ = svc.get_pantry(partner_id="123")
+
+    assert pantry.pantry_state_id != str(published.pantry_state_id)
+    mock_pantry_db.get_partner_pantry_by_id.assert_not_called()
+    mock_culops.get_partner_culops_pantry_page.assert_called_once()
+
+
+def test_crawl_snapshot_prices_every_page_and_completes() -> None:
+    items = generate_mock_pantry_items(items_per_pantry=2, seed=4)
+    costs = price_items(items, MockPartnerDB.get_pantry_cost_markups())
+    mock_pantry_db = MagicMock()
+    mock_culops = MagicMock()
+    mock_culops.get_partner_culops_pantry_data.return_value = iter([(items, False)])
+    svc = PantryService(mock_pantry_db, mock_culops, PartnerService("123", MockPartnerDB()))
+
+    state_id = svc.crawl_snapshot(None, None)
+
+    assert mock_pantry_db.save_pantry_state.call_args.kwargs["partner_id"] == "123"
+    assert mock_culops.get_partner_culops_pantry_data.call_args.kwargs["start_page"] == 1
+    saved = mock_pantry_db.save_pantry_items.call_args.kwargs["items"]
+    assert [item.cost for item in saved] == costs
+    mock_pantry_db.finish_pantry_crawl.assert_called_once_with(state_id, PantrySnapshotStatus.COMPLETE)
+
+
+@pytest.mark.parametrize(
+    ("page", "page_info", "expected"),
+    [
+        (1, PantryPageInfo(has_next=False), (2, False)),
+        (3, PantryPageInfo(has_next=False), (12, True)),
+        (1, PantryPageInfo(has_next=True, last_page=20), (100, True)),
+        (2, PantryPageInfo(has_next=True), (15, True)),
+    ],
+    ids=["single-page", "last-page", "links-last", "no-links-last"],
+)
+def test_first_page_total_count(page: int, page_info: PantryPageInfo, expected: tuple[int, bool]) -> None:
+    items = generate_mock_pantry_items(items_per_pantry=2, seed=1)
+
+    assert PantryService._first_page_total_count(items, page, 5, page_info) == expected
+
+
 def test_calculate_cost_ranges(
     pantry_service: PantryService,
 ) -> None:
@@ -560,3 +806,80 @@ def test_missing_start_dates(pantry_service: PantryService) -> None:
     ]
 
     assert result == expected
+
+
+@pytest.mark.asyncio
+async def test_async_get_pantry_fetches_first_page_and_schedules_crawl() -> None:
+    first_page = generate_mock_pantry_items(items_per_pantry=3, seed=7)
+    async_pantry_db = MagicMock()
+    async_culops = MagicMock()
+    async_culops.get_partner_culops_pantry_page = AsyncMock(
+        return_value=(first_page, PantryPageInfo(has_next=True, last_page=20))
+    )
+    async_partner_db = MagicMock()
+    async_partner_db.get_partner_cost_markups = AsyncMock(return_value=[])
+    crawl_service = MagicMock()
+    crawl_service.get_partner_cost.return_value = []
+    crawl_service.cache_pantry_in_background.side_effect = lambda pantry, *_, **__: pantry
+    async_pantry_db.get_current_pantry_state = AsyncMock(return_value=None)
+    svc = AsyncPantryService(async_pantry_db, async_culops, async_partner_db, lambda: crawl_service)
+
+    pantry, total_count = await svc.get_pantry(partner_id="123", page_size=3)
+
+    assert [item.id for item in pantry.pantry_items] == [item.id for item in first_page]
+    assert total_count == 60
+    assert pantry.total_count_estimated
+    async_partner_db.get_partner_cost_markups.assert_awaited_once_with("123")
+    crawl_service.cache_pantry_in_background.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_async_get_pantry_by_state_id_not_found_raises() -> None:
+    async_pantry_db = MagicMock()
+    async_pantry_db.get_partner_pantry_by_id = AsyncMock(return_value=(None, 0))
+    svc = AsyncPantryService(async_pantry_db, MagicMock(), MagicMock(), MagicMock())
+
+    with pytest.raises(NotFoundException):
+        await svc.get_pantry(partner_id="123", pantry_state_id="12345")
+
+
+@pytest.mark.asyncio
+async def test_async_get_pantry_client_failure_raises_server_error() -> None:
+    async_culops = MagicMock()
+    async_culops.get_partner_culops_pantry_page = AsyncMock(side_effect=RuntimeError("boom"))
+    async_partner_db = MagicMock()
+    async_partner_db.get_partner_cost_markups = AsyncMock(return_value=[])
+    async_pantry_db = MagicMock()
+    async_pantry_db.get_current_pantry_state = AsyncMock(return_value=None)
+    svc = AsyncPantryService(async_pantry_db, async_culops, async_partner_db, MagicMock())
+
+    with pytest.raises(ServerError):
+        await svc.get_pantry(partner_id="123")
+
+
+@pytest.mark.asyncio
+async def test_async_get_pantry_serves_fresh_prewarmed_snapshot() -> None:
+    state_id = uuid4()
+    items = generate_mock_pantry_items(items_per_pantry=2, seed=8)
+    async_pantry_db = MagicMock()
+    async_pantry_db.get_current_pantry_state = AsyncMock(return_value=_published(state_id, timedelta(minutes=5)))
+    stored = Pantry(
+        pantry_state_id=str(state_id),
+        partner_id="123",
+        pantry_state_timestamp=datetime.now(UTC),
+        pantry_items=items,
+        partner_cost_markup=[],
+    )
+    async_pantry_db.get_partner_pantry_by_id = AsyncMock(return_value=(stored, 2))
+    async_culops = MagicMock()
+    crawl_service_factory = MagicMock()
+    svc = AsyncPantryService(async_pantry_db, async_culops, MagicMock(), crawl_service_factory)
+
+    pantry, total_count = await svc.get_pantry(partner_id="123", page_size=2)
+
+    assert pantry.pantry_state_id == str(state_id)
+    assert total_count == 2
+    assert stored.partner_costs_applied
+    async_culops.get_partner_culops_pantry_page.assert_not_called()
+    # Serving a stored snapshot never builds the sync crawl service
+    crawl_service_factory.assert_not_called()
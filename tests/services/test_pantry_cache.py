@@ -0,0 +1,178 @@
+from datetime import UTC, datetime
+from unittest.mock import MagicMock
+from uuid import UUID
+
+import pytest
+
+from src.api.routes.v1.models import Pantry as ResponsePantry
+from src.core.exceptions import ServerError
+from src.dependancies.pantry_cache import get_pantry_cache, get_pantry_cache_metrics
+from src.services.models.pantry import PantryPageInfo
+from src.services.pantry import PantryService
+from src.services.pantry_cache import PantryResponseCache
+from src.services.pantry_crawl_scheduler import CrawlScheduler, CrawlStatus
+from src.utils.generate_pantry_mocks import generate_mock_pantry_items
+
+
+class FakeCacheBackend:
+    """In-memory stand-in for the Redis tier."""
+
+    def __init__(self) -> None:
+        self.store: dict[str, bytes] = {}
+        self.ttls: dict[str, int] = {}
+        self.fail = False
+
+    def get(self, key: str) -> bytes | None:
+        if self.fail:
+            raise ServerError("backend down")
+        return self.store.get(key)
+
+    def set(self, key: str, value: bytes, ttl_seconds: int) -> None:
+        if self.fail:
+            raise ServerError("backend down")
+        self.store[key] = value
+        self.ttls[key] = ttl_seconds
+
+    def delete(self, key: str) -> None:
+        self.store.pop(key, None)
+
+
+def make_response_pantry() -> ResponsePantry:
+    return ResponsePantry(
+        pantryStateId="state-1",
+        partner_id="123",
+        ingredientsAvailableFrom="2025-01-01",
+        ingredientsAvailableUntil="2025-02-01",
+        pantryStateTimestamp=datetime(2025, 1, 1, tzinfo=UTC),
+        pantryItems=[],
+    )
+
+
+def test_key_is_stable_and_scoped_per_partner() -> None:
+    key = PantryResponseCache.key("123", page=1, brand_name="")
+
+    assert key.startswith("pantry:123:")
+    assert key == PantryResponseCache.key("123", brand_name="", page=1)
+    assert key != PantryResponseCache.key("456", page=1, brand_name="")
+
+
+def test_set_populates_both_tiers_and_remote_hit_refills_local() -> None:
+    backend = FakeCacheBackend()
+    cache = PantryResponseCache(ttl_seconds=60, max_entries=8, remote=backend)
+    pantry = make_response_pantry()
+
+    cache.set("k", pantry, 42)
+    assert backend.ttls["k"] == 60
+
+    # A second process only sees the shared tier
+    other = PantryResponseCache(ttl_seconds=60, max_entries=8, remote=backend)
+    cached = other.get("k")
+
+    assert cached is not None
+    assert cached[0] == pantry
+    assert cached[1] == 42
+    assert other.metrics()["remote"]["hits"] == 1
+    assert other.local.get("k") is not None
+
+
+def test_remote_failure_degrades_to_local_tier() -> None:
+    backend = FakeCacheBackend()
+    backend.fail = True
+    cache = PantryResponseCache(ttl_seconds=60, max_entries=8, remote=backend, remote_retry_seconds=60)
+
+    cache.set("k", make_response_pantry(), 1)
+
+    assert cache.get("k") is not None
+    assert cache.get("missing") is None
+    # The shared tier is bypassed after the first error instead of being retried on every call
+    assert cache.metrics()["remote"]["errors"] == 1
+
+
+@pytest.mark.asyncio
+async def test_async_get_and_set_round_trip() -> None:
+    backend = FakeCacheBackend()
+    cache = PantryResponseCache(ttl_seconds=60, max_entries=8, remote=backend)
+
+    assert await cache.aget("k") is None
+    await cache.aset("k", make_response_pantry(), 3)
+
+    cached = await PantryResponseCache(ttl_seconds=60, max_entries=8, remote=backend).aget("k")
+    assert cached is not None
+    assert cached[1] == 3
+
+
+def test_get_pantry_serves_repeat_requests_from_cache() -> None:
+    culops = MagicMock()
+    culops.get_partner_culops_pantry_page.return_value = (
+        generate_mock_pantry_items(items_per_pantry=2, seed=1),
+        PantryPageInfo(has_next=False),
+    )
+    culops.get_partner_culops_pantry_data.side_effect = lambda **_: iter(
+        [(generate_mock_pantry_items(items_per_pantry=2, seed=1), False)]
+    )
+    partner_service = MagicMock()
+    partner_service.get_partner_cost_markups.return_value = []
+    cache = PantryResponseCache(ttl_seconds=60, max_entries=8, remote=FakeCacheBackend())
+    svc = PantryService(MagicMock(), culops, partner_service, cache=cache)
+
+    first, first_count = svc.get_pantry(partner_id="123", page_size=2)
+    second, second_count = svc.get_pantry(partner_id="123", page_size=2)
+    svc.get_pantry(partner_id="123", page_size=2, brand_name="other")
+
+    assert second.pantry_state_id == first.pantry_state_id
+    assert second_count == first_count == 2
+    assert culops.get_partner_culops_pantry_page.call_count == 2
+    assert cache.metrics()["local"]["hits"] == 1
+
+
+def test_delete_removes_entry_from_both_tiers() -> None:
+    backend = FakeCacheBackend()
+    cache = PantryResponseCache(ttl_seconds=60, max_entries=8, remote=backend)
+    cache.set("k", make_response_pantry(), 1)
+
+    cache.delete("k")
+
+    assert cache.get("k") is None
+    assert "k" not in backend.store
+
+
+def test_get_pantry_evicts_cached_response_when_its_crawl_fails() -> None:
+    culops = MagicMock()
+    culops.get_partner_culops_pantry_page.return_value = (
+        generate_mock_pantry_items(items_per_pantry=2, seed=1),
+        PantryPageInfo(has_next=True, last_page=4),
+    )
+    culops.get_partner_culops_pantry_data.side_effect = lambda **_: iter(
+        [(generate_mock_pantry_items(items_per_pantry=2, seed=1), True)]
+    )
+    partner_service = MagicMock()
+    partner_service.get_partner_cost_markups.return_value = []
+    pantry_db = MagicMock()
+    pantry_db.save_pantry_state.side_effect = RuntimeError("db down")
+    cache = PantryResponseCache(ttl_seconds=60, max_entries=8, remote=FakeCacheBackend())
+    scheduler = CrawlScheduler(max_workers=1, max_queued=1)
+    svc = PantryService(pantry_db, culops, partner_service, crawl_scheduler=scheduler, cache=cache)
+
+    svc.get_pantry(partner_id="123", page_size=2)
+    scheduler.shutdown()
+
+    assert scheduler.metrics()["failed_total"] == 1
+    assert cache.metrics()["local"]["size"] == 0
+
+
+def test_pantry_cache_metrics_are_reported_once_the_cache_is_built(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("src.dependancies.pantry_cache.settings.REDIS_HOST", "")
+    get_pantry_cache.cache_clear()
+    try:
+        assert get_pantry_cache_metrics() is None
+
+        pantry_cache = get_pantry_cache()
+        assert pantry_cache is not None
+        pantry_cache.set("k", make_response_pantry(), 1)
+
+        metrics = get_pantry_cache_metrics()
+        assert metrics is not None
+        assert metrics["local"]["size"] == 1
+        assert metrics["remote"]["enabled"] is False
+    finally:
+        get_pantry_cache.cache_clear()
@@ -0,0 +1,172 @@
+import random
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from src.services.models.pantry import (
+    DateRange,
+    PantryItem,
+    PantryItemAvailability,
+    PantryItemCost,
+    PartnerCostMarkup,
+)
+from src.services.pantry_cost import (
+    MarkupTimeline,
+    PartnerPriceCache,
+    markups_fingerprint,
+    price_item,
+    price_items,
+)
+from src.utils.datetime_helper import UTC_MAX, UTC_MIN
+
+EPOCH = datetime(2025, 1, 1, tzinfo=UTC)
+
+
+def reference_partner_cost(item: PantryItem, partner_markups: list[PartnerCostMarkup]) -> list[PantryItemCost]:
+    """The slice-by-slice rescan that the sweep line replaced, kept as the behavioural reference."""
+
+    def overlaps(range1: DateRange, range2: DateRange) -> bool:
+        start1, end1 = range1.start or UTC_MIN, range1.end or UTC_MAX
+        start2, end2 = range2.start or UTC_MIN, range2.end or UTC_MAX
+        return start1 < end2 and end1 > start2
+
+    all_ranges = [x.get_date_range() for x in (item.availability + item.cost + partner_markups)]
+    points = sorted({r.start or UTC_MIN for r in all_ranges} | {r.end or UTC_MAX for r in all_ranges})
+    result: list[PantryItemCost] = []
+    for i in range(len(points) - 1):
+        date_slice = DateRange(start=points[i], end=points[i + 1])
+        matching_costs = [c for c in item.cost if overlaps(date_slice, c.get_date_range())]
+        matching_avails = [a for a in item.availability if overlaps(date_slice, a.get_date_range())]
+        if not matching_costs or (item.availability and not matching_avails):
+            continue
+        for cost in matching_costs:
+            for markup in partner_markups:
+                if overlaps(date_slice, markup.get_date_range()):
+                    result.append(
+                        PantryItemCost(
+                            start_date=None if date_slice.start == UTC_MIN else date_slice.start,
+                            end_date=None if date_slice.end == UTC_MAX else date_slice.end,
+                            production_cost_us_dollars=round(
+                                cost.production_cost_us_dollars * (1 + markup.markup_percent / 100), 2
+                            ),
+                        )
+                    )
+                    break
+    return result
+
+
+def random_bounds(rng: random.Random) -> tuple[datetime | None, datetime | None]:
+    # A small day range makes shared, empty and inverted boundaries common
+    start = None if rng.random() < 0.2 else EPOCH + timedelta(days=rng.randint(0, 12))
+    end = None if rng.random() < 0.2 else EPOCH + timedelta(days=rng.randint(0, 12))
+    return start, end
+
+
+def random_item(rng: random.Random) -> PantryItem:
+    costs = []
+    for _ in range(rng.randint(0, 6)):
+        start, end = random_bounds(rng)
+        costs.append(
+            PantryItemCost(start_date=start, end_date=end, production_cost_us_dollars=round(rng.uniform(0, 50), 2))
+        )
+    availabilities = []
+    for _ in range(rng.choice([0, 0, 1, 2, 3])):
+        start, end = random_bounds(rng)
+        availabilities.append(PantryItemAvailability(available_from=start, available_until=end))
+    return PantryItem(
+        id=str(rng.random()),
+        description="item",
+        amount=1,
+        units="each",
+        is_prepped_and_ready=False,
+        cost=costs,
+        availability=availabilities,
+        custom_fields=[],
+    )
+
+
+def random_markups(rng: random.Random) -> list[PartnerCostMarkup]:
+    markups = []
+    for _ in range(rng.randint(0, 4)):
+        start, end = random_bounds(rng)
+        markups.append(
+            PartnerCostMarkup(markup_percent=rng.choice([0, 5, 12.5, 30]), applied_from=start, applied_until=end)
+        )
+    return markups
+
+
+@pytest.mark.parametrize("seed", range(50))
+def test_price_item_matches_reference(seed: int) -> None:
+    rng = random.Random(seed)
+    for _ in range(40):
+        item = random_item(rng)
+        markups = random_markups(rng)
+
+        assert price_item(item, MarkupTimeline(markups)) == reference_partner_cost(item, markups)
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_price_items_matches_per_item_pricing(seed: int) -> None:
+    rng = random.Random(seed)
+    markups = random_markups(rng)
+    items = [random_item(rng) for _ in range(25)]
+
+    assert price_items(items, markups) == [reference_partner_cost(item, markups) for item in items]
+
+
+def test_markup_timeline_prefers_first_markup_in_partner_order() -> None:
+    first = PartnerCostMarkup(markup_percent=10, applied_from=EPOCH, applied_until=EPOCH + timedelta(days=10))
+    second = PartnerCostMarkup(markup_percent=20, applied_from=None, applied_until=None)
+
+    timeline = MarkupTimeline([first, second])
+
+    assert timeline.markup_at(EPOCH - timedelta(days=1)) is second
+    assert timeline.markup_at(EPOCH + timedelta(days=3)) is first
+    assert timeline.markup_at(EPOCH + timedelta(days=10)) is second
+
+
+def test_partner_price_cache_prices_like_price_items_and_reuses_entries() -> None:
+    rng = random.Random(3)
+    markups = random_markups(rng)
+    items = [random_item(rng).model_copy(update={"id": str(i)}) for i in range(10)]
+    cache = PartnerPriceCache(max_entries=100, ttl_seconds=60)
+
+    assert cache.price_items(items, markups) == price_items(items, markups)
+    assert cache.price_items(items, markups) == price_items(items, markups)
+
+    metrics = cache.metrics()
+    assert metrics["misses"] == 10
+    assert metrics["hits"] == 10
+
+
+def test_partner_price_cache_keys_on_markups() -> None:
+    rng = random.Random(4)
+    item = random_item(rng).model_copy(update={"id": "item-1"})
+    cache = PartnerPriceCache(max_entries=100, ttl_seconds=60)
+    low = [PartnerCostMarkup(markup_percent=5, applied_from=None, applied_until=None)]
+    high = [PartnerCostMarkup(markup_percent=30, applied_from=None, applied_until=None)]
+
+    assert cache.price_items([item], low) == price_items([item], low)
+    assert cache.price_items([item], high) == price_items([item], high)
+    assert cache.metrics()["hits"] == 0
+    assert markups_fingerprint(low) != markups_fingerprint(high)
+
+
+def test_price_item_accepts_stored_days_without_zone() -> None:
+    # Items read back from a stored snapshot carry naive days; markups come back as zoned timestamps
+    item = PantryItem(
+        id="stored",
+        description="item",
+        amount=1,
+        units="each",
+        is_prepped_and_ready=False,
+        cost=[PantryItemCost(start_date=datetime(2025, 1, 1), end_date=None, production_cost_us_dollars=10)],
+        availability=[],
+        custom_fields=[],
+    )
+    markup = PartnerCostMarkup(markup_percent=10, applied_from=EPOCH + timedelta(days=5), applied_until=None)
+
+    [cost] = price_item(item, MarkupTimeline([markup]))
+
+    assert cost.start_date == EPOCH + timedelta(days=5)
+    assert cost.production_cost_us_dollars == 11
@@ -0,0 +1,100 @@
+from datetime import UTC, datetime
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+
+from src.core.config import settings
+from src.core.exceptions import ServerError
+from src.services.models.pantry import PantryCrawlCheckpoint, PantrySnapshotStatus
+from src.services.pantry_crawl_recovery import PantryCrawlRecoveryService
+from src.utils.generate_pantry_mocks import generate_mock_pantry_items
+
+
+def make_checkpoint(
+    last_page_saved: int = 3, attempts: int = 2, partner_id: str | None = "123"
+) -> PantryCrawlCheckpoint:
+    return PantryCrawlCheckpoint(
+        pantry_state_id=uuid4(),
+        partner_id=partner_id,
+        pantry_state_timestamp=datetime(2025, 1, 1, tzinfo=UTC),
+        items_available_from=None,
+        items_available_until=None,
+        brand_name="",
+        page_size=50,
+        last_page_saved=last_page_saved,
+        attempts=attempts,
+    )
+
+
+@pytest.fixture
+def partner_db() -> MagicMock:
+    partner_db = MagicMock()
+    partner_db.get_partner_cost_markups.return_value = []
+    return partner_db
+
+
+def test_resumes_from_page_after_checkpoint(partner_db: MagicMock) -> None:
+    checkpoint = make_checkpoint(last_page_saved=3)
+    pantry_db = MagicMock()
+    pantry_db.claim_stale_pantry_crawls.return_value = [checkpoint]
+    culops = MagicMock()
+    culops.get_partner_culops_pantry_data.return_value = iter(
+        [
+            (generate_mock_pantry_items(items_per_pantry=2, seed=1), True),
+            (generate_mock_pantry_items(items_per_pantry=2, seed=2), False),
+        ]
+    )
+
+    completed = PantryCrawlRecoveryService(pantry_db, culops, partner_db).recover_stale_crawls()
+
+    assert completed == 1
+    fetch_kwargs = culops.get_partner_culops_pantry_data.call_args.kwargs
+    assert fetch_kwargs["start_page"] == 4
+    assert fetch_kwargs["page_size"] == 50
+    saved_pages = [call.kwargs["page_number"] for call in pantry_db.save_pantry_items.call_args_list]
+    assert saved_pages == [4, 5]
+    pantry_db.finish_pantry_crawl.assert_called_once_with(checkpoint.pantry_state_id, PantrySnapshotStatus.COMPLETE)
+    _, limit = pantry_db.claim_stale_pantry_crawls.call_args.args
+    assert limit == settings.PANTRY_CRAWL_RECOVERY_BATCH_SIZE
+
+
+def test_failed_resume_is_left_for_next_sweep(partner_db: MagicMock) -> None:
+    pantry_db = MagicMock()
+    pantry_db.claim_stale_pantry_crawls.return_value = [make_checkpoint()]
+    culops = MagicMock()
+    culops.get_partner_culops_pantry_data.side_effect = ServerError("culops down")
+
+    completed = PantryCrawlRecoveryService(pantry_db, culops, partner_db).recover_stale_crawls()
+
+    assert completed == 0
+    pantry_db.finish_pantry_crawl.assert_not_called()
+
+
+def test_crawl_out_of_attempts_is_marked_failed(partner_db: MagicMock) -> None:
+    checkpoint = make_checkpoint(attempts=settings.PANTRY_CRAWL_MAX_ATTEMPTS + 1)
+    pantry_db = MagicMock()
+    pantry_db.claim_stale_pantry_crawls.return_value = [checkpoint]
+    culops = MagicMock()
+
+    completed = PantryCrawlRecoveryService(pantry_db, culops, partner_db).recover_stale_crawls()
+
+    assert completed == 0
+    culops.get_partner_culops_pantry_data.assert_not_called()
+    pantry_db.finish_pantry_crawl.assert_called_once_with(checkpoint.pantry_state_id, PantrySnapshotStatus.FAILED)
+
+
+def test_shared_snapshot_crawl_resumes_without_partner_markups(partner_db: MagicMock) -> None:
+    checkpoint = make_checkpoint(last_page_saved=1, partner_id=None)
+    pantry_db = MagicMock()
+    pantry_db.claim_stale_pantry_crawls.return_value = [checkpoint]
+    culops = MagicMock()
+    culops.get_partner_culops_pantry_data.return_value = iter(
+        [(generate_mock_pantry_items(items_per_pantry=2, seed=1), False)]
+    )
+
+    completed = PantryCrawlRecoveryService(pantry_db, culops, partner_db).recover_stale_crawls()
+
+    assert completed == 1
+    partner_db.get_partner_cost_markups.assert_not_called()
+    pantry_db.finish_pantry_crawl.assert_called_once_with(checkpoint.pantry_state_id, PantrySnapshotStatus.COMPLETE)
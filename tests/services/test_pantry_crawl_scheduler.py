@@ -0,0 +1,131 @@
+import threading
+from collections.abc import Callable, Iterator
+from datetime import UTC, datetime
+from unittest.mock import MagicMock
+from uuid import UUID, uuid4
+
+import pytest
+
+from src.core.exceptions import ServiceUnavailableException
+from src.services.models.pantry import PantryPageInfo
+from src.services.pantry import PantryService
+from src.services.pantry_crawl_scheduler import CrawlJob, CrawlKey, CrawlScheduler, CrawlStatus
+from src.utils.generate_pantry_mocks import generate_mock_pantry_items
+
+
+@pytest.fixture
+def scheduler() -> Iterator[CrawlScheduler]:
+    scheduler = CrawlScheduler(max_workers=1, max_queued=1)
+    yield scheduler
+    scheduler.shutdown()
+
+
+def make_key(partner_id: str = "123") -> CrawlKey:
+    return CrawlKey(partner_id=partner_id, available_from=None, available_until=None, brand_name="")
+
+
+def blocking_task(release: threading.Event, started: threading.Event | None = None) -> Callable[[], None]:
+    def task() -> None:
+        if started is not None:
+            started.set()
+        release.wait(timeout=5)
+
+    return task
+
+
+def submit(scheduler: CrawlScheduler, key: CrawlKey, task: Callable[[], None]) -> CrawlJob:
+    return scheduler.submit(key, uuid4(), datetime.now(UTC), task)
+
+
+def test_identical_crawl_attaches_to_in_flight_job(scheduler: CrawlScheduler) -> None:
+    release = threading.Event()
+    duplicate = MagicMock()
+
+    first = submit(scheduler, make_key(), blocking_task(release))
+    second = submit(scheduler, make_key(), duplicate)
+    release.set()
+    scheduler.shutdown()
+
+    assert second is first
+    duplicate.assert_not_called()
+    assert first.status == CrawlStatus.SUCCEEDED
+    assert first.run_seconds is not None
+    metrics = scheduler.metrics()
+    assert metrics["submitted_total"] == 1
+    assert metrics["deduplicated_total"] == 1
+    assert metrics["succeeded_total"] == 1
+
+
+def test_full_queue_rejects_new_crawls(scheduler: CrawlScheduler) -> None:
+    release, started = threading.Event(), threading.Event()
+    submit(scheduler, make_key("1"), blocking_task(release, started))
+    assert started.wait(timeout=5)
+    submit(scheduler, make_key("2"), blocking_task(release))
+
+    with pytest.raises(ServiceUnavailableException):
+        submit(scheduler, make_key("3"), MagicMock())
+
+    # Attaching to a queued crawl does not need a queue slot
+    submit(scheduler, make_key("2"), MagicMock())
+    release.set()
+
+    metrics = scheduler.metrics()
+    assert metrics["rejected_total"] == 1
+    assert metrics["deduplicated_total"] == 1
+
+
+def test_failed_crawl_is_recorded_and_releases_key(scheduler: CrawlScheduler) -> None:
+    first = submit(scheduler, make_key(), MagicMock(side_effect=RuntimeError("boom")))
+    scheduler.shutdown()
+
+    assert first.status == CrawlStatus.FAILED
+    assert first.error == "boom"
+    assert scheduler.metrics()["failed_total"] == 1
+    assert submit(scheduler, make_key(), MagicMock()) is not first
+
+
+def test_concurrent_fresh_pantries_share_one_snapshot(scheduler: CrawlScheduler) -> None:
+    release = threading.Event()
+    culops = MagicMock()
+
+    def pantry_pages(**_: object) -> Iterator[tuple[list, bool]]:
+        release.wait(timeout=5)
+        yield generate_mock_pantry_items(items_per_pantry=2, seed=3), False
+
+    culops.get_partner_culops_pantry_page.return_value = (
+        generate_mock_pantry_items(items_per_pantry=2, seed=3),
+        PantryPageInfo(has_next=False),
+    )
+    culops.get_partner_culops_pantry_data.side_effect = pantry_pages
+    partner_service = MagicMock()
+    partner_service.get_partner_cost_markups.return_value = []
+    svc = PantryService(MagicMock(), culops, partner_service, crawl_scheduler=scheduler)
+
+    first, _ = svc.get_pantry(partner_id="123", page_size=2)
+    second, _ = svc.get_pantry(partner_id="123", page_size=2)
+    release.set()
+    scheduler.shutdown()
+
+    assert second.pantry_state_id == first.pantry_state_id
+    assert second.pantry_state_timestamp == first.pantry_state_timestamp
+    svc.pantry_db.save_pantry_state.assert_called_once()
+
+
+def test_failure_callbacks_run_for_every_submitter_of_a_failed_job(scheduler: CrawlScheduler) -> None:
+    release = threading.Event()
+    first_failed, second_failed, succeeded = MagicMock(), MagicMock(), MagicMock()
+
+    def failing_task() -> None:
+        release.wait(timeout=5)
+        raise RuntimeError("boom")
+
+    scheduler.submit(make_key(), uuid4(), datetime.now(UTC), failing_task, on_failure=first_failed)
+    scheduler.submit(make_key(), uuid4(), datetime.now(UTC), MagicMock(), on_failure=second_failed)
+    release.set()
+    scheduler.shutdown()
+    scheduler.submit(make_key(), uuid4(), datetime.now(UTC), MagicMock(), on_failure=succeeded)
+    scheduler.shutdown()
+
+    first_failed.assert_called_once_with()
+    second_failed.assert_called_once_with()
+    succeeded.assert_not_called()
@@ -0,0 +1,117 @@
+import threading
+import time
+from datetime import UTC, datetime
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.core.config import settings
+from src.core.exceptions import ServerError
+from src.db.mocks.pantry_data import MockPantryDB
+from src.db.mocks.partner_data import MockPartnerDB
+from src.services.models.pantry import PantrySnapshotStatus
+from src.services.pantry_prewarm import PantryPrewarmService
+from src.utils.generate_pantry_mocks import generate_mock_pantry_items
+
+
+def _culops(fail_partner: str | None = None) -> MagicMock:
+    culops = MagicMock()
+
+    def pages(**kwargs):
+        if kwargs["partner_id"] == fail_partner:
+            raise ServerError("culops down")
+        return iter([(generate_mock_pantry_items(items_per_pantry=2, seed=1), False)])
+
+    culops.get_partner_culops_pantry_data.side_effect = pages
+    return culops
+
+
+def test_prewarm_publishes_a_complete_snapshot_per_partner() -> None:
+    pantry_db = MockPantryDB()
+
+    published = PantryPrewarmService(pantry_db, _culops(), MockPartnerDB()).prewarm()
+
+    assert published == 3
+    assert sorted(pantry_db.current_pantry_states) == ["123", "BA-MAIN", "partner_123"]
+    for current in pantry_db.current_pantry_states.values():
+        assert pantry_db.crawl_statuses[str(current.pantry_state_id)] == PantrySnapshotStatus.COMPLETE
+        assert current.items_available_from is None and current.items_available_until is None
+
+
+def test_prewarm_keeps_going_when_one_partner_fails() -> None:
+    pantry_db = MockPantryDB()
+
+    published = PantryPrewarmService(pantry_db, _culops(fail_partner="BA-MAIN"), MockPartnerDB()).prewarm()
+
+    assert published == 2
+    assert "BA-MAIN" not in pantry_db.current_pantry_states
+    assert PantrySnapshotStatus.FAILED in pantry_db.crawl_statuses.values()
+
+
+def test_prewarm_with_shared_snapshots_crawls_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "PANTRY_SHARED_SNAPSHOTS_ENABLED", True)
+    pantry_db = MagicMock()
+    culops = _culops()
+
+    published = PantryPrewarmService(pantry_db, culops, MockPartnerDB()).prewarm()
+
+    assert published == 3
+    culops.get_partner_culops_pantry_data.assert_called_once()
+    assert pantry_db.save_pantry_state.call_args.kwargs["partner_id"] is None
+    sources = {call.kwargs["source"].pantry_state_id for call in pantry_db.save_pantry_reference.call_args_list}
+    assert sources == {pantry_db.save_pantry_state.call_args.kwargs["pantry_state_id"]}
+    assert pantry_db.publish_current_pantry_state.call_count == 3
+
+
+def test_prewarm_falls_back_to_partner_crawls_when_the_shared_crawl_fails(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "PANTRY_SHARED_SNAPSHOTS_ENABLED", True)
+    pantry_db = MagicMock()
+    pantry_db.save_pantry_state.side_effect = [ServerError("db down"), None, None, None]
+
+    published = PantryPrewarmService(pantry_db, _culops(), MockPartnerDB()).prewarm()
+
+    assert published == 3
+    pantry_db.save_pantry_reference.assert_not_called()
+    partner_ids = [call.kwargs["partner_id"] for call in pantry_db.save_pantry_state.call_args_list[1:]]
+    assert sorted(partner_ids) == ["123", "BA-MAIN", "partner_123"]
+    assert pantry_db.publish_current_pantry_state.call_count == 3
+
+
+def test_prewarm_bounds_concurrent_partner_crawls(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "PANTRY_PREWARM_CONCURRENCY", 2)
+    partner_db = MagicMock()
+    partner_db.get_partner_ids.return_value = [f"p{n}" for n in range(6)]
+    partner_db.get_partner_cost_markups.return_value = []
+    lock = threading.Lock()
+    running, peak = 0, 0
+
+    def pages(**_):
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.02)
+        with lock:
+            running -= 1
+        return iter([([], False)])
+
+    culops = MagicMock()
+    culops.get_partner_culops_pantry_data.side_effect = pages
+
+    published = PantryPrewarmService(MagicMock(), culops, partner_db).prewarm()
+
+    assert published == 6
+    assert peak == 2
+
+
+def test_prewarm_window(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = datetime(2026, 10, 18, 22, 30, tzinfo=UTC)
+
+    monkeypatch.setattr(settings, "PANTRY_PREWARM_WINDOW_DAYS", 0)
+    assert PantryPrewarmService.prewarm_window(now) == (None, None)
+
+    monkeypatch.setattr(settings, "PANTRY_PREWARM_WINDOW_DAYS", 7)
+    assert PantryPrewarmService.prewarm_window(now) == (
+        datetime(2026, 10, 18, tzinfo=UTC),
+        datetime(2026, 10, 25, tzinfo=UTC),
+    )
@@ -0,0 +1,42 @@
+from datetime import date
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.core.config import settings
+from src.core.exceptions import ServerError
+from src.services.pantry_retention import PantryRetentionService
+
+
+def test_creates_upcoming_partitions_and_drops_expired(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "PANTRY_SNAPSHOT_RETENTION_DAYS", 30)
+    monkeypatch.setattr(settings, "PANTRY_PARTITION_PRECREATE_DAYS", 7)
+    pantry_db = MagicMock()
+    pantry_db.drop_pantry_partitions_before.return_value = [date(2026, 9, 17)]
+
+    dropped = PantryRetentionService(pantry_db).maintain_partitions(today=date(2026, 10, 18))
+
+    assert dropped == [date(2026, 9, 17)]
+    pantry_db.create_pantry_partitions.assert_called_once_with(date(2026, 10, 18), date(2026, 10, 25))
+    pantry_db.drop_pantry_partitions_before.assert_called_once_with(date(2026, 9, 18))
+
+
+def test_partitions_are_created_before_expired_ones_are_dropped() -> None:
+    pantry_db = MagicMock()
+    pantry_db.drop_pantry_partitions_before.return_value = []
+
+    PantryRetentionService(pantry_db).maintain_partitions()
+
+    assert [call[0] for call in pantry_db.method_calls] == [
+        "create_pantry_partitions",
+        "drop_pantry_partitions_before",
+    ]
+
+
+def test_expired_partitions_are_dropped_when_creating_partitions_fails() -> None:
+    pantry_db = MagicMock()
+    pantry_db.create_pantry_partitions.side_effect = ServerError("lock timeout")
+    pantry_db.drop_pantry_partitions_before.return_value = [date(2026, 9, 17)]
+
+    assert PantryRetentionService(pantry_db).maintain_partitions(today=date(2026, 10, 18)) == [date(2026, 9, 17)]
+    pantry_db.drop_pantry_partitions_before.assert_called_once()
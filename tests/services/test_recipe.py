@@ -1173,3 +1173,63 @@ def test_get_recipe_ids_by_skus_mapping_success(recipe_service: RecipeService, m
     assert all(isinstance(r, RecipeSku) for r in result)
     assert [r.sku for r in result] == skus
     assert mock_recipes_repo.get_culops_recipe_ref_by_sku.call_count == len(skus)
+
+
+def make_culops_recipe(culops_recipe_id: int, cycle_date: datetime) -> CulopsRecipe:
+    return CulopsRecipe(
+        partner_id=partner_id,
+        recipe_id=uuid4(),
+        culops_recipe_id=culops_recipe_id,
+        title=f"recipe {culops_recipe_id}",
+        subtitle="",
+        servings=2,
+        add_on=False,
+        cycle_date=cycle_date,
+        recipe_constraint_tags=[],
+        packaging_configuration_tags=[],
+        recipe_slot_plan="2-Person",
+        recipe_slot_short_code="RE01",
+        recipe_card_assignments=[],
+        pantry_items=[],
+    )
+
+
+def test_get_all_recipes_fetches_chunks_concurrently_and_isolates_failures(
+    recipe_service: RecipeService,
+    mock_recipes_repo: Mock,
+    mock_culops_client: Mock,
+    mock_cycle_date: datetime,
+) -> None:
+    mock_recipes_repo.get_all_recipe_refs_by_partner.return_value = [
+        CulopsRecipeRef(culops_recipe_id=culops_recipe_id, recipe_id=uuid4(), deleted=culops_recipe_id == 3)
+        for culops_recipe_id in range(1, 8)
+    ]
+
+    def get_recipes(_: str, culops_recipe_ids: list[int]) -> list[CulopsRecipe]:
+        if 4 in culops_recipe_ids:
+            raise ServerError("CulOps unavailable")
+        # Recipe 6 is missing in CulOps and is skipped by the client
+        return [make_culops_recipe(rid, mock_cycle_date) for rid in culops_recipe_ids if rid != 6]
+
+    mock_culops_client.get_recipes.side_effect = get_recipes
+
+    with (
+        patch("src.services.recipe.settings.CULOPS_RECIPE_FETCH_CHUNK_SIZE", 2),
+        patch("src.services.recipe.settings.CULOPS_RECIPE_FETCH_CONCURRENCY", 2),
+    ):
+        responses = recipe_service.get_all_recipes(partner_id)
+
+    assert [call.args[1] for call in mock_culops_client.get_recipes.call_args_list] == [[1, 2], [4, 5], [6, 7]]
+    assert [response.title for response in responses] == ["recipe 1", "recipe 2", "recipe 7"]
+    mock_culops_client.get_recipe.assert_not_called()
+
+
+def test_get_all_recipes_only_deleted_refs_returns_empty(
+    recipe_service: RecipeService, mock_recipes_repo: Mock, mock_culops_client: Mock
+) -> None:
+    mock_recipes_repo.get_all_recipe_refs_by_partner.return_value = [
+        CulopsRecipeRef(culops_recipe_id=1, recipe_id=uuid4(), deleted=True)
+    ]
+
+    assert recipe_service.get_all_recipes(partner_id) == []
+    mock_culops_client.get_recipes.assert_not_called()
@@ -0,0 +1,58 @@
+from collections.abc import Iterator
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.core.config import settings
+from src.utils.metrics_reporter import MetricsReporter
+from src.utils.task_scheduler import TaskScheduler
+
+
+@pytest.fixture
+def reporter() -> Iterator[MetricsReporter]:
+    reporter = MetricsReporter()
+    reporter.shutdown()
+    reporter._sources.clear()
+    yield reporter
+    reporter.shutdown()
+    reporter._sources.clear()
+
+
+def test_report_collects_every_source_and_skips_failing_ones(reporter: MetricsReporter) -> None:
+    reporter.register("pools", lambda: [{"wait_count": 1}])
+    reporter.register("broken", MagicMock(side_effect=RuntimeError("boom")))
+
+    assert reporter.report() == {"pools": [{"wait_count": 1}]}
+
+
+def test_start_reports_periodically_until_shutdown(reporter: MetricsReporter, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "METRICS_LOG_INTERVAL_SECONDS", 0.01)
+    source = MagicMock(return_value={})
+    reporter.register("cache", source)
+    scheduler = TaskScheduler()
+    scheduler.start()
+    try:
+        reporter.start()
+        future = reporter._future
+        assert future is not None
+
+        with pytest.raises(TimeoutError):
+            future.result(timeout=0.1)
+        reporter.shutdown()
+    finally:
+        scheduler.shutdown(5)
+
+    assert future.cancelled()
+    assert source.call_count >= 2
+
+
+def test_start_is_disabled_without_an_interval(reporter: MetricsReporter, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "METRICS_LOG_INTERVAL_SECONDS", 0)
+    source = MagicMock(return_value={})
+    reporter.register("cache", source)
+
+    reporter.start()
+    reporter.shutdown()
+
+    assert reporter._future is None
+    source.assert_called_once_with()
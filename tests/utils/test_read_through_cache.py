@@ -0,0 +1,141 @@
+from concurrent.futures import Executor, Future
+from typing import Any
+
+import pytest
+
+from src.utils.read_through_cache import ReadThroughCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class InlineExecutor(Executor):
+    """Runs refreshes on submit so tests see their effect straight away."""
+
+    def submit(self, fn: Any, /, *args: Any, **kwargs: Any) -> Future[Any]:
+        future: Future[Any] = Future()
+        future.set_result(fn(*args, **kwargs))
+        return future
+
+
+class Loader:
+    def __init__(self, *values: Any) -> None:
+        self.values = list(values)
+        self.calls = 0
+
+    def __call__(self) -> Any:
+        self.calls += 1
+        value = self.values.pop(0)
+        if isinstance(value, Exception):
+            raise value
+        return value
+
+
+def test_value_is_served_until_ttl_then_reloaded() -> None:
+    clock = FakeClock()
+    cache: ReadThroughCache[str] = ReadThroughCache(max_entries=4, ttl_seconds=10, clock=clock)
+    loader = Loader("679", "680")
+
+    assert cache.get_or_load("2025-12-01", loader) == "679"
+    assert cache.get_or_load("2025-12-01", loader) == "679"
+    clock.now = 10
+    assert cache.get_or_load("2025-12-01", loader) == "680"
+
+    assert loader.calls == 2
+    assert cache.metrics() == {
+        "size": 1,
+        "max_entries": 4,
+        "evictions": 0,
+        "hits": 1,
+        "negative_hits": 0,
+        "stale_hits": 0,
+        "misses": 2,
+        "load_errors": 0,
+        "refreshes": 0,
+        "refresh_errors": 0,
+        "hit_rate": 0.3333,
+    }
+
+
+def test_per_key_ttl_overrides_default() -> None:
+    clock = FakeClock()
+    cache: ReadThroughCache[str] = ReadThroughCache(max_entries=4, ttl_seconds=10, clock=clock)
+    loader = Loader("past", "current")
+
+    cache.get_or_load("past", loader, ttl_seconds=100)
+    cache.get_or_load("current", loader)
+    clock.now = 50
+
+    assert cache.get_or_load("past", Loader()) == "past"
+    assert cache.get_or_load("current", Loader("current again")) == "current again"
+
+
+def test_negative_results_are_cached_for_negative_ttl() -> None:
+    clock = FakeClock()
+    cache: ReadThroughCache[str | None] = ReadThroughCache(
+        max_entries=4, ttl_seconds=100, negative_ttl_seconds=5, clock=clock
+    )
+    loader = Loader(None, "679")
+
+    assert cache.get_or_load("2030-01-01", loader) is None
+    assert cache.get_or_load("2030-01-01", loader) is None
+    clock.now = 5
+    assert cache.get_or_load("2030-01-01", loader) == "679"
+
+    assert loader.calls == 2
+    assert cache.metrics()["negative_hits"] == 1
+
+
+def test_loader_errors_are_not_cached() -> None:
+    cache: ReadThroughCache[str] = ReadThroughCache(max_entries=4, ttl_seconds=10)
+    loader = Loader(ConnectionError("down"), "679")
+
+    with pytest.raises(ConnectionError):
+        cache.get_or_load("key", loader)
+
+    assert cache.get_or_load("key", loader) == "679"
+    assert cache.metrics()["load_errors"] == 1
+
+
+def test_stale_value_is_served_while_refreshed() -> None:
+    clock = FakeClock()
+    cache: ReadThroughCache[list[str]] = ReadThroughCache(
+        max_entries=4, ttl_seconds=10, stale_seconds=60, refresh_executor=InlineExecutor(), clock=clock
+    )
+    cache.get_or_load("recipe-slots", Loader(["A1"]))
+    clock.now = 30
+
+    assert cache.get_or_load("recipe-slots", Loader(["A1", "A2"])) == ["A1"]
+    assert cache.get_or_load("recipe-slots", Loader()) == ["A1", "A2"]
+    assert cache.metrics()["stale_hits"] == 1
+    assert cache.metrics()["refreshes"] == 1
+
+
+def test_failed_refresh_keeps_serving_stale_value_until_window_ends() -> None:
+    clock = FakeClock()
+    cache: ReadThroughCache[list[str]] = ReadThroughCache(
+        max_entries=4, ttl_seconds=10, stale_seconds=60, refresh_executor=InlineExecutor(), clock=clock
+    )
+    cache.get_or_load("recipe-slots", Loader(["A1"]))
+    clock.now = 30
+
+    assert cache.get_or_load("recipe-slots", Loader(ConnectionError("down"))) == ["A1"]
+    assert cache.metrics()["refresh_errors"] == 1
+    clock.now = 70
+    assert cache.get_or_load("recipe-slots", Loader(["B1"])) == ["B1"]
+
+
+def test_zero_ttl_stores_nothing() -> None:
+    cache: ReadThroughCache[str] = ReadThroughCache(max_entries=4, ttl_seconds=0, negative_ttl_seconds=0)
+    loader = Loader("679", "679")
+
+    cache.get_or_load("key", loader)
+    cache.get_or_load("key", loader)
+
+    assert loader.calls == 2
+    assert cache.metrics()["size"] == 0
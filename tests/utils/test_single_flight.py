@@ -0,0 +1,106 @@
+import asyncio
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import pytest
+
+from src.utils.single_flight import AsyncSingleFlight, SingleFlight
+
+
+def _run_concurrently(
+    flight: SingleFlight[int], callers: int, started: threading.Event, release: threading.Event, fn: Callable[[], int]
+) -> list[Future[tuple[int, bool]]]:
+    """Start a leader, wait until ``fn`` runs, join ``callers - 1`` followers, then let ``fn`` finish."""
+    with ThreadPoolExecutor(max_workers=callers) as pool:
+        leader = pool.submit(flight.do, "key", fn)
+        started.wait(timeout=5)
+        followers = [pool.submit(flight.do, "key", fn) for _ in range(callers - 1)]
+        # Followers are counted under the lock before they wait, so this is when they have all joined
+        while flight.stats.coalesced < callers - 1:
+            time.sleep(0.001)
+        release.set()
+    return [leader, *followers]
+
+
+def test_concurrent_calls_for_one_key_share_one_execution() -> None:
+    flight: SingleFlight[int] = SingleFlight()
+    started, release = threading.Event(), threading.Event()
+    calls = 0
+
+    def fetch() -> int:
+        nonlocal calls
+        calls += 1
+        started.set()
+        release.wait(timeout=5)
+        return 42
+
+    futures = _run_concurrently(flight, 4, started, release, fetch)
+    results = [future.result(timeout=5) for future in futures]
+
+    assert calls == 1
+    assert results == [(42, False), (42, True), (42, True), (42, True)]
+    assert flight.metrics() == {"in_flight": 0, "executed": 1, "coalesced": 3}
+
+
+def test_error_is_raised_to_every_waiting_caller_and_not_kept() -> None:
+    flight: SingleFlight[int] = SingleFlight()
+    started, release = threading.Event(), threading.Event()
+
+    def fail() -> int:
+        started.set()
+        release.wait(timeout=5)
+        raise ConnectionError("CulOps unavailable")
+
+    futures = _run_concurrently(flight, 3, started, release, fail)
+
+    for future in futures:
+        with pytest.raises(ConnectionError, match="CulOps unavailable"):
+            future.result(timeout=5)
+    assert flight.do("key", lambda: 7) == (7, False)
+
+
+def test_sequential_calls_are_not_coalesced() -> None:
+    flight: SingleFlight[int] = SingleFlight()
+
+    assert flight.do("a", lambda: 1) == (1, False)
+    assert flight.do("a", lambda: 2) == (2, False)
+    assert flight.do("b", lambda: 3) == (3, False)
+    assert flight.metrics() == {"in_flight": 0, "executed": 3, "coalesced": 0}
+
+
+@pytest.mark.asyncio
+async def test_async_calls_for_one_key_share_one_task() -> None:
+    flight: AsyncSingleFlight[str] = AsyncSingleFlight()
+    calls = 0
+
+    async def fetch() -> str:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return "page"
+
+    results = await asyncio.gather(*(flight.do("key", fetch) for _ in range(3)))
+
+    assert calls == 1
+    assert results == [("page", False), ("page", True), ("page", True)]
+    assert flight.metrics() == {"in_flight": 0, "executed": 1, "coalesced": 2}
+
+
+@pytest.mark.asyncio
+async def test_cancelled_async_caller_leaves_shared_task_running() -> None:
+    flight: AsyncSingleFlight[str] = AsyncSingleFlight()
+
+    async def fetch() -> str:
+        await asyncio.sleep(0.01)
+        return "page"
+
+    first = asyncio.ensure_future(flight.do("key", fetch))
+    second = asyncio.ensure_future(flight.do("key", fetch))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    assert await second == ("page", True)
+    with pytest.raises(asyncio.CancelledError):
+        await first
@@ -0,0 +1,62 @@
+import pytest
+
+from src.utils.ttl_lru_cache import TTLLRUCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_get_returns_value_and_counts_hits_and_misses() -> None:
+    cache: TTLLRUCache[str] = TTLLRUCache(max_entries=2, ttl_seconds=10)
+
+    assert cache.get("a") is None
+    cache.set("a", "value")
+
+    assert cache.get("a") == "value"
+    assert cache.metrics() == {
+        "size": 1,
+        "max_entries": 2,
+        "hits": 1,
+        "misses": 1,
+        "evictions": 0,
+        "expirations": 0,
+        "errors": 0,
+    }
+
+
+def test_least_recently_used_entry_is_evicted() -> None:
+    cache: TTLLRUCache[int] = TTLLRUCache(max_entries=2, ttl_seconds=10)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats.evictions == 1
+
+
+def test_expired_entries_are_dropped() -> None:
+    clock = FakeClock()
+    cache: TTLLRUCache[int] = TTLLRUCache(max_entries=2, ttl_seconds=10, clock=clock)
+    cache.set("a", 1)
+    cache.set("b", 2, ttl_seconds=30)
+
+    clock.now = 10
+
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+    assert cache.stats.expirations == 1
+    assert len(cache) == 1
+
+
+def test_max_entries_must_be_positive() -> None:
+    with pytest.raises(ValueError):
+        TTLLRUCache(max_entries=0, ttl_seconds=10)